@@ -80,6 +80,8 @@ log_metrics = mlflow.tracking.fluent.log_metrics
 set_tags = mlflow.tracking.fluent.set_tags
 delete_experiment = mlflow.tracking.fluent.delete_experiment
 delete_run = mlflow.tracking.fluent.delete_run
+enable_async_logging = mlflow.tracking.fluent.enable_async_logging
+flush_async_logging = mlflow.tracking.fluent.flush_async_logging
 register_model = mlflow.tracking._model_registry.fluent.register_model
 
 
@@ -90,4 +92,4 @@ __all__ = ["ActiveRun", "log_param", "log_params", "log_metric", "log_metrics",
            "end_run", "search_runs", "get_artifact_uri", "get_tracking_uri", "set_tracking_uri",
            "get_experiment", "get_experiment_by_name", "create_experiment", "set_experiment",
            "delete_experiment", "get_run", "delete_run", "run", "register_model",
-           "get_registry_uri", "set_registry_uri"]
+           "get_registry_uri", "set_registry_uri", "enable_async_logging", "flush_async_logging"]
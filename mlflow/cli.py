@@ -262,8 +262,17 @@ def _validate_static_prefix(ctx, param, value):  # pylint: disable=unused-argume
               help="Path to the directory where metrics will be stored. If the directory "
                    "doesn't exist, it will be created. "
                    "Activate prometheus exporter to expose metrics on /metrics endpoint.")
+@click.option("--entity-cache-ttl", type=click.FLOAT, default=None, metavar="SECONDS",
+              help="If specified, each server process caches the runs and experiments it reads "
+                   "for this number of seconds. "
+                   "Writes made through the same process invalidate the cached entities. "
+                   "Disabled by default.")
+@click.option("--entity-cache-size", type=click.INT, default=None,
+              help="Maximum number of runs, and of experiments, cached by each server process "
+                   "when --entity-cache-ttl is specified. Defaults to 1000.")
 def server(backend_store_uri, default_artifact_root, host, port,
-           workers, static_prefix, gunicorn_opts, waitress_opts, expose_prometheus):
+           workers, static_prefix, gunicorn_opts, waitress_opts, expose_prometheus,
+           entity_cache_ttl, entity_cache_size):
     """
     Run the MLflow tracking server.
 
@@ -296,7 +305,8 @@ def server(backend_store_uri, default_artifact_root, host, port,
 
     try:
         _run_server(backend_store_uri, default_artifact_root, host, port,
-                    static_prefix, workers, gunicorn_opts, waitress_opts, expose_prometheus)
+                    static_prefix, workers, gunicorn_opts, waitress_opts, expose_prometheus,
+                    entity_cache_ttl, entity_cache_size)
     except ShellCommandException:
         eprint("Running the mlflow server failed. Please see the logs above for details.")
         sys.exit(1)
@@ -3,6 +3,10 @@ import pprint
 
 
 class _MLflowObject(object):
+    # Entities created in bulk, such as runs and metrics, declare ``__slots__`` so that they
+    # are stored without a ``__dict__``, which this base class must not add either
+    __slots__ = ()
+
     def __iter__(self):
         # Iterate through list of properties and yield as key -> value
         for prop in self._properties():
@@ -35,6 +35,9 @@ class RunInfo(_MLflowObject):
     Metadata about a run.
     """
 
+    __slots__ = ["_run_uuid", "_run_id", "_experiment_id", "_user_id", "_status", "_start_time",
+                 "_end_time", "_lifecycle_stage", "_artifact_uri"]
+
     def __init__(self, run_uuid, experiment_id, user_id, status, start_time, end_time,
                  lifecycle_stage, artifact_uri=None, run_id=None):
         if run_uuid is None:
@@ -62,8 +65,7 @@ class RunInfo(_MLflowObject):
 
     def __eq__(self, other):
         if type(other) is type(self):
-            # TODO deep equality here?
-            return self.__dict__ == other.__dict__
+            return all(getattr(self, attr) == getattr(other, attr) for attr in self.__slots__)
         return False
 
     def _copy_with_overrides(self, status=None, end_time=None, lifecycle_stage=None):
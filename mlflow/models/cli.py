@@ -32,7 +32,20 @@ def commands():
 @cli_args.WORKERS
 @cli_args.NO_CONDA
 @cli_args.INSTALL_MLFLOW
-def serve(model_uri, port, host, workers, no_conda=False, install_mlflow=False):
+@cli_args.MAX_BATCH_SIZE
+@cli_args.MAX_BATCH_WAIT_MS
+@cli_args.ASGI
+@cli_args.INFERENCE_EXECUTOR
+@cli_args.INFERENCE_WORKERS
+@cli_args.REQUEST_TIMEOUT
+@cli_args.MAX_PENDING_REQUESTS
+@cli_args.WARMUP_ITERATIONS
+@cli_args.WARMUP_INPUT
+@cli_args.ENABLE_METRICS
+def serve(model_uri, port, host, workers, no_conda=False, install_mlflow=False,
+          max_batch_size=None, max_batch_wait_ms=None, asgi=False, inference_executor=None,
+          inference_workers=None, request_timeout=None, max_pending_requests=None,
+          warmup_iterations=None, warmup_input=None, enable_metrics=False):
     """
     Serve a model saved with MLflow by launching a webserver on the specified host and port.
     The command supports models with the ``python_function`` or ``crate`` (R Function) flavor.
@@ -41,6 +54,19 @@ def serve(model_uri, port, host, workers, no_conda=False, install_mlflow=False):
 
     You can make requests to ``POST /invocations`` in pandas split- or record-oriented formats.
 
+    With ``--max-batch-size``, the DataFrames of concurrent requests are concatenated and scored
+    with a single call to the model, which reduces the per-request overhead of models that score
+    many small requests.
+
+    With ``--asgi``, the model is served by an ASGI server that loads it once and scores requests
+    on ``--inference-workers`` threads, or on as many processes sharing the memory of the model,
+    instead of loading it in each of the ``--workers`` processes of the default server.
+
+    With ``--warmup-iterations``, the model is warmed up with its input example before the
+    ``/ping`` endpoint reports the server healthy.
+
+    With ``--enable-metrics``, the server exposes Prometheus metrics on the ``/metrics`` endpoint.
+
     Example:
 
     .. code-block:: bash
@@ -55,18 +81,78 @@ def serve(model_uri, port, host, workers, no_conda=False, install_mlflow=False):
     return _get_flavor_backend(model_uri,
                                no_conda=no_conda,
                                workers=workers,
-                               install_mlflow=install_mlflow).serve(model_uri=model_uri, port=port,
-                                                                    host=host)
+                               install_mlflow=install_mlflow,
+                               max_batch_size=max_batch_size,
+                               max_batch_wait_ms=max_batch_wait_ms,
+                               asgi=asgi,
+                               inference_executor=inference_executor,
+                               inference_workers=inference_workers,
+                               request_timeout=request_timeout,
+                               max_pending_requests=max_pending_requests,
+                               warmup_iterations=warmup_iterations,
+                               warmup_input=warmup_input,
+                               enable_metrics=enable_metrics).serve(
+        model_uri=model_uri, port=port, host=host)
+
+
+@commands.command("serve-multi")
+@click.option("--models-root-uri", "-r", required=True, metavar="URI",
+              help="URI under which the served models are named by their relative path, for "
+                   "example 'models:/' to serve the registered model versions 'models:/<name>/"
+                   "<version>' at '/invocations/<name>/<version>'.")
+@cli_args.PORT
+@cli_args.HOST
+@cli_args.WORKERS
+@click.option("--max-models", type=click.INT, default=None,
+              help="Maximum number of models that each worker process keeps loaded. The least "
+                   "recently used models are evicted beyond it.")
+@click.option("--max-models-size-mb", type=click.FLOAT, default=None,
+              help="Maximum total size, in megabytes, of the artifacts of the models that each "
+                   "worker process keeps loaded. The least recently used models are evicted "
+                   "beyond it.")
+@click.option("--preload", multiple=True, metavar="NAME",
+              help="Name of a model to load when the server starts, rather than on its first "
+                   "request. Can be specified several times.")
+@cli_args.ENABLE_METRICS
+def serve_multi(models_root_uri, port, host, workers, max_models, max_models_size_mb, preload,
+                enable_metrics):
+    """
+    Serve several models saved with MLflow from each process of a webserver on the specified
+    host and port. The models must have the ``python_function`` flavor, and are served from the
+    current Python environment.
+
+    Models are named by their path relative to ``--models-root-uri``, and are loaded on their
+    first request to the ``/invocations/<model name>`` endpoint. The ``/models`` endpoint lists
+    the models loaded by the worker process handling the request.
+
+    Example:
+
+    .. code-block:: bash
+
+        $ mlflow models serve-multi -r models:/ --max-models 100 &
+
+        $ curl 127.0.0.1:5000/invocations/my-model/3 -H 'Content-Type: application/json' -d '{
+            "columns": ["a", "b"],
+            "data": [[1, 2]]
+        }'
+    """
+    from mlflow.pyfunc.scoring_server import multi_model
+    multi_model._serve(models_root_uri, port, host, workers=workers or 1, max_models=max_models,
+                       max_models_size_mb=max_models_size_mb, preload=list(preload),
+                       enable_metrics=enable_metrics)
 
 
 @commands.command("predict")
 @cli_args.MODEL_URI
 @click.option("--input-path", "-i", default=None,
-              help="CSV containing pandas DataFrame to predict against.")
+              help="File containing the pandas DataFrame to predict against, in the format "
+                   "specified by --content-type.")
 @click.option("--output-path", "-o", default=None,
               help="File to output results to as json file. If not provided, output to stdout.")
 @click.option("--content-type", "-t", default="json",
-              help="Content type of the input file. Can be one of {'json', 'csv'}.")
+              help="Content type of the input file. Can be one of {'json', 'csv', 'arrow', "
+                   "'parquet', 'npy'}, where 'arrow' is the Apache Arrow IPC streaming format and "
+                   "'npy' a numpy array saved with numpy.save.")
 @click.option("--json-format", "-j", default="split",
               help="Only applies if the content type is 'json'. Specify how the data is encoded.  "
                    "Can be one of {'split', 'records'} mirroring the behavior of Pandas orient "
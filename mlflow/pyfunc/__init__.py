@@ -277,77 +277,83 @@ def _load_model_env(path):
     return _get_flavor_configuration(model_path=path, flavor_name=FLAVOR_NAME).get(ENV, None)
 
 
-def _enforce_type(name, values: pandas.Series, t: DataType):
+def _get_type_conversion(name, dtype, t: DataType):
     """
-    Enforce the input column type matches the declared in model input schema.
-
-    The following type conversions are allowed:
+    Get the conversion of values of type ``dtype`` to the type declared in the model input schema.
 
-    1. np.object -> string
-    2. int -> long (upcast)
-    3. float -> double (upcast)
-
-    Any other type mismatch will raise error.
+    :return: None if the types are already compatible, otherwise the type to which to convert the
+             values. Raises if the values cannot be safely converted.
     """
-    if values.dtype == np.object and t not in (DataType.binary, DataType.string):
-        values = values.infer_objects()
-
-    if values.dtype in (t.to_pandas(), t.to_numpy()):
+    if dtype in (t.to_pandas(), t.to_numpy()):
         # The types are already compatible => conversion is not necessary.
-        return values
+        return None
 
-    if t == DataType.binary and values.dtype.kind == t.binary.to_numpy().kind:
+    if t == DataType.binary and dtype.kind == t.binary.to_numpy().kind:
         # NB: bytes in numpy have variable itemsize depending on the length of the longest
         # element in the array (column). Since MLflow binary type is length agnostic, we ignore
         # itemsize when matching binary columns.
-        return values
+        return None
 
-    if t == DataType.string and values.dtype == np.object:
+    if t == DataType.string and dtype == np.object:
         #  NB: strings are by default parsed and inferred as objects, but it is
         # recommended to use StringDtype extension type if available. See
         #
         # `https://pandas.pydata.org/pandas-docs/stable/user_guide/text.html`
         #
         # for more detail.
-        try:
-            return values.astype(t.to_pandas(), errors="raise")
-        except ValueError:
-            raise MlflowException(
-                "Failed to convert column {0} from type {1} to {2}.".format(
-                  name, values.dtype, t)
-            )
+        return t.to_pandas()
 
     numpy_type = t.to_numpy()
-    is_compatible_type = values.dtype.kind == numpy_type.kind
-    is_upcast = values.dtype.itemsize <= numpy_type.itemsize
+    is_compatible_type = dtype.kind == numpy_type.kind
+    is_upcast = dtype.itemsize <= numpy_type.itemsize
     if is_compatible_type and is_upcast:
-        return values.astype(numpy_type, errors="raise")
+        return numpy_type
     else:
         # NB: conversion between incompatible types (e.g. floats -> ints or
         # double -> float) are not allowed. While supported by pandas and numpy,
         # these conversions alter the values significantly.
         raise MlflowException("Incompatible input types for column {0}. "
                               "Can not safely convert {1} to {2}.".format(name,
-                                                                          values.dtype,
+                                                                          dtype,
                                                                           numpy_type))
 
 
-def _enforce_schema(pdf: pandas.DataFrame, input_schema: Schema):
+def _enforce_type(name, values: pandas.Series, t: DataType):
     """
-    Enforce column names and types match the input schema.
+    Enforce the input column type matches the declared in model input schema.
 
-    For column names, we check there are no missing columns and reorder the columns to match the
-    ordering declared in schema if necessary. Any extra columns are ignored.
+    The following type conversions are allowed:
 
-    For column types, we make sure the types match schema or can be safely converted to match the
-    input schema.
+    1. np.object -> string
+    2. int -> long (upcast)
+    3. float -> double (upcast)
+
+    Any other type mismatch will raise error.
+    """
+    if values.dtype == np.object and t not in (DataType.binary, DataType.string):
+        values = values.infer_objects()
+
+    conversion = _get_type_conversion(name, values.dtype, t)
+    if conversion is None:
+        return values
+    try:
+        return values.astype(conversion, errors="raise")
+    except ValueError:
+        if values.dtype != np.object:
+            raise
+        raise MlflowException(
+            "Failed to convert column {0} from type {1} to {2}.".format(
+              name, values.dtype, t)
+        )
+
+
+def _check_input_columns(pdf: pandas.DataFrame, input_schema: Schema):
     """
-    if isinstance(pdf, list):
-        pdf = pandas.DataFrame(pdf)
-    if not isinstance(pdf, pandas.DataFrame):
-        message = 'Expected input to be DataFrame or list. Found: %s' % type(pdf).__name__
-        raise MlflowException(message)
+    Check that the input has the columns declared in the input schema.
 
+    :return: The names of the input columns matching the columns of the schema, in the order of
+             the schema.
+    """
     if input_schema.has_column_names():
         # make sure there are no missing columns
         col_names = input_schema.column_names()
@@ -363,6 +369,7 @@ def _enforce_schema(pdf: pandas.DataFrame, input_schema: Schema):
             message = ("Model input is missing columns {0}."
                        " Note that there were extra columns: {1}".format(missing_cols, extra_cols))
             raise MlflowException(message)
+        return col_names
     else:
         # The model signature does not specify column names => we can only verify column count.
         if len(pdf.columns) < len(input_schema.columns):
@@ -372,12 +379,120 @@ def _enforce_schema(pdf: pandas.DataFrame, input_schema: Schema):
                        "only verify their count.").format(len(input_schema.columns),
                                                           len(pdf.columns))
             raise MlflowException(message)
-        col_names = pdf.columns[:len(input_schema.columns)]
-    col_types = input_schema.column_types()
-    new_pdf = pandas.DataFrame()
-    for i, x in enumerate(col_names):
-        new_pdf[x] = _enforce_type(x, pdf[x], col_types[i])
-    return new_pdf
+        return list(pdf.columns[:len(input_schema.columns)])
+
+
+class _ConversionPlan(object):
+    """
+    Conversion of the DataFrames with given columns and column types to the model input schema.
+
+    Input columns are grouped by the type to which they are converted, so that each group is
+    selected and cast at once, at the level of the pandas blocks holding its columns.
+    """
+
+    def __init__(self, pdf: pandas.DataFrame, input_schema: Schema):
+        self.col_names = _check_input_columns(pdf, input_schema)
+        self.col_types = input_schema.column_types()
+        # Columns of objects are converted one by one, since their type depends on their values
+        self.object_columns = []
+        self.is_identity = False
+        self.groups = None
+        if not pdf.columns.is_unique or len(set(self.col_names)) < len(self.col_names):
+            # Columns are selected by position, which requires unique column names. Otherwise,
+            # the columns are converted one by one.
+            return
+        positions = pdf.columns.get_indexer(self.col_names)
+        dtypes = pdf.dtypes.values
+        # Type to which to convert the columns of each group, or None, and their positions in the
+        # input and in the output
+        groups = {}
+        for i, (name, t, position) in enumerate(zip(self.col_names, self.col_types, positions)):
+            dtype = dtypes[position]
+            if dtype == np.object:
+                self.object_columns.append((name, t))
+                conversion = None
+            else:
+                conversion = _get_type_conversion(name, dtype, t)
+            input_positions, output_positions = groups.setdefault(conversion, ([], []))
+            input_positions.append(position)
+            output_positions.append(i)
+        self.groups = [(conversion, input_positions)
+                       for conversion, (input_positions, _) in groups.items()]
+        output_positions = np.concatenate([output for _, output in groups.values()])
+        self.output_order = np.argsort(output_positions)
+        self.output_in_order = np.array_equal(output_positions, np.arange(len(output_positions)))
+        self.is_identity = len(self.groups) == 1 and self.groups[0][0] is None and \
+            not self.object_columns and np.array_equal(positions, np.arange(len(pdf.columns)))
+
+    def apply(self, pdf: pandas.DataFrame) -> pandas.DataFrame:
+        if self.is_identity:
+            # The input already matches the schema
+            return pdf
+        if self.groups is None:
+            new_pdf = pandas.DataFrame()
+            for i, x in enumerate(self.col_names):
+                new_pdf[x] = _enforce_type(x, pdf[x], self.col_types[i])
+            return new_pdf
+        frames = []
+        for conversion, input_positions in self.groups:
+            frame = pdf.iloc[:, input_positions]
+            frames.append(frame if conversion is None else frame.astype(conversion, copy=False))
+        if len(frames) == 1:
+            new_pdf = frames[0]
+        else:
+            new_pdf = pandas.concat(frames, axis=1, copy=False)
+            if not self.output_in_order:
+                new_pdf = new_pdf.iloc[:, self.output_order]
+        if self.object_columns:
+            # Converted columns are set on a shallow copy, so that the input is left unchanged
+            new_pdf = new_pdf.copy(deep=False)
+        for name, t in self.object_columns:
+            new_pdf[name] = _enforce_type(name, new_pdf[name], t)
+        return new_pdf
+
+
+class _SchemaEnforcer(object):
+    """
+    Enforces a model input schema on DataFrames. The conversion of the input columns to the schema
+    is planned once for each combination of input column names and types, so that enforcing the
+    schema on an input like a previous one only selects and casts its columns in bulk.
+    """
+
+    _MAX_PLANS = 32
+
+    def __init__(self, input_schema: Schema):
+        self.input_schema = input_schema
+        self._plans = {}
+
+    def enforce(self, pdf: pandas.DataFrame) -> pandas.DataFrame:
+        if isinstance(pdf, list):
+            pdf = pandas.DataFrame(pdf)
+        if not isinstance(pdf, pandas.DataFrame):
+            message = 'Expected input to be DataFrame or list. Found: %s' % type(pdf).__name__
+            raise MlflowException(message)
+        key = (tuple(pdf.columns), tuple(pdf.dtypes))
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = _ConversionPlan(pdf, self.input_schema)
+            if len(self._plans) >= self._MAX_PLANS:
+                self._plans.clear()
+            self._plans[key] = plan
+        return plan.apply(pdf)
+
+
+def _enforce_schema(pdf: pandas.DataFrame, input_schema: Schema):
+    """
+    Enforce column names and types match the input schema.
+
+    For column names, we check there are no missing columns and reorder the columns to match the
+    ordering declared in schema if necessary. Any extra columns are ignored.
+
+    For column types, we make sure the types match schema or can be safely converted to match the
+    input schema.
+
+    The input is returned as is if it already matches the schema.
+    """
+    return _SchemaEnforcer(input_schema).enforce(pdf)
 
 
 PyFuncOutput = Union[pandas.DataFrame, pandas.Series, np.ndarray, list]
@@ -405,6 +520,9 @@ class PyFuncModel(object):
             raise MlflowException("Model is missing metadata.")
         self._model_meta = model_meta
         self._model_impl = model_impl
+        # The input schema is enforced with conversion plans reused across calls to predict
+        input_schema = model_meta.get_input_schema()
+        self._schema_enforcer = _SchemaEnforcer(input_schema) if input_schema is not None else None
 
     def predict(self, data: pandas.DataFrame) -> PyFuncOutput:
         """
@@ -412,9 +530,8 @@ class PyFuncModel(object):
         :param data: Model input as pandas.DataFrame.
         :return: Model predictions as one of pandas.DataFrame, pandas.Series, numpy.ndarray or list.
         """
-        input_schema = self._model_meta.get_input_schema()
-        if input_schema is not None:
-            data = _enforce_schema(data, input_schema)
+        if self._schema_enforcer is not None:
+            data = self._schema_enforcer.enforce(data)
         return self._model_impl.predict(data)
 
     @property
@@ -522,6 +639,11 @@ def spark_udf(spark, model_uri, result_type="double"):
     """
     A Spark UDF that can be used to invoke the Python function formatted model.
 
+    On Spark 3.0 and above, the UDF is a pandas UDF iterating over the Arrow batches of each task,
+    so that the model is looked up once per task rather than once per batch. The batches passed to
+    the model hold at most ``spark.sql.execution.arrow.maxRecordsPerBatch`` rows (10000 by
+    default), a configuration of the Spark session that applies to all of its pandas UDFs.
+
     Parameters passed to the UDF are forwarded to the model as a DataFrame where the column names
     are ordinals (0, 1, ...). On some versions of Spark, it is also possible to wrap the input in a
     struct. In that case, the data will be passed as a DataFrame with column names given by the
@@ -588,7 +710,7 @@ def spark_udf(spark, model_uri, result_type="double"):
     # Scope Spark import to this method so users don't need pyspark to use non-Spark-related
     # functionality.
     from mlflow.pyfunc.spark_model_cache import SparkModelCache
-    from pyspark.sql.functions import pandas_udf
+    from pyspark.sql.functions import pandas_udf, PandasUDFType
     from pyspark.sql.types import _parse_datatype_string
     from pyspark.sql.types import ArrayType, DataType as SparkDataType
     from pyspark.sql.types import DoubleType, IntegerType, FloatType, LongType, StringType
@@ -615,69 +737,98 @@ def spark_udf(spark, model_uri, result_type="double"):
 
     def predict(*args):
         model = SparkModelCache.get_or_load(archive_path)
-        input_schema = model.metadata.get_input_schema()
-        pdf = None
-
-        for x in args:
-            if type(x) == pandas.DataFrame:
-                if len(args) != 1:
-                    raise Exception("If passing a StructType column, there should be only one "
-                                    "input column, but got %d" % len(args))
-                pdf = x
-        if pdf is None:
-            args = list(args)
-            if input_schema is None:
-                names = [str(i) for i in range(len(args))]
-            else:
-                names = input_schema.column_names()
-                if len(args) > len(names):
-                    args = args[:len(names)]
-                if len(args) < len(names):
-                    message = ("Model input is missing columns. Expected {0} input columns {1},"
-                               " but the model received only {2} unnamed input columns"
-                               " (Since the columns were passed unnamed they are expected to be in"
-                               " the order specified by the schema).".format(
-                                   len(names), names, len(args)))
-                    raise MlflowException(message)
-            pdf = pandas.DataFrame(data={names[i]: x for i, x in enumerate(args)}, columns=names)
-
-        result = model.predict(pdf)
-
-        if not isinstance(result, pandas.DataFrame):
-            result = pandas.DataFrame(data=result)
-
-        elem_type = result_type.elementType if isinstance(result_type, ArrayType) else result_type
-
-        if type(elem_type) == IntegerType:
-            result = result.select_dtypes([np.byte, np.ubyte, np.short, np.ushort,
-                                           np.int32]).astype(np.int32)
-        elif type(elem_type) == LongType:
-            result = result.select_dtypes([np.byte, np.ubyte, np.short, np.ushort, np.int, np.long])
-
-        elif type(elem_type) == FloatType:
-            result = result.select_dtypes(include=(np.number,)).astype(np.float32)
-
-        elif type(elem_type) == DoubleType:
-            result = result.select_dtypes(include=(np.number,)).astype(np.float64)
-
-        if len(result.columns) == 0:
-            raise MlflowException(
-                message="The the model did not produce any values compatible with the requested "
-                        "type '{}'. Consider requesting udf with StringType or "
-                        "Arraytype(StringType).".format(str(elem_type)),
-                error_code=INVALID_PARAMETER_VALUE)
-
-        if type(elem_type) == StringType:
-            result = result.applymap(str)
-
-        if type(result_type) == ArrayType:
-            return pandas.Series([row[1].values for row in result.iterrows()])
-        else:
-            return result[result.columns[0]]
+        return _predict_spark_udf_batch(model, args, result_type)
 
+    def predict_batches(batches):
+        model = SparkModelCache.get_or_load(archive_path)
+        for args in batches:
+            # Batches of a single column are not wrapped in a tuple
+            if not isinstance(args, tuple):
+                args = (args,)
+            yield _predict_spark_udf_batch(model, args, result_type)
+
+    if hasattr(PandasUDFType, "SCALAR_ITER"):
+        return pandas_udf(predict_batches, result_type, PandasUDFType.SCALAR_ITER)
     return pandas_udf(predict, result_type)
 
 
+def _predict_spark_udf_batch(model, args, result_type):
+    """
+    Score a batch of the data passed to a UDF returned by :py:func:`spark_udf`.
+
+    :param model: The :py:class:`PyFuncModel` to apply.
+    :param args: pandas Series of the columns passed to the UDF, or a single pandas DataFrame if
+                 a struct column was passed to the UDF.
+    :param result_type: ``pyspark.sql.types.DataType`` of the results of the UDF.
+    :return: pandas Series of the results of the UDF.
+    """
+    from pyspark.sql.types import ArrayType
+    from pyspark.sql.types import DoubleType, IntegerType, FloatType, LongType, StringType
+
+    input_schema = model.metadata.get_input_schema()
+    pdf = None
+
+    for x in args:
+        if type(x) == pandas.DataFrame:
+            if len(args) != 1:
+                raise Exception("If passing a StructType column, there should be only one "
+                                "input column, but got %d" % len(args))
+            pdf = x
+    if pdf is None:
+        args = list(args)
+        if input_schema is None:
+            names = [str(i) for i in range(len(args))]
+        else:
+            names = input_schema.column_names()
+            if len(args) > len(names):
+                args = args[:len(names)]
+            if len(args) < len(names):
+                message = ("Model input is missing columns. Expected {0} input columns {1},"
+                           " but the model received only {2} unnamed input columns"
+                           " (Since the columns were passed unnamed they are expected to be in"
+                           " the order specified by the schema).".format(
+                               len(names), names, len(args)))
+                raise MlflowException(message)
+        # The columns are assembled without copying the buffers converted from Arrow
+        pdf = pandas.concat(args, axis=1, copy=False)
+        pdf.columns = names
+
+    result = model.predict(pdf)
+
+    if not isinstance(result, pandas.DataFrame):
+        result = pandas.DataFrame(data=result)
+
+    elem_type = result_type.elementType if isinstance(result_type, ArrayType) else result_type
+
+    if type(elem_type) == IntegerType:
+        result = result.select_dtypes([np.byte, np.ubyte, np.short, np.ushort,
+                                       np.int32]).astype(np.int32)
+    elif type(elem_type) == LongType:
+        result = result.select_dtypes([np.byte, np.ubyte, np.short, np.ushort, np.int, np.long])
+
+    elif type(elem_type) == FloatType:
+        result = result.select_dtypes(include=(np.number,)).astype(np.float32)
+
+    elif type(elem_type) == DoubleType:
+        result = result.select_dtypes(include=(np.number,)).astype(np.float64)
+
+    if len(result.columns) == 0:
+        raise MlflowException(
+            message="The the model did not produce any values compatible with the requested "
+                    "type '{}'. Consider requesting udf with StringType or "
+                    "Arraytype(StringType).".format(str(elem_type)),
+            error_code=INVALID_PARAMETER_VALUE)
+
+    if type(elem_type) == StringType:
+        result = result.applymap(str)
+
+    if type(result_type) == ArrayType:
+        # Each row is a view of the two dimensional array of the results
+        return pandas.Series(list(result.to_numpy()))
+    else:
+        return result[result.columns[0]]
+
+
 def save_model(path, loader_module=None, data_path=None, code_path=None, conda_env=None,
                mlflow_model=None, python_model=None, artifacts=None,
                signature: ModelSignature = None, input_example: ModelInputExample = None,
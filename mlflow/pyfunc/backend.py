@@ -7,6 +7,7 @@ from mlflow.models import FlavorBackend
 from mlflow.models.docker_utils import _build_image, DISABLE_ENV_CREATION
 from mlflow.pyfunc import ENV
 from mlflow.pyfunc import scoring_server
+from mlflow.pyfunc.scoring_server import async_server
 
 from mlflow.projects import _get_or_create_conda_env, _get_conda_bin_executable, \
                             _get_conda_command
@@ -22,11 +23,26 @@ class PyFuncBackend(FlavorBackend):
         Flavor backend implementation for the generic python models.
     """
 
-    def __init__(self, config, workers=1, no_conda=False, install_mlflow=False, **kwargs):
+    def __init__(self, config, workers=1, no_conda=False, install_mlflow=False,
+                 max_batch_size=None, max_batch_wait_ms=None, asgi=False, inference_executor=None,
+                 inference_workers=None, request_timeout=None, max_pending_requests=None,
+                 warmup_iterations=None, warmup_input=None, enable_metrics=False, **kwargs):
         super(PyFuncBackend, self).__init__(config=config, **kwargs)
         self._nworkers = workers or 1
         self._no_conda = no_conda
         self._install_mlflow = install_mlflow
+        self._max_batch_size = max_batch_size
+        self._max_batch_wait_ms = max_batch_wait_ms
+        self._asgi = asgi
+        self._warmup_iterations = warmup_iterations
+        self._warmup_input = os.path.abspath(warmup_input) if warmup_input else None
+        self._enable_metrics = enable_metrics
+        self._async_config = {
+            async_server._SERVER_INFERENCE_EXECUTOR: inference_executor,
+            async_server._SERVER_INFERENCE_WORKERS: inference_workers,
+            async_server._SERVER_REQUEST_TIMEOUT: request_timeout,
+            async_server._SERVER_MAX_PENDING_REQUESTS: max_pending_requests,
+        }
 
     def prepare_env(self, model_uri):
         local_path = _download_artifact_from_uri(model_uri)
@@ -72,20 +88,56 @@ class PyFuncBackend(FlavorBackend):
         # NB: Absolute windows paths do not work with mlflow apis, use file uri to ensure
         # platform compatibility.
         local_uri = path_to_local_file_uri(local_path)
-        if os.name != "nt":
-            command = ("gunicorn --timeout=60 -b {host}:{port} -w {nworkers} ${{GUNICORN_CMD_ARGS}}"
-                       " -- mlflow.pyfunc.scoring_server.wsgi:app").format(
+        # Batching requires each server process to handle requests concurrently, so that there
+        # are requests to batch together
+        threads_opt = ""
+        if self._max_batch_size:
+            threads_opt = " --threads={}".format(self._max_batch_size)
+        if self._asgi:
+            # Each uvicorn process loads the model once and scores requests on its own executor
+            workers_opt = ""
+            if int(self._nworkers) > 1:
+                workers_opt = " --workers={}".format(self._nworkers)
+            command = ("uvicorn --host={host} --port={port}{workers_opt}"
+                       " mlflow.pyfunc.scoring_server.asgi:app").format(
                 host=host,
                 port=port,
-                nworkers=self._nworkers)
+                workers_opt=workers_opt)
+        elif os.name != "nt":
+            command = ("gunicorn --timeout=60 -b {host}:{port} -w {nworkers}{threads_opt}"
+                       " ${{GUNICORN_CMD_ARGS}} -- mlflow.pyfunc.scoring_server.wsgi:app").format(
+                host=host,
+                port=port,
+                nworkers=self._nworkers,
+                threads_opt=threads_opt)
         else:
-            command = ("waitress-serve --host={host} --port={port} "
+            command = ("waitress-serve --host={host} --port={port}{threads_opt} "
                        "--ident=mlflow mlflow.pyfunc.scoring_server.wsgi:app").format(
                 host=host,
-                port=port)
+                port=port,
+                threads_opt=threads_opt)
 
         command_env = os.environ.copy()
         command_env[scoring_server._SERVER_MODEL_PATH] = local_uri
+        if self._max_batch_size:
+            command_env[scoring_server._SERVER_MAX_BATCH_SIZE] = str(self._max_batch_size)
+            if self._max_batch_wait_ms is not None:
+                command_env[scoring_server._SERVER_MAX_BATCH_WAIT_MS] = \
+                    str(self._max_batch_wait_ms)
+        if self._warmup_iterations:
+            command_env[scoring_server._SERVER_WARMUP_ITERATIONS] = str(self._warmup_iterations)
+            if self._warmup_input is not None:
+                command_env[scoring_server._SERVER_WARMUP_INPUT_PATH] = self._warmup_input
+        if self._enable_metrics:
+            from mlflow.pyfunc.scoring_server.metrics import _set_default_multiproc_dir
+            command_env[scoring_server._SERVER_ENABLE_METRICS] = "true"
+            # The server processes write their metrics to files in this directory, from which the
+            # /metrics endpoint of any process aggregates the metrics of all of them
+            _set_default_multiproc_dir(command_env)
+        if self._asgi:
+            for name, value in self._async_config.items():
+                if value is not None:
+                    command_env[name] = str(value)
         if not self._no_conda and ENV in self._config:
             conda_env_path = os.path.join(local_path, self._config[ENV])
             return _execute_in_conda_env(conda_env_path, command, self._install_mlflow,
@@ -9,17 +9,23 @@ is parsed into pandas.DataFrame and passed to the model.
 Defines two endpoints:
     /ping used for health check
     /invocations used for scoring
+and a /metrics endpoint exposing Prometheus metrics if metrics are enabled.
 """
 from collections import OrderedDict
+from contextlib import contextmanager
 import flask
+import itertools
 import json
 from json import JSONEncoder
 import logging
 import numpy as np
+import os
 import pandas as pd
 from six import reraise
 import sys
+import time
 import traceback
+from werkzeug.datastructures import MIMEAccept
 
 # NB: We need to be careful what we import form mlflow here. Scoring server is used from within
 # model's conda environment. The version of mlflow doing the serving (outside) and the version of
@@ -41,21 +47,48 @@ try:
     from StringIO import StringIO
 except ImportError:
     from io import StringIO
+from io import BytesIO
 
 _SERVER_MODEL_PATH = "__pyfunc_model_path__"
+_SERVER_MAX_BATCH_SIZE = "__pyfunc_max_batch_size__"
+_SERVER_MAX_BATCH_WAIT_MS = "__pyfunc_max_batch_wait_ms__"
+_SERVER_WARMUP_ITERATIONS = "__pyfunc_warmup_iterations__"
+_SERVER_WARMUP_INPUT_PATH = "__pyfunc_warmup_input_path__"
+_SERVER_ENABLE_METRICS = "__pyfunc_enable_metrics__"
+
+_DEFAULT_MAX_BATCH_WAIT_MS = 5
+
+# JSON responses with at least this number of rows are streamed, serializing this number of rows
+# at a time
+_MIN_STREAMED_ROWS = 100000
+_RESPONSE_CHUNK_ROWS = 10000
 
 CONTENT_TYPE_CSV = "text/csv"
 CONTENT_TYPE_JSON = "application/json"
 CONTENT_TYPE_JSON_RECORDS_ORIENTED = "application/json; format=pandas-records"
 CONTENT_TYPE_JSON_SPLIT_ORIENTED = "application/json; format=pandas-split"
 CONTENT_TYPE_JSON_SPLIT_NUMPY = "application/json-numpy-split"
+CONTENT_TYPE_ARROW_STREAM = "application/vnd.apache.arrow.stream"
+CONTENT_TYPE_PARQUET = "application/vnd.apache.parquet"
+CONTENT_TYPE_NPY = "application/x-npy"
 
 CONTENT_TYPES = [
     CONTENT_TYPE_CSV,
     CONTENT_TYPE_JSON,
     CONTENT_TYPE_JSON_RECORDS_ORIENTED,
     CONTENT_TYPE_JSON_SPLIT_ORIENTED,
-    CONTENT_TYPE_JSON_SPLIT_NUMPY
+    CONTENT_TYPE_JSON_SPLIT_NUMPY,
+    CONTENT_TYPE_ARROW_STREAM,
+    CONTENT_TYPE_PARQUET,
+    CONTENT_TYPE_NPY,
+]
+
+# Content types in which predictions can be returned, selected by the Accept header of requests
+RESPONSE_CONTENT_TYPES = [
+    CONTENT_TYPE_JSON,
+    CONTENT_TYPE_ARROW_STREAM,
+    CONTENT_TYPE_PARQUET,
+    CONTENT_TYPE_NPY,
 ]
 
 _logger = logging.getLogger(__name__)
@@ -121,9 +154,236 @@ def parse_split_oriented_json_input_to_numpy(json_input):
             error_code=MALFORMED_REQUEST)
 
 
-def predictions_to_json(raw_predictions, output):
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet  # pylint: disable=unused-import
+        return pyarrow
+    except ImportError:
+        raise MlflowException("The Arrow and Parquet formats require the pyarrow package, which "
+                              "is not installed in the model's environment.",
+                              error_code=BAD_REQUEST)
+
+
+def parse_arrow_input(arrow_input):
+    """
+    :param arrow_input: Bytes of a pandas DataFrame serialized in the Apache Arrow IPC streaming
+                        format.
+    """
+    pa = _import_pyarrow()
+    # pylint: disable=broad-except
+    try:
+        table = pa.ipc.open_stream(pa.py_buffer(arrow_input)).read_all()
+        # Numeric columns without nulls are converted without copying the Arrow buffers
+        return table.to_pandas(split_blocks=True)
+    except Exception:
+        _handle_serving_error(
+            error_message=(
+                "Failed to parse input as a Pandas DataFrame. Ensure that the input is"
+                " a valid Apache Arrow IPC stream, for example produced by writing"
+                " `pyarrow.Table.from_pandas(df)` with `pyarrow.ipc.new_stream`."),
+            error_code=MALFORMED_REQUEST)
+
+
+def parse_parquet_input(parquet_input):
+    """
+    :param parquet_input: Bytes of a pandas DataFrame serialized in the Apache Parquet format.
+    """
+    pa = _import_pyarrow()
+    # pylint: disable=broad-except
+    try:
+        table = pa.parquet.read_table(pa.BufferReader(parquet_input))
+        return table.to_pandas(split_blocks=True)
+    except Exception:
+        _handle_serving_error(
+            error_message=(
+                "Failed to parse input as a Pandas DataFrame. Ensure that the input is"
+                " a valid Parquet file produced using the `pandas.DataFrame.to_parquet()`"
+                " method."),
+            error_code=MALFORMED_REQUEST)
+
+
+def parse_npy_input(npy_input, schema: Schema=None):
+    """
+    :param npy_input: Bytes of a one or two dimensional numpy array serialized in the ``.npy``
+                      format with ``numpy.save``. The columns of structured arrays are named after
+                      their fields, and the columns of other arrays after the columns of
+                      ``schema``, if it has as many named columns as the array.
+    :param schema: Optional schema specification to be used during parsing.
+    """
+    # pylint: disable=broad-except
+    try:
+        array = np.load(BytesIO(npy_input), allow_pickle=False)
+        if array.ndim == 1 and array.dtype.names is None:
+            array = array.reshape(-1, 1)
+        if array.ndim not in [1, 2]:
+            raise ValueError("Expected a one or two dimensional array, got %s dimensions"
+                             % array.ndim)
+    except Exception:
+        _handle_serving_error(
+            error_message=(
+                "Failed to parse input as a numpy array. Ensure that the input is a one or two"
+                " dimensional array without Python objects, serialized using `numpy.save()`."),
+            error_code=MALFORMED_REQUEST)
+    columns = None
+    if array.dtype.names is None and schema is not None and schema.has_column_names() and \
+            len(schema.columns) == array.shape[1]:
+        columns = schema.column_names()
+    # Two dimensional arrays are wrapped without copying their data
+    return pd.DataFrame(array, columns=columns)
+
+
+def _predictions_to_dataframe(raw_predictions):
+    if isinstance(raw_predictions, pd.DataFrame):
+        predictions = raw_predictions
+    elif isinstance(raw_predictions, pd.Series):
+        predictions = raw_predictions.to_frame()
+    else:
+        array = np.asarray(raw_predictions)
+        if array.ndim == 1:
+            array = array.reshape(-1, 1)
+        predictions = pd.DataFrame(array)
+    predictions = predictions.copy(deep=False)
+    if list(predictions.columns) == [0]:
+        predictions.columns = ["predictions"]
+    else:
+        # Arrow and Parquet require string column names
+        predictions.columns = [str(c) for c in predictions.columns]
+    return predictions
+
+
+def predictions_to_bytes(raw_predictions, content_type):
+    """
+    Serialize predictions in one of the binary ``RESPONSE_CONTENT_TYPES``. Predictions are
+    serialized as a DataFrame in the Arrow and Parquet formats, where one dimensional predictions
+    form a single ``predictions`` column, and as an array in the ``.npy`` format.
+    """
+    output = BytesIO()
+    if content_type == CONTENT_TYPE_NPY:
+        if isinstance(raw_predictions, (pd.DataFrame, pd.Series)):
+            raw_predictions = raw_predictions.values
+        np.save(output, np.asarray(raw_predictions), allow_pickle=False)
+        return output.getvalue()
+    pa = _import_pyarrow()
+    table = pa.Table.from_pandas(_predictions_to_dataframe(raw_predictions), preserve_index=False)
+    if content_type == CONTENT_TYPE_ARROW_STREAM:
+        writer = pa.ipc.new_stream(output, table.schema)
+        writer.write_table(table)
+        writer.close()
+    elif content_type == CONTENT_TYPE_PARQUET:
+        pa.parquet.write_table(table, output)
+    else:
+        raise MlflowException("Unsupported response content type '%s'" % content_type)
+    return output.getvalue()
+
+
+def _import_orjson():
+    try:
+        import orjson
+        return orjson
+    except ImportError:
+        return None
+
+
+def _dataframe_to_records(df):
+    """
+    Equivalent of ``df.to_dict(orient="records")``, converting whole columns to Python objects
+    rather than one row at a time.
+    """
+    if len(df.columns) == 0:
+        return df.to_dict(orient="records")
+    columns = list(df.columns)
+    values = [df.iloc[:, i].tolist() for i in range(len(columns))]
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+
+def _has_non_finite_objects(values):
+    for value in values:
+        if isinstance(value, (float, np.floating)):
+            if not np.isfinite(value):
+                return True
+        elif isinstance(value, (list, tuple, dict, np.ndarray)):
+            # Nested values are not inspected
+            return True
+    return False
+
+
+def _has_non_finite_floats(predictions):
+    """
+    :return: Whether ``predictions`` may hold NaN or infinite values, including float values of
+             object arrays and columns.
+    """
+    if isinstance(predictions, np.ndarray):
+        if predictions.dtype.kind == "O":
+            return _has_non_finite_objects(predictions.ravel())
+        return predictions.dtype.kind == "f" and not np.isfinite(predictions).all()
+    for _, column in predictions.select_dtypes(include="object").items():
+        if _has_non_finite_objects(column):
+            return True
+    floats = predictions.select_dtypes(include="floating")
+    if len(floats.columns) == 0:
+        return False
+    try:
+        return not np.isfinite(floats.to_numpy(dtype=np.float64)).all()
+    except (TypeError, ValueError):
+        # Missing values of nullable float columns
+        return True
+
+
+def _predictions_to_json_bytes(raw_predictions):
+    """
+    :return: The UTF-8 encoded JSON serialization of ``raw_predictions``, equivalent to the one
+             written by :py:func:`predictions_to_json`.
+    """
+    if isinstance(raw_predictions, pd.Series):
+        raw_predictions = pd.DataFrame(raw_predictions)
+    orjson = _import_orjson()
+    # orjson serializes NaN and infinite values as null, unlike the json module
+    if orjson is not None and isinstance(raw_predictions, (np.ndarray, pd.DataFrame)) \
+            and not _has_non_finite_floats(raw_predictions):
+        try:
+            if isinstance(raw_predictions, np.ndarray) and raw_predictions.dtype.kind in "biuf":
+                array = raw_predictions
+                if array.dtype.kind == "f":
+                    # Floats are serialized with the digits of the Python floats they convert to
+                    array = array.astype(np.float64, copy=False)
+                return orjson.dumps(np.ascontiguousarray(array),
+                                    option=orjson.OPT_SERIALIZE_NUMPY)
+            return orjson.dumps(_get_jsonable_obj(raw_predictions, pandas_orient="records"),
+                                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Values that orjson does not support, such as bytes, are serialized by NumpyEncoder
+            pass
     predictions = _get_jsonable_obj(raw_predictions, pandas_orient="records")
-    json.dump(predictions, output, cls=NumpyEncoder)
+    return json.dumps(predictions, cls=NumpyEncoder).encode("utf-8")
+
+
+def _stream_predictions_json(raw_predictions, chunk_rows=_RESPONSE_CHUNK_ROWS):
+    """
+    Serialize the rows of ``raw_predictions``, a numpy array or pandas DataFrame or Series, as a
+    JSON array ``chunk_rows`` rows at a time.
+
+    :return: Iterator over the bytes of the JSON array. The first chunk of rows is serialized
+             before returning, so that predictions that cannot be serialized raise here rather
+             than after part of the response is sent.
+    """
+    if isinstance(raw_predictions, pd.Series):
+        raw_predictions = pd.DataFrame(raw_predictions)
+    rows = raw_predictions.iloc if isinstance(raw_predictions, pd.DataFrame) else raw_predictions
+
+    def serialize_chunk(start):
+        # Chunks are serialized as JSON arrays, whose brackets are stripped to join them
+        return (b"," if start > 0 else b"[") + \
+            _predictions_to_json_bytes(rows[start:start + chunk_rows])[1:-1]
+
+    first_chunk = serialize_chunk(0)
+    other_chunks = (serialize_chunk(start)
+                    for start in range(chunk_rows, len(raw_predictions), chunk_rows))
+    return itertools.chain([first_chunk], other_chunks, [b"]"])
+
+
+def predictions_to_json(raw_predictions, output):
+    output.write(_predictions_to_json_bytes(raw_predictions).decode("utf-8"))
 
 
 def _handle_serving_error(error_message, error_code, include_traceback=True):
@@ -147,21 +407,193 @@ def _handle_serving_error(error_message, error_code, include_traceback=True):
     reraise(MlflowException, e)
 
 
-def init(model: PyFuncModel):
+def _get_predict_func(model, max_batch_size=None,
+                      max_batch_wait_ms=_DEFAULT_MAX_BATCH_WAIT_MS, metrics=None):
+    """
+    :return: Function scoring the input of a single request with ``model``, in batches with the
+             inputs of concurrent requests if ``max_batch_size`` is specified. The calls to the
+             model are recorded in ``metrics`` if specified.
+    """
+    if metrics is not None:
+        model = metrics.instrument(model)
+    if max_batch_size:
+        from mlflow.pyfunc.scoring_server.batching import BatchingPredictor
+        return BatchingPredictor(model, max_batch_size, max_batch_wait_ms / 1000.0).predict
+    return model.predict
+
+
+def _parse_input(content_type, data, input_schema):
+    """
+    :param content_type: Content type of the request.
+    :param data: Bytes of the request body.
+    :param input_schema: Input schema of the model, or None.
+    :return: The parsed input, or None if ``content_type`` is not supported.
+    """
+    if content_type == CONTENT_TYPE_CSV:
+        return parse_csv_input(csv_input=StringIO(data.decode('utf-8')))
+    elif content_type in [CONTENT_TYPE_JSON, CONTENT_TYPE_JSON_SPLIT_ORIENTED]:
+        return parse_json_input(json_input=data.decode('utf-8'), orient="split",
+                                schema=input_schema)
+    elif content_type == CONTENT_TYPE_JSON_RECORDS_ORIENTED:
+        return parse_json_input(json_input=data.decode('utf-8'), orient="records",
+                                schema=input_schema)
+    elif content_type == CONTENT_TYPE_JSON_SPLIT_NUMPY:
+        return parse_split_oriented_json_input_to_numpy(data.decode('utf-8'))
+    elif content_type == CONTENT_TYPE_ARROW_STREAM:
+        return parse_arrow_input(data)
+    elif content_type == CONTENT_TYPE_PARQUET:
+        return parse_parquet_input(data)
+    elif content_type == CONTENT_TYPE_NPY:
+        return parse_npy_input(data, schema=input_schema)
+    return None
+
+
+@contextmanager
+def _time_stage(metrics, stage):
+    if metrics is None:
+        yield
+    else:
+        with metrics.time_stage(stage):
+            yield
+
+
+def _time_stream(metrics, stage, create_stream):
+    """
+    Call ``create_stream`` and return the iterator it creates, recording the time spent creating
+    the iterator and producing its items as the duration of ``stage`` once the iteration ends. The
+    time spent by the consumer between items, such as sending them to the client, is not recorded.
+    """
+    if metrics is None:
+        return create_stream()
+    start_time = time.time()
+    try:
+        stream = create_stream()
+    except Exception:
+        metrics.observe_stage_duration(stage, time.time() - start_time)
+        raise
+
+    def generate(elapsed):
+        try:
+            while True:
+                start_time = time.time()
+                item = next(stream, None)
+                elapsed += time.time() - start_time
+                if item is None:
+                    return
+                yield item
+        finally:
+            metrics.observe_stage_duration(stage, elapsed)
+
+    return generate(time.time() - start_time)
+
+
+def _score(predict, input_schema, content_type, data, accept_mimetypes, metrics=None):
+    """
+    Score the body of a request to the ``/invocations`` endpoint. This is shared by the WSGI and
+    the ASGI servers.
+
+    :param predict: Function scoring the parsed input.
+    :param input_schema: Input schema of the model, or None.
+    :param content_type: Content type of the request.
+    :param data: Bytes of the request body.
+    :param accept_mimetypes: ``werkzeug.datastructures.MIMEAccept`` parsed from the Accept header
+                             of the request, selecting the content type of the response.
+    :param metrics: Optional :py:class:`mlflow.pyfunc.scoring_server.metrics.ScoringMetrics` in
+                    which to record the time spent parsing the request and serializing the
+                    response.
+    :return: Tuple of the response body, status code and content type. The body of large JSON
+             responses is an iterator over chunks of bytes, to stream them.
+    """
+    try:
+        with _time_stage(metrics, "parse"):
+            parsed_input = _parse_input(content_type, data, input_schema)
+        if parsed_input is None:
+            return (("This predictor only supports the following content types,"
+                     " {supported_content_types}. Got '{received_content_type}'.".format(
+                         supported_content_types=CONTENT_TYPES,
+                         received_content_type=content_type)),
+                    415, 'text/plain')
+
+        # pylint: disable=broad-except
+        try:
+            raw_predictions = predict(parsed_input)
+        except MlflowException as e:
+            _handle_serving_error(
+                error_message=e.message,
+                error_code=BAD_REQUEST,
+                include_traceback=False)
+        except Exception:
+            _handle_serving_error(
+                error_message=(
+                    "Encountered an unexpected error while evaluating the model. Verify"
+                    " that the serialized input Dataframe is compatible with the model for"
+                    " inference."),
+                error_code=BAD_REQUEST)
+        response_content_type = accept_mimetypes.best_match(RESPONSE_CONTENT_TYPES,
+                                                            default=CONTENT_TYPE_JSON)
+        if response_content_type == CONTENT_TYPE_JSON \
+                and isinstance(raw_predictions, (np.ndarray, pd.DataFrame, pd.Series)) \
+                and len(raw_predictions) >= _MIN_STREAMED_ROWS:
+            # Most of the predictions are serialized while the response is sent
+            return (_time_stream(metrics, "serialization",
+                                 lambda: _stream_predictions_json(raw_predictions)),
+                    200, CONTENT_TYPE_JSON)
+        with _time_stage(metrics, "serialization"):
+            if response_content_type != CONTENT_TYPE_JSON:
+                return (predictions_to_bytes(raw_predictions, response_content_type), 200,
+                        response_content_type)
+            return _predictions_to_json_bytes(raw_predictions), 200, CONTENT_TYPE_JSON
+    except MlflowException as e:
+        return e.serialize_as_json(), e.get_http_status_code(), CONTENT_TYPE_JSON
+
+
+def init(model: PyFuncModel, max_batch_size=None, max_batch_wait_ms=_DEFAULT_MAX_BATCH_WAIT_MS,
+         warmup_input=None, warmup_iterations=0, warmup_content_type=CONTENT_TYPE_JSON,
+         enable_metrics=False):
 
     """
     Initialize the server. Loads pyfunc model from the path.
+
+    :param max_batch_size: If specified, the DataFrames of concurrent requests are scored together
+                           in batches of up to this number of rows.
+    :param max_batch_wait_ms: Maximum number of milliseconds for which a request waits for other
+                              requests to batch it with.
+    :param warmup_input: If specified, bytes of a request body that is scored
+                         ``warmup_iterations`` times in the background once the server is
+                         initialized. The server only reports itself healthy once the warm-up is
+                         complete.
+    :param warmup_iterations: Number of times to score ``warmup_input``.
+    :param warmup_content_type: Content type of ``warmup_input``.
+    :param enable_metrics: If True, the server records Prometheus metrics of the requests and
+                           exposes them on its ``/metrics`` endpoint.
     """
     app = flask.Flask(__name__)
     input_schema = model.metadata.get_input_schema()
+    metrics = None
+    if enable_metrics:
+        from mlflow.pyfunc.scoring_server.metrics import ScoringMetrics
+        metrics = ScoringMetrics()
+    predict = _get_predict_func(model, max_batch_size, max_batch_wait_ms, metrics)
+    warm_up = None
+    if warmup_input is not None and warmup_iterations > 0:
+        from mlflow.pyfunc.scoring_server.warmup import WarmUp
+        warm_up = WarmUp(lambda: _score(predict, input_schema, warmup_content_type, warmup_input,
+                                        MIMEAccept(), metrics),
+                         warmup_iterations)
+        warm_up.start()
 
     @app.route('/ping', methods=['GET'])
     def ping():  # pylint: disable=unused-variable
         """
         Determine if the container is working and healthy.
-        We declare it healthy if we can load the model successfully.
+        We declare it healthy if we can load the model successfully, and warm it up if a warm-up
+        is configured.
         """
         health = model is not None
+        if warm_up is not None:
+            status = 200 if health and warm_up.ready.is_set() else 503
+            return flask.Response(response=json.dumps(warm_up.get_status()), status=status,
+                                  mimetype='application/json')
         status = 200 if health else 404
         return flask.Response(response='\n', status=status, mimetype='application/json')
 
@@ -173,47 +605,28 @@ def init(model: PyFuncModel):
         we take data as CSV or json, convert it to a Pandas DataFrame or Numpy,
         generate predictions and convert them back to json.
         """
-        # Convert from CSV to pandas
-        if flask.request.content_type == CONTENT_TYPE_CSV:
-            data = flask.request.data.decode('utf-8')
-            csv_input = StringIO(data)
-            data = parse_csv_input(csv_input=csv_input)
-        elif flask.request.content_type in [CONTENT_TYPE_JSON, CONTENT_TYPE_JSON_SPLIT_ORIENTED]:
-            data = parse_json_input(json_input=flask.request.data.decode('utf-8'),
-                                    orient="split", schema=input_schema)
-        elif flask.request.content_type == CONTENT_TYPE_JSON_RECORDS_ORIENTED:
-            data = parse_json_input(json_input=flask.request.data.decode('utf-8'),
-                                    orient="records", schema=input_schema)
-        elif flask.request.content_type == CONTENT_TYPE_JSON_SPLIT_NUMPY:
-            data = parse_split_oriented_json_input_to_numpy(flask.request.data.decode('utf-8'))
-        else:
-            return flask.Response(
-                response=("This predictor only supports the following content types,"
-                          " {supported_content_types}. Got '{received_content_type}'.".format(
-                            supported_content_types=CONTENT_TYPES,
-                            received_content_type=flask.request.content_type)),
-                status=415,
-                mimetype='text/plain')
-
-        # Do the prediction
-        # pylint: disable=broad-except
-        try:
-            raw_predictions = model.predict(data)
-        except MlflowException as e:
-            _handle_serving_error(
-                error_message=e.message,
-                error_code=BAD_REQUEST,
-                include_traceback=False)
-        except Exception:
-            _handle_serving_error(
-                error_message=(
-                    "Encountered an unexpected error while evaluating the model. Verify"
-                    " that the serialized input Dataframe is compatible with the model for"
-                    " inference."),
-                error_code=BAD_REQUEST)
-        result = StringIO()
-        predictions_to_json(raw_predictions, result)
-        return flask.Response(response=result.getvalue(), status=200, mimetype='application/json')
+        if metrics is None:
+            response, status, mimetype = _score(predict, input_schema,
+                                                flask.request.content_type,
+                                                flask.request.get_data(),
+                                                flask.request.accept_mimetypes)
+            return flask.Response(response=response, status=status, mimetype=mimetype)
+        with metrics.track_in_flight():
+            response, status, mimetype = _score(predict, input_schema,
+                                                flask.request.content_type,
+                                                flask.request.get_data(),
+                                                flask.request.accept_mimetypes, metrics)
+        metrics.record_request(status, flask.request.content_type)
+        return flask.Response(response=response, status=status, mimetype=mimetype)
+
+    if metrics is not None:
+        @app.route('/metrics', methods=['GET'])
+        def prometheus_metrics():  # pylint: disable=unused-variable
+            """
+            Expose the Prometheus metrics of the server.
+            """
+            response, content_type = metrics.generate_latest()
+            return flask.Response(response=response, status=200, content_type=content_type)
 
     return app
 
@@ -227,6 +640,14 @@ def _predict(model_uri, input_path, output_path, content_type, json_format):
         df = parse_json_input(input_path, orient=json_format)
     elif content_type == "csv":
         df = parse_csv_input(input_path)
+    elif content_type in _BINARY_INPUT_PARSERS:
+        if input_path is sys.stdin:
+            binary_input = sys.stdin.buffer.read()
+        else:
+            with open(input_path, "rb") as f:
+                binary_input = f.read()
+        df = _BINARY_INPUT_PARSERS[content_type](binary_input,
+                                                 pyfunc_model.metadata.get_input_schema())
     else:
         raise Exception("Unknown content type '{}'".format(content_type))
 
@@ -237,11 +658,90 @@ def _predict(model_uri, input_path, output_path, content_type, json_format):
             predictions_to_json(pyfunc_model.predict(df), fout)
 
 
+# Parsers of the binary formats accepted by ``mlflow models predict``, taking the input bytes and
+# the input schema of the model
+_BINARY_INPUT_PARSERS = {
+    "arrow": lambda data, schema: parse_arrow_input(data),
+    "parquet": lambda data, schema: parse_parquet_input(data),
+    "npy": parse_npy_input,
+}
+
+
 def _serve(model_uri, port, host):
     pyfunc_model = load_model(model_uri)
     init(pyfunc_model).run(port=port, host=host)
 
 
+def _get_batching_config(env):
+    """
+    :return: Keyword arguments of :py:func:`init` configuring request batching, read from the
+             ``_SERVER_MAX_BATCH_SIZE`` and ``_SERVER_MAX_BATCH_WAIT_MS`` variables of ``env``.
+    """
+    config = {}
+    if env.get(_SERVER_MAX_BATCH_SIZE):
+        config["max_batch_size"] = int(env[_SERVER_MAX_BATCH_SIZE])
+    if env.get(_SERVER_MAX_BATCH_WAIT_MS):
+        config["max_batch_wait_ms"] = float(env[_SERVER_MAX_BATCH_WAIT_MS])
+    return config
+
+
+def _get_metrics_config(env):
+    """
+    :return: Keyword arguments of :py:func:`init` enabling metrics if the
+             ``_SERVER_ENABLE_METRICS`` variable of ``env`` is set to ``true``.
+    """
+    if env.get(_SERVER_ENABLE_METRICS, "").lower() == "true":
+        return {"enable_metrics": True}
+    return {}
+
+
+def _read_warmup_input(model_uri, warmup_input_path=None):
+    """
+    :param model_uri: URI of the served model.
+    :param warmup_input_path: Optional path of a file holding the input of the warm-up requests,
+                              formatted as a JSON pandas DataFrame with the split orient.
+    :return: Tuple of the bytes and the content type of the input of the warm-up requests, which
+             defaults to the input example saved with the model, or None if there is no input.
+    """
+    if warmup_input_path is not None:
+        with open(warmup_input_path, "rb") as f:
+            return f.read(), CONTENT_TYPE_JSON_SPLIT_ORIENTED
+    from mlflow.models import Model
+    from mlflow.models.model import MLMODEL_FILE_NAME
+    from mlflow.tracking.artifact_utils import _download_artifact_from_uri
+    local_path = _download_artifact_from_uri(model_uri)
+    example_info = Model.load(os.path.join(local_path, MLMODEL_FILE_NAME)).saved_input_example_info
+    if example_info is None or example_info.get("type") != "dataframe":
+        return None
+    content_type = CONTENT_TYPE_JSON_RECORDS_ORIENTED \
+        if example_info.get("pandas_orient") == "records" else CONTENT_TYPE_JSON_SPLIT_ORIENTED
+    with open(os.path.join(local_path, example_info["artifact_path"]), "rb") as f:
+        return f.read(), content_type
+
+
+def _get_warmup_config(env):
+    """
+    :return: Keyword arguments of :py:func:`init` configuring the warm-up of the model, read from
+             the ``_SERVER_WARMUP_ITERATIONS`` and ``_SERVER_WARMUP_INPUT_PATH`` variables of
+             ``env``.
+    """
+    iterations = int(env.get(_SERVER_WARMUP_ITERATIONS) or 0)
+    if iterations <= 0:
+        return {}
+    warmup_input = _read_warmup_input(env[_SERVER_MODEL_PATH],
+                                      env.get(_SERVER_WARMUP_INPUT_PATH) or None)
+    if warmup_input is None:
+        _logger.warning("Not warming up the model, since it was saved without an input example "
+                        "and no warm-up input was specified.")
+        return {}
+    data, content_type = warmup_input
+    return {
+        "warmup_input": data,
+        "warmup_iterations": iterations,
+        "warmup_content_type": content_type,
+    }
+
+
 def _get_jsonable_obj(data, pandas_orient="records"):
     """Attempt to make the data json-able via standard library.
     Look for some commonly used types that are not jsonable and convert them into json-able ones.
@@ -253,9 +753,11 @@ def _get_jsonable_obj(data, pandas_orient="records"):
     """
     if isinstance(data, np.ndarray):
         return data.tolist()
+    if isinstance(data, pd.Series):
+        data = pd.DataFrame(data)
     if isinstance(data, pd.DataFrame):
+        if pandas_orient == "records":
+            return _dataframe_to_records(data)
         return data.to_dict(orient=pandas_orient)
-    if isinstance(data, pd.Series):
-        return pd.DataFrame(data).to_dict(orient=pandas_orient)
     else:  # by default just return whatever this is and hope for the best
         return data
@@ -0,0 +1,11 @@
+import os
+from mlflow.pyfunc import scoring_server
+from mlflow.pyfunc import load_model
+from mlflow.pyfunc.scoring_server import async_server
+
+
+app = async_server.init(load_model(os.environ[scoring_server._SERVER_MODEL_PATH]),
+                        **scoring_server._get_batching_config(os.environ),
+                        **scoring_server._get_warmup_config(os.environ),
+                        **scoring_server._get_metrics_config(os.environ),
+                        **async_server._get_async_config(os.environ))
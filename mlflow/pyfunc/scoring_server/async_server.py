@@ -0,0 +1,328 @@
+"""
+ASGI scoring server for python models, an alternative to the WSGI server defined by
+:py:mod:`mlflow.pyfunc.scoring_server`.
+
+The model is loaded once per server process, whose event loop handles the I/O of all requests
+concurrently, and requests are scored on an executor:
+
+- The ``thread`` executor scores requests on a pool of threads sharing the model. This suits
+  models whose inference releases the GIL, as most numerical libraries do.
+- The ``process`` executor scores requests on a pool of processes forked from the server process
+  once the model is loaded, so that the memory of the model is shared copy-on-write by all the
+  processes instead of being loaded by each of them. Requests are sent to the processes as raw
+  bytes and parsed there. This executor requires the ``fork`` start method, which is not
+  available on Windows.
+
+The number of requests being scored or waiting to be scored is capped: once the cap is reached,
+requests are rejected with a ``503`` status until pending requests complete. Requests that are not
+scored within the request timeout are answered with a ``504`` status. On shutdown, the server
+stops accepting requests and waits for the pending requests to complete.
+
+If metrics are enabled, they are exposed on the ``/metrics`` endpoint. The metrics of requests
+scored by the ``process`` executor are recorded by its processes, and are only reported if the
+``prometheus_multiproc_dir`` environment variable is set (see
+:py:mod:`mlflow.pyfunc.scoring_server.metrics`).
+
+The ASGI application is served by `uvicorn <https://www.uvicorn.org/>`_, which is not installed
+with MLflow.
+"""
+import asyncio
+import gc
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from functools import partial
+
+from werkzeug.datastructures import MIMEAccept
+from werkzeug.http import parse_accept_header
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import ENDPOINT_NOT_FOUND, INVALID_PARAMETER_VALUE, \
+    TEMPORARILY_UNAVAILABLE
+from mlflow.pyfunc import scoring_server
+
+_logger = logging.getLogger(__name__)
+
+_SERVER_INFERENCE_EXECUTOR = "__pyfunc_inference_executor__"
+_SERVER_INFERENCE_WORKERS = "__pyfunc_inference_workers__"
+_SERVER_REQUEST_TIMEOUT = "__pyfunc_request_timeout__"
+_SERVER_MAX_PENDING_REQUESTS = "__pyfunc_max_pending_requests__"
+
+THREAD_EXECUTOR = "thread"
+PROCESS_EXECUTOR = "process"
+INFERENCE_EXECUTORS = [THREAD_EXECUTOR, PROCESS_EXECUTOR]
+
+_DEFAULT_REQUEST_TIMEOUT = 60
+_DEFAULT_MAX_PENDING_REQUESTS = 128
+
+# Scoring function of the processes of the process executor, set before forking them
+_forked_score = None
+
+
+def _score_request(score, content_type, accept_header, data):
+    response, status, content_type = score(content_type, data,
+                                           parse_accept_header(accept_header, MIMEAccept))
+    if not isinstance(response, (bytes, str)):
+        # Streamed responses are joined, since they are sent back to the event loop in one piece
+        response = b"".join(response)
+    return response, status, content_type
+
+
+def _score_request_in_forked_process(content_type, accept_header, data):
+    return _score_request(_forked_score, content_type, accept_header, data)
+
+
+def _create_executor(executor, workers, score):
+    """
+    :return: Tuple of the executor on which to score requests, and of the function to submit to
+             it, taking the content type, Accept header and body of a request and returning the
+             response body, status code and content type.
+    """
+    if executor == THREAD_EXECUTOR:
+        return (ThreadPoolExecutor(max_workers=workers),
+                partial(_score_request, score))
+    if executor == PROCESS_EXECUTOR:
+        try:
+            mp_context = multiprocessing.get_context("fork")
+        except ValueError:
+            raise MlflowException("The '%s' inference executor is not supported on this platform, "
+                                  "use the '%s' executor instead."
+                                  % (PROCESS_EXECUTOR, THREAD_EXECUTOR),
+                                  error_code=INVALID_PARAMETER_VALUE)
+        global _forked_score
+        _forked_score = score
+        if hasattr(gc, "freeze"):
+            # Objects that exist before forking are moved out of the garbage collector's reach, so
+            # that collections in the forked processes do not copy the pages holding the model
+            gc.freeze()
+        return (ProcessPoolExecutor(max_workers=workers, mp_context=mp_context),
+                _score_request_in_forked_process)
+    raise MlflowException("Unknown inference executor '%s'. Supported executors are %s."
+                          % (executor, INFERENCE_EXECUTORS), error_code=INVALID_PARAMETER_VALUE)
+
+
+class ScoringApp(object):
+    """
+    ASGI application serving the ``/ping`` and ``/invocations`` endpoints of the scoring server.
+    """
+
+    def __init__(self, model, executor=THREAD_EXECUTOR, workers=None,
+                 request_timeout=_DEFAULT_REQUEST_TIMEOUT,
+                 max_pending_requests=_DEFAULT_MAX_PENDING_REQUESTS, max_batch_size=None,
+                 max_batch_wait_ms=scoring_server._DEFAULT_MAX_BATCH_WAIT_MS, warmup_input=None,
+                 warmup_iterations=0, warmup_content_type=scoring_server.CONTENT_TYPE_JSON,
+                 enable_metrics=False):
+        """
+        :param model: :py:class:`mlflow.pyfunc.PyFuncModel` to serve.
+        :param executor: Executor on which to score requests, ``thread`` or ``process``.
+        :param workers: Number of threads or processes of the executor. Defaults to the number of
+                        CPUs.
+        :param request_timeout: Number of seconds after which requests that have not been scored
+                                are answered with a ``504`` status.
+        :param max_pending_requests: Maximum number of requests being scored or waiting to be
+                                     scored, above which requests are answered with a ``503``
+                                     status.
+        :param max_batch_size: If specified, the DataFrames of concurrent requests are scored
+                               together in batches of up to this number of rows.
+        :param max_batch_wait_ms: Maximum number of milliseconds for which a request waits for
+                                  other requests to batch it with.
+        :param warmup_input: If specified, bytes of a request body that is scored
+                             ``warmup_iterations`` times on the executor once the application is
+                             initialized. The ``/ping`` endpoint only reports the server healthy
+                             once the warm-up is complete.
+        :param warmup_iterations: Number of times to score ``warmup_input``.
+        :param warmup_content_type: Content type of ``warmup_input``.
+        :param enable_metrics: If True, the application records Prometheus metrics of the requests
+                               and exposes them on its ``/metrics`` endpoint.
+        """
+        self.model = model
+        self.request_timeout = request_timeout
+        self.max_pending_requests = max_pending_requests
+        self._metrics = None
+        if enable_metrics:
+            from mlflow.pyfunc.scoring_server.metrics import ScoringMetrics
+            self._metrics = ScoringMetrics()
+        score = partial(scoring_server._score,
+                        scoring_server._get_predict_func(model, max_batch_size, max_batch_wait_ms,
+                                                         self._metrics),
+                        model.metadata.get_input_schema(), metrics=self._metrics)
+        workers = workers or os.cpu_count()
+        self._executor, self._score = _create_executor(executor, workers, score)
+        self._warm_up = None
+        if warmup_input is not None and warmup_iterations > 0:
+            from mlflow.pyfunc.scoring_server.warmup import WarmUp
+            # Warm-up requests are scored concurrently, so that each thread or process of the
+            # executor is likely to score some of them
+            self._warm_up = WarmUp(
+                lambda: self._executor.submit(self._score, warmup_content_type, "",
+                                              warmup_input).result(),
+                warmup_iterations, concurrency=workers)
+            self._warm_up.start()
+        self._num_pending_requests = 0
+        self._shutting_down = False
+        self._no_pending_requests = None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._handle_lifespan(receive, send)
+        elif scope["type"] == "http":
+            if scope["path"] == "/ping" and scope["method"] == "GET":
+                await self._handle_ping(send)
+            elif scope["path"] == "/invocations" and scope["method"] == "POST":
+                await self._handle_invocations(scope, receive, send)
+            elif scope["path"] == "/metrics" and scope["method"] == "GET" \
+                    and self._metrics is not None:
+                response, content_type = self._metrics.generate_latest()
+                await _send_response(send, response, 200, content_type)
+            else:
+                await _send_error(send, MlflowException(
+                    "No endpoint %s %s" % (scope["method"], scope["path"]),
+                    error_code=ENDPOINT_NOT_FOUND))
+
+    async def _handle_ping(self, send):
+        if self._warm_up is None:
+            await _send_response(send, b"\n", 200, scoring_server.CONTENT_TYPE_JSON)
+            return
+        status = 200 if self._warm_up.ready.is_set() else 503
+        await _send_response(send, json.dumps(self._warm_up.get_status()), status,
+                             scoring_server.CONTENT_TYPE_JSON)
+
+    async def _handle_lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def shutdown(self):
+        """
+        Stop accepting requests, wait for at most ``request_timeout`` seconds for the pending
+        requests to complete and shut the executor down.
+        """
+        self._shutting_down = True
+        if self._num_pending_requests > 0:
+            self._no_pending_requests = asyncio.Event()
+            try:
+                await asyncio.wait_for(self._no_pending_requests.wait(), self.request_timeout)
+            except asyncio.TimeoutError:
+                _logger.warning("Shutting down with %s pending requests",
+                                self._num_pending_requests)
+        self._executor.shutdown(wait=False)
+
+    async def _handle_invocations(self, scope, receive, send):
+        if self._metrics is None:
+            await self._score_invocation(scope, receive, send)
+            return
+        content_type = dict(scope["headers"]).get(b"content-type", b"").decode("latin-1")
+        sent = {}
+
+        async def send_and_record_status(message):
+            if message["type"] == "http.response.start":
+                sent["status"] = message["status"]
+            await send(message)
+
+        with self._metrics.track_in_flight():
+            await self._score_invocation(scope, receive, send_and_record_status)
+        if "status" in sent:
+            self._metrics.record_request(sent["status"], content_type)
+
+    async def _score_invocation(self, scope, receive, send):
+        if self._shutting_down:
+            await _send_error(send, MlflowException("The server is shutting down.",
+                                                    error_code=TEMPORARILY_UNAVAILABLE))
+            return
+        if self._num_pending_requests >= self.max_pending_requests:
+            await _send_error(send, MlflowException(
+                "The server is handling the maximum number of %s pending requests, retry later."
+                % self.max_pending_requests, error_code=TEMPORARILY_UNAVAILABLE),
+                headers=[(b"retry-after", b"1")])
+            return
+        self._num_pending_requests += 1
+        try:
+            headers = dict(scope["headers"])
+            data = await _read_body(receive)
+            if data is None:
+                return
+            future = asyncio.get_event_loop().run_in_executor(
+                self._executor, self._score,
+                headers.get(b"content-type", b"").decode("latin-1") or None,
+                headers.get(b"accept", b"").decode("latin-1"), data)
+            try:
+                response, status, content_type = await asyncio.wait_for(future,
+                                                                        self.request_timeout)
+            except asyncio.TimeoutError:
+                await _send_error(send, MlflowException(
+                    "The request was not scored within %s seconds." % self.request_timeout,
+                    error_code=TEMPORARILY_UNAVAILABLE), status=504)
+                return
+            await _send_response(send, response, status, content_type)
+        finally:
+            self._num_pending_requests -= 1
+            if self._num_pending_requests == 0 and self._no_pending_requests is not None:
+                self._no_pending_requests.set()
+
+
+async def _read_body(receive):
+    """
+    :return: The bytes of the request body, or None if the client disconnected.
+    """
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return None
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            return b"".join(chunks)
+
+
+async def _send_response(send, body, status, content_type, headers=None):
+    if not isinstance(body, bytes):
+        body = body.encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", content_type.encode("latin-1")),
+                    (b"content-length", str(len(body)).encode("latin-1"))] + (headers or []),
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _send_error(send, exception, status=None, headers=None):
+    await _send_response(send, exception.serialize_as_json(),
+                         status or exception.get_http_status_code(),
+                         scoring_server.CONTENT_TYPE_JSON, headers)
+
+
+def init(model, **kwargs):
+    """
+    Initialize the ASGI server.
+
+    :param model: :py:class:`mlflow.pyfunc.PyFuncModel` to serve.
+    :param kwargs: Keyword arguments of :py:class:`ScoringApp`.
+    :return: The ASGI application.
+    """
+    return ScoringApp(model, **kwargs)
+
+
+def _get_async_config(env):
+    """
+    :return: Keyword arguments of :py:class:`ScoringApp` read from the ``_SERVER_INFERENCE_*``,
+             ``_SERVER_REQUEST_TIMEOUT`` and ``_SERVER_MAX_PENDING_REQUESTS`` variables of
+             ``env``.
+    """
+    config = {}
+    if env.get(_SERVER_INFERENCE_EXECUTOR):
+        config["executor"] = env[_SERVER_INFERENCE_EXECUTOR]
+    if env.get(_SERVER_INFERENCE_WORKERS):
+        config["workers"] = int(env[_SERVER_INFERENCE_WORKERS])
+    if env.get(_SERVER_REQUEST_TIMEOUT):
+        config["request_timeout"] = float(env[_SERVER_REQUEST_TIMEOUT])
+    if env.get(_SERVER_MAX_PENDING_REQUESTS):
+        config["max_pending_requests"] = int(env[_SERVER_MAX_PENDING_REQUESTS])
+    return config
@@ -0,0 +1,155 @@
+"""
+Dynamic batching of the prediction requests handled concurrently by a scoring server process.
+Requests are queued, and a background thread concatenates the queued input DataFrames into a
+single DataFrame, scores it with a single ``predict`` call and splits the predictions back into
+per-request results.
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import numpy as np
+import pandas as pd
+from six.moves import queue
+
+_logger = logging.getLogger(__name__)
+
+
+class _PendingRequest(object):
+    def __init__(self, data):
+        self.data = data
+        self.future = Future()
+
+
+def _split_predictions(predictions, num_rows):
+    """
+    Split the predictions of a batch into the predictions of each of the batched requests.
+
+    :param predictions: Predictions returned by the model for the concatenated input.
+    :param num_rows: Number of input rows of each request of the batch.
+    :return: List of the predictions of each request.
+    """
+    if isinstance(predictions, (pd.DataFrame, pd.Series)):
+        rows = predictions.iloc
+    elif isinstance(predictions, (np.ndarray, list)):
+        rows = predictions
+    else:
+        raise TypeError("Predictions of type %s cannot be split by input row" %
+                        type(predictions))
+    if len(predictions) != sum(num_rows):
+        raise ValueError("Expected one prediction per input row, got %s predictions for %s rows"
+                         % (len(predictions), sum(num_rows)))
+    results = []
+    start = 0
+    for n in num_rows:
+        results.append(rows[start:start + n])
+        start += n
+    return results
+
+
+class BatchingPredictor(object):
+    """
+    Scores the pandas DataFrames passed to :py:meth:`predict` by concurrent threads in batches.
+
+    A batch is scored once it holds at least ``max_batch_size`` rows, or ``max_batch_wait``
+    seconds after its first request was queued. Requests whose inputs have different columns or
+    column types are scored in separate ``predict`` calls. If scoring a batch fails, or if its
+    predictions do not have one row per input row, each of its requests is scored separately, so
+    that an invalid request does not fail the other requests of its batch.
+    """
+
+    def __init__(self, model, max_batch_size, max_batch_wait):
+        """
+        :param model: Model with a ``predict`` method, typically a
+                      :py:class:`mlflow.pyfunc.PyFuncModel`.
+        :param max_batch_size: Number of rows at which a batch is scored without further waiting.
+        :param max_batch_wait: Maximum number of seconds to wait for other requests after the
+                               first request of a batch was queued.
+        """
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_batch_wait = max_batch_wait
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def predict(self, data):
+        """
+        Score ``data`` as part of a batch, blocking until its predictions are available. Inputs
+        other than pandas DataFrames are scored immediately.
+
+        :return: The predictions of the model for ``data``. Raises the exception raised by the
+                 model, if any.
+        """
+        if not isinstance(data, pd.DataFrame):
+            return self.model.predict(data)
+        request = _PendingRequest(data)
+        self._start_thread_if_necessary()
+        self._queue.put(request)
+        return request.future.result()
+
+    def _start_thread_if_necessary(self):
+        # The thread is started lazily, since it would not survive the fork of a server worker
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="MlflowBatchingPredictor")
+                self._thread.daemon = True
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            requests = [self._queue.get()]
+            num_rows = len(requests[0].data)
+            deadline = time.time() + self.max_batch_wait
+            while num_rows < self.max_batch_size:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                requests.append(request)
+                num_rows += len(request.data)
+            # pylint: disable=broad-except
+            try:
+                self._predict_batch(requests)
+            except Exception as e:
+                # Fail the requests left without a result rather than the thread, whose death
+                # would leave them and all the following requests waiting forever
+                _logger.exception("Failed to score a batch of %s requests", len(requests))
+                for request in requests:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+
+    def _predict_batch(self, requests):
+        groups = OrderedDict()
+        for request in requests:
+            key = tuple(zip(request.data.columns, request.data.dtypes))
+            groups.setdefault(key, []).append(request)
+        for group in groups.values():
+            if len(group) == 1:
+                self._predict_request(group[0])
+                continue
+            # pylint: disable=broad-except
+            try:
+                data = pd.concat([request.data for request in group], ignore_index=True)
+                results = _split_predictions(self.model.predict(data),
+                                             [len(request.data) for request in group])
+            except Exception as e:
+                _logger.debug("Failed to score a batch of %s requests, scoring them separately: "
+                              "%s", len(group), e)
+                for request in group:
+                    self._predict_request(request)
+            else:
+                for request, result in zip(group, results):
+                    request.future.set_result(result)
+
+    def _predict_request(self, request):
+        # pylint: disable=broad-except
+        try:
+            request.future.set_result(self.model.predict(request.data))
+        except Exception as e:
+            request.future.set_exception(e)
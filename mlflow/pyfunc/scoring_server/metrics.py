@@ -0,0 +1,164 @@
+"""
+Prometheus metrics of the scoring server, exposed on its ``/metrics`` endpoint.
+
+The metrics break the latency of requests down into the stages of scoring them: parsing the
+request body, enforcing the input schema of the model, calling the model's ``predict`` method and
+serializing the predictions. They also count requests by status and content type, and track the
+number of requests in flight and the number of rows scored by each call to ``predict``, which is
+the size of the batches of concurrent requests if request batching is enabled.
+
+When the server runs several processes, the ``prometheus_multiproc_dir`` environment variable must
+point to a directory shared by the processes, in which each process writes its metrics and from
+which the ``/metrics`` endpoint aggregates the metrics of all processes. The variable must be set
+before the processes start.
+"""
+import copy
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, generate_latest, \
+    CONTENT_TYPE_LATEST
+from prometheus_client.multiprocess import MultiProcessCollector
+
+from mlflow.pyfunc.scoring_server import CONTENT_TYPES
+
+# Directory of the metrics of the server processes, named as for the tracking server. Recent
+# versions of prometheus_client prefer the upper case name when both are set.
+PROMETHEUS_MULTIPROC_DIR_ENV_VAR = "prometheus_multiproc_dir"
+_PROMETHEUS_MULTIPROC_DIR_ENV_VARS = ["PROMETHEUS_MULTIPROC_DIR", PROMETHEUS_MULTIPROC_DIR_ENV_VAR]
+
+_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+                    5.0, 10.0, float("inf"))
+_BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 4096, 16384, 65536,
+                       float("inf"))
+
+
+def _get_multiproc_dir(env=os.environ):
+    for env_var in _PROMETHEUS_MULTIPROC_DIR_ENV_VARS:
+        if env.get(env_var):
+            return env[env_var]
+    return None
+
+
+def _set_default_multiproc_dir(env):
+    """
+    Point the ``prometheus_multiproc_dir`` variable of ``env``, the environment of the processes of
+    a server, to a new temporary directory if no directory is set.
+    """
+    if _get_multiproc_dir(env) is None:
+        env[PROMETHEUS_MULTIPROC_DIR_ENV_VAR] = tempfile.mkdtemp(prefix="mlflow-scoring-metrics-")
+
+
+class ScoringMetrics(object):
+    """
+    Prometheus metrics of a scoring server process, registered in a registry of their own so that
+    several servers can be initialized in the same process.
+    """
+
+    def __init__(self, per_model=False):
+        """
+        :param per_model: If True, the metrics are labeled with the name of the model they
+                          relate to, for servers hosting several models. The metrics of a model
+                          are then recorded through :py:meth:`for_model`.
+        """
+        self.registry = CollectorRegistry()
+        model_labels = ["model"] if per_model else []
+        self.requests = Counter(
+            "mlflow_scoring_requests", "Number of requests to the /invocations endpoint, by "
+            "response status and request content type.", model_labels + ["status", "content_type"],
+            registry=self.registry)
+        self.stage_duration = Histogram(
+            "mlflow_scoring_stage_duration_seconds", "Time spent in each stage of scoring the "
+            "requests to the /invocations endpoint.", model_labels + ["stage"],
+            buckets=_LATENCY_BUCKETS, registry=self.registry)
+        self.requests_in_flight = Gauge(
+            "mlflow_scoring_requests_in_flight", "Number of requests to the /invocations endpoint "
+            "being handled.", model_labels, multiprocess_mode="livesum", registry=self.registry)
+        self.batch_size = Histogram(
+            "mlflow_scoring_batch_size", "Number of rows scored by each call to the predict "
+            "method of the model.", model_labels, buckets=_BATCH_SIZE_BUCKETS,
+            registry=self.registry)
+        self._labels = {}
+
+    def for_model(self, model):
+        """
+        :return: View of these metrics recording the metrics of ``model``, if they are labeled
+                 by model.
+        """
+        metrics = copy.copy(self)
+        metrics._labels = {"model": model}
+        return metrics
+
+    def _labeled(self, metric, **labels):
+        labels.update(self._labels)
+        return metric.labels(**labels) if labels else metric
+
+    def track_in_flight(self):
+        """
+        Context manager counting its body as a request in flight.
+        """
+        return self._labeled(self.requests_in_flight).track_inprogress()
+
+    def observe_batch_size(self, num_rows):
+        self._labeled(self.batch_size).observe(num_rows)
+
+    @contextmanager
+    def time_stage(self, stage):
+        """
+        Context manager recording the time spent in its body as the duration of ``stage``, one
+        of ``parse``, ``schema_enforcement``, ``predict`` and ``serialization``.
+        """
+        start_time = time.time()
+        try:
+            yield
+        finally:
+            self.observe_stage_duration(stage, time.time() - start_time)
+
+    def observe_stage_duration(self, stage, seconds):
+        self._labeled(self.stage_duration, stage=stage).observe(seconds)
+
+    def record_request(self, status, content_type):
+        # Content types sent by clients are not bounded, so unsupported ones share a label value
+        content_type = content_type if content_type in CONTENT_TYPES else "other"
+        self._labeled(self.requests, status=str(status), content_type=content_type).inc()
+
+    def instrument(self, model):
+        """
+        :return: Wrapper of ``model`` whose ``predict`` method records the number of rows it
+                 scores and the time spent in schema enforcement and in the model.
+        """
+        return _InstrumentedModel(model, self)
+
+    def generate_latest(self):
+        """
+        :return: Tuple of the metrics in the Prometheus text format, aggregated across the
+                 processes of the server if it runs several processes, and of their content type.
+        """
+        multiproc_dir = _get_multiproc_dir()
+        if multiproc_dir is None:
+            return generate_latest(self.registry), CONTENT_TYPE_LATEST
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry, path=multiproc_dir)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+class _InstrumentedModel(object):
+    def __init__(self, model, metrics):
+        self.model = model
+        self.metrics = metrics
+
+    def predict(self, data):
+        self.metrics.observe_batch_size(len(data))
+        model_impl = getattr(self.model, "_model_impl", None)
+        if model_impl is None:
+            with self.metrics.time_stage("predict"):
+                return self.model.predict(data)
+        # Mirrors PyFuncModel.predict, timing its two steps separately
+        schema_enforcer = getattr(self.model, "_schema_enforcer", None)
+        if schema_enforcer is not None:
+            with self.metrics.time_stage("schema_enforcement"):
+                data = schema_enforcer.enforce(data)
+        with self.metrics.time_stage("predict"):
+            return model_impl.predict(data)
@@ -0,0 +1,350 @@
+"""
+Scoring server hosting several models in each server process.
+
+Models are named by their path relative to a root URI, for example ``my-model/3`` for the model
+version ``models:/my-model/3`` under the ``models:/`` root, or ``customer-42`` for a model saved at
+``/srv/models/customer-42`` under the ``/srv/models`` root. The server serves the
+``/invocations/<model name>`` endpoint of each model, and loads models on their first request into
+a cache of recently used models. Once the cache holds more than a maximum number of models, or
+models whose artifacts exceed a maximum size on disk, the least recently used models are evicted.
+The size of the artifacts of a model is a proxy for the memory it uses once loaded. The artifacts
+of an evicted model are deleted once the requests scoring it complete.
+
+All the models are served from the Python environment of the server.
+"""
+import json
+import logging
+import os
+import posixpath
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import flask
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, RESOURCE_DOES_NOT_EXIST
+from mlflow.pyfunc import scoring_server
+from mlflow.server.handlers import catch_mlflow_exception
+from mlflow.tracking.artifact_utils import _download_artifact_from_uri
+
+_logger = logging.getLogger(__name__)
+
+_SERVER_MODELS_ROOT_URI = "__pyfunc_models_root_uri__"
+_SERVER_MAX_MODELS = "__pyfunc_max_models__"
+_SERVER_MAX_MODELS_SIZE_MB = "__pyfunc_max_models_size_mb__"
+_SERVER_PRELOAD_MODELS = "__pyfunc_preload_models__"
+
+
+def _get_dir_size(path):
+    size = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            size += os.path.getsize(os.path.join(root, name))
+    return size
+
+
+class _LoadedModel(object):
+    def __init__(self, model, local_dir, size):
+        self.model = model
+        self.input_schema = model.metadata.get_input_schema()
+        self.local_dir = local_dir
+        self.size = size
+        # Number of requests using the model, and whether the model was evicted from the cache,
+        # guarded by the lock of the cache
+        self.users = 0
+        self.evicted = False
+
+
+class ModelCache(object):
+    """
+    Cache of the models served by a multi-model scoring server, loading models on their first
+    request and evicting the least recently used models.
+    """
+
+    def __init__(self, models_root_uri, max_models=None, max_size_bytes=None, metrics=None):
+        """
+        :param models_root_uri: URI under which the models are named by their relative path,
+                                such as ``models:/``.
+        :param max_models: Maximum number of models to keep loaded.
+        :param max_size_bytes: Maximum total size of the artifacts of the loaded models.
+        :param metrics: Optional :py:class:`mlflow.pyfunc.scoring_server.metrics.ScoringMetrics`
+                        in which to record the loads and evictions of models.
+        """
+        self.models_root_uri = models_root_uri
+        self.max_models = max_models
+        self.max_size_bytes = max_size_bytes
+        self._models = OrderedDict()
+        self._lock = threading.Lock()
+        # Locks of the models being loaded, so that concurrent requests to a model load it once
+        # without blocking the requests to other models
+        self._load_locks = {}
+        self._metrics = None
+        if metrics is not None:
+            from prometheus_client import Counter, Gauge, Histogram
+            self._metrics = {
+                "loads": Counter("mlflow_scoring_model_loads", "Number of models loaded.",
+                                 registry=metrics.registry),
+                "evictions": Counter("mlflow_scoring_model_evictions",
+                                     "Number of models evicted from the model cache.",
+                                     registry=metrics.registry),
+                "loaded": Gauge("mlflow_scoring_models_loaded", "Number of models loaded.",
+                                multiprocess_mode="livesum", registry=metrics.registry),
+                "load_duration": Histogram("mlflow_scoring_model_load_duration_seconds",
+                                           "Time spent loading models.",
+                                           registry=metrics.registry),
+            }
+
+    def get_model_uri(self, name):
+        segments = name.split("/")
+        if any(segment in ["", ".", ".."] for segment in segments):
+            raise MlflowException("Invalid model name '%s'." % name,
+                                  error_code=INVALID_PARAMETER_VALUE)
+        root_uri = self.models_root_uri
+        separator = "" if root_uri.endswith("/") else "/"
+        return root_uri + separator + posixpath.join(*segments)
+
+    def get(self, name):
+        """
+        :return: The loaded model named ``name``, loading it if it is not loaded. The artifacts of
+                 the model are deleted as soon as it is evicted, so requests scoring the model
+                 must use :py:meth:`use` instead.
+        """
+        return self._get(name, use=False)
+
+    @contextmanager
+    def use(self, name):
+        """
+        Context manager yielding the loaded model named ``name``, loading it if it is not loaded.
+        The artifacts of the model are not deleted before the context exits, even if the model is
+        evicted in the meantime.
+        """
+        loaded_model = self._get(name, use=True)
+        try:
+            yield loaded_model
+        finally:
+            with self._lock:
+                loaded_model.users -= 1
+                delete = loaded_model.evicted and loaded_model.users == 0
+            if delete:
+                shutil.rmtree(loaded_model.local_dir, ignore_errors=True)
+
+    def _get_loaded(self, name, use):
+        # Must be called with self._lock held
+        loaded_model = self._models.get(name)
+        if loaded_model is not None:
+            self._models.move_to_end(name)
+            if use:
+                loaded_model.users += 1
+        return loaded_model
+
+    def _get(self, name, use):
+        with self._lock:
+            loaded_model = self._get_loaded(name, use)
+            if loaded_model is not None:
+                return loaded_model
+            load_lock = self._load_locks.setdefault(name, threading.Lock())
+        with load_lock:
+            with self._lock:
+                loaded_model = self._get_loaded(name, use)
+                if loaded_model is not None:
+                    return loaded_model
+            try:
+                loaded_model = self._load(name)
+            except Exception:
+                with self._lock:
+                    self._load_locks.pop(name, None)
+                raise
+            # The model is inserted with the same acquisition of the lock that removes its load
+            # lock, so that every request finds either of them and none loads the model again
+            with self._lock:
+                self._load_locks.pop(name, None)
+                self._models[name] = loaded_model
+                if use:
+                    loaded_model.users += 1
+                evicted = self._evict()
+                unused = [m for m in evicted if m.users == 0]
+        for evicted_model in unused:
+            shutil.rmtree(evicted_model.local_dir, ignore_errors=True)
+        if self._metrics is not None:
+            self._metrics["evictions"].inc(len(evicted))
+            self._metrics["loaded"].inc(1 - len(evicted))
+        return loaded_model
+
+    def list_models(self):
+        """
+        :return: Names of the loaded models, from the least to the most recently used.
+        """
+        with self._lock:
+            return list(self._models)
+
+    def _load(self, name):
+        from mlflow.pyfunc import load_model
+        model_uri = self.get_model_uri(name)
+        start_time = time.time()
+        # Models are downloaded to a directory of their own, which is deleted once they are evicted
+        local_dir = tempfile.mkdtemp(prefix="mlflow-model-")
+        try:
+            local_path = _download_artifact_from_uri(model_uri, output_path=local_dir)
+            model = load_model(local_path)
+        except FileNotFoundError:
+            # Other errors, such as failures to connect to the artifact store, are not reported
+            # as missing models
+            shutil.rmtree(local_dir, ignore_errors=True)
+            raise MlflowException("Model '%s' not found at '%s'." % (name, model_uri),
+                                  error_code=RESOURCE_DOES_NOT_EXIST)
+        except Exception:
+            shutil.rmtree(local_dir, ignore_errors=True)
+            raise
+        loaded_model = _LoadedModel(model, local_dir, _get_dir_size(local_dir))
+        _logger.info("Loaded model '%s' from '%s' in %.3f seconds", name, model_uri,
+                     time.time() - start_time)
+        if self._metrics is not None:
+            self._metrics["loads"].inc()
+            self._metrics["load_duration"].observe(time.time() - start_time)
+        return loaded_model
+
+    def _evict(self):
+        """
+        Evict the least recently used models until the cache is within its limits, keeping at
+        least the most recently used model.
+
+        :return: The evicted models.
+        """
+        evicted = []
+        total_size = sum(m.size for m in self._models.values())
+        while len(self._models) > 1 and (
+                (self.max_models is not None and len(self._models) > self.max_models) or
+                (self.max_size_bytes is not None and total_size > self.max_size_bytes)):
+            name, loaded_model = self._models.popitem(last=False)
+            _logger.info("Evicting model '%s'", name)
+            loaded_model.evicted = True
+            total_size -= loaded_model.size
+            evicted.append(loaded_model)
+        return evicted
+
+
+def init(models_root_uri, max_models=None, max_size_bytes=None, preload=None,
+         enable_metrics=False):
+    """
+    Initialize the multi-model server.
+
+    :param models_root_uri: URI under which the models are named by their relative path, such as
+                            ``models:/``.
+    :param max_models: Maximum number of models to keep loaded.
+    :param max_size_bytes: Maximum total size of the artifacts of the loaded models.
+    :param preload: Optional list of the names of models to load before serving requests.
+    :param enable_metrics: If True, the server records Prometheus metrics of the requests to each
+                           model and exposes them on its ``/metrics`` endpoint.
+    :return: The Flask application.
+    """
+    app = flask.Flask(__name__)
+    metrics = None
+    if enable_metrics:
+        from mlflow.pyfunc.scoring_server.metrics import ScoringMetrics
+        metrics = ScoringMetrics(per_model=True)
+    model_cache = ModelCache(models_root_uri, max_models, max_size_bytes, metrics)
+    for name in preload or []:
+        model_cache.get(name)
+
+    @app.route('/ping', methods=['GET'])
+    def ping():  # pylint: disable=unused-variable
+        """
+        Determine if the server is working and healthy.
+        """
+        return flask.Response(response='\n', status=200, mimetype='application/json')
+
+    @app.route('/models', methods=['GET'])
+    def models():  # pylint: disable=unused-variable
+        """
+        List the loaded models, from the least to the most recently used.
+        """
+        return flask.Response(response=json.dumps({"models": model_cache.list_models()}),
+                              status=200, mimetype='application/json')
+
+    @app.route('/invocations/<path:name>', methods=['POST'])
+    @catch_mlflow_exception
+    def transformation(name):  # pylint: disable=unused-variable
+        """
+        Score a batch of data with the model named ``name``.
+        """
+        with model_cache.use(name) as loaded_model:
+            if metrics is None:
+                response, status, mimetype = scoring_server._score(
+                    loaded_model.model.predict, loaded_model.input_schema,
+                    flask.request.content_type, flask.request.get_data(),
+                    flask.request.accept_mimetypes)
+                return flask.Response(response=response, status=status, mimetype=mimetype)
+            model_metrics = metrics.for_model(name)
+            with model_metrics.track_in_flight():
+                response, status, mimetype = scoring_server._score(
+                    scoring_server._get_predict_func(loaded_model.model, metrics=model_metrics),
+                    loaded_model.input_schema, flask.request.content_type,
+                    flask.request.get_data(), flask.request.accept_mimetypes, model_metrics)
+        model_metrics.record_request(status, flask.request.content_type)
+        return flask.Response(response=response, status=status, mimetype=mimetype)
+
+    if metrics is not None:
+        @app.route('/metrics', methods=['GET'])
+        def prometheus_metrics():  # pylint: disable=unused-variable
+            """
+            Expose the Prometheus metrics of the server.
+            """
+            response, content_type = metrics.generate_latest()
+            return flask.Response(response=response, status=200, content_type=content_type)
+
+    return app
+
+
+def _get_multi_model_config(env):
+    """
+    :return: Keyword arguments of :py:func:`init` read from the ``_SERVER_*`` variables of
+             ``env``.
+    """
+    config = {"models_root_uri": env[_SERVER_MODELS_ROOT_URI]}
+    if env.get(_SERVER_MAX_MODELS):
+        config["max_models"] = int(env[_SERVER_MAX_MODELS])
+    if env.get(_SERVER_MAX_MODELS_SIZE_MB):
+        config["max_size_bytes"] = int(float(env[_SERVER_MAX_MODELS_SIZE_MB]) * 1024 * 1024)
+    preload = [name for name in env.get(_SERVER_PRELOAD_MODELS, "").split(",") if name]
+    if preload:
+        config["preload"] = preload
+    config.update(scoring_server._get_metrics_config(env))
+    return config
+
+
+def _serve(models_root_uri, port, host, workers=1, max_models=None, max_models_size_mb=None,
+           preload=None, enable_metrics=False):
+    """
+    Serve the models under ``models_root_uri`` with gunicorn, or waitress on Windows, in the
+    current Python environment.
+    """
+    if os.name != "nt":
+        command = ("gunicorn --timeout=60 -b {host}:{port} -w {nworkers} ${{GUNICORN_CMD_ARGS}}"
+                   " -- mlflow.pyfunc.scoring_server.wsgi:app").format(
+            host=host, port=port, nworkers=workers)
+    else:
+        command = ("waitress-serve --host={host} --port={port} "
+                   "--ident=mlflow mlflow.pyfunc.scoring_server.wsgi:app").format(
+            host=host, port=port)
+    command_env = os.environ.copy()
+    command_env[_SERVER_MODELS_ROOT_URI] = models_root_uri
+    if max_models is not None:
+        command_env[_SERVER_MAX_MODELS] = str(max_models)
+    if max_models_size_mb is not None:
+        command_env[_SERVER_MAX_MODELS_SIZE_MB] = str(max_models_size_mb)
+    if preload:
+        command_env[_SERVER_PRELOAD_MODELS] = ",".join(preload)
+    if enable_metrics:
+        from mlflow.pyfunc.scoring_server.metrics import _set_default_multiproc_dir
+        command_env[scoring_server._SERVER_ENABLE_METRICS] = "true"
+        _set_default_multiproc_dir(command_env)
+    _logger.info("=== Running command '%s'", command)
+    if os.name != "nt":
+        subprocess.Popen(["bash", "-c", command], env=command_env).wait()
+    else:
+        subprocess.Popen(command.split(" "), env=command_env).wait()
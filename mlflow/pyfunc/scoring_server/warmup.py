@@ -0,0 +1,97 @@
+"""
+Warm-up of a served model before the scoring server reports itself healthy.
+
+Models frequently pay one-off costs on their first predictions, such as lazy graph compilation or
+just-in-time compilation. The scoring server scores a warm-up request a number of times in the
+background after starting, and its ``/ping`` endpoint only reports the server as healthy once the
+warm-up is complete, so that load balancers do not route requests to a cold model.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+_logger = logging.getLogger(__name__)
+
+_LATENCY_PERCENTILES = [50, 90, 99]
+
+
+class WarmUp(object):
+    """
+    Scores a warm-up request ``iterations`` times, ``concurrency`` requests at a time, and records
+    the latencies of the requests.
+    """
+
+    def __init__(self, score, iterations, concurrency=1):
+        """
+        :param score: Function taking no arguments that scores the warm-up request, returning the
+                      response body, status code and content type.
+        :param iterations: Number of times to score the warm-up request.
+        :param concurrency: Number of warm-up requests scored concurrently, for servers that
+                            score requests on several threads or processes.
+        """
+        self.score = score
+        self.iterations = iterations
+        self.concurrency = concurrency
+        self.ready = threading.Event()
+        self.latencies = []
+        self.error = None
+
+    def start(self):
+        """
+        Run the warm-up on a background thread.
+        """
+        thread = threading.Thread(target=self.run, name="MlflowModelWarmUp")
+        thread.daemon = True
+        thread.start()
+
+    def run(self):
+        start_time = time.time()
+        # pylint: disable=broad-except
+        try:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                for latency in executor.map(lambda _: self._score_once(),
+                                            range(self.iterations)):
+                    self.latencies.append(latency)
+        except Exception as e:
+            # The model is still served, since failing to warm it up does not prevent it from
+            # scoring other requests
+            self.error = str(e)
+            _logger.warning("Failed to warm up the model: %s", e)
+        finally:
+            self.ready.set()
+        _logger.info("Warmed up the model with %s requests in %.3f seconds. Latencies: %s",
+                     len(self.latencies), time.time() - start_time, self.get_latency_percentiles())
+
+    def _score_once(self):
+        start_time = time.time()
+        response, status, _ = self.score()
+        if status != 200:
+            raise Exception("Warm-up request failed with status {}: {}".format(status, response))
+        return time.time() - start_time
+
+    def get_latency_percentiles(self):
+        """
+        :return: Dictionary of the percentiles of the latencies of the warm-up requests, in
+                 milliseconds, keyed by ``p<percentile>``.
+        """
+        if not self.latencies:
+            return {}
+        values = np.percentile(np.array(self.latencies) * 1000, _LATENCY_PERCENTILES)
+        return {"p%s" % p: round(float(v), 3) for p, v in zip(_LATENCY_PERCENTILES, values)}
+
+    def get_status(self):
+        """
+        :return: JSON-serializable status of the warm-up, reported by the ``/ping`` endpoint.
+        """
+        status = {"status": "ready" if self.ready.is_set() else "warming up"}
+        if self.ready.is_set():
+            status["warmup"] = {
+                "iterations": len(self.latencies),
+                "latency_ms": self.get_latency_percentiles(),
+            }
+            if self.error is not None:
+                status["warmup"]["error"] = self.error
+        return status
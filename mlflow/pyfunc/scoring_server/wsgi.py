@@ -1,6 +1,13 @@
 import os
 from mlflow.pyfunc import scoring_server
 from mlflow.pyfunc import load_model
+from mlflow.pyfunc.scoring_server import multi_model
 
 
-app = scoring_server.init(load_model(os.environ[scoring_server._SERVER_MODEL_PATH]))
+if os.environ.get(multi_model._SERVER_MODELS_ROOT_URI):
+    app = multi_model.init(**multi_model._get_multi_model_config(os.environ))
+else:
+    app = scoring_server.init(load_model(os.environ[scoring_server._SERVER_MODEL_PATH]),
+                              **scoring_server._get_batching_config(os.environ),
+                              **scoring_server._get_warmup_config(os.environ),
+                              **scoring_server._get_metrics_config(os.environ))
@@ -1,10 +1,44 @@
+import contextlib
+import hashlib
 import os
+import re
 import shutil
 import tempfile
+import uuid
 import zipfile
 
 from pyspark.files import SparkFiles
 
+from mlflow.store.artifact.artifact_cache import _file_lock, _LockNotAcquired
+
+# Directory in which model archives are extracted, shared by the Python workers of an executor.
+# Defaults to a directory under the root directory of the files distributed by Spark.
+SPARK_MODEL_CACHE_DIR_ENV_VAR = "MLFLOW_SPARK_MODEL_CACHE_DIR"
+
+_EXTRACTED_MARKER_FILE = ".extracted"
+_ARCHIVE_NAME_PATTERN = re.compile(r".*-([0-9a-f]{64})\.zip$")
+
+
+def _hash_file(path):
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def _get_cache_dir():
+    cache_dir = os.environ.get(SPARK_MODEL_CACHE_DIR_ENV_VAR) or \
+        os.path.join(SparkFiles.getRootDirectory(), "mlflow-models")
+    if not os.path.exists(cache_dir):
+        try:
+            os.makedirs(cache_dir)
+        except OSError:
+            # Another worker may have created the directory concurrently
+            if not os.path.isdir(cache_dir):
+                raise
+    return cache_dir
+
 
 class SparkModelCache(object):
     """Caches models in memory on Spark Executors, to avoid continually reloading from disk.
@@ -14,11 +48,20 @@ class SparkModelCache(object):
     Python's module loading behavior for classes in different modules. In this case, we
     are relying on the fact that Python will load a module at-most-once, and can therefore
     store per-process state in a static map.
+
+    Model archives are extracted once per executor, into a directory shared by its Python workers
+    and keyed by the hash of the archive contents. Flavors that memory-map the files of a model
+    thereby share a single physical copy of them across the workers. A worker holds a shared lock
+    on each archive it loaded for as long as the model stays cached, since models may read their
+    files after loading. Extracting a new archive evicts the archives that no worker holds.
     """
 
     # Map from unique name --> loaded model.
     _models = {}
 
+    # Map from extracted archive directory --> shared lock held on the directory.
+    _archive_locks = {}
+
     # Number of cache hits we've had, for testing purposes.
     _cache_hits = 0
 
@@ -35,8 +78,12 @@ class SparkModelCache(object):
         # NB: We must archive the directory as Spark.addFile does not support non-DFS
         # directories when recursive=True.
         archive_path = shutil.make_archive(archive_basepath, 'zip', model_path)
-        spark.sparkContext.addFile(archive_path)
-        return archive_path
+        # The hash of the archive contents is part of its name, so that executors do not need to
+        # hash the archive to find out whether they already extracted it
+        hashed_archive_path = "{}-{}.zip".format(archive_basepath, _hash_file(archive_path))
+        os.rename(archive_path, hashed_archive_path)
+        spark.sparkContext.addFile(hashed_archive_path)
+        return hashed_archive_path
 
     @staticmethod
     def get_or_load(archive_path):
@@ -52,13 +99,61 @@ class SparkModelCache(object):
         # SparkFiles.get(), as opposed to the (absolute) path.
         archive_path_basename = os.path.basename(archive_path)
         local_path = SparkFiles.get(archive_path_basename)
-        temp_dir = tempfile.mkdtemp()
-        zip_ref = zipfile.ZipFile(local_path, 'r')
-        zip_ref.extractall(temp_dir)
-        zip_ref.close()
+        match = _ARCHIVE_NAME_PATTERN.match(archive_path_basename)
+        content_hash = match.group(1) if match else _hash_file(local_path)
 
         # We must rely on a supposed cyclic import here because we want this behavior
         # on the Spark Executors (i.e., don't try to pickle the load_model function).
         from mlflow.pyfunc import load_pyfunc  # pylint: disable=cyclic-import
-        SparkModelCache._models[archive_path] = load_pyfunc(temp_dir)
-        return SparkModelCache._models[archive_path]
+        cache_dir = _get_cache_dir()
+        model_dir = os.path.join(cache_dir, content_hash)
+        lock_path = model_dir + ".lock"
+        marker_path = os.path.join(model_dir, _EXTRACTED_MARKER_FILE)
+        if model_dir in SparkModelCache._archive_locks:
+            # Another archive with the same contents was loaded, so the lock is already held
+            SparkModelCache._models[archive_path] = load_pyfunc(model_dir)
+            return SparkModelCache._models[archive_path]
+        while True:
+            with contextlib.ExitStack() as stack:
+                # The shared lock prevents other workers from evicting the model while it is
+                # cached, so it is kept rather than released once the model is loaded
+                stack.enter_context(_file_lock(lock_path, shared=True))
+                if os.path.exists(marker_path):
+                    SparkModelCache._models[archive_path] = load_pyfunc(model_dir)
+                    SparkModelCache._archive_locks[model_dir] = stack.pop_all()
+                    return SparkModelCache._models[archive_path]
+            with _file_lock(lock_path):
+                # Another worker may have extracted the archive while we waited for the lock
+                if not os.path.exists(marker_path):
+                    _extract_archive(local_path, model_dir)
+                    _evict_archives(cache_dir, keep=content_hash)
+
+
+def _extract_archive(archive_path, model_dir):
+    if os.path.exists(model_dir):
+        # Left over by a worker that failed while extracting the archive
+        shutil.rmtree(model_dir)
+    tmp_dir = "{}.tmp-{}".format(model_dir, uuid.uuid4().hex)
+    try:
+        with zipfile.ZipFile(archive_path, 'r') as zip_ref:
+            zip_ref.extractall(tmp_dir)
+        # The marker file flags the extraction as complete, so it is written last
+        open(os.path.join(tmp_dir, _EXTRACTED_MARKER_FILE), "w").close()
+        os.rename(tmp_dir, model_dir)
+    finally:
+        if os.path.exists(tmp_dir):
+            shutil.rmtree(tmp_dir)
+
+
+def _evict_archives(cache_dir, keep):
+    """
+    Delete the extracted archives other than ``keep`` that no worker is extracting or has loaded.
+    """
+    for name in os.listdir(cache_dir):
+        if name == keep or "." in name:
+            continue
+        try:
+            with _file_lock(os.path.join(cache_dir, name + ".lock"), blocking=False):
+                shutil.rmtree(os.path.join(cache_dir, name), ignore_errors=True)
+        except _LockNotAcquired:
+            continue
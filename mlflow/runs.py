@@ -78,3 +78,36 @@ def describe_run(run_id):
     run = store.get_run(run_id)
     json_run = json.dumps(run.to_dictionary(), indent=4)
     print(json_run)
+
+
+@commands.command("export")
+@click.option("--experiment-ids", envvar=mlflow.tracking._EXPERIMENT_ID_ENV_VAR,
+              type=click.STRING, required=True,
+              help="Comma-separated IDs of the experiments whose runs to export.")
+@click.option("--output-path", "-o", type=click.Path(dir_okay=False, writable=True),
+              required=True, help="Path of the file to which the runs are written.")
+@click.option("--format", "export_format", type=click.Choice(["parquet", "arrow"]),
+              default="parquet", help="Write a Parquet file (default) or an Arrow IPC stream "
+                                      "file.")
+@click.option("--filter", "filter_string", default="",
+              help="Filter query string of the runs to export, as for 'mlflow.search_runs'.")
+@click.option("--order-by", multiple=True,
+              help="Column to order the runs by, such as 'metrics.rmse DESC'. May be repeated.")
+@click.option("--view", "-v", default="active_only",
+              help="Select view type for the exported runs. Valid view types are "
+                   "'active_only' (default), 'deleted_only', and 'all'.")
+@click.option("--max-results", type=click.INT, default=None,
+              help="Maximum number of runs to export. All matching runs are exported by default.")
+def export_runs(experiment_ids, output_path, export_format, filter_string, order_by, view,
+                max_results):
+    """
+    Export the runs of the specified experiments in the configured tracking server to a Parquet
+    file or an Arrow IPC stream file, with a row per run and map columns of the metrics, params
+    and tags of the runs. Requires ``pyarrow``.
+    """
+    view_type = ViewType.from_string(view) if view else ViewType.ACTIVE_ONLY
+    mlflow.tracking.MlflowClient().export_runs(
+        experiment_ids.split(","), output_path, filter_string=filter_string,
+        run_view_type=view_type, order_by=list(order_by) or None, export_format=export_format,
+        max_results=max_results)
+    print("Exported runs to %s" % output_path)
@@ -6,7 +6,8 @@ import textwrap
 from flask import Flask, send_from_directory, Response
 
 from mlflow.server import handlers
-from mlflow.server.handlers import get_artifact_handler, STATIC_PREFIX_ENV_VAR, _add_static_prefix
+from mlflow.server.handlers import get_artifact_handler, export_runs_handler, \
+    get_metric_histories_handler, STATIC_PREFIX_ENV_VAR, _add_static_prefix
 from mlflow.utils.process import exec_cmd
 
 # NB: These are intenrnal environment variables used for communication between
@@ -14,6 +15,8 @@ from mlflow.utils.process import exec_cmd
 BACKEND_STORE_URI_ENV_VAR = "_MLFLOW_SERVER_FILE_STORE"
 ARTIFACT_ROOT_ENV_VAR = "_MLFLOW_SERVER_ARTIFACT_ROOT"
 PROMETHEUS_EXPORTER_ENV_VAR = "prometheus_multiproc_dir"
+ENTITY_CACHE_TTL_ENV_VAR = "_MLFLOW_SERVER_ENTITY_CACHE_TTL"
+ENTITY_CACHE_SIZE_ENV_VAR = "_MLFLOW_SERVER_ENTITY_CACHE_SIZE"
 
 REL_STATIC_DIR = "js/build"
 
@@ -38,6 +41,18 @@ def health():
     return "OK", 200
 
 
+# Serve the runs export routes, which stream their response rather than returning a protobuf
+# message.
+for http_path in handlers._get_paths("/preview/mlflow/runs/export"):
+    app.add_url_rule(http_path, "export_runs_handler", export_runs_handler,
+                     methods=["GET", "POST"])
+
+# Serve the bulk metric history route, whose request and response are not protobuf messages.
+for http_path in handlers._get_paths("/preview/mlflow/metrics/get-histories"):
+    app.add_url_rule(http_path, "get_metric_histories_handler", get_metric_histories_handler,
+                     methods=["POST"])
+
+
 # Serve the "get-artifact" route.
 @app.route(_add_static_prefix('/get-artifact'))
 def serve_artifacts():
@@ -91,11 +106,16 @@ def _build_gunicorn_command(gunicorn_opts, host, port, workers):
 
 
 def _run_server(file_store_path, default_artifact_root, host, port, static_prefix=None,
-                workers=None, gunicorn_opts=None, waitress_opts=None, expose_prometheus=None):
+                workers=None, gunicorn_opts=None, waitress_opts=None, expose_prometheus=None,
+                entity_cache_ttl=None, entity_cache_size=None):
     """
     Run the MLflow server, wrapping it in gunicorn or waitress on windows
     :param static_prefix: If set, the index.html asset will be served from the path static_prefix.
                           If left None, the index.html asset will be served from the root path.
+    :param entity_cache_ttl: If set, each server process caches the runs and experiments it reads
+                             for this number of seconds.
+    :param entity_cache_size: Maximum number of runs, and of experiments, cached by each server
+                              process.
     :return: None
     """
     env_map = {}
@@ -109,6 +129,11 @@ def _run_server(file_store_path, default_artifact_root, host, port, static_prefi
     if expose_prometheus:
         env_map[PROMETHEUS_EXPORTER_ENV_VAR] = expose_prometheus
 
+    if entity_cache_ttl:
+        env_map[ENTITY_CACHE_TTL_ENV_VAR] = str(entity_cache_ttl)
+        if entity_cache_size:
+            env_map[ENTITY_CACHE_SIZE_ENV_VAR] = str(entity_cache_size)
+
     # TODO: eventually may want waitress on non-win32
     if sys.platform == 'win32':
         full_command = _build_waitress_command(waitress_opts, host, port)
@@ -1,14 +1,20 @@
 # Define all the service endpoint handlers here.
+import hashlib
+import itertools
 import json
+import mimetypes
 import os
+import posixpath
 import re
+import unicodedata
 
 import logging
 from functools import wraps
 
-from flask import Response, request, send_file
+from flask import Response, request
 from google.protobuf import descriptor
 from querystring_parser import parser
+from werkzeug.urls import url_quote
 
 from mlflow.entities import Metric, Param, RunTag, ViewType, ExperimentTag
 from mlflow.entities.model_registry import RegisteredModelTag, ModelVersionTag
@@ -31,9 +37,12 @@ from mlflow.protos.model_registry_pb2 import ModelRegistryService, CreateRegiste
 from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST, INVALID_PARAMETER_VALUE
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.db.db_types import DATABASE_ENGINES
+from mlflow.store.tracking.run_export import PARQUET_FORMAT, iter_run_pages, \
+    iter_export_chunks, validate_export_format, CONTENT_TYPES as EXPORT_CONTENT_TYPES
 from mlflow.tracking._model_registry.registry import ModelRegistryStoreRegistry
 from mlflow.tracking._tracking_service.registry import TrackingStoreRegistry
-from mlflow.utils.proto_json_utils import message_to_json, parse_dict
+from mlflow.utils.proto_json_utils import message_to_json, parse_dict, run_to_json_dict, \
+    metric_to_json_dict
 from mlflow.utils.validation import _validate_batch_log_api_req
 from mlflow.utils.string_utils import is_string_type
 from mlflow.tracking.registry import UnsupportedModelRegistryStoreURIException
@@ -83,12 +92,19 @@ _model_registry_store_registry = ModelRegistryStoreRegistryWrapper()
 
 
 def _get_tracking_store(backend_store_uri=None, default_artifact_root=None):
-    from mlflow.server import BACKEND_STORE_URI_ENV_VAR, ARTIFACT_ROOT_ENV_VAR
+    from mlflow.server import BACKEND_STORE_URI_ENV_VAR, ARTIFACT_ROOT_ENV_VAR, \
+        ENTITY_CACHE_TTL_ENV_VAR, ENTITY_CACHE_SIZE_ENV_VAR
     global _tracking_store
     if _tracking_store is None:
         store_uri = backend_store_uri or os.environ.get(BACKEND_STORE_URI_ENV_VAR, None)
         artifact_root = default_artifact_root or os.environ.get(ARTIFACT_ROOT_ENV_VAR, None)
-        _tracking_store = _tracking_store_registry.get_store(store_uri, artifact_root)
+        store = _tracking_store_registry.get_store(store_uri, artifact_root)
+        entity_cache_ttl = os.environ.get(ENTITY_CACHE_TTL_ENV_VAR)
+        if entity_cache_ttl:
+            from mlflow.store.tracking.caching_store import CachingStore, _DEFAULT_MAX_SIZE
+            entity_cache_size = int(os.environ.get(ENTITY_CACHE_SIZE_ENV_VAR, _DEFAULT_MAX_SIZE))
+            store = CachingStore(store, float(entity_cache_ttl), entity_cache_size)
+        _tracking_store = store
     return _tracking_store
 
 
@@ -170,20 +186,161 @@ _TEXT_EXTENSIONS = ['txt', 'log', 'yaml', 'yml', 'json', 'js', 'py',
                     'csv', 'tsv', 'md', 'rst', MLMODEL_FILE_NAME, MLPROJECT_FILE_NAME]
 
 
+# Size of the chunks in which artifacts are streamed to clients
+_ARTIFACT_STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+def _get_artifact_etag(artifact_uri, file_info):
+    # Artifacts are not expected to change once logged, so the location and size of an artifact
+    # identify its contents
+    key = "%s/%s:%s" % (artifact_uri, file_info.path, file_info.file_size)
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def _get_content_disposition(filename):
+    """
+    Build an attachment ``Content-Disposition`` header value for ``filename``, with an ASCII
+    fallback of the name for HTTP servers that only accept Latin-1 headers and, for names that
+    are not ASCII, the UTF-8 name encoded as per RFC 5987, as ``flask.send_file`` does.
+    """
+    ascii_filename = unicodedata.normalize("NFKD", filename).encode("ascii", "ignore") \
+        .decode("ascii")
+    value = 'attachment; filename="%s"' % re.sub(r'(["\\])', r"\\\1", ascii_filename)
+    if ascii_filename != filename:
+        value += "; filename*=UTF-8''%s" % url_quote(filename, safe="")
+    return value
+
+
+def _stream_artifact(artifact_repo, path, offset=0, length=None):
+    stream = artifact_repo.open_artifact_stream(path, offset, length)
+
+    def generate():
+        try:
+            while True:
+                chunk = stream.read(_ARTIFACT_STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            stream.close()
+
+    return generate()
+
+
 @catch_mlflow_exception
 def get_artifact_handler():
     query_string = request.query_string.decode('utf-8')
     request_dict = parser.parse(query_string, normalized=True)
     run_id = request_dict.get('run_id') or request_dict.get('run_uuid')
     run = _get_tracking_store().get_run(run_id)
-    filename = os.path.abspath(_get_artifact_repo(run).download_artifacts(request_dict['path']))
+    path = posixpath.normpath(request_dict['path'])
+    artifact_repo = _get_artifact_repo(run)
+    file_info = artifact_repo.get_file_info(path)
+    if file_info is None or file_info.is_dir:
+        raise MlflowException("No artifact file found at path '%s' of run '%s'" % (path, run_id),
+                              error_code=RESOURCE_DOES_NOT_EXIST)
+
+    filename = posixpath.basename(path)
     extension = os.path.splitext(filename)[-1].replace(".", "")
     # Always send artifacts as attachments to prevent the browser from displaying them on our web
     # server's domain, which might enable XSS.
     if extension in _TEXT_EXTENSIONS:
-        return send_file(filename, mimetype='text/plain', as_attachment=True)
+        mimetype = 'text/plain'
     else:
-        return send_file(filename, as_attachment=True)
+        mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    headers = {'Content-Disposition': _get_content_disposition(filename)}
+
+    # Without the size of the artifact, it can only be streamed as a whole
+    size = file_info.file_size
+    if size is None:
+        return Response(_stream_artifact(artifact_repo, path), mimetype=mimetype,
+                        headers=headers, direct_passthrough=True)
+
+    etag = _get_artifact_etag(artifact_repo.artifact_uri, file_info)
+    headers['Accept-Ranges'] = 'bytes'
+    if request.if_none_match.contains(etag):
+        response = Response(status=304, headers=headers)
+        response.set_etag(etag)
+        return response
+
+    offset, length, status = 0, size, 200
+    # Multiple ranges are not supported, and the ranges requested for a different version of the
+    # artifact are ignored, in both cases by sending the whole artifact
+    byte_ranges = request.range
+    if byte_ranges is not None and byte_ranges.units == 'bytes' and \
+            len(byte_ranges.ranges) == 1 and request.if_range.date is None and \
+            request.if_range.etag in (None, etag):
+        byte_range = byte_ranges.range_for_length(size)
+        if byte_range is None:
+            headers['Content-Range'] = 'bytes */%d' % size
+            return Response(status=416, headers=headers)
+        offset, length, status = byte_range[0], byte_range[1] - byte_range[0], 206
+        headers['Content-Range'] = 'bytes %d-%d/%d' % (offset, offset + length - 1, size)
+    headers['Content-Length'] = str(length)
+    response = Response(_stream_artifact(artifact_repo, path, offset, length), status=status,
+                        mimetype=mimetype, headers=headers, direct_passthrough=True)
+    response.set_etag(etag)
+    return response
+
+
+@catch_mlflow_exception
+def export_runs_handler():
+    """
+    Export the runs matching a search, whose parameters are those of ``SearchRuns``, as a Parquet
+    file or an Arrow IPC stream according to the ``format`` query parameter. All the matching runs
+    are exported, or at most ``max_results`` runs if it is set.
+    """
+    request_message = _get_request_message(SearchRuns())
+    export_format = request.args.get("format", PARQUET_FORMAT)
+    validate_export_format(export_format)
+    run_view_type = ViewType.ACTIVE_ONLY
+    if request_message.HasField('run_view_type'):
+        run_view_type = ViewType.from_proto(request_message.run_view_type)
+    max_results = None
+    if request_message.HasField('max_results'):
+        max_results = request_message.max_results
+    run_pages = iter_run_pages(_get_tracking_store(), request_message.experiment_ids,
+                               request_message.filter, run_view_type,
+                               request_message.order_by, max_results)
+    chunks = iter_export_chunks(run_pages, export_format)
+    # The first page of runs is exported before responding, so that invalid searches are reported
+    # with an error status rather than in the middle of the response
+    first_chunk = next(chunks)
+    headers = {'Content-Disposition': 'attachment; filename="runs.%s"' % export_format}
+    return Response(itertools.chain([first_chunk], chunks),
+                    mimetype=EXPORT_CONTENT_TYPES[export_format], headers=headers,
+                    direct_passthrough=True)
+
+
+@catch_mlflow_exception
+def get_metric_histories_handler():
+    """
+    Return the histories of several metrics of several runs. The JSON request body holds the
+    ``run_ids`` and optional ``metric_keys``, ``max_points_per_series``, ``min_step`` and
+    ``max_step`` arguments of ``get_metric_histories``. The response lists the ``metrics`` of
+    each ``run_id`` and ``metric_key`` in ``histories``.
+    """
+    request_json = _get_request_json() or {}
+    run_ids = request_json.get("run_ids")
+    metric_keys = request_json.get("metric_keys")
+    if not isinstance(run_ids, list) or not all(is_string_type(r) for r in run_ids) or \
+            (metric_keys is not None and (not isinstance(metric_keys, list) or
+                                          not all(is_string_type(k) for k in metric_keys))):
+        raise MlflowException("Invalid request. 'run_ids' must be a list of run IDs, and "
+                              "'metric_keys' an optional list of metric names.",
+                              error_code=INVALID_PARAMETER_VALUE)
+    step_range = None
+    if request_json.get("min_step") is not None or request_json.get("max_step") is not None:
+        step_range = (request_json.get("min_step"), request_json.get("max_step"))
+    histories = _get_tracking_store().get_metric_histories(
+        run_ids, metric_keys, request_json.get("max_points_per_series"), step_range)
+    response_json = {"histories": [
+        {"run_id": run_id, "metric_key": metric_key,
+         "metrics": [metric_to_json_dict(metric) for metric in history]}
+        for run_id, run_histories in histories.items()
+        for metric_key, history in run_histories.items()
+    ]}
+    return _wrap_json_response(response_json)
 
 
 def _not_implemented():
@@ -374,18 +531,14 @@ def _delete_tag():
 @catch_mlflow_exception
 def _get_run():
     request_message = _get_request_message(GetRun())
-    response_message = GetRun.Response()
     run_id = request_message.run_id or request_message.run_uuid
-    response_message.run.MergeFrom(_get_tracking_store().get_run(run_id).to_proto())
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+    run = _get_tracking_store().get_run(run_id)
+    return _wrap_json_response({"run": run_to_json_dict(run)})
 
 
 @catch_mlflow_exception
 def _search_runs():
     request_message = _get_request_message(SearchRuns())
-    response_message = SearchRuns.Response()
     run_view_type = ViewType.ACTIVE_ONLY
     if request_message.HasField('run_view_type'):
         run_view_type = ViewType.from_proto(request_message.run_view_type)
@@ -396,12 +549,15 @@ def _search_runs():
     page_token = request_message.page_token
     run_entities = _get_tracking_store().search_runs(experiment_ids, filter_string, run_view_type,
                                                      max_results, order_by, page_token)
-    response_message.runs.extend([r.to_proto() for r in run_entities])
+    response_json = {}
+    if run_entities:
+        response_json["runs"] = [run_to_json_dict(r) for r in run_entities]
     if run_entities.token:
-        response_message.next_page_token = run_entities.token
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+        # Stores may return the token as bytes, which protobuf messages used to accept
+        token = run_entities.token
+        response_json["next_page_token"] = \
+            token.decode("utf-8") if isinstance(token, bytes) else token
+    return _wrap_json_response(response_json)
 
 
 @catch_mlflow_exception
@@ -425,14 +581,13 @@ def _list_artifacts():
 @catch_mlflow_exception
 def _get_metric_history():
     request_message = _get_request_message(GetMetricHistory())
-    response_message = GetMetricHistory.Response()
     run_id = request_message.run_id or request_message.run_uuid
     metric_entites = _get_tracking_store().get_metric_history(run_id,
                                                               request_message.metric_key)
-    response_message.metrics.extend([m.to_proto() for m in metric_entites])
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+    response_json = {}
+    if metric_entites:
+        response_json["metrics"] = [metric_to_json_dict(m) for m in metric_entites]
+    return _wrap_json_response(response_json)
 
 
 @catch_mlflow_exception
@@ -495,6 +650,16 @@ def _wrap_response(response_message):
     return response
 
 
+def _wrap_json_response(response_json):
+    """
+    Respond with the JSON of a response message built as a dictionary, for the endpoints
+    returning many runs or metrics, which skip creating the protobuf message.
+    """
+    response = Response(mimetype='application/json')
+    response.set_data(json.dumps(response_json))
+    return response
+
+
 @catch_mlflow_exception
 def _create_registered_model():
     request_message = _get_request_message(CreateRegisteredModel())
@@ -0,0 +1,214 @@
+"""
+On-disk cache of downloaded artifacts, shared by the processes of a machine.
+
+Entries are addressed by the SHA-256 hash of a key that identifies immutable artifacts, for
+example a registered model version. The total size of the cache is capped, and the least recently
+used entries are evicted once the cap is exceeded. File locks make the cache safe to use from
+concurrent processes: an entry is only written while holding an exclusive lock on it, entries are
+only read while holding a shared lock, and entries in use are never evicted.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import uuid
+from contextlib import contextmanager
+
+from mlflow.utils.file_utils import mkdir
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+_logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV_VAR = "MLFLOW_ARTIFACT_CACHE_DIR"
+CACHE_MAX_SIZE_ENV_VAR = "MLFLOW_ARTIFACT_CACHE_MAX_SIZE"
+_DEFAULT_CACHE_MAX_SIZE = 10 * 1024 * 1024 * 1024
+
+_ENTRY_CONTENT_DIR = "content"
+_ENTRY_METADATA_FILE = "entry.json"
+
+
+class _LockNotAcquired(Exception):
+    pass
+
+
+@contextmanager
+def _file_lock(path, shared=False, blocking=True):
+    """
+    Hold an advisory lock on the file at ``path``, creating the file if necessary. Shared locks
+    are treated as exclusive locks on Windows.
+
+    :raises _LockNotAcquired: If ``blocking`` is False and the lock is held by someone else.
+    """
+    with open(path, "a+") as f:
+        try:
+            if fcntl is not None:
+                flags = (fcntl.LOCK_SH if shared else fcntl.LOCK_EX) | \
+                    (0 if blocking else fcntl.LOCK_NB)
+                fcntl.flock(f.fileno(), flags)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+        except (IOError, OSError):
+            if blocking:
+                raise
+            raise _LockNotAcquired(path)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _copy_tree(src, dst):
+    """
+    Copy the contents of directory ``src`` into directory ``dst``, which may already exist.
+    """
+    for root, _, files in os.walk(src):
+        dst_dir = os.path.join(dst, os.path.relpath(root, src))
+        if not os.path.exists(dst_dir):
+            os.makedirs(dst_dir)
+        for name in files:
+            shutil.copyfile(os.path.join(root, name), os.path.join(dst_dir, name))
+
+
+def _get_dir_size(path):
+    return sum(os.path.getsize(os.path.join(root, name))
+               for root, _, files in os.walk(path) for name in files)
+
+
+class ArtifactCache(object):
+    """
+    Cache of downloaded artifacts stored under ``cache_dir``, holding at most ``max_size`` bytes
+    of artifacts (the most recently added entry is kept even if it exceeds the cap on its own).
+    """
+
+    def __init__(self, cache_dir, max_size=_DEFAULT_CACHE_MAX_SIZE):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_size = max_size
+        if not os.path.exists(self.cache_dir):
+            mkdir(self.cache_dir)
+
+    def _entry_dir(self, entry_id):
+        return os.path.join(self.cache_dir, entry_id)
+
+    def _entry_lock_path(self, entry_id):
+        return os.path.join(self.cache_dir, entry_id + ".lock")
+
+    def _read_entry_metadata(self, entry_id):
+        try:
+            with open(os.path.join(self._entry_dir(entry_id), _ENTRY_METADATA_FILE)) as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def download(self, key, download_func, dst_path=None):
+        """
+        Copy the cached artifacts identified by ``key`` to ``dst_path``, downloading them into the
+        cache first if they are not cached yet.
+
+        :param key: String that uniquely identifies immutable artifacts.
+        :param download_func: Function taking the path of an existing local directory, that
+                              downloads the artifacts into it and returns the local path of the
+                              downloaded artifacts within that directory.
+        :param dst_path: Local directory to which to copy the artifacts. It must already exist.
+                         If unspecified, the artifacts are copied to a new temporary directory.
+        :return: Local path of the artifacts within ``dst_path``.
+        """
+        entry_id = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        dst_path = os.path.abspath(dst_path or tempfile.mkdtemp())
+        with _file_lock(self._entry_lock_path(entry_id), shared=True):
+            metadata = self._read_entry_metadata(entry_id)
+            if metadata is not None:
+                return self._copy_entry(entry_id, metadata, dst_path)
+        with _file_lock(self._entry_lock_path(entry_id)):
+            # Another process may have added the entry while we waited for the lock
+            metadata = self._read_entry_metadata(entry_id)
+            if metadata is None:
+                metadata = self._add_entry(entry_id, key, download_func)
+            local_path = self._copy_entry(entry_id, metadata, dst_path)
+        self._evict(keep=entry_id)
+        return local_path
+
+    def _add_entry(self, entry_id, key, download_func):
+        entry_dir = self._entry_dir(entry_id)
+        if os.path.exists(entry_dir):
+            # Left over by a process that failed while adding the entry
+            shutil.rmtree(entry_dir)
+        tmp_dir = os.path.join(self.cache_dir, ".tmp-%s" % uuid.uuid4().hex)
+        content_dir = os.path.join(tmp_dir, _ENTRY_CONTENT_DIR)
+        try:
+            mkdir(content_dir)
+            local_path = download_func(content_dir)
+            metadata = {
+                "key": key,
+                "path": os.path.relpath(os.path.abspath(local_path), content_dir),
+                "size": _get_dir_size(content_dir),
+            }
+            os.rename(tmp_dir, entry_dir)
+        finally:
+            if os.path.exists(tmp_dir):
+                shutil.rmtree(tmp_dir)
+        # The metadata file marks the entry as complete, so it is written last
+        with open(os.path.join(entry_dir, _ENTRY_METADATA_FILE), "w") as f:
+            json.dump(metadata, f)
+        return metadata
+
+    def _copy_entry(self, entry_id, metadata, dst_path):
+        entry_dir = self._entry_dir(entry_id)
+        # The modification time of the metadata file records when the entry was last used
+        os.utime(os.path.join(entry_dir, _ENTRY_METADATA_FILE), None)
+        _copy_tree(os.path.join(entry_dir, _ENTRY_CONTENT_DIR), dst_path)
+        return os.path.normpath(os.path.join(dst_path, metadata["path"]))
+
+    def _evict(self, keep):
+        """
+        Delete the least recently used entries until the cache fits in ``max_size``, skipping
+        ``keep`` and the entries that are in use.
+        """
+        with _file_lock(os.path.join(self.cache_dir, ".evict.lock")):
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                if name.startswith(".") or name.endswith(".lock"):
+                    continue
+                metadata = self._read_entry_metadata(name)
+                if metadata is None:
+                    continue
+                last_used = os.path.getmtime(os.path.join(self._entry_dir(name),
+                                                          _ENTRY_METADATA_FILE))
+                entries.append((last_used, name, metadata["size"]))
+            total_size = sum(size for _, _, size in entries)
+            for _, entry_id, size in sorted(entries):
+                if total_size <= self.max_size:
+                    break
+                if entry_id == keep:
+                    continue
+                try:
+                    with _file_lock(self._entry_lock_path(entry_id), blocking=False):
+                        shutil.rmtree(self._entry_dir(entry_id))
+                except _LockNotAcquired:
+                    continue
+                total_size -= size
+                _logger.debug("Evicted artifact cache entry %s", entry_id)
+
+
+def get_artifact_cache():
+    """
+    :return: The :py:class:`ArtifactCache` configured by the ``MLFLOW_ARTIFACT_CACHE_DIR`` and
+             ``MLFLOW_ARTIFACT_CACHE_MAX_SIZE`` environment variables, or None if
+             ``MLFLOW_ARTIFACT_CACHE_DIR`` is not set.
+    """
+    cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+    if not cache_dir:
+        return None
+    max_size = int(os.environ.get(CACHE_MAX_SIZE_ENV_VAR, _DEFAULT_CACHE_MAX_SIZE))
+    return ArtifactCache(cache_dir, max_size)
@@ -1,14 +1,27 @@
 import os
 import posixpath
+import shutil
 import tempfile
 from abc import abstractmethod, ABCMeta
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+from functools import partial
 
+from mlflow.utils.file_utils import relative_path_to_artifact_path
 from mlflow.utils.validation import path_not_unique, bad_path_message
 from mlflow.utils import experimental
 
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, RESOURCE_DOES_NOT_EXIST
 
+# Maximum number of files transferred concurrently by an artifact repository
+MAX_WORKERS_ENV_VAR = "MLFLOW_ARTIFACT_MAX_WORKERS"
+_DEFAULT_MAX_WORKERS = 8
+# Files larger than the threshold are uploaded in chunks by the repositories that support it
+MULTIPART_UPLOAD_THRESHOLD_ENV_VAR = "MLFLOW_MULTIPART_UPLOAD_THRESHOLD"
+MULTIPART_UPLOAD_CHUNK_SIZE_ENV_VAR = "MLFLOW_MULTIPART_UPLOAD_CHUNK_SIZE"
+_DEFAULT_MULTIPART_UPLOAD_THRESHOLD = 8 * 1024 * 1024
+_DEFAULT_MULTIPART_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
 
 class ArtifactRepository:
     """
@@ -18,6 +31,10 @@ class ArtifactRepository:
 
     __metaclass__ = ABCMeta
 
+    # Repositories whose file transfers share a connection that is not thread-safe set this to
+    # False, so that their files are transferred one at a time
+    _supports_concurrent_transfers = True
+
     def __init__(self, artifact_uri):
         self.artifact_uri = artifact_uri
 
@@ -58,22 +75,91 @@ class ArtifactRepository:
         """
         pass
 
+    def get_file_info(self, artifact_path):
+        """
+        Return the :py:class:`mlflow.entities.FileInfo` of a single artifact. Repositories that
+        support it look the artifact up directly; others list its parent directory.
+
+        :param artifact_path: Relative source path to the artifact.
+
+        :return: The :py:class:`mlflow.entities.FileInfo` of the artifact, or None if there is no
+                 artifact at ``artifact_path``.
+        """
+        parent_dir = posixpath.dirname(artifact_path)
+        for file_info in self.list_artifacts(parent_dir or None):
+            if file_info.path == artifact_path:
+                return file_info
+        return None
+
     def _is_directory(self, artifact_path):
         listing = self.list_artifacts(artifact_path)
         return len(listing) > 0
 
-    def download_artifacts(self, artifact_path, dst_path=None):
+    def _get_max_workers(self):
+        """
+        :return: Maximum number of files to transfer concurrently with this repository.
+        """
+        if not self._supports_concurrent_transfers:
+            return 1
+        return max(1, int(os.environ.get(MAX_WORKERS_ENV_VAR, _DEFAULT_MAX_WORKERS)))
+
+    @staticmethod
+    def _get_multipart_upload_threshold():
+        """
+        :return: Size in bytes above which repositories that support it upload a file in chunks.
+        """
+        return int(os.environ.get(MULTIPART_UPLOAD_THRESHOLD_ENV_VAR,
+                                  _DEFAULT_MULTIPART_UPLOAD_THRESHOLD))
+
+    @staticmethod
+    def _get_multipart_upload_chunk_size():
+        """
+        :return: Size in bytes of the chunks of files uploaded in chunks.
+        """
+        return int(os.environ.get(MULTIPART_UPLOAD_CHUNK_SIZE_ENV_VAR,
+                                  _DEFAULT_MULTIPART_UPLOAD_CHUNK_SIZE))
+
+    def _log_artifacts_concurrently(self, local_dir, upload_file):
+        """
+        Upload the files under a local directory concurrently, using at most
+        ``MLFLOW_ARTIFACT_MAX_WORKERS`` threads. If a file fails to upload, pending uploads are
+        cancelled and the error is raised.
+
+        :param local_dir: Local directory whose files to upload.
+        :param upload_file: Function called with the local path of each file and its path
+                            relative to ``local_dir``, in posix format, that uploads the file.
+        """
+        local_dir = os.path.abspath(local_dir)
+
+        def upload_tasks():
+            for (root, _, filenames) in os.walk(local_dir):
+                rel_dir = ""
+                if root != local_dir:
+                    rel_dir = relative_path_to_artifact_path(os.path.relpath(root, local_dir))
+                for f in filenames:
+                    yield partial(upload_file, os.path.join(root, f), posixpath.join(rel_dir, f))
+
+        _transfer_concurrently(upload_tasks(), self._get_max_workers())
+
+    def download_artifacts(self, artifact_path, dst_path=None, progress_callback=None):
         """
         Download an artifact file or directory to a local directory if applicable, and return a
         local path for it.
         The caller is responsible for managing the lifecycle of the downloaded artifacts.
 
+        Files of an artifact directory are downloaded concurrently by a pool of at most
+        ``MLFLOW_ARTIFACT_MAX_WORKERS`` threads while the directory is still being listed. If any
+        file fails to download, pending downloads are cancelled and the error is raised.
+
         :param artifact_path: Relative source path to the desired artifacts.
         :param dst_path: Absolute path of the local filesystem destination directory to which to
                          download the specified artifacts. This directory must already exist.
                          If unspecified, the artifacts will either be downloaded to a new
                          uniquely-named directory on the local filesystem or will be returned
                          directly in the case of the LocalArtifactRepository.
+        :param progress_callback: Optional function called with the relative source path and the
+                                  local path of each file once it has been downloaded. It may be
+                                  called from multiple threads.
 
         :return: Absolute path of the local filesystem location containing the desired artifacts.
         """
@@ -81,14 +167,21 @@ class ArtifactRepository:
         # TODO: Probably need to add a more efficient method to stream just a single artifact
         #       without downloading it, or to get a pre-signed URL for cloud storage.
         def download_file(fullpath):
+            local_file_path = os.path.join(dst_path, fullpath)
+            self._download_file(remote_file_path=fullpath, local_path=local_file_path)
+            if progress_callback is not None:
+                progress_callback(fullpath, local_file_path)
+            return local_file_path
+
+        def prepare_download(fullpath):
+            # Local directories are created before submitting downloads, so that concurrent
+            # downloads never race to create them
             fullpath = fullpath.rstrip('/')  # Prevents incorrect split if fullpath ends with a '/'
             dirpath, _ = posixpath.split(fullpath)
             local_dir_path = os.path.join(dst_path, dirpath)
-            local_file_path = os.path.join(dst_path, fullpath)
             if not os.path.exists(local_dir_path):
                 os.makedirs(local_dir_path)
-            self._download_file(remote_file_path=fullpath, local_path=local_file_path)
-            return local_file_path
+            return fullpath
 
         def download_artifact_dir(dir_path):
             local_dir = os.path.join(dst_path, dir_path)
@@ -101,10 +194,10 @@ class ArtifactRepository:
             else:
                 for file_info in dir_content:
                     if file_info.is_dir:
-                        download_artifact_dir(dir_path=file_info.path)
+                        for task in download_artifact_dir(dir_path=file_info.path):
+                            yield task
                     else:
-                        download_file(file_info.path)
-            return local_dir
+                        yield partial(download_file, prepare_download(file_info.path))
 
         if dst_path is None:
             dst_path = tempfile.mkdtemp()
@@ -125,9 +218,33 @@ class ArtifactRepository:
 
         # Check if the artifacts points to a directory
         if self._is_directory(artifact_path):
-            return download_artifact_dir(artifact_path)
+            _transfer_concurrently(download_artifact_dir(artifact_path), self._get_max_workers())
+            return os.path.join(dst_path, artifact_path)
         else:
-            return download_file(artifact_path)
+            return download_file(prepare_download(artifact_path))
+
+    def open_artifact_stream(self, artifact_path, offset=0, length=None):
+        """
+        Open a binary stream over the contents of an artifact file. Repositories that support it
+        read the file directly from the artifact store; others download it to a temporary file
+        that is deleted once the stream is closed.
+
+        :param artifact_path: Relative source path to the artifact file.
+        :param offset: Position in bytes of the file from which to start reading.
+        :param length: Maximum number of bytes to read. If unspecified, the stream is read until
+                       the end of the file.
+
+        :return: A readable file-like object, which the caller is responsible for closing.
+        """
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            local_path = self.download_artifacts(artifact_path, dst_path=tmp_dir)
+            fileobj = open(local_path, "rb")
+        except Exception:
+            shutil.rmtree(tmp_dir)
+            raise
+        fileobj.seek(offset)
+        return _ArtifactStream(fileobj, length, on_close=lambda: shutil.rmtree(tmp_dir))
 
     @abstractmethod
     def _download_file(self, remote_file_path, local_path):
@@ -152,6 +269,80 @@ class ArtifactRepository:
         pass
 
 
+class _ArtifactStream(object):
+    """
+    Readable file-like object returned by :py:meth:`ArtifactRepository.open_artifact_stream`,
+    reading at most ``length`` bytes from ``fileobj`` and calling ``on_close`` once closed.
+    """
+
+    def __init__(self, fileobj, length=None, on_close=None):
+        self._fileobj = fileobj
+        self._remaining = length
+        self._on_close = on_close
+        self.closed = False
+
+    def read(self, size=-1):
+        if self._remaining is not None and (size is None or size < 0 or size > self._remaining):
+            size = self._remaining
+        data = self._fileobj.read() if size is None or size < 0 else self._fileobj.read(size)
+        if self._remaining is not None:
+            self._remaining -= len(data)
+        return data
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self._fileobj.close()
+        finally:
+            if self._on_close is not None:
+                self._on_close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _transfer_concurrently(tasks, max_workers):
+    """
+    Run file transfers on a pool of at most ``max_workers`` threads.
+
+    :param tasks: Iterable of functions taking no arguments. Each function is submitted to the
+                  pool as soon as the iterable produces it, so that producing tasks (for example,
+                  by listing a remote directory) overlaps with running them.
+    :return: None. Raises the first exception raised by a task, after cancelling the tasks that
+             have not started yet.
+    """
+    errors = []
+
+    def record_error(future):
+        if not future.cancelled() and future.exception() is not None:
+            errors.append(future.exception())
+
+    futures = []
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        for task in tasks:
+            # Stops submitting tasks early once a task failed. Done callbacks may run after
+            # ``wait`` returns, so the futures themselves are checked for exceptions below.
+            if errors:
+                break
+            future = executor.submit(task)
+            future.add_done_callback(record_error)
+            futures.append(future)
+        wait(futures, return_when=FIRST_EXCEPTION)
+        for future in futures:
+            if future.done() and not future.cancelled() and future.exception() is not None:
+                raise future.exception()
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
 def verify_artifact_path(artifact_path):
     if artifact_path and path_not_unique(artifact_path):
         raise MlflowException("Invalid artifact path: '%s'. %s" % (artifact_path,
@@ -31,16 +31,30 @@ class AzureBlobArtifactRepository(ArtifactRepository):
         (_, account, _) = AzureBlobArtifactRepository.parse_wasbs_uri(artifact_uri)
         if "AZURE_STORAGE_CONNECTION_STRING" in os.environ:
             self.client = BlobServiceClient.from_connection_string(
-                conn_str=os.environ.get("AZURE_STORAGE_CONNECTION_STRING"))
+                conn_str=os.environ.get("AZURE_STORAGE_CONNECTION_STRING"),
+                **self._get_upload_config())
         elif "AZURE_STORAGE_ACCESS_KEY" in os.environ:
             account_url = "https://{account}.blob.core.windows.net".format(account=account)
             self.client = BlobServiceClient(
                 account_url=account_url,
-                credential=os.environ.get("AZURE_STORAGE_ACCESS_KEY"))
+                credential=os.environ.get("AZURE_STORAGE_ACCESS_KEY"),
+                **self._get_upload_config())
         else:
             raise Exception("You need to set one of AZURE_STORAGE_CONNECTION_STRING or "
                             "AZURE_STORAGE_ACCESS_KEY to access Azure storage.")
 
+    def _get_upload_config(self):
+        # Blobs larger than the multipart upload threshold are uploaded as blocks of the multipart
+        # upload chunk size
+        return {
+            "max_single_put_size": self._get_multipart_upload_threshold(),
+            "max_block_size": self._get_multipart_upload_chunk_size(),
+        }
+
+    def _upload_file(self, container_client, local_file, dest_path):
+        with open(local_file, "rb") as file:
+            container_client.upload_blob(dest_path, file, max_concurrency=self._get_max_workers())
+
     @staticmethod
     def parse_wasbs_uri(uri):
         """Parse a wasbs:// URI, returning (container, storage_account, path)."""
@@ -65,25 +79,17 @@ class AzureBlobArtifactRepository(ArtifactRepository):
             dest_path = posixpath.join(dest_path, artifact_path)
         dest_path = posixpath.join(
                 dest_path, os.path.basename(local_file))
-        with open(local_file, "rb") as file:
-            container_client.upload_blob(dest_path, file)
+        self._upload_file(container_client, local_file, dest_path)
 
     def log_artifacts(self, local_dir, artifact_path=None):
         (container, _, dest_path) = self.parse_wasbs_uri(self.artifact_uri)
         container_client = self.client.get_container_client(container)
         if artifact_path:
             dest_path = posixpath.join(dest_path, artifact_path)
-        local_dir = os.path.abspath(local_dir)
-        for (root, _, filenames) in os.walk(local_dir):
-            upload_path = dest_path
-            if root != local_dir:
-                rel_path = os.path.relpath(root, local_dir)
-                upload_path = posixpath.join(dest_path, rel_path)
-            for f in filenames:
-                remote_file_path = posixpath.join(upload_path, f)
-                local_file_path = os.path.join(root, f)
-                with open(local_file_path, "rb") as file:
-                    container_client.upload_blob(remote_file_path, file)
+        self._log_artifacts_concurrently(
+            local_dir,
+            lambda local_file, rel_path: self._upload_file(
+                container_client, local_file, posixpath.join(dest_path, rel_path)))
 
     def list_artifacts(self, path=None):
         from azure.storage.blob._models import BlobPrefix
@@ -116,6 +122,24 @@ class AzureBlobArtifactRepository(ArtifactRepository):
             return []
         return sorted(infos, key=lambda f: f.path)
 
+    def get_file_info(self, artifact_path):
+        from azure.core.exceptions import ResourceNotFoundError
+        (container, _, remote_root_path) = self.parse_wasbs_uri(self.artifact_uri)
+        container_client = self.client.get_container_client(container)
+        remote_full_path = posixpath.join(remote_root_path, artifact_path)
+        try:
+            properties = container_client.get_blob_client(remote_full_path).get_blob_properties()
+        except ResourceNotFoundError:
+            pass
+        else:
+            return FileInfo(artifact_path, False, properties.size)
+        # Directories are only prefixes of the names of their blobs
+        blobs = container_client.list_blobs(name_starts_with=remote_full_path + "/",
+                                            results_per_page=1)
+        if next(iter(blobs), None) is not None:
+            return FileInfo(artifact_path, True, None)
+        return None
+
     def _download_file(self, remote_file_path, local_path):
         (container, _, remote_root_path) = self.parse_wasbs_uri(self.artifact_uri)
         container_client = self.client.get_container_client(container)
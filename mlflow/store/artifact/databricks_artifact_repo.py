@@ -17,7 +17,7 @@ from mlflow.protos.databricks_artifacts_pb2 import DatabricksMlflowArtifactsServ
 from mlflow.protos.service_pb2 import MlflowService, GetRun, ListArtifacts
 from mlflow.store.artifact.artifact_repo import ArtifactRepository
 from mlflow.utils.databricks_utils import get_databricks_host_creds
-from mlflow.utils.file_utils import relative_path_to_artifact_path, yield_file_in_chunks
+from mlflow.utils.file_utils import yield_file_in_chunks
 from mlflow.utils.proto_json_utils import message_to_json
 from mlflow.utils.rest_utils import call_endpoint, extract_api_info_for_service
 from mlflow.utils.uri import (
@@ -225,15 +225,10 @@ class DatabricksArtifactRepository(ArtifactRepository):
 
     def log_artifacts(self, local_dir, artifact_path=None):
         artifact_path = artifact_path or ""
-        for (dirpath, _, filenames) in os.walk(local_dir):
-            artifact_subdir = artifact_path
-            if dirpath != local_dir:
-                rel_path = os.path.relpath(dirpath, local_dir)
-                rel_path = relative_path_to_artifact_path(rel_path)
-                artifact_subdir = posixpath.join(artifact_path, rel_path)
-            for name in filenames:
-                file_path = os.path.join(dirpath, name)
-                self.log_artifact(file_path, artifact_subdir)
+        self._log_artifacts_concurrently(
+            local_dir,
+            lambda local_file, rel_path: self.log_artifact(
+                local_file, posixpath.join(artifact_path, posixpath.dirname(rel_path))))
 
     def list_artifacts(self, path=None):
         if path:
@@ -5,9 +5,10 @@ from six.moves import urllib
 
 from mlflow.entities import FileInfo
 from mlflow.store.artifact.artifact_repo import ArtifactRepository
-from mlflow.utils.file_utils import relative_path_to_artifact_path
 from mlflow.exceptions import MlflowException
 
+_GCS_CHUNK_SIZE_UNIT = 256 * 1024
+
 
 class GCSArtifactRepository(ArtifactRepository):
     """
@@ -51,26 +52,27 @@ class GCSArtifactRepository(ArtifactRepository):
         dest_path = posixpath.join(
             dest_path, os.path.basename(local_file))
 
-        gcs_bucket = self._get_bucket(bucket)
-        blob = gcs_bucket.blob(dest_path)
+        self._upload_file(self._get_bucket(bucket), local_file, dest_path)
+
+    def _upload_file(self, gcs_bucket, local_file, dest_path):
+        if os.path.getsize(local_file) > self._get_multipart_upload_threshold():
+            # Upload large files in chunks through a resumable upload. The chunk size must be a
+            # multiple of 256 KB.
+            chunk_size = max(1, self._get_multipart_upload_chunk_size() // _GCS_CHUNK_SIZE_UNIT)
+            blob = gcs_bucket.blob(dest_path, chunk_size=chunk_size * _GCS_CHUNK_SIZE_UNIT)
+        else:
+            blob = gcs_bucket.blob(dest_path)
         blob.upload_from_filename(local_file)
 
     def log_artifacts(self, local_dir, artifact_path=None):
         (bucket, dest_path) = self.parse_gcs_uri(self.artifact_uri)
         if artifact_path:
             dest_path = posixpath.join(dest_path, artifact_path)
-        gcs_bucket = self._get_bucket(bucket)
-
-        local_dir = os.path.abspath(local_dir)
-        for (root, _, filenames) in os.walk(local_dir):
-            upload_path = dest_path
-            if root != local_dir:
-                rel_path = os.path.relpath(root, local_dir)
-                rel_path = relative_path_to_artifact_path(rel_path)
-                upload_path = posixpath.join(dest_path, rel_path)
-            for f in filenames:
-                path = posixpath.join(upload_path, f)
-                gcs_bucket.blob(path).upload_from_filename(os.path.join(root, f))
+        # Clients are not shared between the threads uploading the files
+        self._log_artifacts_concurrently(
+            local_dir,
+            lambda local_file, rel_path: self._upload_file(
+                self._get_bucket(bucket), local_file, posixpath.join(dest_path, rel_path)))
 
     def list_artifacts(self, path=None):
         (bucket, artifact_path) = self.parse_gcs_uri(self.artifact_uri)
@@ -98,6 +100,18 @@ class GCSArtifactRepository(ArtifactRepository):
 
         return [FileInfo(path[len(artifact_path) + 1:-1], True, None) for path in dir_paths]
 
+    def get_file_info(self, artifact_path):
+        (bucket, remote_root_path) = self.parse_gcs_uri(self.artifact_uri)
+        remote_full_path = posixpath.join(remote_root_path, artifact_path)
+        bkt = self._get_bucket(bucket)
+        blob = bkt.get_blob(remote_full_path)
+        if blob is not None:
+            return FileInfo(artifact_path, False, blob.size)
+        # Directories are only prefixes of the names of their blobs
+        if any(bkt.list_blobs(prefix=remote_full_path + "/", max_results=1)):
+            return FileInfo(artifact_path, True, None)
+        return None
+
     def _download_file(self, remote_file_path, local_path):
         (bucket, remote_root_path) = self.parse_gcs_uri(self.artifact_uri)
         remote_full_path = posixpath.join(remote_root_path, remote_file_path)
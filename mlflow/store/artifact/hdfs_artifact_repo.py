@@ -104,7 +104,7 @@ class HdfsArtifactRepository(ArtifactRepository):
             else:
                 yield hdfs_path, False, hdfs.info(hdfs_path).get("size")
 
-    def download_artifacts(self, artifact_path, dst_path=None):
+    def download_artifacts(self, artifact_path, dst_path=None, progress_callback=None):
         """
             Download an artifact file or directory to a local directory/file if applicable, and
             return a local path for it.
@@ -118,6 +118,10 @@ class HdfsArtifactRepository(ArtifactRepository):
                              exist. If unspecified, the artifacts will be downloaded to a new,
                              uniquely-named
                              directory on the local filesystem.
+            :param progress_callback: Optional function called with the relative source path and
+                                      the local path of each file once it has been downloaded.
+                                      Files are downloaded one at a time over a single HDFS
+                                      connection.
 
             :return: Absolute path of the local filesystem location containing the downloaded
             artifacts - file/directory.
@@ -131,6 +135,8 @@ class HdfsArtifactRepository(ArtifactRepository):
             if not hdfs.isdir(hdfs_base_path):
                 local_path = os.path.join(local_dir, os.path.normpath(artifact_path))
                 _download_hdfs_file(hdfs, hdfs_base_path, local_path)
+                if progress_callback is not None:
+                    progress_callback(artifact_path, local_path)
                 return local_path
 
             for path, is_dir, _ in self._walk_path(hdfs, hdfs_base_path):
@@ -143,6 +149,9 @@ class HdfsArtifactRepository(ArtifactRepository):
                     mkdir(local_path)
                 else:
                     _download_hdfs_file(hdfs, path, local_path)
+                    if progress_callback is not None:
+                        progress_callback(posixpath.join(artifact_path, relative_path),
+                                          local_path)
             return local_dir
 
     def _download_file(self, remote_file_path, local_path):
@@ -2,7 +2,8 @@ import distutils.dir_util as dir_util
 import os
 import shutil
 
-from mlflow.store.artifact.artifact_repo import ArtifactRepository, verify_artifact_path
+from mlflow.store.artifact.artifact_repo import ArtifactRepository, verify_artifact_path, \
+    _ArtifactStream
 from mlflow.utils.file_utils import mkdir, list_all, get_file_info, local_file_uri_to_path, \
     relative_path_to_artifact_path
 
@@ -50,7 +51,7 @@ class LocalArtifactRepository(ArtifactRepository):
             mkdir(artifact_dir)
         dir_util.copy_tree(src=local_dir, dst=artifact_dir, preserve_mode=0, preserve_times=0)
 
-    def download_artifacts(self, artifact_path, dst_path=None):
+    def download_artifacts(self, artifact_path, dst_path=None, progress_callback=None):
         """
         Artifacts tracked by ``LocalArtifactRepository`` already exist on the local filesystem.
         If ``dst_path`` is ``None``, the absolute filesystem path of the specified artifact is
@@ -60,11 +61,14 @@ class LocalArtifactRepository(ArtifactRepository):
         :param dst_path: Absolute path of the local filesystem destination directory to which to
                          download the specified artifacts. This directory must already exist. If
                          unspecified, the absolute path of the local artifact will be returned.
+        :param progress_callback: Optional function called with the relative source path and the
+                                  local path of each file once it has been copied to ``dst_path``.
 
         :return: Absolute path of the local filesystem location containing the desired artifacts.
         """
         if dst_path:
-            return super(LocalArtifactRepository, self).download_artifacts(artifact_path, dst_path)
+            return super(LocalArtifactRepository, self).download_artifacts(
+                artifact_path, dst_path, progress_callback)
         # NOTE: The artifact_path is expected to be in posix format.
         # Posix paths work fine on windows but just in case we normalize it here.
         local_artifact_path = os.path.join(self.artifact_dir, os.path.normpath(artifact_path))
@@ -88,6 +92,18 @@ class LocalArtifactRepository(ArtifactRepository):
         else:
             return []
 
+    def get_file_info(self, artifact_path):
+        # NOTE: The artifact_path is expected to be in posix format.
+        local_path = os.path.join(self.artifact_dir, os.path.normpath(artifact_path))
+        if not os.path.exists(local_path):
+            return None
+        return get_file_info(local_path, artifact_path)
+
+    def open_artifact_stream(self, artifact_path, offset=0, length=None):
+        fileobj = open(self.download_artifacts(artifact_path), "rb")
+        fileobj.seek(offset)
+        return _ArtifactStream(fileobj, length)
+
     def _download_file(self, remote_file_path, local_path):
         # NOTE: The remote_file_path is expected to be in posix format.
         # Posix paths work fine on windows but just in case we normalize it here.
@@ -98,7 +98,7 @@ class RunsArtifactRepository(ArtifactRepository):
         """
         return self.repo.list_artifacts(path)
 
-    def download_artifacts(self, artifact_path, dst_path=None):
+    def download_artifacts(self, artifact_path, dst_path=None, progress_callback=None):
         """
         Download an artifact file or directory to a local directory if applicable, and return a
         local path for it.
@@ -110,10 +110,15 @@ class RunsArtifactRepository(ArtifactRepository):
                          If unspecified, the artifacts will either be downloaded to a new
                          uniquely-named directory on the local filesystem or will be returned
                          directly in the case of the LocalArtifactRepository.
+        :param progress_callback: Optional function called with the relative source path and the
+                                  local path of each file once it has been downloaded.
 
         :return: Absolute path of the local filesystem location containing the desired artifacts.
         """
-        return self.repo.download_artifacts(artifact_path, dst_path)
+        return self.repo.download_artifacts(artifact_path, dst_path, progress_callback)
+
+    def open_artifact_stream(self, artifact_path, offset=0, length=None):
+        return self.repo.open_artifact_stream(artifact_path, offset, length)
 
     def _download_file(self, remote_file_path, local_path):
         """
@@ -1,4 +1,5 @@
 import os
+import threading
 from mimetypes import guess_type
 
 import posixpath
@@ -7,12 +8,17 @@ from six.moves import urllib
 from mlflow import data
 from mlflow.entities import FileInfo
 from mlflow.exceptions import MlflowException
-from mlflow.store.artifact.artifact_repo import ArtifactRepository
-from mlflow.utils.file_utils import relative_path_to_artifact_path
+from mlflow.store.artifact.artifact_repo import ArtifactRepository, _ArtifactStream
 
 
 class S3ArtifactRepository(ArtifactRepository):
     """Stores artifacts on Amazon S3."""
+
+    def __init__(self, artifact_uri):
+        super(S3ArtifactRepository, self).__init__(artifact_uri)
+        self._s3_client = None
+        self._s3_client_lock = threading.Lock()
+
     @staticmethod
     def parse_s3_uri(uri):
         """Parse an S3 URI, returning (bucket, path)"""
@@ -34,6 +40,15 @@ class S3ArtifactRepository(ArtifactRepository):
             return None
 
     def _get_s3_client(self):
+        # boto3 clients are thread-safe, but creating them from the default session is not, so a
+        # single client is shared by the threads transferring the artifacts of this repository
+        with self._s3_client_lock:
+            if self._s3_client is None:
+                self._s3_client = self._create_s3_client()
+            return self._s3_client
+
+    @staticmethod
+    def _create_s3_client():
         import boto3
         from botocore.client import Config
         s3_endpoint_url = os.environ.get('MLFLOW_S3_ENDPOINT_URL')
@@ -58,7 +73,14 @@ class S3ArtifactRepository(ArtifactRepository):
             Filename=local_file,
             Bucket=bucket,
             Key=key,
-            ExtraArgs=extra_args)
+            ExtraArgs=extra_args,
+            Config=self._get_transfer_config())
+
+    def _get_transfer_config(self):
+        from boto3.s3.transfer import TransferConfig
+        return TransferConfig(multipart_threshold=self._get_multipart_upload_threshold(),
+                              multipart_chunksize=self._get_multipart_upload_chunk_size(),
+                              max_concurrency=self._get_max_workers())
 
     def log_artifact(self, local_file, artifact_path=None):
         (bucket, dest_path) = data.parse_s3_uri(self.artifact_uri)
@@ -77,19 +99,13 @@ class S3ArtifactRepository(ArtifactRepository):
         if artifact_path:
             dest_path = posixpath.join(dest_path, artifact_path)
         s3_client = self._get_s3_client()
-        local_dir = os.path.abspath(local_dir)
-        for (root, _, filenames) in os.walk(local_dir):
-            upload_path = dest_path
-            if root != local_dir:
-                rel_path = os.path.relpath(root, local_dir)
-                rel_path = relative_path_to_artifact_path(rel_path)
-                upload_path = posixpath.join(dest_path, rel_path)
-            for f in filenames:
-                self._upload_file(
-                    s3_client=s3_client,
-                    local_file=os.path.join(root, f),
-                    bucket=bucket,
-                    key=posixpath.join(upload_path, f))
+        self._log_artifacts_concurrently(
+            local_dir,
+            lambda local_file, rel_path: self._upload_file(
+                s3_client=s3_client,
+                local_file=local_file,
+                bucket=bucket,
+                key=posixpath.join(dest_path, rel_path)))
 
     def list_artifacts(self, path=None):
         (bucket, artifact_path) = data.parse_s3_uri(self.artifact_uri)
@@ -137,5 +153,31 @@ class S3ArtifactRepository(ArtifactRepository):
         s3_client = self._get_s3_client()
         s3_client.download_file(bucket, s3_full_path, local_path)
 
+    def get_file_info(self, artifact_path):
+        from botocore.exceptions import ClientError
+        (bucket, s3_root_path) = data.parse_s3_uri(self.artifact_uri)
+        s3_full_path = posixpath.join(s3_root_path, artifact_path)
+        s3_client = self._get_s3_client()
+        try:
+            response = s3_client.head_object(Bucket=bucket, Key=s3_full_path)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") not in ("404", "NoSuchKey"):
+                raise
+        else:
+            return FileInfo(artifact_path, False, int(response["ContentLength"]))
+        # Directories are only prefixes of the keys of their files
+        response = s3_client.list_objects_v2(Bucket=bucket, Prefix=s3_full_path + "/", MaxKeys=1)
+        return FileInfo(artifact_path, True, None) if response.get("Contents") else None
+
+    def open_artifact_stream(self, artifact_path, offset=0, length=None):
+        (bucket, s3_root_path) = data.parse_s3_uri(self.artifact_uri)
+        s3_full_path = posixpath.join(s3_root_path, artifact_path)
+        kwargs = {}
+        if offset or length is not None:
+            last_byte = "" if length is None else str(offset + max(length, 1) - 1)
+            kwargs["Range"] = "bytes=%d-%s" % (offset, last_byte)
+        response = self._get_s3_client().get_object(Bucket=bucket, Key=s3_full_path, **kwargs)
+        return _ArtifactStream(response["Body"], length)
+
     def delete_artifacts(self, artifact_path=None):
         raise MlflowException('Not implemented yet')
@@ -11,6 +11,9 @@ from mlflow.exceptions import MlflowException
 class SFTPArtifactRepository(ArtifactRepository):
     """Stores artifacts as files in a remote directory, via sftp."""
 
+    # All transfers go through a single SFTP connection
+    _supports_concurrent_transfers = False
+
     def __init__(self, artifact_uri, client=None):
         self.uri = artifact_uri
         parsed = urllib.parse.urlparse(artifact_uri)
@@ -9,7 +9,7 @@ import sqlalchemy
 
 from mlflow.exceptions import MlflowException
 from mlflow.store.tracking.dbmodels.initial_models import Base as InitialBase
-from mlflow.protos.databricks_pb2 import INTERNAL_ERROR
+from mlflow.protos.databricks_pb2 import INTERNAL_ERROR, INVALID_PARAMETER_VALUE
 from mlflow.store.db.db_types import SQLITE
 
 _logger = logging.getLogger(__name__)
@@ -56,6 +56,35 @@ def _verify_schema(engine):
             "more detail." % (current_rev, head_revision))
 
 
+def _get_keyset_filter_clause(sort_keys, last_sort_key):
+    """
+    Create the filter selecting the rows sorted after a row, to seek to the page after that row
+    rather than skipping the rows of the previous pages with an offset.
+
+    :param sort_keys: List of pairs of the expressions by which the rows are sorted and of
+                      whether they are sorted in ascending order. The rows for which an
+                      expression is NULL must be sorted after its other rows by the previous
+                      expressions, such as a flag of the NULL values.
+    :param last_sort_key: List of the values of the sort expressions for the row after which to
+                          seek, as stored in a page token.
+    :return: SQLAlchemy clause selecting the rows whose sort key is after ``last_sort_key``.
+    """
+    if len(last_sort_key) != len(sort_keys):
+        raise MlflowException("Invalid page token, it does not match the order_by parameter of "
+                              "the search.", error_code=INVALID_PARAMETER_VALUE)
+    clauses = []
+    previous_keys_equal = []
+    for (expression, ascending), value in zip(sort_keys, last_sort_key):
+        if value is None:
+            # Rows with NULL values are last for the expression, so no row is after them
+            previous_keys_equal.append(expression.is_(None))
+            continue
+        is_after = expression > value if ascending else expression < value
+        clauses.append(sqlalchemy.and_(*(previous_keys_equal + [is_after])))
+        previous_keys_equal.append(expression == value)
+    return sqlalchemy.or_(*clauses)
+
+
 def _get_managed_session_maker(SessionMaker, db_type):
     """
     Creates a factory for producing exception-safe SQLAlchemy sessions that are made available
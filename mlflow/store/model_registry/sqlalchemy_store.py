@@ -282,17 +282,20 @@ class SqlAlchemyStore(AbstractStore):
                                   INVALID_PARAMETER_VALUE)
 
         parsed_filter = SearchUtils.parse_filter_for_registered_models(filter_string)
-        parsed_orderby = self._parse_search_registered_models_order_by(order_by)
-        offset = SearchUtils.parse_start_offset_from_page_token(page_token)
+        sort_keys = self._get_search_registered_models_order_by_keys(order_by)
+        # Pages start after the sort key of the last registered model of the previous page.
+        # Page tokens encoding an offset are still supported.
+        offset, last_sort_key = SearchUtils.parse_page_token(page_token)
         # we query for max_results + 1 items to check whether there is another page to return.
         # this remediates having to make another query which returns no items.
         max_results_for_query = max_results + 1
 
-        def compute_next_token(current_size):
+        def compute_next_token(sql_registered_models):
             next_token = None
-            if max_results_for_query == current_size:
-                final_offset = offset + max_results
-                next_token = SearchUtils.create_page_token(final_offset)
+            if max_results_for_query == len(sql_registered_models):
+                last_model = sql_registered_models[max_results - 1]
+                next_token = SearchUtils.create_keyset_page_token(
+                    [getattr(last_model, field.key) for field, _ in sort_keys])
             return next_token
 
         if len(parsed_filter) == 0:
@@ -320,25 +323,30 @@ class SqlAlchemyStore(AbstractStore):
             raise MlflowException(f'Invalid filter string: {filter_string}'
                                   'Search registered models supports filter expressions like:' +
                                   sample_query, error_code=INVALID_PARAMETER_VALUE)
+        if last_sort_key is not None:
+            conditions.append(
+                mlflow.store.db.utils._get_keyset_filter_clause(sort_keys, last_sort_key))
         with self.ManagedSessionMaker() as session:
             query = session\
                 .query(SqlRegisteredModel)\
                 .filter(*conditions)\
-                .order_by(*parsed_orderby)\
+                .order_by(*[field.asc() if ascending else field.desc()
+                            for field, ascending in sort_keys])\
                 .limit(max_results_for_query)
-            if page_token:
+            if offset:
                 query = query.offset(offset)
             sql_registered_models = query.all()
-            next_page_token = compute_next_token(len(sql_registered_models))
+            next_page_token = compute_next_token(sql_registered_models)
             rm_entities = [rm.to_mlflow_entity() for rm in sql_registered_models][:max_results]
             return PagedList(rm_entities, next_page_token)
 
     @classmethod
-    def _parse_search_registered_models_order_by(cls, order_by_list):
-        """Sorts a set of registered models based on their natural ordering and an overriding set
-        of order_bys. Registered models are naturally ordered first by name ascending.
+    def _get_search_registered_models_order_by_keys(cls, order_by_list):
+        """Returns the sort keys of registered models as pairs of a column and of whether it is
+        sorted in ascending order. Registered models are sorted by their natural ordering and an
+        overriding set of order_bys. Registered models are naturally ordered by name ascending.
         """
-        clauses = []
+        keys = []
         if order_by_list:
             for order_by_clause in order_by_list:
                 attribute_token, ascending = \
@@ -353,13 +361,10 @@ class SqlAlchemyStore(AbstractStore):
                         f"Valid keys are "
                         f"'{SearchUtils.RECOMMENDED_ORDER_BY_KEYS_REGISTERED_MODELS}'",
                         error_code=INVALID_PARAMETER_VALUE)
-                if ascending:
-                    clauses.append(field.asc())
-                else:
-                    clauses.append(field.desc())
+                keys.append((field, ascending))
 
-        clauses.append(SqlRegisteredModel.name.asc())
-        return clauses
+        keys.append((SqlRegisteredModel.name, True))
+        return keys
 
     def get_registered_model(self, name):
         """
@@ -206,6 +206,36 @@ class AbstractStore:
         """
         pass
 
+    def get_metric_histories(self, run_ids, metric_keys=None, max_points_per_series=None,
+                             step_range=None):
+        """
+        Return the histories of several metrics of several runs.
+
+        :param run_ids: List of unique identifiers of runs.
+        :param metric_keys: List of metric names, or None for all the metrics of the runs.
+        :param max_points_per_series: Maximum number of points to return for each metric of each
+            run, or None to return all the points. Longer histories are downsampled as described
+            in :py:func:`mlflow.store.tracking.metric_history.downsample_metric_history`.
+        :param step_range: Optional pair of the minimum and maximum steps, inclusive, of the
+            points to return. Either step may be None for an open range.
+
+        :return: Dictionary mapping run IDs to dictionaries mapping metric names to lists of
+            :py:class:`mlflow.entities.Metric` entities, sorted by step and timestamp. Metrics
+            without points are omitted.
+        """
+        from mlflow.store.tracking.metric_history import validate_metric_histories_request, \
+            add_metric_history
+        validate_metric_histories_request(run_ids, metric_keys, max_points_per_series, step_range)
+        histories = {}
+        for run_id in run_ids:
+            keys = metric_keys
+            if keys is None:
+                keys = list(self.get_run(run_id).data.metrics)
+            for key in keys:
+                add_metric_history(histories, run_id, key, self.get_metric_history(run_id, key),
+                                   max_points_per_series, step_range)
+        return histories
+
     def search_runs(self, experiment_ids, filter_string, run_view_type,
                     max_results=SEARCH_MAX_RESULTS_DEFAULT, order_by=None, page_token=None):
         """
@@ -245,6 +275,33 @@ class AbstractStore:
         """
         pass
 
+    def export_runs(self, experiment_ids, filter_string, run_view_type, order_by, export_format,
+                    output, max_results=None):
+        """
+        Write the runs that match the given list of search expressions within the experiments as
+        Apache Arrow or Apache Parquet data, one page of runs at a time.
+
+        :param experiment_ids: List of experiment ids to scope the search
+        :param filter_string: A search filter string.
+        :param run_view_type: ACTIVE_ONLY, DELETED_ONLY, or ALL runs
+        :param order_by: List of order_by clauses.
+        :param export_format: ``parquet`` to write a Parquet file, or ``arrow`` to write an Arrow
+            IPC stream. The schema of the data is described in
+            :py:mod:`mlflow.store.tracking.run_export`.
+        :param output: Writable binary file-like object to which the data is written.
+        :param max_results: Maximum number of runs to export, or None to export all the runs that
+            match the search.
+
+        :return: None.
+        """
+        from mlflow.store.tracking.run_export import iter_run_pages, iter_export_chunks, \
+            validate_export_format
+        validate_export_format(export_format)
+        run_pages = iter_run_pages(self, experiment_ids, filter_string, run_view_type, order_by,
+                                   max_results)
+        for chunk in iter_export_chunks(run_pages, export_format):
+            output.write(chunk)
+
     def list_run_infos(self, experiment_id, run_view_type):
         """
         Return run information for runs which belong to the experiment_id.
@@ -0,0 +1,225 @@
+"""
+Read-through cache of the runs and experiments of a tracking store. The tracking server wraps its
+backend store in a :py:class:`CachingStore` so that repeated reads of the same entities, for
+example by dashboards polling a set of runs, do not query the backend store every time.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from mlflow.entities import ViewType
+from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
+from mlflow.store.tracking.abstract_store import AbstractStore
+
+_DEFAULT_MAX_SIZE = 1000
+
+
+class _EntityCache(object):
+    """
+    Thread-safe LRU cache holding at most ``max_size`` entries, each of which expires after its
+    own time to live.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Incremented by every invalidation, so that values loaded before an invalidation are not
+        # cached after it
+        self._generation = 0
+
+    def get_or_load(self, key, load_func, get_ttl):
+        """
+        :param key: Key of the entry.
+        :param load_func: Function taking no arguments that loads the value of the entry.
+        :param get_ttl: Function taking the loaded value, returning the number of seconds for which
+                        to cache it, or None to cache it until it is evicted or invalidated.
+        :return: The cached value, or the value returned by ``load_func`` if there is none.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                value, expiration_time = entry
+                if expiration_time is None or expiration_time > time.time():
+                    # Re-insert the entry to mark it as most recently used
+                    self._entries[key] = entry
+                    return value
+            generation = self._generation
+        value = load_func()
+        ttl = get_ttl(value)
+        with self._lock:
+            if self._generation == generation:
+                self._entries[key] = (value, None if ttl is None else time.time() + ttl)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, key):
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+class CachingStore(AbstractStore):
+    """
+    Tracking store that caches the runs and experiments read from another store.
+
+    Runs, experiments and experiment listings are cached for ``ttl`` seconds. The cached entities
+    are invalidated by the writes that go through this store; writes made through other processes,
+    such as the other processes of the tracking server, are only visible once the cached entities
+    expire. Terminated runs expire too, since their tags, lifecycle stage and artifacts can still
+    change. Other reads are not cached.
+    """
+
+    def __init__(self, store, ttl, max_size=_DEFAULT_MAX_SIZE):
+        """
+        :param store: Tracking store whose entities to cache.
+        :param ttl: Number of seconds for which to cache entities.
+        :param max_size: Maximum number of runs, and of experiments, to cache.
+        """
+        super(CachingStore, self).__init__()
+        self.store = store
+        self.ttl = ttl
+        self._runs = _EntityCache(max_size)
+        self._experiments = _EntityCache(max_size)
+
+    def __getattr__(self, name):
+        # Store-specific methods are forwarded without caching
+        if name == "store":
+            raise AttributeError(name)
+        return getattr(self.store, name)
+
+    def _get_ttl(self, _):
+        return self.ttl
+
+    def list_experiments(self, view_type=ViewType.ACTIVE_ONLY):
+        return self._experiments.get_or_load(("list", view_type),
+                                             lambda: self.store.list_experiments(view_type),
+                                             self._get_ttl)
+
+    def create_experiment(self, name, artifact_location):
+        try:
+            return self.store.create_experiment(name, artifact_location)
+        finally:
+            self._experiments.clear()
+
+    def get_experiment(self, experiment_id):
+        return self._experiments.get_or_load(("id", str(experiment_id)),
+                                             lambda: self.store.get_experiment(experiment_id),
+                                             self._get_ttl)
+
+    def get_experiment_by_name(self, experiment_name):
+        return self.store.get_experiment_by_name(experiment_name)
+
+    def delete_experiment(self, experiment_id):
+        try:
+            self.store.delete_experiment(experiment_id)
+        finally:
+            self._experiments.clear()
+            self._runs.clear()
+
+    def restore_experiment(self, experiment_id):
+        try:
+            self.store.restore_experiment(experiment_id)
+        finally:
+            self._experiments.clear()
+            self._runs.clear()
+
+    def rename_experiment(self, experiment_id, new_name):
+        try:
+            self.store.rename_experiment(experiment_id, new_name)
+        finally:
+            self._experiments.clear()
+
+    def set_experiment_tag(self, experiment_id, tag):
+        try:
+            self.store.set_experiment_tag(experiment_id, tag)
+        finally:
+            self._experiments.clear()
+
+    def get_run(self, run_id):
+        return self._runs.get_or_load(run_id, lambda: self.store.get_run(run_id),
+                                      self._get_ttl)
+
+    def update_run_info(self, run_id, run_status, end_time):
+        try:
+            return self.store.update_run_info(run_id, run_status, end_time)
+        finally:
+            self._runs.invalidate(run_id)
+
+    def create_run(self, experiment_id, user_id, start_time, tags):
+        return self.store.create_run(experiment_id, user_id, start_time, tags)
+
+    def delete_run(self, run_id):
+        try:
+            self.store.delete_run(run_id)
+        finally:
+            self._runs.invalidate(run_id)
+
+    def restore_run(self, run_id):
+        try:
+            self.store.restore_run(run_id)
+        finally:
+            self._runs.invalidate(run_id)
+
+    def log_metric(self, run_id, metric):
+        try:
+            self.store.log_metric(run_id, metric)
+        finally:
+            self._runs.invalidate(run_id)
+
+    def log_param(self, run_id, param):
+        try:
+            self.store.log_param(run_id, param)
+        finally:
+            self._runs.invalidate(run_id)
+
+    def set_tag(self, run_id, tag):
+        try:
+            self.store.set_tag(run_id, tag)
+        finally:
+            self._runs.invalidate(run_id)
+
+    def delete_tag(self, run_id, key):
+        try:
+            self.store.delete_tag(run_id, key)
+        finally:
+            self._runs.invalidate(run_id)
+
+    def log_batch(self, run_id, metrics, params, tags):
+        try:
+            self.store.log_batch(run_id, metrics, params, tags)
+        finally:
+            self._runs.invalidate(run_id)
+
+    def record_logged_model(self, run_id, mlflow_model):
+        try:
+            self.store.record_logged_model(run_id, mlflow_model)
+        finally:
+            self._runs.invalidate(run_id)
+
+    def get_metric_history(self, run_id, metric_key):
+        return self.store.get_metric_history(run_id, metric_key)
+
+    def get_metric_histories(self, run_ids, metric_keys=None, max_points_per_series=None,
+                             step_range=None):
+        return self.store.get_metric_histories(run_ids, metric_keys, max_points_per_series,
+                                               step_range)
+
+    def search_runs(self, experiment_ids, filter_string, run_view_type,
+                    max_results=SEARCH_MAX_RESULTS_DEFAULT, order_by=None, page_token=None):
+        return self.store.search_runs(experiment_ids, filter_string, run_view_type,
+                                      max_results, order_by, page_token)
+
+    def _search_runs(self, experiment_ids, filter_string, run_view_type, max_results, order_by,
+                     page_token):
+        return self.store._search_runs(experiment_ids, filter_string, run_view_type,
+                                       max_results, order_by, page_token)
+
+    def list_run_infos(self, experiment_id, run_view_type):
+        return self.store.list_run_infos(experiment_id, run_view_type)
@@ -5,6 +5,7 @@ import sys
 import shutil
 
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 from mlflow.entities import Experiment, Metric, Param, Run, RunData, RunInfo, RunStatus, RunTag, \
     ViewType, SourceType, ExperimentTag
@@ -16,6 +17,9 @@ from mlflow.models import Model
 from mlflow.protos.databricks_pb2 import INTERNAL_ERROR, RESOURCE_DOES_NOT_EXIST
 from mlflow.store.tracking import DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH, SEARCH_MAX_RESULTS_THRESHOLD
 from mlflow.store.tracking.abstract_store import AbstractStore
+from mlflow.store.tracking.file_store_search_index import FileStoreSearchIndex
+from mlflow.store.tracking.metric_history import validate_metric_histories_request, \
+    add_metric_history
 from mlflow.utils.validation import _validate_metric_name, _validate_param_name, _validate_run_id, \
     _validate_tag_name, _validate_experiment_id, \
     _validate_batch_log_limits, _validate_batch_log_data
@@ -30,6 +34,9 @@ from mlflow.utils.uri import append_to_uri_path
 from mlflow.utils.mlflow_tags import MLFLOW_LOGGED_MODELS
 
 _TRACKING_DIR_ENV_VAR = "MLFLOW_TRACKING_DIR"
+_SEARCH_INDEX_ENV_VAR = "MLFLOW_FILE_STORE_SEARCH_INDEX"
+# Number of threads reading the metric histories requested by get_metric_histories
+_METRIC_HISTORY_READER_THREADS = 8
 
 
 def _default_root_dir():
@@ -92,11 +99,23 @@ class FileStore(AbstractStore):
     META_DATA_FILE_NAME = "meta.yaml"
     DEFAULT_EXPERIMENT_ID = "0"
 
-    def __init__(self, root_directory=None, artifact_root_uri=None):
+    def __init__(self, root_directory=None, artifact_root_uri=None, use_search_index=None):
         """
         Create a new FileStore with the given root directory and a given default artifact root URI.
+
+        :param use_search_index: If True, run searches are answered from a per-experiment index
+                                 (see :py:class:`FileStoreSearchIndex`) that is built on first
+                                 search and kept up to date as runs are logged, rather than by
+                                 reading every run directory. The index only reflects runs
+                                 modified through FileStore instances with the index enabled;
+                                 call :py:meth:`rebuild_search_index` after modifying runs by
+                                 other means. Defaults to the value of the
+                                 ``MLFLOW_FILE_STORE_SEARCH_INDEX`` environment variable.
         """
         super(FileStore, self).__init__()
+        if use_search_index is None:
+            use_search_index = (get_env(_SEARCH_INDEX_ENV_VAR) or "").lower() in ["true", "1"]
+        self.use_search_index = use_search_index
         self.root_directory = local_file_uri_to_path(root_directory or _default_root_dir())
         self.artifact_root_uri = artifact_root_uri or path_to_local_file_uri(self.root_directory)
         self.trash_folder = os.path.join(self.root_directory, FileStore.TRASH_FOLDER_NAME)
@@ -334,8 +353,9 @@ class FileStore(AbstractStore):
         Permanently delete a run (metadata and metrics, tags, parameters).
         This is used by the ``mlflow gc`` command line and is not intended to be used elsewhere.
         """
-        _, run_dir = self._find_run_root(run_id)
+        experiment_id, run_dir = self._find_run_root(run_id)
         shutil.rmtree(run_dir)
+        self._update_search_index(experiment_id, lambda index: index.delete_runs([run_id]))
 
     def _get_deleted_runs(self):
         experiment_ids = self._get_active_experiments() + self._get_deleted_experiments()
@@ -412,7 +432,12 @@ class FileStore(AbstractStore):
         mkdir(run_dir, FileStore.PARAMS_FOLDER_NAME)
         mkdir(run_dir, FileStore.ARTIFACTS_FOLDER_NAME)
         for tag in tags:
-            self.set_tag(run_uuid, tag)
+            _validate_tag_name(tag.key)
+            self._set_run_tag(run_info, tag)
+        self._update_search_index(
+            experiment_id,
+            lambda index: index.add_runs([Run(run_info, RunData(tags=[
+                RunTag(tag.key, self._writeable_value(tag.value)) for tag in tags]))]))
         return self.get_run(run_id=run_uuid)
 
     def get_run(self, run_id):
@@ -530,6 +555,36 @@ class FileStore(AbstractStore):
         run_info = self._get_run_info(run_id)
         return self._get_metric_history(run_info, metric_key)
 
+    def get_metric_histories(self, run_ids, metric_keys=None, max_points_per_series=None,
+                             step_range=None):
+        validate_metric_histories_request(run_ids, metric_keys, max_points_per_series,
+                                          step_range)
+        for metric_key in metric_keys or []:
+            _validate_metric_name(metric_key)
+        series = []
+        for run_id in run_ids:
+            _validate_run_id(run_id)
+            run_info = self._get_run_info(run_id)
+            parent_path, metric_files = self._get_run_files(run_info, "metric")
+            if metric_keys is not None:
+                metric_files = set(metric_files)
+                metric_files = [key for key in metric_keys if key in metric_files]
+            series.extend((run_id, parent_path, key) for key in metric_files)
+
+        def read_metric_history(run_series):
+            _, parent_path, metric_key = run_series
+            return [FileStore._get_metric_from_line(metric_key, line)
+                    for line in read_file_lines(parent_path, metric_key)]
+
+        # Each metric history is a file of its own, so the files are read in parallel
+        with ThreadPoolExecutor(max_workers=_METRIC_HISTORY_READER_THREADS) as executor:
+            series_histories = list(executor.map(read_metric_history, series))
+        histories = {}
+        for (run_id, _, metric_key), history in zip(series, series_histories):
+            add_metric_history(histories, run_id, metric_key, history, max_points_per_series,
+                               step_range)
+        return histories
+
     def _get_metric_history(self, run_info, metric_key):
         parent_path, metric_files = self._get_run_files(run_info, "metric")
         if metric_key not in metric_files:
@@ -619,6 +674,133 @@ class FileStore(AbstractStore):
                                 exc_info=True)
         return run_infos
 
+    def _get_search_index(self, experiment_id):
+        experiment_dir = self._get_experiment_path(experiment_id)
+        if experiment_dir is None:
+            return None
+        return FileStoreSearchIndex(experiment_dir)
+
+    def _update_search_index(self, experiment_id, update_func):
+        """
+        Apply ``update_func`` to the search index of the specified experiment, if the index is
+        enabled and has already been built. If the update fails, the index is deleted so that it
+        is rebuilt by the next search rather than returning stale results.
+
+        The update waits for any rebuild of the index in progress, so that it is applied to the
+        rebuilt index if the rebuild read the run before it was modified.
+        """
+        if not self.use_search_index:
+            return
+        index = self._get_search_index(experiment_id)
+        if index is None:
+            return
+        with index.lock(shared=True):
+            if not index.exists():
+                return
+            try:
+                update_func(index)
+            except Exception as e:  # pylint: disable=broad-except
+                logging.warning("Failed to update the search index of experiment '%s', it will "
+                                "be rebuilt by the next search. Detailed error %s", experiment_id,
+                                str(e))
+                index.delete()
+
+    def rebuild_search_index(self, experiment_id):
+        """
+        Rebuild the search index of the specified experiment from its run directories. This is
+        only necessary if runs of the experiment were modified without going through a FileStore
+        that has the search index enabled.
+
+        :param experiment_id: String ID of the experiment
+        """
+        index = self._get_search_index(experiment_id)
+        if index is None:
+            raise MlflowException("Could not find experiment with ID %s" % experiment_id,
+                                  databricks_pb2.RESOURCE_DOES_NOT_EXIST)
+        experiment_dir = get_parent_dir(index.path)
+        with index.lock():
+            runs, ignored_entries = self._get_runs_from_dirs(
+                experiment_id, experiment_dir, sorted(self._list_run_dir_names(experiment_dir)))
+            index.rebuild(runs, ignored_entries)
+
+    @staticmethod
+    def _list_run_dir_names(experiment_dir):
+        """
+        List the names of the entries of the experiment directory that may be run directories,
+        without checking which of them are directories.
+        """
+        return set(name for name in os.listdir(experiment_dir)
+                   if name not in FileStore.RESERVED_EXPERIMENT_FOLDERS and
+                   name != FileStore.META_DATA_FILE_NAME and not name.startswith("."))
+
+    def _get_runs_from_dirs(self, experiment_id, experiment_dir, names):
+        """
+        :return: Tuple of the runs read from the specified entries of the experiment directory,
+                 and of the names of the entries that could not be read as runs.
+        """
+        runs = []
+        ignored_entries = []
+        for name in names:
+            run_dir = os.path.join(experiment_dir, name)
+            if not os.path.isdir(run_dir):
+                ignored_entries.append(name)
+                continue
+            try:
+                run_info = self._get_run_info_from_dir(run_dir)
+            except MissingConfigException as rnfe:
+                logging.warning("Malformed run '%s'. Detailed error %s", name, str(rnfe),
+                                exc_info=True)
+                ignored_entries.append(name)
+                continue
+            if run_info.experiment_id != experiment_id:
+                logging.warning("Wrong experiment ID (%s) recorded for run '%s'. "
+                                "It should be %s. Run will be ignored.",
+                                str(run_info.experiment_id), str(run_info.run_id),
+                                str(experiment_id))
+                ignored_entries.append(name)
+                continue
+            runs.append(self._get_run_from_info(run_info))
+        return runs, ignored_entries
+
+    def _get_indexed_runs(self, experiment_id, view_type):
+        """
+        Return the runs of the specified experiment from its search index, building the index if
+        it does not exist yet. Runs whose directories were created or removed since the index was
+        last updated are added to or removed from the index, which only requires listing the
+        experiment directory. Entries of the directory that cannot be read as runs are recorded in
+        the index, so that they are only read once.
+        """
+        self._check_root_dir()
+        index = self._get_search_index(experiment_id)
+        if index is None:
+            return []
+        if not index.is_valid():
+            self.rebuild_search_index(experiment_id)
+            return index.get_runs(view_type)
+        experiment_dir = get_parent_dir(index.path)
+        if self._list_run_dir_names(experiment_dir) != \
+                index.run_ids() | index.ignored_entries():
+            with index.lock():
+                # Run directories are read again under the lock, so that updates of the new runs
+                # made while they are read are not overwritten
+                entries = self._list_run_dir_names(experiment_dir)
+                indexed_run_ids = index.run_ids()
+                ignored_entries = index.ignored_entries()
+                removed_run_ids = indexed_run_ids - entries
+                removed_ignored_entries = ignored_entries - entries
+                new_runs, new_ignored_entries = self._get_runs_from_dirs(
+                    experiment_id, experiment_dir,
+                    sorted(entries - indexed_run_ids - ignored_entries))
+                if removed_run_ids:
+                    index.delete_runs(removed_run_ids)
+                if removed_ignored_entries:
+                    index.delete_ignored_entries(removed_ignored_entries)
+                if new_runs:
+                    index.add_runs(new_runs)
+                if new_ignored_entries:
+                    index.add_ignored_entries(new_ignored_entries)
+        return index.get_runs(view_type)
+
     def _search_runs(self, experiment_ids, filter_string, run_view_type, max_results, order_by,
                      page_token):
         if max_results > SEARCH_MAX_RESULTS_THRESHOLD:
@@ -628,11 +810,15 @@ class FileStore(AbstractStore):
                                   databricks_pb2.INVALID_PARAMETER_VALUE)
         runs = []
         for experiment_id in experiment_ids:
-            run_infos = self._list_run_infos(experiment_id, run_view_type)
-            runs.extend(self._get_run_from_info(r) for r in run_infos)
+            if self.use_search_index:
+                runs.extend(self._get_indexed_runs(experiment_id, run_view_type))
+            else:
+                run_infos = self._list_run_infos(experiment_id, run_view_type)
+                runs.extend(self._get_run_from_info(r) for r in run_infos)
         filtered = SearchUtils.filter(runs, filter_string)
         sorted_runs = SearchUtils.sort(filtered, order_by)
-        runs, next_page_token = SearchUtils.paginate(sorted_runs, page_token, max_results)
+        runs, next_page_token = SearchUtils.paginate(sorted_runs, page_token, max_results,
+                                                     order_by)
         return runs, next_page_token
 
     def log_metric(self, run_id, metric):
@@ -641,6 +827,8 @@ class FileStore(AbstractStore):
         run_info = self._get_run_info(run_id)
         check_run_is_active(run_info)
         self._log_run_metric(run_info, metric)
+        self._update_search_index(run_info.experiment_id,
+                                  lambda index: index.log_batch(run_id, metrics=[metric]))
 
     def _log_run_metric(self, run_info, metric):
         metric_path = self._get_metric_path(run_info.experiment_id, run_info.run_id, metric.key)
@@ -661,6 +849,9 @@ class FileStore(AbstractStore):
         run_info = self._get_run_info(run_id)
         check_run_is_active(run_info)
         self._log_run_param(run_info, param)
+        writeable_param = Param(param.key, self._writeable_value(param.value))
+        self._update_search_index(run_info.experiment_id,
+                                  lambda index: index.log_batch(run_id, params=[writeable_param]))
 
     def _log_run_param(self, run_info, param):
         param_path = self._get_param_path(run_info.experiment_id, run_info.run_id, param.key)
@@ -713,6 +904,9 @@ class FileStore(AbstractStore):
         run_info = self._get_run_info(run_id)
         check_run_is_active(run_info)
         self._set_run_tag(run_info, tag)
+        writeable_tag = RunTag(tag.key, self._writeable_value(tag.value))
+        self._update_search_index(run_info.experiment_id,
+                                  lambda index: index.log_batch(run_id, tags=[writeable_tag]))
 
     def _set_run_tag(self, run_info, tag):
         tag_path = self._get_tag_path(run_info.experiment_id, run_info.run_id, tag.key)
@@ -734,11 +928,15 @@ class FileStore(AbstractStore):
             raise MlflowException("No tag with name: {} in run with id {}".format(key, run_id),
                                   error_code=RESOURCE_DOES_NOT_EXIST)
         os.remove(tag_path)
+        self._update_search_index(run_info.experiment_id,
+                                  lambda index: index.delete_tag(run_id, key))
 
     def _overwrite_run_info(self, run_info):
         run_dir = self._get_run_dir(run_info.experiment_id, run_info.run_id)
         run_info_dict = _make_persisted_run_info_dict(run_info)
         write_yaml(run_dir, FileStore.META_DATA_FILE_NAME, run_info_dict, overwrite=True)
+        self._update_search_index(run_info.experiment_id,
+                                  lambda index: index.update_run_info(run_info))
 
     def log_batch(self, run_id, metrics, params, tags):
         _validate_run_id(run_id)
@@ -755,6 +953,12 @@ class FileStore(AbstractStore):
                 self._set_run_tag(run_info, tag)
         except Exception as e:
             raise MlflowException(e, INTERNAL_ERROR)
+        self._update_search_index(
+            run_info.experiment_id,
+            lambda index: index.log_batch(
+                run_id, metrics=metrics,
+                params=[Param(p.key, self._writeable_value(p.value)) for p in params],
+                tags=[RunTag(t.key, self._writeable_value(t.value)) for t in tags]))
 
     def record_logged_model(self, run_id, mlflow_model):
         if not isinstance(mlflow_model, Model):
@@ -777,3 +981,5 @@ class FileStore(AbstractStore):
             self._set_run_tag(run_info, tag)
         except Exception as e:
             raise MlflowException(e, INTERNAL_ERROR)
+        self._update_search_index(run_info.experiment_id,
+                                  lambda index: index.log_batch(run_id, tags=[tag]))
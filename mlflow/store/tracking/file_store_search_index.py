@@ -0,0 +1,279 @@
+"""
+SQLite-backed index of the runs of a :py:class:`mlflow.store.tracking.file_store.FileStore`
+experiment. The index lives in the experiment directory and holds the run info, latest metric
+values, params and tags of every run in the experiment, so that runs can be searched without
+reading every run directory.
+
+Incremental updates of the index by FileStores, which may run in several processes sharing the
+experiment directory, hold a shared lock on a lock file next to the index. Rebuilds and other
+updates made from the run directories hold the lock exclusively from reading the runs until the
+index is updated, so that they neither miss nor overwrite the incremental updates of runs
+modified in the meantime.
+"""
+import os
+import sqlite3
+import uuid
+from contextlib import contextmanager
+
+from mlflow.entities import Metric, Param, Run, RunData, RunInfo, RunTag
+from mlflow.entities.lifecycle_stage import LifecycleStage
+from mlflow.store.artifact.artifact_cache import _file_lock
+
+_SCHEMA_VERSION = 2
+
+_SCHEMA = [
+    """CREATE TABLE runs (
+        run_uuid TEXT PRIMARY KEY,
+        experiment_id TEXT NOT NULL,
+        user_id TEXT,
+        status TEXT,
+        start_time INTEGER,
+        end_time INTEGER,
+        lifecycle_stage TEXT,
+        artifact_uri TEXT
+    )""",
+    """CREATE TABLE latest_metrics (
+        run_uuid TEXT NOT NULL,
+        key TEXT NOT NULL,
+        value REAL,
+        timestamp INTEGER,
+        step INTEGER,
+        PRIMARY KEY (run_uuid, key)
+    )""",
+    """CREATE TABLE params (
+        run_uuid TEXT NOT NULL,
+        key TEXT NOT NULL,
+        value TEXT,
+        PRIMARY KEY (run_uuid, key)
+    )""",
+    """CREATE TABLE tags (
+        run_uuid TEXT NOT NULL,
+        key TEXT NOT NULL,
+        value TEXT,
+        PRIMARY KEY (run_uuid, key)
+    )""",
+    # Entries of the experiment directory that could not be read as runs, so that they are not
+    # read again by every search
+    """CREATE TABLE ignored_entries (
+        name TEXT PRIMARY KEY
+    )""",
+]
+
+_DATA_TABLES = ["latest_metrics", "params", "tags"]
+
+_replace_file = getattr(os, "replace", os.rename)
+
+
+def _metric_sort_key(metric):
+    # Same ordering as FileStore._get_metric_from_file
+    return metric.step, metric.timestamp, metric.value
+
+
+def _metric_from_row(key, value, timestamp, step):
+    # SQLite stores NaN as NULL
+    return Metric(key=key, value=float("nan") if value is None else value,
+                  timestamp=timestamp, step=step)
+
+
+class FileStoreSearchIndex(object):
+    """
+    Search index of a single FileStore experiment, stored as a SQLite database in the experiment
+    directory. The index is kept up to date by the FileStore that owns it and can be rebuilt from
+    the run directories at any time with :py:meth:`rebuild`.
+    """
+    INDEX_FILE_NAME = ".search_index.db"
+
+    def __init__(self, experiment_dir):
+        self.path = os.path.join(experiment_dir, FileStoreSearchIndex.INDEX_FILE_NAME)
+
+    @staticmethod
+    @contextmanager
+    def _connect(path):
+        conn = sqlite3.connect(path, timeout=60)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def lock(self, shared=False):
+        """
+        Hold the lock of the index: shared to apply incremental updates to the index, or exclusive
+        to update the index from the run directories.
+        """
+        return _file_lock(self.path + ".lock", shared=shared)
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def is_valid(self):
+        """
+        :return: True if the index exists and was created with the current schema version.
+        """
+        if not self.exists():
+            return False
+        try:
+            with self._connect(self.path) as conn:
+                return conn.execute("PRAGMA user_version").fetchone()[0] == _SCHEMA_VERSION
+        except sqlite3.DatabaseError:
+            return False
+
+    def delete(self):
+        if self.exists():
+            os.remove(self.path)
+
+    def rebuild(self, runs, ignored_entries=()):
+        """
+        Replace the contents of the index with the specified runs. The new index is written to a
+        temporary file that atomically replaces the existing index, so that concurrent readers
+        never observe a partially built index. The exclusive :py:meth:`lock` must be held from
+        reading ``runs`` until the index is replaced.
+
+        :param runs: List of :py:class:`mlflow.entities.Run` to index.
+        :param ignored_entries: Names of the entries of the experiment directory that could not be
+                                read as runs.
+        """
+        tmp_path = "%s.%s.tmp" % (self.path, uuid.uuid4().hex)
+        try:
+            with self._connect(tmp_path) as conn:
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+                conn.execute("PRAGMA user_version = %d" % _SCHEMA_VERSION)
+                self._insert_runs(conn, runs)
+                self._insert_ignored_entries(conn, ignored_entries)
+            _replace_file(tmp_path, self.path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def run_ids(self):
+        with self._connect(self.path) as conn:
+            return set(row[0] for row in conn.execute("SELECT run_uuid FROM runs"))
+
+    def ignored_entries(self):
+        with self._connect(self.path) as conn:
+            return set(row[0] for row in conn.execute("SELECT name FROM ignored_entries"))
+
+    def add_ignored_entries(self, names):
+        with self._connect(self.path) as conn:
+            self._insert_ignored_entries(conn, names)
+
+    def delete_ignored_entries(self, names):
+        with self._connect(self.path) as conn:
+            conn.executemany("DELETE FROM ignored_entries WHERE name = ?",
+                             [(name,) for name in names])
+
+    def add_runs(self, runs):
+        """
+        Add the specified runs to the index, replacing any indexed data of runs with the same IDs.
+        """
+        run_ids = [run.info.run_id for run in runs]
+        with self._connect(self.path) as conn:
+            self._delete_runs(conn, run_ids)
+            # Run directories that were ignored while the runs were being created
+            conn.executemany("DELETE FROM ignored_entries WHERE name = ?",
+                             [(run_id,) for run_id in run_ids])
+            self._insert_runs(conn, runs)
+
+    def delete_runs(self, run_ids):
+        with self._connect(self.path) as conn:
+            self._delete_runs(conn, run_ids)
+
+    def update_run_info(self, run_info):
+        with self._connect(self.path) as conn:
+            conn.execute("INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                         self._run_info_row(run_info))
+
+    def log_batch(self, run_id, metrics=(), params=(), tags=()):
+        """
+        Record newly logged metrics, params and tags of the specified run. Only the latest value of
+        each metric is kept, as determined by ``(step, timestamp, value)``.
+        """
+        with self._connect(self.path) as conn:
+            latest_metrics = {}
+            for metric in metrics:
+                current = latest_metrics.get(metric.key)
+                if current is None:
+                    row = conn.execute(
+                        "SELECT value, timestamp, step FROM latest_metrics "
+                        "WHERE run_uuid = ? AND key = ?", (run_id, metric.key)).fetchone()
+                    current = _metric_from_row(metric.key, *row) if row is not None else None
+                if current is None or _metric_sort_key(metric) >= _metric_sort_key(current):
+                    latest_metrics[metric.key] = metric
+            conn.executemany("INSERT OR REPLACE INTO latest_metrics VALUES (?, ?, ?, ?, ?)",
+                             [(run_id, m.key, m.value, m.timestamp, m.step)
+                              for m in latest_metrics.values()])
+            conn.executemany("INSERT OR REPLACE INTO params VALUES (?, ?, ?)",
+                             [(run_id, p.key, p.value) for p in params])
+            conn.executemany("INSERT OR REPLACE INTO tags VALUES (?, ?, ?)",
+                             [(run_id, t.key, t.value) for t in tags])
+
+    def delete_tag(self, run_id, key):
+        with self._connect(self.path) as conn:
+            conn.execute("DELETE FROM tags WHERE run_uuid = ? AND key = ?", (run_id, key))
+
+    def get_runs(self, view_type):
+        """
+        :param view_type: :py:class:`mlflow.entities.ViewType` of the runs to return.
+        :return: List of :py:class:`mlflow.entities.Run` in the specified lifecycle stages,
+                 ordered by run ID.
+        """
+        stages = LifecycleStage.view_type_to_stages(view_type)
+        run_filter = "run_uuid IN (SELECT run_uuid FROM runs WHERE lifecycle_stage IN (%s))" % \
+            ", ".join("?" * len(stages))
+        with self._connect(self.path) as conn:
+            metrics, params, tags = {}, {}, {}
+            for run_id, key, value, timestamp, step in conn.execute(
+                    "SELECT run_uuid, key, value, timestamp, step FROM latest_metrics WHERE " +
+                    run_filter, stages):
+                metrics.setdefault(run_id, []).append(
+                    _metric_from_row(key, value, timestamp, step))
+            for run_id, key, value in conn.execute(
+                    "SELECT run_uuid, key, value FROM params WHERE " + run_filter, stages):
+                params.setdefault(run_id, []).append(Param(key, value))
+            for run_id, key, value in conn.execute(
+                    "SELECT run_uuid, key, value FROM tags WHERE " + run_filter, stages):
+                tags.setdefault(run_id, []).append(RunTag(key, value))
+            runs = []
+            for row in conn.execute(
+                    "SELECT run_uuid, experiment_id, user_id, status, start_time, end_time, "
+                    "lifecycle_stage, artifact_uri FROM runs WHERE " + run_filter +
+                    " ORDER BY run_uuid", stages):
+                run_info = RunInfo(run_uuid=row[0], run_id=row[0], experiment_id=row[1],
+                                   user_id=row[2], status=row[3], start_time=row[4],
+                                   end_time=row[5], lifecycle_stage=row[6], artifact_uri=row[7])
+                run_data = RunData(metrics=metrics.get(row[0]), params=params.get(row[0]),
+                                   tags=tags.get(row[0]))
+                runs.append(Run(run_info, run_data))
+            return runs
+
+    @staticmethod
+    def _run_info_row(run_info):
+        return (run_info.run_id, run_info.experiment_id, run_info.user_id, run_info.status,
+                run_info.start_time, run_info.end_time, run_info.lifecycle_stage,
+                run_info.artifact_uri)
+
+    @staticmethod
+    def _insert_runs(conn, runs):
+        conn.executemany("INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                         [FileStoreSearchIndex._run_info_row(run.info) for run in runs])
+        conn.executemany("INSERT INTO latest_metrics VALUES (?, ?, ?, ?, ?)",
+                         [(run.info.run_id, m.key, m.value, m.timestamp, m.step)
+                          for run in runs for m in run.data._metric_objs])
+        conn.executemany("INSERT INTO params VALUES (?, ?, ?)",
+                         [(run.info.run_id, key, value)
+                          for run in runs for key, value in run.data.params.items()])
+        conn.executemany("INSERT INTO tags VALUES (?, ?, ?)",
+                         [(run.info.run_id, key, value)
+                          for run in runs for key, value in run.data.tags.items()])
+
+    @staticmethod
+    def _insert_ignored_entries(conn, names):
+        conn.executemany("INSERT OR REPLACE INTO ignored_entries VALUES (?)",
+                         [(name,) for name in names])
+
+    @staticmethod
+    def _delete_runs(conn, run_ids):
+        run_ids = [(run_id,) for run_id in run_ids]
+        for table in ["runs"] + _DATA_TABLES:
+            conn.executemany("DELETE FROM %s WHERE run_uuid = ?" % table, run_ids)
@@ -0,0 +1,78 @@
+"""
+Retrieval of the histories of several metrics of several runs at once, as used to plot the metrics
+of runs side by side.
+
+Long histories can optionally be downsampled to a maximum number of points per series, keeping the
+points with the minimum and maximum values of consecutive buckets of points, so that the shape of
+the series, including its spikes, is preserved on a plot.
+"""
+import math
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+
+
+def validate_metric_histories_request(run_ids, metric_keys, max_points_per_series, step_range):
+    if not run_ids:
+        raise MlflowException("At least one run ID must be specified.",
+                              error_code=INVALID_PARAMETER_VALUE)
+    if metric_keys is not None and not metric_keys:
+        raise MlflowException("At least one metric key must be specified, or None to retrieve "
+                              "all the metrics of the runs.", error_code=INVALID_PARAMETER_VALUE)
+    if max_points_per_series is not None and (not isinstance(max_points_per_series, int) or
+                                              max_points_per_series < 1):
+        raise MlflowException("Invalid value for max_points_per_series. It must be a positive "
+                              "integer, but got value %s" % max_points_per_series,
+                              error_code=INVALID_PARAMETER_VALUE)
+    if step_range is not None and len(step_range) != 2:
+        raise MlflowException("Invalid step range %s. It must be a pair of the minimum and "
+                              "maximum steps, either of which may be None." % (step_range,),
+                              error_code=INVALID_PARAMETER_VALUE)
+
+
+def is_in_step_range(step, step_range):
+    if step_range is None:
+        return True
+    min_step, max_step = step_range
+    return (min_step is None or step >= min_step) and (max_step is None or step <= max_step)
+
+
+def downsample_metric_history(history, max_points):
+    """
+    Downsample a metric history to at most ``max_points`` points. The points, sorted by step and
+    timestamp, are split into ``max_points / 2`` buckets of consecutive points, of which the points
+    with the minimum and maximum values are kept.
+
+    :param history: List of :py:class:`mlflow.entities.Metric` of a metric of a run.
+    :param max_points: Maximum number of points to keep, or None to keep all the points.
+    :return: The points kept, sorted by step and timestamp.
+    """
+    history = sorted(history, key=lambda metric: (metric.step, metric.timestamp))
+    if max_points is None or len(history) <= max_points:
+        return history
+    if max_points == 1:
+        return history[-1:]
+    num_buckets = max_points // 2
+    downsampled = []
+    for i in range(num_buckets):
+        bucket = history[i * len(history) // num_buckets:(i + 1) * len(history) // num_buckets]
+        indices = [j for j, metric in enumerate(bucket) if not math.isnan(metric.value)]
+        if not indices:
+            downsampled.append(bucket[0])
+            continue
+        min_index = min(indices, key=lambda j: bucket[j].value)
+        max_index = max(indices, key=lambda j: bucket[j].value)
+        downsampled.extend(bucket[j] for j in sorted({min_index, max_index}))
+    return downsampled
+
+
+def add_metric_history(histories, run_id, metric_key, history, max_points_per_series=None,
+                       step_range=None):
+    """
+    Add the points of ``history`` in ``step_range`` to ``histories``, the dictionary returned by
+    ``get_metric_histories``, downsampling them to ``max_points_per_series`` points.
+    """
+    history = [metric for metric in history if is_in_step_range(metric.step, step_range)]
+    if history:
+        histories.setdefault(run_id, {})[metric_key] = \
+            downsample_metric_history(history, max_points_per_series)
@@ -1,15 +1,24 @@
+import json
+
 from mlflow.entities import Experiment, Run, RunInfo, Metric, ViewType
 from mlflow.exceptions import MlflowException
 from mlflow.protos import databricks_pb2
 from mlflow.protos.service_pb2 import CreateExperiment, MlflowService, GetExperiment, \
     GetRun, SearchRuns, ListExperiments, GetMetricHistory, LogMetric, LogParam, SetTag, \
     UpdateRun, CreateRun, DeleteRun, RestoreRun, DeleteExperiment, RestoreExperiment, \
-    UpdateExperiment, LogBatch, LogModel, DeleteTag, SetExperimentTag, GetExperimentByName
+    UpdateExperiment, LogBatch, LogModel, DeleteTag, SetExperimentTag, GetExperimentByName, \
+    Metric as ProtoMetric
 from mlflow.store.tracking.abstract_store import AbstractStore
-from mlflow.utils.proto_json_utils import message_to_json
-from mlflow.utils.rest_utils import call_endpoint, extract_api_info_for_service
+from mlflow.store.tracking.run_export import validate_export_format
+from mlflow.utils.proto_json_utils import message_to_json, parse_dict
+from mlflow.utils.rest_utils import call_endpoint, extract_api_info_for_service, http_request, \
+    verify_rest_response
 
 _PATH_PREFIX = "/api/2.0"
+_EXPORT_RUNS_ENDPOINT = _PATH_PREFIX + "/preview/mlflow/runs/export"
+_GET_METRIC_HISTORIES_ENDPOINT = _PATH_PREFIX + "/preview/mlflow/metrics/get-histories"
+# Size of the chunks in which exported runs are read from the server
+_EXPORT_CHUNK_SIZE = 1024 * 1024
 _METHOD_TO_INFO = extract_api_info_for_service(MlflowService, _PATH_PREFIX)
 
 
@@ -187,6 +196,29 @@ class RestStore(AbstractStore):
         response_proto = self._call_endpoint(GetMetricHistory, req_body)
         return [Metric.from_proto(metric) for metric in response_proto.metrics]
 
+    def get_metric_histories(self, run_ids, metric_keys=None, max_points_per_series=None,
+                             step_range=None):
+        request_json = {"run_ids": list(run_ids)}
+        if metric_keys is not None:
+            request_json["metric_keys"] = list(metric_keys)
+        if max_points_per_series is not None:
+            request_json["max_points_per_series"] = max_points_per_series
+        if step_range is not None:
+            request_json["min_step"], request_json["max_step"] = step_range
+        response = http_request(host_creds=self.get_host_creds(),
+                                endpoint=_GET_METRIC_HISTORIES_ENDPOINT, method="POST",
+                                json=request_json)
+        response = verify_rest_response(response, _GET_METRIC_HISTORIES_ENDPOINT)
+        histories = {}
+        for series in json.loads(response.text).get("histories", []):
+            metrics = []
+            for metric_json in series["metrics"]:
+                metric_proto = ProtoMetric()
+                parse_dict(metric_json, metric_proto)
+                metrics.append(Metric.from_proto(metric_proto))
+            histories.setdefault(series["run_id"], {})[series["metric_key"]] = metrics
+        return histories
+
     def _search_runs(self, experiment_ids, filter_string, run_view_type, max_results, order_by,
                      page_token):
         experiment_ids = [str(experiment_id) for experiment_id in experiment_ids]
@@ -205,6 +237,27 @@ class RestStore(AbstractStore):
             next_page_token = response_proto.next_page_token
         return runs, next_page_token
 
+    def export_runs(self, experiment_ids, filter_string, run_view_type, order_by, export_format,
+                    output, max_results=None):
+        validate_export_format(export_format)
+        sr = SearchRuns(experiment_ids=[str(experiment_id) for experiment_id in experiment_ids],
+                        filter=filter_string,
+                        run_view_type=ViewType.to_proto(run_view_type),
+                        order_by=order_by)
+        if max_results is not None:
+            sr.max_results = max_results
+        # The server streams the runs as it searches them, so the response is copied to the
+        # output as it is received
+        response = http_request(host_creds=self.get_host_creds(), endpoint=_EXPORT_RUNS_ENDPOINT,
+                                method="POST", json=json.loads(message_to_json(sr)),
+                                params={"format": export_format}, stream=True)
+        try:
+            verify_rest_response(response, _EXPORT_RUNS_ENDPOINT)
+            for chunk in response.iter_content(chunk_size=_EXPORT_CHUNK_SIZE):
+                output.write(chunk)
+        finally:
+            response.close()
+
     def delete_run(self, run_id):
         req_body = message_to_json(DeleteRun(run_id=run_id))
         self._call_endpoint(DeleteRun, req_body)
@@ -0,0 +1,157 @@
+"""
+Export of the runs matching a search as Apache Arrow or Apache Parquet data.
+
+Runs are read from the tracking store one page at a time, following the page tokens of the
+search, and each page is written as an Arrow record batch, so that exports of many runs are
+streamed without holding all the runs in memory. The metrics, params and tags of the runs are
+exported as map columns, keyed by metric, param and tag name, so that all the record batches of an
+export share a schema whatever the keys of their runs.
+"""
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.store.tracking import SEARCH_MAX_RESULTS_THRESHOLD
+
+PARQUET_FORMAT = "parquet"
+ARROW_FORMAT = "arrow"
+EXPORT_FORMATS = [PARQUET_FORMAT, ARROW_FORMAT]
+
+CONTENT_TYPES = {
+    PARQUET_FORMAT: "application/vnd.apache.parquet",
+    ARROW_FORMAT: "application/vnd.apache.arrow.stream",
+}
+
+
+def validate_export_format(export_format):
+    if export_format not in EXPORT_FORMATS:
+        raise MlflowException("Invalid export format '%s'. Supported formats are %s."
+                              % (export_format, EXPORT_FORMATS),
+                              error_code=INVALID_PARAMETER_VALUE)
+
+
+def get_schema():
+    """
+    :return: The ``pyarrow.Schema`` of exported runs.
+    """
+    import pyarrow as pa
+    timestamp = pa.timestamp("ms", tz="UTC")
+    return pa.schema([
+        ("run_id", pa.string()),
+        ("experiment_id", pa.string()),
+        ("user_id", pa.string()),
+        ("status", pa.string()),
+        ("start_time", timestamp),
+        ("end_time", timestamp),
+        ("artifact_uri", pa.string()),
+        ("lifecycle_stage", pa.string()),
+        ("metrics", pa.map_(pa.string(), pa.float64())),
+        ("params", pa.map_(pa.string(), pa.string())),
+        ("tags", pa.map_(pa.string(), pa.string())),
+    ])
+
+
+def runs_to_record_batch(runs, schema=None):
+    """
+    :param runs: List of :py:class:`mlflow.entities.Run` objects.
+    :param schema: Schema returned by :py:func:`get_schema`, to avoid recreating it for each batch.
+    :return: ``pyarrow.RecordBatch`` of the runs, with one row per run.
+    """
+    import pyarrow as pa
+    schema = schema or get_schema()
+    infos = [run.info for run in runs]
+    columns = [
+        [info.run_id for info in infos],
+        [info.experiment_id for info in infos],
+        [info.user_id for info in infos],
+        [info.status for info in infos],
+        [info.start_time for info in infos],
+        [info.end_time for info in infos],
+        [info.artifact_uri for info in infos],
+        [info.lifecycle_stage for info in infos],
+        [list(run.data.metrics.items()) for run in runs],
+        [list(run.data.params.items()) for run in runs],
+        [list(run.data.tags.items()) for run in runs],
+    ]
+    arrays = [pa.array(column, type=field.type) for column, field in zip(columns, schema)]
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def iter_run_pages(store, experiment_ids, filter_string, run_view_type, order_by=None,
+                   max_results=None, page_size=SEARCH_MAX_RESULTS_THRESHOLD):
+    """
+    Search runs page by page.
+
+    :param store: Tracking store in which to search runs.
+    :param max_results: Maximum number of runs to return, or None to return all matching runs.
+    :param page_size: Number of runs to search at a time.
+    :return: Iterator over the pages of runs, as lists of :py:class:`mlflow.entities.Run`.
+    """
+    num_runs = 0
+    page_token = None
+    while max_results is None or num_runs < max_results:
+        num_page_runs = page_size
+        if max_results is not None:
+            num_page_runs = min(page_size, max_results - num_runs)
+        runs = store.search_runs(experiment_ids, filter_string, run_view_type, num_page_runs,
+                                 order_by, page_token)
+        if runs:
+            yield list(runs)
+        num_runs += len(runs)
+        page_token = runs.token
+        if not page_token:
+            break
+
+
+class _ChunkSink(object):
+    """
+    Writable file-like object collecting the data written to it, from which the data written
+    since the previous call to :py:meth:`pop` is retrieved.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self.closed = False
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def pop(self):
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def iter_export_chunks(run_pages, export_format):
+    """
+    Write pages of runs as Arrow or Parquet data, one record batch per page.
+
+    :param run_pages: Iterable of lists of :py:class:`mlflow.entities.Run`, such as returned by
+                      :py:func:`iter_run_pages`.
+    :param export_format: ``parquet`` for a Parquet file, or ``arrow`` for an Arrow IPC stream.
+    :return: Iterator over the chunks of bytes of the exported data, yielding a chunk per page of
+             runs.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    validate_export_format(export_format)
+    schema = get_schema()
+    sink = _ChunkSink()
+    if export_format == PARQUET_FORMAT:
+        writer = pq.ParquetWriter(sink, schema)
+    else:
+        writer = pa.ipc.new_stream(sink, schema)
+    for runs in run_pages:
+        batch = runs_to_record_batch(runs, schema)
+        if export_format == PARQUET_FORMAT:
+            writer.write_table(pa.Table.from_batches([batch], schema=schema))
+        else:
+            writer.write_batch(batch)
+        yield sink.pop()
+    writer.close()
+    yield sink.pop()
@@ -5,16 +5,19 @@ import uuid
 import math
 import sqlalchemy
 import sqlalchemy.sql.expression as sql
+from sqlalchemy.orm.attributes import set_committed_value
 
 from mlflow.entities.lifecycle_stage import LifecycleStage
 from mlflow.models import Model
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_THRESHOLD
-from mlflow.store.db.db_types import MYSQL, MSSQL
+from mlflow.store.tracking.metric_history import validate_metric_histories_request, \
+    add_metric_history
+from mlflow.store.db.db_types import MYSQL, MSSQL, POSTGRES, SQLITE
 import mlflow.store.db.utils
 from mlflow.store.tracking.dbmodels.models import SqlExperiment, SqlRun, \
     SqlMetric, SqlParam, SqlTag, SqlExperimentTag, SqlLatestMetric
 from mlflow.store.db.base_sql_model import Base
-from mlflow.entities import RunStatus, SourceType, Experiment
+from mlflow.entities import RunStatus, SourceType, Experiment, Metric
 from mlflow.store.tracking.abstract_store import AbstractStore
 from mlflow.entities import ViewType
 from mlflow.exceptions import MlflowException
@@ -31,6 +34,11 @@ from mlflow.utils.mlflow_tags import MLFLOW_LOGGED_MODELS
 
 _logger = logging.getLogger(__name__)
 
+# Upper bound on the number of bind parameters used by a single multi-row INSERT statement or
+# ``IN`` clause. Older SQLite versions reject statements with more than 999 bind parameters
+# (SQLITE_MAX_VARIABLE_NUMBER) and MSSQL accepts at most 2100.
+_MAX_BIND_PARAMS_PER_STATEMENT = 999
+
 # For each database table, fetch its columns and define an appropriate attribute for each column
 # on the table's associated object representation (Mapper). This is necessary to ensure that
 # columns defined via backreference are available as Mapper instance attributes (e.g.,
@@ -459,14 +467,7 @@ class SqlAlchemyStore(AbstractStore):
 
     def log_metric(self, run_id, metric):
         _validate_metric(metric.key, metric.value, metric.timestamp, metric.step)
-        is_nan = math.isnan(metric.value)
-        if is_nan:
-            value = 0
-        elif math.isinf(metric.value):
-            #  NB: Sql can not represent Infs = > We replace +/- Inf with max/min 64b float value
-            value = 1.7976931348623157e308 if metric.value > 0 else -1.7976931348623157e308
-        else:
-            value = metric.value
+        value, is_nan = _get_metric_value_for_db(metric.value)
         with self.ManagedSessionMaker() as session:
             run = self._get_run(run_uuid=run_id, session=session)
             self._check_run_is_active(run)
@@ -512,6 +513,54 @@ class SqlAlchemyStore(AbstractStore):
             metrics = session.query(SqlMetric).filter_by(run_uuid=run_id, key=metric_key).all()
             return [metric.to_mlflow_entity() for metric in metrics]
 
+    def get_metric_histories(self, run_ids, metric_keys=None, max_points_per_series=None,
+                             step_range=None):
+        validate_metric_histories_request(run_ids, metric_keys, max_points_per_series,
+                                          step_range)
+        run_ids = list(run_ids)
+        # The points of all the requested series are read with a single query per chunk of runs,
+        # selecting the columns of the points rather than ORM objects
+        columns = [SqlMetric.run_uuid, SqlMetric.key, SqlMetric.value, SqlMetric.timestamp,
+                   SqlMetric.step, SqlMetric.is_nan]
+        metric_keys = set(metric_keys) if metric_keys is not None else None
+        # The run IDs of each chunk share the bind parameters of the statement with the filters.
+        # Metric keys too numerous to leave room for the run IDs are only filtered after the query.
+        filters = []
+        if step_range is not None:
+            min_step, max_step = step_range
+            if min_step is not None:
+                filters.append(SqlMetric.step >= min_step)
+            if max_step is not None:
+                filters.append(SqlMetric.step <= max_step)
+        num_filter_params = len(filters)
+        if metric_keys is not None and \
+                num_filter_params + len(metric_keys) <= _MAX_BIND_PARAMS_PER_STATEMENT // 2:
+            filters.append(SqlMetric.key.in_(list(metric_keys)))
+            num_filter_params += len(metric_keys)
+        chunk_size = _MAX_BIND_PARAMS_PER_STATEMENT - num_filter_params
+        series = {}
+        with self.ManagedSessionMaker() as session:
+            for i in range(0, len(run_ids), chunk_size):
+                chunk = run_ids[i:i + chunk_size]
+                # As in the FileStore, deleted runs are read but unknown runs are rejected
+                found_run_ids = {run_uuid for run_uuid, in session.query(SqlRun.run_uuid)
+                                 .filter(SqlRun.run_uuid.in_(chunk))}
+                for run_id in chunk:
+                    if run_id not in found_run_ids:
+                        raise MlflowException("Run with id={} not found".format(run_id),
+                                              RESOURCE_DOES_NOT_EXIST)
+                rows = session.query(*columns).filter(SqlMetric.run_uuid.in_(chunk), *filters)
+                for run_uuid, key, value, timestamp, step, is_nan in rows:
+                    if metric_keys is not None and key not in metric_keys:
+                        continue
+                    metric = Metric(key=key, value=value if not is_nan else float("nan"),
+                                    timestamp=timestamp, step=step)
+                    series.setdefault((run_uuid, key), []).append(metric)
+        histories = {}
+        for (run_uuid, key), history in series.items():
+            add_metric_history(histories, run_uuid, key, history, max_points_per_series)
+        return histories
+
     def log_param(self, run_id, param):
         with self.ManagedSessionMaker() as session:
             run = self._get_run(run_uuid=run_id, session=session)
@@ -543,12 +592,8 @@ class SqlAlchemyStore(AbstractStore):
                 session.rollback()
                 existing_params = [p.value for p in run.params if p.key == param.key]
                 if len(existing_params) > 0:
-                    old_value = existing_params[0]
-                    raise MlflowException(
-                        "Changing param values is not allowed. Param with key='{}' was already"
-                        " logged with value='{}' for run ID='{}'. Attempted logging new value"
-                        " '{}'.".format(
-                            param.key, old_value, run_id, param.value), INVALID_PARAMETER_VALUE)
+                    _raise_param_overwrite_error(
+                        run_id, param.key, existing_params[0], param.value)
                 else:
                     raise
 
@@ -607,15 +652,6 @@ class SqlAlchemyStore(AbstractStore):
 
     def _search_runs(self, experiment_ids, filter_string, run_view_type, max_results, order_by,
                      page_token):
-
-        def compute_next_token(current_size):
-            next_token = None
-            if max_results == current_size:
-                final_offset = offset + max_results
-                next_token = SearchUtils.create_page_token(final_offset)
-
-            return next_token
-
         if max_results > SEARCH_MAX_RESULTS_THRESHOLD:
             raise MlflowException("Invalid value for request parameter max_results. It must be at "
                                   "most {}, but got value {}".format(SEARCH_MAX_RESULTS_THRESHOLD,
@@ -625,55 +661,215 @@ class SqlAlchemyStore(AbstractStore):
         stages = set(LifecycleStage.view_type_to_stages(run_view_type))
 
         with self.ManagedSessionMaker() as session:
-            # Fetch the appropriate runs and eagerly load their summary metrics, params, and
-            # tags. These run attributes are referenced during the invocation of
-            # ``run.to_mlflow_entity()``, so eager loading helps avoid additional database queries
-            # that are otherwise executed at attribute access time under a lazy loading model.
+            # Select the IDs of the runs of the requested page first, with the filters and sort
+            # keys on metrics, params and tags expressed as correlated subqueries rather than
+            # joins, so that the database can evaluate them with the primary key index of each
+            # entity table. The data of the selected runs is then loaded in bulk.
             parsed_filters = SearchUtils.parse_search_filter(filter_string)
-            parsed_orderby, sorting_joins = _get_orderby_clauses(order_by, session)
-
-            query = session.query(SqlRun)
-            for j in _get_sqlalchemy_filter_clauses(parsed_filters, session):
-                query = query.join(j)
-            # using an outer join is necessary here because we want to be able to sort
-            # on a column (tag, metric or param) without removing the lines that
-            # do not have a value for this column (which is what inner join would do)
-            for j in sorting_joins:
-                query = query.outerjoin(j)
-
-            offset = SearchUtils.parse_start_offset_from_page_token(page_token)
-            queried_runs = query.distinct() \
-                .options(*self._get_eager_run_query_options()) \
-                .filter(
-                    SqlRun.experiment_id.in_(experiment_ids),
-                    SqlRun.lifecycle_stage.in_(stages),
-                    *_get_attributes_filtering_clauses(parsed_filters)) \
-                .order_by(*parsed_orderby) \
+            sort_keys = _get_orderby_keys(order_by)
+            filter_clauses = [SqlRun.experiment_id.in_(experiment_ids),
+                              SqlRun.lifecycle_stage.in_(stages)] + \
+                _get_attributes_filtering_clauses(parsed_filters) + \
+                _get_sqlalchemy_filter_clauses(parsed_filters)
+
+            # Pages start after the sort key of the last run of the previous page, selected along
+            # with the run IDs, rather than at an offset that the database would have to skip
+            # over. Page tokens encoding an offset are still supported.
+            offset, last_sort_key = SearchUtils.parse_page_token(page_token)
+            if last_sort_key is not None:
+                filter_clauses.append(
+                    mlflow.store.db.utils._get_keyset_filter_clause(sort_keys, last_sort_key))
+            rows = session.query(SqlRun.run_uuid, *[key for key, _ in sort_keys]) \
+                .filter(*filter_clauses) \
+                .order_by(*_get_orderby_clauses(sort_keys)) \
                 .offset(offset).limit(max_results).all()
 
-            runs = [run.to_mlflow_entity() for run in queried_runs]
-            next_page_token = compute_next_token(len(runs))
+            runs = self._load_runs(session, [row[0] for row in rows])
+            next_page_token = None
+            if rows and len(rows) == max_results:
+                next_page_token = SearchUtils.create_keyset_page_token(rows[-1][1:])
 
         return runs, next_page_token
 
+    @staticmethod
+    def _load_runs(session, run_ids):
+        """
+        Load the runs with the specified IDs along with their latest metrics, params and tags,
+        using one ``IN`` query per table for each chunk of ``_MAX_BIND_PARAMS_PER_STATEMENT`` runs.
+
+        :return: List of :py:class:`mlflow.entities.Run`, in the order of ``run_ids``.
+        """
+        sql_runs = {}
+        for i in range(0, len(run_ids), _MAX_BIND_PARAMS_PER_STATEMENT):
+            chunk = run_ids[i:i + _MAX_BIND_PARAMS_PER_STATEMENT]
+            chunk_runs = {run.run_uuid: run for run in
+                          session.query(SqlRun).filter(SqlRun.run_uuid.in_(chunk))}
+            for attribute, entity in [("latest_metrics", SqlLatestMetric), ("params", SqlParam),
+                                      ("tags", SqlTag)]:
+                values = {run_uuid: [] for run_uuid in chunk_runs}
+                for row in session.query(entity).filter(entity.run_uuid.in_(chunk)):
+                    values[row.run_uuid].append(row)
+                # Populate the relationships of the runs without triggering lazy loads
+                for run_uuid, run in chunk_runs.items():
+                    set_committed_value(run, attribute, values[run_uuid])
+            sql_runs.update(chunk_runs)
+        return [sql_runs[run_id].to_mlflow_entity() for run_id in run_ids]
+
     def log_batch(self, run_id, metrics, params, tags):
         _validate_run_id(run_id)
         _validate_batch_log_data(metrics, params, tags)
         _validate_batch_log_limits(metrics, params, tags)
+        # Log all entities of the batch in a single transaction so that a failure leaves no
+        # partially logged data behind and the whole batch costs a handful of round trips
         with self.ManagedSessionMaker() as session:
             run = self._get_run(run_uuid=run_id, session=session)
             self._check_run_is_active(run)
-        try:
-            for param in params:
-                self.log_param(run_id, param)
-            for metric in metrics:
-                self.log_metric(run_id, metric)
-            for tag in tags:
-                self.set_tag(run_id, tag)
-        except MlflowException as e:
-            raise e
-        except Exception as e:
-            raise MlflowException(e, INTERNAL_ERROR)
+            try:
+                self._log_params(session, run_id, params)
+                self._log_metrics(session, run_id, metrics)
+                self._set_tags(session, run_id, tags)
+            except MlflowException as e:
+                raise e
+            except Exception as e:
+                raise MlflowException(e, INTERNAL_ERROR)
+
+    def _log_params(self, session, run_id, params):
+        """
+        Insert the specified params using multi-row INSERT statements. Params that were already
+        logged with the same value are skipped; attempting to log a different value for an
+        existing param key raises an exception.
+        """
+        if not params:
+            return
+        new_params = {}
+        for param in params:
+            if param.key in new_params and new_params[param.key] != param.value:
+                _raise_param_overwrite_error(
+                    run_id, param.key, new_params[param.key], param.value)
+            new_params[param.key] = param.value
+        existing_params = session \
+            .query(SqlParam.key, SqlParam.value) \
+            .filter(SqlParam.run_uuid == run_id, SqlParam.key.in_(list(new_params))) \
+            .all()
+        for key, old_value in existing_params:
+            if old_value != new_params[key]:
+                _raise_param_overwrite_error(run_id, key, old_value, new_params[key])
+            del new_params[key]
+        self._bulk_insert(session, SqlParam.__table__.insert(),
+                          [dict(run_uuid=run_id, key=key, value=value)
+                           for key, value in new_params.items()])
+
+    def _log_metrics(self, session, run_id, metrics):
+        """
+        Insert the specified metrics using multi-row INSERT statements, ignoring metrics that
+        were already logged, and update the ``latest_metrics`` table with one pass per batch.
+        """
+        if not metrics:
+            return
+        # Deduplicate on the primary key of the ``metrics`` table
+        rows = {}
+        for metric in metrics:
+            value, is_nan = _get_metric_value_for_db(metric.value)
+            row = dict(run_uuid=run_id, key=metric.key, value=value,
+                       timestamp=metric.timestamp, step=metric.step, is_nan=is_nan)
+            rows[(metric.key, metric.timestamp, metric.step, value, is_nan)] = row
+        rows = list(rows.values())
+        self._insert_metrics_ignoring_duplicates(session, run_id, rows)
+        self._update_latest_metrics_if_necessary(session, run_id, rows)
+
+    def _insert_metrics_ignoring_duplicates(self, session, run_id, rows):
+        table = SqlMetric.__table__
+        if self.db_type == POSTGRES:
+            from sqlalchemy.dialects.postgresql import insert
+            statement = insert(table).on_conflict_do_nothing()
+        elif self.db_type == MYSQL:
+            from sqlalchemy.dialects.mysql import insert
+            statement = insert(table)
+            statement = statement.on_duplicate_key_update(value=statement.inserted.value)
+        elif self.db_type == SQLITE:
+            statement = table.insert().prefix_with("OR IGNORE")
+        else:
+            # Dialects without an "insert if not exists" statement: filter out the metrics that
+            # are already present before inserting the remaining ones
+            existing_metrics = set(session.query(
+                SqlMetric.key, SqlMetric.timestamp, SqlMetric.step, SqlMetric.value,
+                SqlMetric.is_nan).filter(
+                    SqlMetric.run_uuid == run_id,
+                    SqlMetric.key.in_(set(row["key"] for row in rows)),
+                    SqlMetric.timestamp.in_(set(row["timestamp"] for row in rows))).all())
+            rows = [row for row in rows
+                    if (row["key"], row["timestamp"], row["step"], row["value"],
+                        row["is_nan"]) not in existing_metrics]
+            statement = table.insert()
+        self._bulk_insert(session, statement, rows)
+
+    def _update_latest_metrics_if_necessary(self, session, run_id, rows):
+        """
+        Batched counterpart of ``_update_latest_metric_if_necessary``: computes the most recent
+        value of each metric key in ``rows`` and writes it to the ``latest_metrics`` table if it
+        is strictly more recent than the stored value.
+        """
+        def _metric_order(metric):
+            return metric["step"], metric["timestamp"], metric["value"]
+
+        latest_rows = {}
+        for row in rows:
+            current = latest_rows.get(row["key"])
+            if current is None or _metric_order(row) > _metric_order(current):
+                latest_rows[row["key"]] = row
+        # Lock the existing latest metric rows for the remainder of the transaction in order to
+        # ensure isolation
+        latest_metrics = session \
+            .query(SqlLatestMetric) \
+            .filter(
+                SqlLatestMetric.run_uuid == run_id,
+                SqlLatestMetric.key.in_(list(latest_rows))) \
+            .with_for_update() \
+            .all()
+        for latest_metric in latest_metrics:
+            row = latest_rows.pop(latest_metric.key)
+            if _metric_order(row) > (latest_metric.step, latest_metric.timestamp,
+                                     latest_metric.value):
+                latest_metric.value = row["value"]
+                latest_metric.timestamp = row["timestamp"]
+                latest_metric.step = row["step"]
+                latest_metric.is_nan = row["is_nan"]
+        session.flush()
+        self._bulk_insert(session, SqlLatestMetric.__table__.insert(), list(latest_rows.values()))
+
+    def _set_tags(self, session, run_id, tags):
+        """
+        Set the specified tags, updating the values of existing tags and inserting the new ones
+        using multi-row INSERT statements. If a key is repeated, the last value wins.
+        """
+        if not tags:
+            return
+        new_tags = {}
+        for tag in tags:
+            new_tags[tag.key] = tag.value
+        existing_tags = session \
+            .query(SqlTag) \
+            .filter(SqlTag.run_uuid == run_id, SqlTag.key.in_(list(new_tags))) \
+            .all()
+        for existing_tag in existing_tags:
+            existing_tag.value = new_tags.pop(existing_tag.key)
+        session.flush()
+        self._bulk_insert(session, SqlTag.__table__.insert(),
+                          [dict(run_uuid=run_id, key=key, value=value)
+                           for key, value in new_tags.items()])
+
+    @staticmethod
+    def _bulk_insert(session, statement, rows):
+        """
+        Execute ``statement`` as multi-row INSERTs of ``rows`` (a list of column-value dicts),
+        splitting the rows into chunks that stay within the bind parameter limits of all
+        supported databases.
+        """
+        if not rows:
+            return
+        rows_per_statement = max(1, _MAX_BIND_PARAMS_PER_STATEMENT // len(rows[0]))
+        for i in range(0, len(rows), rows_per_statement):
+            session.execute(statement.values(rows[i:i + rows_per_statement]))
 
     def record_logged_model(self, run_id, mlflow_model):
         if not isinstance(mlflow_model, Model):
@@ -692,6 +888,27 @@ class SqlAlchemyStore(AbstractStore):
             session.merge(SqlTag(key=MLFLOW_LOGGED_MODELS, value=value, run_uuid=run_id))
 
 
+def _get_metric_value_for_db(value):
+    """
+    :return: A tuple ``(value, is_nan)`` of the value to store for a metric in the database and
+             whether the original value was NaN.
+    """
+    is_nan = math.isnan(value)
+    if is_nan:
+        return 0, True
+    elif math.isinf(value):
+        #  NB: Sql can not represent Infs = > We replace +/- Inf with max/min 64b float value
+        return (1.7976931348623157e308 if value > 0 else -1.7976931348623157e308), False
+    return value, False
+
+
+def _raise_param_overwrite_error(run_id, key, old_value, new_value):
+    raise MlflowException(
+        "Changing param values is not allowed. Param with key='{}' was already"
+        " logged with value='{}' for run ID='{}'. Attempted logging new value"
+        " '{}'.".format(key, old_value, run_id, new_value), INVALID_PARAMETER_VALUE)
+
+
 def _get_attributes_filtering_clauses(parsed):
     clauses = []
     for sql_statement in parsed:
@@ -712,7 +929,7 @@ def _get_attributes_filtering_clauses(parsed):
     return clauses
 
 
-def _to_sqlalchemy_filtering_statement(sql_statement, session):
+def _to_sqlalchemy_filtering_statement(sql_statement):
     key_type = sql_statement.get('type')
     key_name = sql_statement.get('key')
     value = sql_statement.get('value')
@@ -733,48 +950,48 @@ def _to_sqlalchemy_filtering_statement(sql_statement, session):
 
     if comparator in SearchUtils.CASE_INSENSITIVE_STRING_COMPARISON_OPERATORS:
         op = SearchUtils.get_sql_filter_ops(entity.value, comparator)
-        return (
-            session
-            .query(entity)
-            .filter(entity.key == key_name, op(value))
-            .subquery()
-        )
+        value_clause = op(value)
     elif comparator in SearchUtils.filter_ops:
         op = SearchUtils.filter_ops.get(comparator)
-        return (
-            session
-            .query(entity)
-            .filter(entity.key == key_name, op(entity.value, value))
-            .subquery()
-        )
+        value_clause = op(entity.value, value)
     else:
         return None
+    return sql.exists().where(sql.and_(entity.run_uuid == SqlRun.run_uuid,
+                                       entity.key == key_name,
+                                       value_clause))
 
 
-def _get_sqlalchemy_filter_clauses(parsed, session):
-    """creates SqlAlchemy subqueries
-    that will be inner-joined to SQLRun to act as multi-clause filters."""
+def _get_sqlalchemy_filter_clauses(parsed):
+    """creates SqlAlchemy EXISTS clauses, correlated with SqlRun, that act as filters on
+    metrics, params and tags."""
     filters = []
     for sql_statement in parsed:
-        filter_query = _to_sqlalchemy_filtering_statement(sql_statement, session)
-        if filter_query is not None:
-            filters.append(filter_query)
+        filter_clause = _to_sqlalchemy_filtering_statement(sql_statement)
+        if filter_clause is not None:
+            filters.append(filter_clause)
     return filters
 
 
-def _get_orderby_clauses(order_by_list, session):
-    """Sorts a set of runs based on their natural ordering and an overriding set of order_bys.
+def _get_entity_column_of_run(entity, column, key):
+    """
+    :return: Scalar subquery, correlated with SqlRun, selecting ``column`` of the ``entity`` with
+             the specified key of each run.
+    """
+    return sql.select([column]) \
+        .where(sql.and_(entity.run_uuid == SqlRun.run_uuid, entity.key == key)) \
+        .correlate(SqlRun) \
+        .as_scalar()
+
+
+def _get_orderby_keys(order_by_list):
+    """Returns the sort keys of runs as pairs of an expression and of whether it is sorted in
+    ascending order. Runs are sorted by their natural ordering and an overriding set of order_bys.
     Runs are naturally ordered first by start time descending, then by run id for tie-breaking.
     """
 
-    clauses = []
-    ordering_joins = []
-    clause_id = 0
-    # contrary to filters, it is not easily feasible to separately handle sorting
-    # on attributes and on joined tables as we must keep all clauses in the same order
+    keys = []
     if order_by_list:
         for order_by_clause in order_by_list:
-            clause_id += 1
             (key_type, key, ascending) = SearchUtils.parse_order_by_for_search_runs(order_by_clause)
             if SearchUtils.is_attribute(key_type, '='):
                 order_value = getattr(SqlRun, SqlRun.get_attribute_name(key))
@@ -788,36 +1005,30 @@ def _get_orderby_clauses(order_by_list, session):
                 else:
                     raise MlflowException("Invalid identifier type '%s'" % key_type,
                                           error_code=INVALID_PARAMETER_VALUE)
-
-                # build a subquery first because we will join it in the main request so that the
-                # metric we want to sort on is available when we apply the sorting clause
-                subquery = session \
-                    .query(entity) \
-                    .filter(entity.key == key) \
-                    .subquery()
-
-                ordering_joins.append(subquery)
-                order_value = subquery.c.value
+                # runs without a value for the key are kept, with a NULL sort value
+                order_value = _get_entity_column_of_run(entity, entity.value, key)
 
             # sqlite does not support NULLS LAST expression, so we sort first by
             # presence of the field (and is_nan for metrics), then by actual value
-            # As the subqueries are created independently and used later in the
-            # same main query, the CASE WHEN columns need to have unique names to
-            # avoid ambiguity
             if SearchUtils.is_metric(key_type, '='):
-                clauses.append(sql.case([
-                    (subquery.c.is_nan.is_(True), 1),
-                    (order_value.is_(None), 1)
-                ], else_=0).label('clause_%s' % clause_id))
+                is_nan = _get_entity_column_of_run(SqlLatestMetric, SqlLatestMetric.is_nan, key)
+                # NaN values are stored as 0, and sorted apart from the NULL values so that each
+                # group of runs sorted last ties on the value. The groups are ordered as sqlite
+                # orders 0 and NULL values, on every database.
+                keys.append((sql.case([
+                    (is_nan.is_(True), 2 if ascending else 1),
+                    (order_value.is_(None), 1 if ascending else 2)
+                ], else_=0), True))
             else:  # other entities do not have an 'is_nan' field
-                clauses.append(sql.case([(order_value.is_(None), 1)], else_=0)
-                               .label('clause_%s' % clause_id))
+                keys.append((sql.case([(order_value.is_(None), 1)], else_=0), True))
+
+            keys.append((order_value, ascending))
+
+    keys.append((SqlRun.start_time, False))
+    keys.append((SqlRun.run_uuid, True))
+    return keys
 
-            if ascending:
-                clauses.append(order_value)
-            else:
-                clauses.append(order_value.desc())
 
-    clauses.append(SqlRun.start_time.desc())
-    clauses.append(SqlRun.run_uuid)
-    return clauses, ordering_joins
+def _get_orderby_clauses(sort_keys):
+    """Returns the ORDER BY clauses sorting runs by the keys returned by ``_get_orderby_keys``."""
+    return [expression if ascending else expression.desc() for expression, ascending in sort_keys]
@@ -0,0 +1,199 @@
+"""
+Internal module implementing asynchronous, batched logging of metrics, params and tags for the
+fluent API. Logging operations are queued and a background thread coalesces them per run into
+``log_batch`` calls.
+"""
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, wait
+
+from mlflow.tracking.client import MlflowClient
+from mlflow.tracking._tracking_service.utils import get_tracking_uri
+from mlflow.utils.validation import _validate_batch_log_data, MAX_ENTITIES_PER_BATCH, \
+    MAX_METRICS_PER_BATCH, MAX_PARAMS_TAGS_PER_BATCH
+
+_logger = logging.getLogger(__name__)
+
+_DEFAULT_FLUSH_INTERVAL_SECONDS = 5
+_DEFAULT_MAX_QUEUE_SIZE = MAX_ENTITIES_PER_BATCH
+
+
+class _PendingOperation(object):
+    def __init__(self, tracking_uri, run_id, metrics, params, tags):
+        self.tracking_uri = tracking_uri
+        self.run_id = run_id
+        self.metrics = metrics
+        self.params = params
+        self.tags = tags
+        self.future = Future()
+
+    def __len__(self):
+        return len(self.metrics) + len(self.params) + len(self.tags)
+
+
+def _split_into_batches(metrics, params, tags):
+    """
+    Split the specified entities into ``(metrics, params, tags)`` batches that satisfy the limits
+    enforced by ``mlflow.utils.validation._validate_batch_log_limits``, preserving the order in
+    which entities of each type were logged.
+    """
+    while metrics or params or tags:
+        batch_params = params[:MAX_PARAMS_TAGS_PER_BATCH]
+        batch_tags = tags[:MAX_PARAMS_TAGS_PER_BATCH]
+        num_metrics = min(MAX_METRICS_PER_BATCH,
+                          MAX_ENTITIES_PER_BATCH - len(batch_params) - len(batch_tags))
+        batch_metrics = metrics[:num_metrics]
+        yield batch_metrics, batch_params, batch_tags
+        metrics = metrics[len(batch_metrics):]
+        params = params[len(batch_params):]
+        tags = tags[len(batch_tags):]
+
+
+class AsyncBatchLogger(object):
+    """
+    Queues metrics, params and tags and logs them from a background thread. Queued entities are
+    coalesced per run into as few ``log_batch`` calls as possible. The queue is flushed every
+    ``flush_interval`` seconds, whenever it holds at least ``max_queue_size`` entities, and when
+    :py:meth:`flush` is called.
+    """
+
+    def __init__(self, flush_interval=_DEFAULT_FLUSH_INTERVAL_SECONDS,
+                 max_queue_size=_DEFAULT_MAX_QUEUE_SIZE):
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self._reset()
+
+    def _reset(self):
+        self._cond = threading.Condition()
+        self._queue = []
+        self._queue_size = 0
+        self._in_flight = []
+        self._flush_requested = False
+        self._stopped = False
+        self._thread = None
+        self._pid = os.getpid()
+
+    def log_batch(self, run_id, metrics=(), params=(), tags=()):
+        """
+        Queue the specified entities for logging to the specified run. Entities are validated
+        eagerly, so that invalid values raise an exception at call time.
+
+        :return: A ``concurrent.futures.Future`` that completes once the entities have been
+                 logged, or holds the exception raised while logging them. Entities logged to the
+                 same run may be coalesced into a single ``log_batch`` call, in which case an error
+                 affects all the operations that were logged together.
+        """
+        metrics, params, tags = list(metrics), list(params), list(tags)
+        _validate_batch_log_data(metrics, params, tags)
+        operation = _PendingOperation(get_tracking_uri(), run_id, metrics, params, tags)
+        if self._pid != os.getpid():
+            # The background thread (and entities queued by the parent) do not survive a fork
+            self._reset()
+        with self._cond:
+            self._start_thread_if_necessary()
+            self._queue.append(operation)
+            self._queue_size += len(operation)
+            if self._queue_size >= self.max_queue_size:
+                self._cond.notify()
+        return operation.future
+
+    def flush(self, run_id=None):
+        """
+        Log all queued entities and wait for them to be logged.
+
+        :param run_id: If specified, only wait for the entities of the specified run.
+        :return: None. Raises the first exception encountered while logging the flushed entities,
+                 if any.
+        """
+        if self._pid != os.getpid():
+            self._reset()
+        with self._cond:
+            futures = [operation.future for operation in self._queue + self._in_flight
+                       if run_id is None or operation.run_id == run_id]
+            if not futures:
+                return
+            self._flush_requested = True
+            self._cond.notify()
+        wait(futures)
+        for future in futures:
+            exception = future.exception()
+            if exception is not None:
+                raise exception
+
+    def shutdown(self):
+        """
+        Log all queued entities and stop the background thread. Errors are logged rather than
+        raised, since this method is called at interpreter exit.
+        """
+        if self._pid != os.getpid():
+            return
+        with self._cond:
+            thread = self._thread
+            self._stopped = True
+            self._cond.notify()
+        if thread is not None:
+            thread.join()
+
+    def _start_thread_if_necessary(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, name="MlflowAsyncBatchLogger")
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                deadline = time.time() + self.flush_interval
+                while not (self._stopped or self._flush_requested or
+                           self._queue_size >= self.max_queue_size):
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                operations = self._queue
+                self._in_flight = operations
+                self._queue = []
+                self._queue_size = 0
+                self._flush_requested = False
+                stopped = self._stopped
+            self._log_operations(operations)
+            with self._cond:
+                self._in_flight = []
+                if stopped and not self._queue:
+                    self._thread = None
+                    return
+
+    @staticmethod
+    def _log_operations(operations):
+        operations_by_run = OrderedDict()
+        for operation in operations:
+            key = (operation.tracking_uri, operation.run_id)
+            operations_by_run.setdefault(key, []).append(operation)
+        for (tracking_uri, run_id), run_operations in operations_by_run.items():
+            metrics = [m for operation in run_operations for m in operation.metrics]
+            params = [p for operation in run_operations for p in operation.params]
+            tags = [t for operation in run_operations for t in operation.tags]
+            try:
+                client = MlflowClient(tracking_uri)
+                for batch_metrics, batch_params, batch_tags in _split_into_batches(
+                        metrics, params, tags):
+                    client.log_batch(run_id, metrics=batch_metrics, params=batch_params,
+                                     tags=batch_tags)
+            except Exception as e:  # pylint: disable=broad-except
+                _logger.error("Failed to asynchronously log %s metrics, %s params and %s tags to "
+                              "run %s: %s", len(metrics), len(params), len(tags), run_id, e)
+                for operation in run_operations:
+                    operation.future.set_exception(e)
+            else:
+                for operation in run_operations:
+                    operation.future.set_result(None)
+
+
+_async_batch_logger = AsyncBatchLogger()
+
+atexit.register(_async_batch_logger.shutdown)
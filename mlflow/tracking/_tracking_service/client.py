@@ -59,6 +59,23 @@ class TrackingServiceClient(object):
         """
         return self.store.get_metric_history(run_id=run_id, metric_key=key)
 
+    def get_metric_histories(self, run_ids, metric_keys=None, max_points_per_series=None,
+                             step_range=None):
+        """
+        Return the histories of several metrics of several runs.
+
+        :param run_ids: List of run IDs.
+        :param metric_keys: List of metric names, or None to return all the metrics of the runs.
+        :param max_points_per_series: Maximum number of points returned for each metric of each
+                                      run, or None to return all the points.
+        :param step_range: Optional pair of the minimum and maximum steps of the points returned.
+        :return: Dictionary mapping the IDs of the runs to dictionaries mapping metric names to
+                 lists of :py:class:`mlflow.entities.Metric` entities, sorted by step.
+        """
+        return self.store.get_metric_histories(run_ids=run_ids, metric_keys=metric_keys,
+                                               max_points_per_series=max_points_per_series,
+                                               step_range=step_range)
+
     def create_run(self, experiment_id, start_time=None, tags=None):
         """
         Create a :py:class:`mlflow.entities.Run` object that can be associated with
@@ -348,3 +365,27 @@ class TrackingServiceClient(object):
         return self.store.search_runs(experiment_ids=experiment_ids, filter_string=filter_string,
                                       run_view_type=run_view_type, max_results=max_results,
                                       order_by=order_by, page_token=page_token)
+
+    def export_runs(self, experiment_ids, path, filter_string="",
+                    run_view_type=ViewType.ACTIVE_ONLY, order_by=None,
+                    export_format="parquet", max_results=None):
+        """
+        Export the runs that fit the search criteria to a Parquet file or an Arrow IPC stream
+        file.
+
+        :param experiment_ids: List of experiment IDs, or a single int or string id.
+        :param path: Local path of the file to which the runs are written.
+        :param filter_string: Filter query string, defaults to searching all runs.
+        :param run_view_type: one of enum values ACTIVE_ONLY, DELETED_ONLY, or ALL runs
+                              defined in :py:class:`mlflow.entities.ViewType`.
+        :param order_by: List of columns to order by, as for :py:meth:`search_runs`.
+        :param export_format: ``parquet`` or ``arrow``.
+        :param max_results: Maximum number of runs to export, or None to export all the runs
+                            that fit the search criteria.
+        """
+        if isinstance(experiment_ids, int) or is_string_type(experiment_ids):
+            experiment_ids = [experiment_ids]
+        with open(path, "wb") as f:
+            self.store.export_runs(experiment_ids=experiment_ids, filter_string=filter_string,
+                                   run_view_type=run_view_type, order_by=order_by,
+                                   export_format=export_format, output=f, max_results=max_results)
@@ -5,11 +5,15 @@ import posixpath
 
 from six.moves import urllib
 
+from mlflow.entities import RunStatus
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.store.artifact.artifact_cache import get_artifact_cache
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.artifact.models_artifact_repo import ModelsArtifactRepository
-from mlflow.tracking._tracking_service.utils import _get_store
+from mlflow.store.artifact.runs_artifact_repo import RunsArtifactRepository
+from mlflow.tracking._model_registry.utils import get_registry_uri
+from mlflow.tracking._tracking_service.utils import _get_store, get_tracking_uri
 from mlflow.utils.uri import append_to_uri_path
 
 
@@ -45,14 +49,65 @@ def get_artifact_uri(run_id, artifact_path=None):
         return append_to_uri_path(run.info.artifact_uri, artifact_path)
 
 
+def _get_artifact_cache_key(artifact_uri):
+    """
+    :return: Tuple of the key identifying the immutable artifacts referred to by ``artifact_uri``
+             in the artifact cache, or None if the artifacts may still change and must not be
+             cached, and of the URI from which to download these artifacts. ``models:/`` URIs are
+             identified by their registry and model version, and ``runs:/`` URIs by their run ID
+             and resolved artifact URI, provided that the run has terminated. The stage of a
+             ``models:/<name>/<stage>`` URI is resolved to a version once, and the artifacts are
+             downloaded from the URI of that version, so that a transition of the stage cannot
+             store the artifacts of another version under the key.
+
+             Artifacts logged to a run after it terminated are not detected: a ``runs:/`` URI
+             downloaded before they were logged keeps being served from the cache.
+    """
+    if ModelsArtifactRepository.is_models_uri(artifact_uri):
+        name, version, stage = ModelsArtifactRepository._parse_uri(artifact_uri)
+        if stage is not None:
+            from mlflow.tracking import MlflowClient
+            latest = MlflowClient().get_latest_versions(name, [stage])
+            if len(latest) == 0:
+                return None, artifact_uri
+            version = latest[0].version
+        return ("models:%s:%s:%s" % (get_registry_uri(), name, version),
+                "models:/%s/%s" % (name, version))
+    elif RunsArtifactRepository.is_runs_uri(artifact_uri):
+        run_id, artifact_path = RunsArtifactRepository.parse_runs_uri(artifact_uri)
+        run = _get_store().get_run(run_id)
+        if not RunStatus.is_terminated(RunStatus.from_string(run.info.status)):
+            return None, artifact_uri
+        resolved_uri = run.info.artifact_uri if artifact_path is None else \
+            append_to_uri_path(run.info.artifact_uri, artifact_path)
+        return "runs:%s:%s:%s" % (get_tracking_uri(), run_id, resolved_uri), artifact_uri
+    return None, artifact_uri
+
+
 # TODO: This would be much simpler if artifact_repo.download_artifacts could take the absolute path
 # or no path.
 def _download_artifact_from_uri(artifact_uri, output_path=None):
     """
+    If the ``MLFLOW_ARTIFACT_CACHE_DIR`` environment variable is set, the artifacts of registered
+    model versions (``models:/`` URIs) and terminated runs (``runs:/`` URIs) are downloaded once
+    into the artifact cache, and copied from there to ``output_path``.
+
     :param artifact_uri: The *absolute* URI of the artifact to download.
     :param output_path: The local filesystem path to which to download the artifact. If unspecified,
                         a local output path will be created.
     """
+    cache = get_artifact_cache()
+    if cache is not None:
+        key, download_uri = _get_artifact_cache_key(artifact_uri)
+        if key is not None:
+            return cache.download(
+                key,
+                lambda dst_path: _download_artifact_from_uri_without_cache(download_uri, dst_path),
+                output_path)
+    return _download_artifact_from_uri_without_cache(artifact_uri, output_path)
+
+
+def _download_artifact_from_uri_without_cache(artifact_uri, output_path=None):
     parsed_uri = urllib.parse.urlparse(artifact_uri)
     prefix = ""
     if parsed_uri.scheme and not parsed_uri.path.startswith("/"):
@@ -109,6 +109,38 @@ class MlflowClient(object):
         """
         return self._tracking_client.get_metric_history(run_id, key)
 
+    @experimental
+    def get_metric_histories(self, run_ids, metric_keys=None, max_points_per_series=None,
+                             step_range=None):
+        """
+        Return the histories of several metrics of several runs, in a single request to the
+        tracking store, for example to plot the metrics of runs side by side. Long histories can
+        be downsampled to at most ``max_points_per_series`` points, keeping the points with the
+        minimum and maximum values of consecutive buckets of steps so that spikes are preserved.
+
+        :param run_ids: List of run IDs.
+        :param metric_keys: List of metric names, or None to return all the metrics of the runs.
+        :param max_points_per_series: Maximum number of points returned for each metric of each
+                                      run, or None to return all the points.
+        :param step_range: Optional pair ``(min_step, max_step)`` of the minimum and maximum
+                           steps of the points returned, either of which may be None.
+        :return: Dictionary mapping the IDs of the runs to dictionaries mapping metric names to
+                 lists of :py:class:`mlflow.entities.Metric` entities, sorted by step. Metrics
+                 without points in ``step_range`` are omitted.
+
+        .. code-block:: python
+            :caption: Example
+
+            from mlflow.tracking import MlflowClient
+
+            client = MlflowClient()
+            histories = client.get_metric_histories([run_id_1, run_id_2], ["loss"],
+                                                    max_points_per_series=500)
+            losses = [m.value for m in histories[run_id_1]["loss"]]
+        """
+        return self._tracking_client.get_metric_histories(run_ids, metric_keys,
+                                                          max_points_per_series, step_range)
+
     def create_run(self, experiment_id, start_time=None, tags=None):
         """
         Create a :py:class:`mlflow.entities.Run` object that can be associated with
@@ -348,6 +380,45 @@ class MlflowClient(object):
         return self._tracking_client.search_runs(experiment_ids, filter_string, run_view_type,
                                                  max_results, order_by, page_token)
 
+    @experimental
+    def export_runs(self, experiment_ids, path, filter_string="",
+                    run_view_type=ViewType.ACTIVE_ONLY, order_by=None,
+                    export_format="parquet", max_results=None):
+        """
+        Export the runs that fit the search criteria to a Parquet file or an Arrow IPC stream
+        file, for offline analysis of many runs. Tracking servers stream the runs as they search
+        them, which is much faster than paging through :py:meth:`search_runs`. Requires
+        ``pyarrow``.
+
+        Each run is a row with the ``run_id``, ``experiment_id``, ``user_id``, ``status``,
+        ``start_time``, ``end_time``, ``artifact_uri`` and ``lifecycle_stage`` columns, and the
+        ``metrics``, ``params`` and ``tags`` columns mapping the keys of the run's latest
+        metrics, params and tags to their values.
+
+        :param experiment_ids: List of experiment IDs, or a single int or string id.
+        :param path: Local path of the file to which the runs are written.
+        :param filter_string: Filter query string, defaults to searching all runs.
+        :param run_view_type: one of enum values ACTIVE_ONLY, DELETED_ONLY, or ALL runs
+                              defined in :py:class:`mlflow.entities.ViewType`.
+        :param order_by: List of columns to order by, as for :py:meth:`search_runs`.
+        :param export_format: ``parquet`` to write a Parquet file, or ``arrow`` to write an Arrow
+                              IPC stream file.
+        :param max_results: Maximum number of runs to export, or None to export all the runs
+                            that fit the search criteria.
+
+        .. code-block:: python
+            :caption: Example
+
+            import pyarrow.parquet as pq
+            from mlflow.tracking import MlflowClient
+
+            client = MlflowClient()
+            client.export_runs(["0"], "runs.parquet", filter_string="metrics.rmse < 1")
+            runs = pq.read_table("runs.parquet").to_pandas()
+        """
+        self._tracking_client.export_runs(experiment_ids, path, filter_string, run_view_type,
+                                          order_by, export_format, max_results)
+
     # Registry API
 
     # Registered Model Methods
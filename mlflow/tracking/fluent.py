@@ -15,6 +15,7 @@ from mlflow.entities.lifecycle_stage import LifecycleStage
 from mlflow.exceptions import MlflowException
 from mlflow.tracking.client import MlflowClient
 from mlflow.tracking import artifact_utils
+from mlflow.tracking._async_logging import _async_batch_logger
 from mlflow.tracking.context import registry as context_registry
 from mlflow.utils import env
 from mlflow.utils.databricks_utils import is_in_databricks_notebook, get_notebook_id
@@ -24,8 +25,10 @@ from mlflow.utils.validation import _validate_run_id
 _EXPERIMENT_ID_ENV_VAR = "MLFLOW_EXPERIMENT_ID"
 _EXPERIMENT_NAME_ENV_VAR = "MLFLOW_EXPERIMENT_NAME"
 _RUN_ID_ENV_VAR = "MLFLOW_RUN_ID"
+_ASYNC_LOGGING_ENV_VAR = "MLFLOW_ENABLE_ASYNC_LOGGING"
 _active_run_stack = []
 _active_experiment_id = None
+_async_logging_enabled = None
 
 SEARCH_MAX_RESULTS_PANDAS = 100000
 NUM_RUNS_PER_PAGE_PANDAS = 10000
@@ -161,7 +164,10 @@ def end_run(status=RunStatus.to_string(RunStatus.FINISHED)):
         # Clear out the global existing run environment variable as well.
         env.unset_variable(_RUN_ID_ENV_VAR)
         run = _active_run_stack.pop()
-        MlflowClient().set_terminated(run.info.run_id, status)
+        try:
+            _async_batch_logger.flush(run.info.run_id)
+        finally:
+            MlflowClient().set_terminated(run.info.run_id, status)
 
 
 atexit.register(end_run)
@@ -206,8 +212,12 @@ def log_param(key, value):
 
     :param key: Parameter name (string)
     :param value: Parameter value (string, but will be string-ified if not)
+    :return: None, or a ``concurrent.futures.Future`` if asynchronous logging is enabled (see
+             :py:func:`enable_async_logging`).
     """
     run_id = _get_or_start_run().info.run_id
+    if _is_async_logging_enabled():
+        return _async_batch_logger.log_batch(run_id, params=[Param(key, str(value))])
     MlflowClient().log_param(run_id, key, value)
 
 
@@ -218,8 +228,12 @@ def set_tag(key, value):
 
     :param key: Tag name (string)
     :param value: Tag value (string, but will be string-ified if not)
+    :return: None, or a ``concurrent.futures.Future`` if asynchronous logging is enabled (see
+             :py:func:`enable_async_logging`).
     """
     run_id = _get_or_start_run().info.run_id
+    if _is_async_logging_enabled():
+        return _async_batch_logger.log_batch(run_id, tags=[RunTag(key, str(value))])
     MlflowClient().set_tag(run_id, key, value)
 
 
@@ -244,9 +258,15 @@ def log_metric(key, value, step=None):
                   replaced by other values depending on the store. For example, sFor example, the
                   SQLAlchemy store replaces +/- Inf with max / min float values.
     :param step: Metric step (int). Defaults to zero if unspecified.
+    :return: None, or a ``concurrent.futures.Future`` if asynchronous logging is enabled (see
+             :py:func:`enable_async_logging`).
     """
     run_id = _get_or_start_run().info.run_id
-    MlflowClient().log_metric(run_id, key, value, int(time.time() * 1000), step or 0)
+    timestamp = int(time.time() * 1000)
+    if _is_async_logging_enabled():
+        return _async_batch_logger.log_batch(
+            run_id, metrics=[Metric(key, value, timestamp, step or 0)])
+    MlflowClient().log_metric(run_id, key, value, timestamp, step or 0)
 
 
 def log_metrics(metrics, step=None):
@@ -260,11 +280,14 @@ def log_metrics(metrics, step=None):
     :param step: A single integer step at which to log the specified
                  Metrics. If unspecified, each metric is logged at step zero.
 
-    :returns: None
+    :returns: None, or a ``concurrent.futures.Future`` if asynchronous logging is enabled (see
+              :py:func:`enable_async_logging`).
     """
     run_id = _get_or_start_run().info.run_id
     timestamp = int(time.time() * 1000)
     metrics_arr = [Metric(key, value, timestamp, step or 0) for key, value in metrics.items()]
+    if _is_async_logging_enabled():
+        return _async_batch_logger.log_batch(run_id, metrics=metrics_arr)
     MlflowClient().log_batch(run_id=run_id, metrics=metrics_arr, params=[], tags=[])
 
 
@@ -275,10 +298,13 @@ def log_params(params):
 
     :param params: Dictionary of param_name: String -> value: (String, but will be string-ified if
                    not)
-    :returns: None
+    :returns: None, or a ``concurrent.futures.Future`` if asynchronous logging is enabled (see
+              :py:func:`enable_async_logging`).
     """
     run_id = _get_or_start_run().info.run_id
     params_arr = [Param(key, str(value)) for key, value in params.items()]
+    if _is_async_logging_enabled():
+        return _async_batch_logger.log_batch(run_id, params=params_arr)
     MlflowClient().log_batch(run_id=run_id, metrics=[], params=params_arr, tags=[])
 
 
@@ -289,13 +315,53 @@ def set_tags(tags):
 
     :param tags: Dictionary of tag_name: String -> value: (String, but will be string-ified if
                  not)
-    :returns: None
+    :returns: None, or a ``concurrent.futures.Future`` if asynchronous logging is enabled (see
+              :py:func:`enable_async_logging`).
     """
     run_id = _get_or_start_run().info.run_id
     tags_arr = [RunTag(key, str(value)) for key, value in tags.items()]
+    if _is_async_logging_enabled():
+        return _async_batch_logger.log_batch(run_id, tags=tags_arr)
     MlflowClient().log_batch(run_id=run_id, metrics=[], params=[], tags=tags_arr)
 
 
+def enable_async_logging(enable=True):
+    """
+    Enable or disable asynchronous logging for :py:func:`log_metric`, :py:func:`log_metrics`,
+    :py:func:`log_param`, :py:func:`log_params`, :py:func:`set_tag` and :py:func:`set_tags`.
+    Asynchronous logging can also be enabled by setting the ``MLFLOW_ENABLE_ASYNC_LOGGING``
+    environment variable to ``true``.
+
+    When asynchronous logging is enabled, these functions return immediately with a
+    ``concurrent.futures.Future`` and the logged entities are queued. A background thread
+    coalesces queued entities per run into batched logging calls, sending them every few seconds,
+    whenever enough entities are queued, when :py:func:`flush_async_logging` is called, when the
+    run ends, and at interpreter exit.
+
+    :param enable: If ``True``, enable asynchronous logging. If ``False``, flush any queued
+                   entities and disable asynchronous logging.
+    """
+    global _async_logging_enabled
+    if not enable:
+        _async_batch_logger.flush()
+    _async_logging_enabled = enable
+
+
+def flush_async_logging():
+    """
+    Log all metrics, params and tags queued by asynchronous logging (see
+    :py:func:`enable_async_logging`) and wait for them to be logged. Raises the first exception
+    encountered while logging the queued entities, if any.
+    """
+    _async_batch_logger.flush()
+
+
+def _is_async_logging_enabled():
+    if _async_logging_enabled is not None:
+        return _async_logging_enabled
+    return str(os.environ.get(_ASYNC_LOGGING_ENV_VAR, "")).lower() == "true"
+
+
 def log_artifact(local_path, artifact_path=None):
     """
     Log a local file or directory as an artifact of the currently active run. If no run is
@@ -422,57 +488,40 @@ def search_runs(experiment_ids=None, filter_string="", run_view_type=ViewType.AC
         experiment_ids = _get_experiment_id()
     runs = _get_paginated_runs(experiment_ids, filter_string, run_view_type, max_results,
                                order_by)
-    info = {'run_id': [], 'experiment_id': [],
-            'status': [], 'artifact_uri': [],
-            'start_time': [], 'end_time': []}
-    params, metrics, tags = ({}, {}, {})
-    PARAM_NULL, METRIC_NULL, TAG_NULL = (None, np.nan, None)
+    return _runs_to_dataframe(runs)
+
+
+def _runs_to_dataframe(runs):
+    """
+    Build the DataFrame of ``search_runs`` column by column. The column of each metric, param and
+    tag is allocated once, filled with null values, and the values of the runs that have the key
+    are then set by index, so that the cost is proportional to the number of values rather than to
+    the number of runs times the number of keys.
+    """
+    num_runs = len(runs)
+    data = {
+        'run_id': [run.info.run_id for run in runs],
+        'experiment_id': [run.info.experiment_id for run in runs],
+        'status': [run.info.status for run in runs],
+        'artifact_uri': [run.info.artifact_uri for run in runs],
+        'start_time': pd.to_datetime([run.info.start_time for run in runs], unit="ms", utc=True),
+        'end_time': pd.to_datetime([run.info.end_time for run in runs], unit="ms", utc=True),
+    }
+    metrics, params, tags = ({}, {}, {})
     for i, run in enumerate(runs):
-        info['run_id'].append(run.info.run_id)
-        info['experiment_id'].append(run.info.experiment_id)
-        info['status'].append(run.info.status)
-        info['artifact_uri'].append(run.info.artifact_uri)
-        info['start_time'].append(pd.to_datetime(run.info.start_time, unit="ms", utc=True))
-        info['end_time'].append(pd.to_datetime(run.info.end_time, unit="ms", utc=True))
-
-        # Params
-        param_keys = set(params.keys())
-        for key in param_keys:
-            if key in run.data.params:
-                params[key].append(run.data.params[key])
-            else:
-                params[key].append(PARAM_NULL)
-        new_params = set(run.data.params.keys()) - param_keys
-        for p in new_params:
-            params[p] = [PARAM_NULL]*i  # Fill in null values for all previous runs
-            params[p].append(run.data.params[p])
-
-        # Metrics
-        metric_keys = set(metrics.keys())
-        for key in metric_keys:
-            if key in run.data.metrics:
-                metrics[key].append(run.data.metrics[key])
-            else:
-                metrics[key].append(METRIC_NULL)
-        new_metrics = set(run.data.metrics.keys()) - metric_keys
-        for m in new_metrics:
-            metrics[m] = [METRIC_NULL]*i
-            metrics[m].append(run.data.metrics[m])
-
-        # Tags
-        tag_keys = set(tags.keys())
-        for key in tag_keys:
-            if key in run.data.tags:
-                tags[key].append(run.data.tags[key])
-            else:
-                tags[key].append(TAG_NULL)
-        new_tags = set(run.data.tags.keys()) - tag_keys
-        for t in new_tags:
-            tags[t] = [TAG_NULL]*i
-            tags[t].append(run.data.tags[t])
-
-    data = {}
-    data.update(info)
+        for key, value in run.data.metrics.items():
+            if key not in metrics:
+                metrics[key] = np.full(num_runs, np.nan)
+            metrics[key][i] = value
+        for key, value in run.data.params.items():
+            if key not in params:
+                params[key] = np.full(num_runs, None, dtype=object)
+            params[key][i] = value
+        for key, value in run.data.tags.items():
+            if key not in tags:
+                tags[key] = np.full(num_runs, None, dtype=object)
+            tags[key][i] = value
+
     for key in metrics:
         data['metrics.' + key] = metrics[key]
     for key in params:
@@ -43,3 +43,58 @@ PORT = click.option("--port", "-p", default=5000,
 # We use None to disambiguate manually selecting "4"
 WORKERS = click.option("--workers", "-w", default=None,
                        help="Number of gunicorn worker processes to handle requests (default: 4).")
+
+MAX_BATCH_SIZE = click.option("--max-batch-size", type=click.INT, default=None,
+                              help="If specified, concurrent requests to the model are scored "
+                                   "together in batches of up to this number of rows, and each "
+                                   "worker process handles this number of requests concurrently. "
+                                   "Batching is disabled by default.")
+
+MAX_BATCH_WAIT_MS = click.option("--max-batch-wait-ms", type=click.FLOAT, default=None,
+                                 help="Maximum number of milliseconds for which a request waits "
+                                      "for other requests to batch it with, when "
+                                      "--max-batch-size is specified (default: 5).")
+
+ASGI = click.option("--asgi", is_flag=True, default=False,
+                    help="If specified, serve the model with an ASGI server (uvicorn, which must "
+                         "be installed in the model's environment) that loads the model once per "
+                         "server process and scores requests on an executor of "
+                         "--inference-workers threads or processes.")
+
+INFERENCE_EXECUTOR = click.option("--inference-executor", default=None,
+                                  type=click.Choice(["thread", "process"]),
+                                  help="With --asgi, whether requests are scored on a pool of "
+                                       "threads sharing the model, or on a pool of processes "
+                                       "forked once the model is loaded, which share its memory "
+                                       "(default: thread).")
+
+INFERENCE_WORKERS = click.option("--inference-workers", type=click.INT, default=None,
+                                 help="With --asgi, number of threads or processes scoring "
+                                      "requests (default: number of CPUs).")
+
+REQUEST_TIMEOUT = click.option("--request-timeout", type=click.FLOAT, default=None,
+                               help="With --asgi, number of seconds after which requests that "
+                                    "have not been scored fail with a 504 status (default: 60).")
+
+MAX_PENDING_REQUESTS = click.option("--max-pending-requests", type=click.INT, default=None,
+                                    help="With --asgi, maximum number of requests being scored or "
+                                         "waiting to be scored, above which requests fail with a "
+                                         "503 status (default: 128).")
+
+WARMUP_ITERATIONS = click.option("--warmup-iterations", type=click.INT, default=None,
+                                 help="If specified, each server process scores a warm-up request "
+                                      "this number of times once the model is loaded, and the "
+                                      "/ping endpoint only reports the server healthy once the "
+                                      "warm-up is complete. The warm-up request is the input "
+                                      "example saved with the model, or --warmup-input.")
+
+WARMUP_INPUT = click.option("--warmup-input", default=None, metavar="PATH",
+                            help="Path of a JSON file holding the input of the warm-up requests as "
+                                 "a pandas DataFrame with the split orient, used instead of the "
+                                 "input example saved with the model.")
+
+ENABLE_METRICS = click.option("--enable-metrics", is_flag=True, default=False,
+                              help="If specified, the server records Prometheus metrics of the "
+                                   "scoring requests, such as the time spent parsing requests, "
+                                   "in the model and serializing predictions, and exposes them on "
+                                   "the /metrics endpoint.")
@@ -1,4 +1,5 @@
 import base64
+import math
 
 from json import JSONEncoder
 
@@ -15,6 +16,57 @@ def message_to_json(message):
     return MessageToJson(message, preserving_proto_field_name=True)
 
 
+def _double_to_json(value):
+    # Non-finite doubles are strings in the JSON mapping of protobuf
+    value = float(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "Infinity" if value > 0 else "-Infinity"
+    return value
+
+
+def metric_to_json_dict(metric):
+    """
+    Converts a :py:class:`mlflow.entities.Metric` to the dictionary of its JSON representation,
+    as :py:func:`message_to_json` would convert its protobuf message.
+    """
+    return {"key": metric.key, "value": _double_to_json(metric.value),
+            "timestamp": str(metric.timestamp), "step": str(metric.step)}
+
+
+def run_to_json_dict(run):
+    """
+    Converts a :py:class:`mlflow.entities.Run` to the dictionary of its JSON representation,
+    as :py:func:`message_to_json` would convert its protobuf message, without creating the
+    message. Fields are omitted under the same conditions as in ``Run.to_proto``, and int64
+    fields are strings, as in the JSON mapping of protobuf.
+    """
+    info = run.info
+    info_json = {"run_uuid": info.run_uuid, "experiment_id": info.experiment_id,
+                 "user_id": info.user_id, "status": info.status,
+                 "start_time": str(info.start_time)}
+    if info.end_time:
+        info_json["end_time"] = str(info.end_time)
+    if info.artifact_uri:
+        info_json["artifact_uri"] = info.artifact_uri
+    info_json["lifecycle_stage"] = info.lifecycle_stage
+    info_json["run_id"] = info.run_id
+    run_json = {"info": info_json}
+    data = run.data
+    if data:
+        data_json = {}
+        if data._metric_objs:
+            data_json["metrics"] = [metric_to_json_dict(m) for m in data._metric_objs]
+        if data.params:
+            data_json["params"] = [{"key": key, "value": value}
+                                   for key, value in data.params.items()]
+        if data.tags:
+            data_json["tags"] = [{"key": key, "value": value} for key, value in data.tags.items()]
+        run_json["data"] = data_json
+    return run_json
+
+
 def _stringify_all_experiment_ids(x):
     """Converts experiment_id fields which are defined as ints into strings in the given json.
     This is necessary for backwards- and forwards-compatibility with MLflow clients/servers
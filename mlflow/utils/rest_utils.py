@@ -1,9 +1,12 @@
 import base64
-import time
 import logging
 import json
+import os
+import threading
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from mlflow import __version__
 from mlflow.protos import databricks_pb2
@@ -20,20 +23,102 @@ _DEFAULT_HEADERS = {
     'User-Agent': 'mlflow-python-client/%s' % __version__
 }
 
+MLFLOW_HTTP_REQUEST_MAX_RETRIES = "MLFLOW_HTTP_REQUEST_MAX_RETRIES"
+MLFLOW_HTTP_REQUEST_BACKOFF_FACTOR = "MLFLOW_HTTP_REQUEST_BACKOFF_FACTOR"
+MLFLOW_HTTP_POOL_MAXSIZE = "MLFLOW_HTTP_POOL_MAXSIZE"
 
-def http_request(host_creds, endpoint, retries=3, retry_interval=3,
-                 max_rate_limit_interval=60, **kwargs):
+_DEFAULT_MAX_RETRIES = 5
+_DEFAULT_BACKOFF_FACTOR = 2
+_DEFAULT_POOL_MAXSIZE = 10
+_RETRY_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+
+
+def _reset_request_sessions():
+    global _request_sessions_lock, _request_sessions_pid
+    # Pooled connections (and a lock possibly held by another thread at fork time) must not be
+    # shared with a parent process, so forked children start with an empty pool
+    _request_sessions_lock = threading.Lock()
+    _request_sessions.clear()
+    _request_sessions_pid = os.getpid()
+
+
+_request_sessions = {}
+_request_sessions_lock = threading.Lock()
+_request_sessions_pid = os.getpid()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_request_sessions)
+
+
+def _create_request_session(max_retries, backoff_factor, pool_maxsize):
+    retry_kwargs = dict(
+        total=max_retries,
+        connect=max_retries,
+        # Requests that reached the server are not retried after read errors (such as timeouts),
+        # since non-idempotent requests such as CreateRun or LogBatch may already have been applied
+        read=0,
+        redirect=max_retries,
+        status=max_retries,
+        status_forcelist=_RETRY_STATUS_CODES,
+        backoff_factor=backoff_factor,
+        raise_on_status=False,
+    )
+    try:
+        # Retry the status codes above regardless of the HTTP method, as the previous retry loop
+        # did
+        retry = Retry(allowed_methods=False, **retry_kwargs)
+    except TypeError:
+        # urllib3 < 1.26 names this argument ``method_whitelist``
+        retry = Retry(method_whitelist=False, **retry_kwargs)
+    adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize,
+                          max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _get_request_session(host, max_retries, backoff_factor):
+    """
+    Returns a process-wide ``requests.Session`` for the specified host and retry policy. Sessions
+    keep a pool of keep-alive connections (of size ``MLFLOW_HTTP_POOL_MAXSIZE``), so successive
+    requests to the same server reuse TCP and TLS connections.
+    """
+    if _request_sessions_pid != os.getpid():
+        # Fallback for platforms without ``os.register_at_fork``
+        _reset_request_sessions()
+    key = (host, max_retries, backoff_factor)
+    with _request_sessions_lock:
+        session = _request_sessions.get(key)
+        if session is None:
+            pool_maxsize = int(os.environ.get(MLFLOW_HTTP_POOL_MAXSIZE, _DEFAULT_POOL_MAXSIZE))
+            session = _create_request_session(max_retries, backoff_factor, pool_maxsize)
+            _request_sessions[key] = session
+        return session
+
+
+def http_request(host_creds, endpoint, max_retries=None, backoff_factor=None, **kwargs):
     """
-    Makes an HTTP request with the specified method to the specified hostname/endpoint. Ratelimit
-    error code (429) will be retried with an exponential back off (1, 2, 4, ... seconds) for at most
-    `max_rate_limit_interval` seconds.  Internal errors (500s) will be retried up to `retries` times
-    , waiting `retry_interval` seconds between successive retries. Parses the API response
-    (assumed to be JSON) into a Python object and returns it.
+    Makes an HTTP request with the specified method to the specified hostname/endpoint. Requests
+    are sent through a pooled, keep-alive session shared by all requests to the same host. Ratelimit
+    errors (429), internal errors (500, 502, 503, 504) and errors establishing the connection are
+    retried up to `max_retries` times with an exponential back off of `backoff_factor` *
+    (1, 2, 4, ...) seconds, honoring any ``Retry-After`` header sent by the server. Requests whose
+    response could not be read, for example because it timed out, are not retried. Parses the API
+    response (assumed to be JSON) into a Python object and returns it.
 
     :param host_creds: A :py:class:`mlflow.rest_utils.MlflowHostCreds` object containing
         hostname and optional authentication.
+    :param max_retries: Maximum number of retries. Defaults to the value of the
+        ``MLFLOW_HTTP_REQUEST_MAX_RETRIES`` environment variable, or 5 if it is not set.
+    :param backoff_factor: Factor of the exponential back off between retries. Defaults to the value
+        of the ``MLFLOW_HTTP_REQUEST_BACKOFF_FACTOR`` environment variable, or 2 if it is not set.
     :return: Parsed API response
     """
+    if max_retries is None:
+        max_retries = int(os.environ.get(MLFLOW_HTTP_REQUEST_MAX_RETRIES, _DEFAULT_MAX_RETRIES))
+    if backoff_factor is None:
+        backoff_factor = float(
+            os.environ.get(MLFLOW_HTTP_REQUEST_BACKOFF_FACTOR, _DEFAULT_BACKOFF_FACTOR))
     hostname = host_creds.host
     auth_str = None
     if host_creds.username and host_creds.password:
@@ -54,37 +139,16 @@ def http_request(host_creds, endpoint, retries=3, retry_interval=3,
     if host_creds.client_cert_path is not None:
         kwargs['cert'] = host_creds.client_cert_path
 
-    def request_with_ratelimit_retries(max_rate_limit_interval, **kwargs):
-        response = requests.request(**kwargs)
-        time_left = max_rate_limit_interval
-        sleep = 1
-        while response.status_code == 429 and time_left > 0:
-            _logger.warning(
-                "API request to {path} returned status code 429 (Rate limit exceeded). "
-                "Retrying in %d seconds. "
-                "Will continue to retry 429s for up to %d seconds.",
-                sleep, time_left)
-            time.sleep(sleep)
-            time_left -= sleep
-            response = requests.request(**kwargs)
-            sleep = min(time_left, sleep*2)  # sleep for 1, 2, 4, ... seconds;
-        return response
-
     cleaned_hostname = strip_suffix(hostname, '/')
     url = "%s%s" % (cleaned_hostname, endpoint)
-    for i in range(retries):
-        response = request_with_ratelimit_retries(max_rate_limit_interval,
-                                                  url=url, headers=headers, verify=verify, **kwargs)
-        if response.status_code >= 200 and response.status_code < 500:
-            return response
-        else:
-            _logger.error(
-                "API request to %s failed with code %s != 200, retrying up to %s more times. "
-                "API response body: %s",
-                url, response.status_code, retries - i - 1, response.text)
-            time.sleep(retry_interval)
-    raise MlflowException("API request to %s failed to return code 200 after %s tries" %
-                          (url, retries))
+    session = _get_request_session(cleaned_hostname, max_retries, backoff_factor)
+    response = session.request(url=url, headers=headers, verify=verify, **kwargs)
+    if response.status_code >= 500:
+        _logger.error("API request to %s failed with code %s != 200. API response body: %s",
+                      url, response.status_code, response.text)
+        raise MlflowException("API request to %s failed to return code 200 after %s tries" %
+                              (url, max_retries + 1))
+    return response
 
 
 def _can_parse_as_json(string):
@@ -162,10 +226,10 @@ class MlflowHostCreds(object):
         true in production.
         If this is set to true ``server_cert_path`` must not be set.
     :param client_cert_path: Path to ssl client cert file (.pem).
-        Sets the cert param of the ``requests.request``
+        Sets the cert param of the ``requests.Session.request``
         function (see https://requests.readthedocs.io/en/master/api/).
     :param server_cert_path: Path to a CA bundle to use.
-        Sets the verify param of the ``requests.request``
+        Sets the verify param of the ``requests.Session.request``
         function (see https://requests.readthedocs.io/en/master/api/).
         If this is set ``ignore_tls_verification`` must be false.
     """
@@ -414,6 +414,9 @@ class SearchUtils(object):
         # Return a key such that None values are always at the end.
         is_null_or_nan = sort_value is None or (isinstance(sort_value, float)
                                                 and math.isnan(sort_value))
+        # None and NaN values sort equally, by the natural ordering of the runs
+        if is_null_or_nan:
+            sort_value = None
         if ascending:
             return (is_null_or_nan, sort_value)
         return (not is_null_or_nan, sort_value)
@@ -437,13 +440,7 @@ class SearchUtils(object):
         return runs
 
     @classmethod
-    def parse_start_offset_from_page_token(cls, page_token):
-        # Note: the page_token is expected to be a base64-encoded JSON that looks like
-        # { "offset": xxx }. However, this format is not stable, so it should not be
-        # relied upon outside of this method.
-        if not page_token:
-            return 0
-
+    def _decode_page_token(cls, page_token):
         try:
             decoded_token = base64.b64decode(page_token)
         except TypeError:
@@ -458,7 +455,13 @@ class SearchUtils(object):
         except ValueError:
             raise MlflowException("Invalid page token, decoded value=%s" % decoded_token,
                                   error_code=INVALID_PARAMETER_VALUE)
+        if not isinstance(parsed_token, dict):
+            raise MlflowException("Invalid page token, parsed value=%s" % parsed_token,
+                                  error_code=INVALID_PARAMETER_VALUE)
+        return parsed_token
 
+    @classmethod
+    def _parse_offset(cls, parsed_token):
         offset_str = parsed_token.get("offset")
         if not offset_str:
             raise MlflowException("Invalid page token, parsed value=%s" % parsed_token,
@@ -472,23 +475,117 @@ class SearchUtils(object):
 
         return offset
 
+    @classmethod
+    def parse_start_offset_from_page_token(cls, page_token):
+        # Note: the page_token is expected to be a base64-encoded JSON that looks like
+        # { "offset": xxx }. However, this format is not stable, so it should not be
+        # relied upon outside of this method.
+        if not page_token:
+            return 0
+        return cls._parse_offset(cls._decode_page_token(page_token))
+
     @classmethod
     def create_page_token(cls, offset):
         return base64.b64encode(json.dumps({"offset": offset}).encode("utf-8"))
 
     @classmethod
-    def paginate(cls, runs, page_token, max_results):
-        """Paginates a set of runs based on an offset encoded into the page_token and a max
+    def create_keyset_page_token(cls, sort_key):
+        """
+        Create a page token encoding the sort key of the last result of a page. The next page
+        starts after that result in the sort order, so that it does not skip or repeat results
+        when results are inserted or deleted between the requests for the two pages.
+
+        :param sort_key: List of the JSON-serializable values of the sort keys of the last result.
+        """
+        return base64.b64encode(json.dumps({"sort_key": list(sort_key)}).encode("utf-8"))
+
+    @classmethod
+    def parse_page_token(cls, page_token):
+        """
+        Parse a page token created by either :py:meth:`create_page_token` or
+        :py:meth:`create_keyset_page_token`.
+
+        :return: Pair of the offset of the page and of the sort key of the last result of the
+                 previous page. The offset is 0 for keyset page tokens, and the sort key is None
+                 for offset page tokens and if there is no page token.
+        """
+        if not page_token:
+            return 0, None
+        parsed_token = cls._decode_page_token(page_token)
+        if "sort_key" not in parsed_token:
+            return cls._parse_offset(parsed_token), None
+        sort_key = parsed_token["sort_key"]
+        if not isinstance(sort_key, list):
+            raise MlflowException("Invalid page token, parsed value=%s" % parsed_token,
+                                  error_code=INVALID_PARAMETER_VALUE)
+        return 0, sort_key
+
+    @classmethod
+    def _get_run_sort_key(cls, run, parsed_order_by_list):
+        """
+        :return: Pair of the list of the values by which ``run`` is sorted by :py:meth:`sort`,
+                 with None for missing and NaN values, and of the list of their directions.
+        """
+        values = []
+        ascendings = []
+        for key_type, key, ascending in parsed_order_by_list:
+            _, value = cls._get_value_for_sort(run, key_type, key, ascending)
+            values.append(value)
+            ascendings.append(ascending)
+        return values + [run.info.start_time, run.info.run_uuid], ascendings + [False, True]
+
+    @classmethod
+    def _compare_sort_keys(cls, values, other_values, ascendings):
+        """
+        Compare sort keys as :py:meth:`sort` orders runs, with None values last and equal.
+
+        :return: A negative number, zero or a positive number if ``values`` sort before, equally
+                 to or after ``other_values``.
+        """
+        for value, other_value, ascending in zip(values, other_values, ascendings):
+            if value is None or other_value is None:
+                if value is None and other_value is None:
+                    continue
+                return 1 if value is None else -1
+            if value != other_value:
+                return (1 if value > other_value else -1) * (1 if ascending else -1)
+        return 0
+
+    @classmethod
+    def paginate(cls, runs, page_token, max_results, order_by_list=None):
+        """Paginates a set of runs sorted by :py:meth:`sort` based on the page_token and a max
         results limit. Returns a pair containing the set of paginated runs, followed by
         an optional next_page_token if there are further results that need to be returned.
+
+        The next page token encodes the sort key of the last run of the page, and the page of a
+        token starts at the first run sorted after that key. Page tokens encoding an offset into
+        the runs are still supported.
         """
-        start_offset = cls.parse_start_offset_from_page_token(page_token)
+        start_offset, last_sort_key = cls.parse_page_token(page_token)
+        parsed_order_by_list = [cls.parse_order_by_for_search_runs(order_by)
+                                for order_by in order_by_list or []]
+        if last_sort_key is not None:
+            if len(last_sort_key) != len(parsed_order_by_list) + 2:
+                raise MlflowException("Invalid page token, it does not match the order_by "
+                                      "parameter of the search.",
+                                      error_code=INVALID_PARAMETER_VALUE)
+            start_offset = len(runs)
+            for i, run in enumerate(runs):
+                values, ascendings = cls._get_run_sort_key(run, parsed_order_by_list)
+                if cls._compare_sort_keys(values, last_sort_key, ascendings) > 0:
+                    start_offset = i
+                    break
         final_offset = start_offset + max_results
 
         paginated_runs = runs[start_offset:final_offset]
         next_page_token = None
         if final_offset < len(runs):
-            next_page_token = cls.create_page_token(final_offset)
+            if paginated_runs:
+                last_sort_key, _ = cls._get_run_sort_key(paginated_runs[-1],
+                                                         parsed_order_by_list)
+                next_page_token = cls.create_keyset_page_token(last_sort_key)
+            else:
+                next_page_token = cls.create_page_token(final_offset)
         return (paginated_runs, next_page_token)
 
     # Model Registry specific parser
@@ -1,6 +1,7 @@
 import pytest
 
-from mlflow.entities import Run, Metric, RunData, RunStatus, RunInfo, LifecycleStage
+from mlflow.entities import Run, Metric, Param, RunData, RunStatus, RunInfo, RunTag, \
+    LifecycleStage
 from mlflow.exceptions import MlflowException
 from tests.entities.test_run_data import TestRunData
 from tests.entities.test_run_info import TestRunInfo
@@ -77,3 +78,18 @@ class TestRun(TestRunInfo, TestRunData):
         with pytest.raises(MlflowException) as no_info_exc:
             Run(None, run_data)
         assert "run_info cannot be None" in str(no_info_exc)
+
+    def test_run_entities_are_stored_without_dict(self):
+        run_data, _, _, _ = TestRunData._create()
+        run_info = TestRunInfo._create()[0]
+        run = Run(run_info, run_data)
+        for entity in [run, run_info, run_data, run_data._metric_objs[0], Param("p", "v"),
+                       RunTag("t", "v")]:
+            assert not hasattr(entity, "__dict__")
+            with pytest.raises(AttributeError):
+                entity.unknown_attribute = 1
+        assert run_info == RunInfo.from_proto(run_info.to_proto())
+        assert run_info != RunInfo.from_proto(
+            run_info._copy_with_overrides(lifecycle_stage="deleted").to_proto())
+        assert RunTag("t", "v") == RunTag("t", "v")
+        assert RunTag("t", "v") != RunTag("t", "w")
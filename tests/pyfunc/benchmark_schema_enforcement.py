@@ -0,0 +1,55 @@
+"""
+Benchmark of the per-call overhead of enforcing the input schema of a pyfunc model.
+
+Compares the first call to ``predict`` on inputs with given columns and column types, which plans
+the conversion of the input to the schema, with subsequent calls, which reuse the plan. Run with:
+
+    python -m tests.pyfunc.benchmark_schema_enforcement
+"""
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from mlflow.models import Model, ModelSignature
+from mlflow.pyfunc import PyFuncModel, _enforce_schema
+from mlflow.types import ColSpec, Schema
+
+
+class IdentityModel(object):
+    @staticmethod
+    def predict(pdf):
+        return pdf
+
+
+def _inputs(num_rows, num_cols):
+    names = ["c%d" % i for i in range(num_cols)]
+    matching = pd.DataFrame(np.random.rand(num_rows, num_cols), columns=names)
+    upcast = matching.astype(np.float32)
+    # Half of the columns are upcast, and the columns are not in the order of the schema
+    mixed = pd.concat([matching.iloc[:, ::2], upcast.iloc[:, 1::2]], axis=1)
+    return names, [("matching", matching), ("upcast", upcast), ("mixed", mixed)]
+
+
+def _time_ms(func, number):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1000
+
+
+def main():
+    print("%-20s %-10s %15s %15s" % ("input", "types", "planned (ms)", "reused (ms)"))
+    for num_rows, num_cols, number in [(1, 2000, 20), (100000, 20, 20), (1, 20, 1000)]:
+        names, inputs = _inputs(num_rows, num_cols)
+        input_schema = Schema([ColSpec("double", name) for name in names])
+        model_meta = Model()
+        model_meta.signature = ModelSignature(inputs=input_schema)
+        model = PyFuncModel(model_meta=model_meta, model_impl=IdentityModel())
+        for label, pdf in inputs:
+            model.predict(pdf)
+            planned = _time_ms(lambda: _enforce_schema(pdf, input_schema), number)
+            reused = _time_ms(lambda: model.predict(pdf), number)
+            print("%-20s %-10s %15.3f %15.3f" % ("%d x %d" % (num_rows, num_cols), label,
+                                                 planned, reused))
+
+
+if __name__ == "__main__":
+    main()
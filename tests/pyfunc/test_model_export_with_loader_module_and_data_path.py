@@ -265,6 +265,54 @@ def test_schema_enforcement_no_col_names():
     assert "Expected input to be DataFrame or list. Found: set" in str(ex)
 
 
+def test_schema_enforcement_reuses_conversion_plans():
+    class TestModel(object):
+        @staticmethod
+        def predict(pdf):
+            return pdf
+
+    m = Model()
+    input_schema = Schema([
+        ColSpec("double", "a"),
+        ColSpec("long", "b"),
+        ColSpec("string", "c"),
+        ColSpec("double", "d"),
+    ])
+    m.signature = ModelSignature(inputs=input_schema)
+    pyfunc_model = PyFuncModel(model_meta=m, model_impl=TestModel())
+    expected_types = dict(zip(input_schema.column_names(), input_schema.pandas_types()))
+
+    # Inputs matching the schema are passed to the model as is
+    pdf = pd.DataFrame({"a": [1.0, 2.0], "b": [1, 2], "c": ["x", "y"], "d": [3.0, 4.0]})
+    pdf["c"] = pdf["c"].astype(input_schema.pandas_types()[2])
+    assert pyfunc_model.predict(pdf) is pdf
+
+    # Other inputs are converted without modifying them
+    pdf = pd.DataFrame({
+        "d": np.array([3.0, 4.0], dtype=np.float32),
+        "x": [0, 0],
+        "c": ["x", "y"],
+        "b": np.array([1, 2], dtype=np.int32),
+        "a": [1.0, 2.0],
+    })
+    original_pdf = pdf.copy()
+    for _ in range(2):
+        res = pyfunc_model.predict(pdf)
+        assert list(res.columns) == input_schema.column_names()
+        assert res.dtypes.to_dict() == expected_types
+        assert res["a"].tolist() == [1.0, 2.0]
+        assert res["b"].tolist() == [1, 2]
+        assert res["c"].tolist() == ["x", "y"]
+        assert res["d"].tolist() == [3.0, 4.0]
+        assert pdf.equals(original_pdf)
+    assert len(pyfunc_model._schema_enforcer._plans) == 2
+
+    # Plans of incompatible inputs are not kept
+    with pytest.raises(MlflowException, match="Incompatible input types"):
+        pyfunc_model.predict(pdf.astype({"b": np.float64}))
+    assert len(pyfunc_model._schema_enforcer._plans) == 2
+
+
 @pytest.mark.large
 def test_model_log_load(sklearn_knn_model, iris_data, tmpdir):
     sk_model_path = os.path.join(str(tmpdir), "knn.pkl")
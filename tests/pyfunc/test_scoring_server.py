@@ -1,9 +1,11 @@
 import json
 import math
+import mock
 import numpy as np
 import os
 import pandas as pd
 from collections import namedtuple, OrderedDict
+from io import StringIO
 
 import pytest
 import random
@@ -12,6 +14,7 @@ import sklearn.neighbors as knn
 
 import mlflow.pyfunc.scoring_server as pyfunc_scoring_server
 import mlflow.sklearn
+from mlflow.exceptions import MlflowException
 from mlflow.models import ModelSignature, infer_signature
 from mlflow.protos.databricks_pb2 import ErrorCode, MALFORMED_REQUEST, BAD_REQUEST
 from mlflow.pyfunc import PythonModel
@@ -360,3 +363,186 @@ def test_get_jsonnable_obj():
     assert json.dumps(py_ary, cls=NumpyEncoder) == json.dumps(np_ary, cls=NumpyEncoder)
     np_ary = _get_jsonable_obj(np.array(py_ary, dtype=type(str)))
     assert json.dumps(py_ary, cls=NumpyEncoder) == json.dumps(np_ary, cls=NumpyEncoder)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_predictions_to_json_matches_json_module_serialization(use_orjson):
+    predictions = [
+        np.array([1.5, 2.0, 3.25]),
+        np.array([[1, 2], [3, 4]], np.int32)[:, ::-1],
+        np.array([math.pi], np.float32),
+        np.array([1.0, np.nan, np.inf]),
+        np.array(["a", "b"]),
+        np.array([b"x", b"y"]),
+        pd.Series([1, 2], name="p"),
+        pd.DataFrame({"a": [1.5, 2.0], "b": ["x", "y"], 3: [True, False]}),
+        pd.DataFrame({"a": [np.nan, 1.0]}),
+        pd.DataFrame({"v": [np.array([1, 2]), np.array([3, 4])]}),
+        pd.DataFrame({"s": ["a", np.nan], "f": [np.float32(np.inf), "b"]}),
+        pd.DataFrame({"v": [[1.0, np.nan], [2.0]]}),
+        np.array(["a", np.nan], dtype=object),
+        [1, np.float32(2.5)],
+        {"a": np.array([1, 2])},
+    ]
+    orjson = pyfunc_scoring_server._import_orjson()
+    with mock.patch("mlflow.pyfunc.scoring_server._import_orjson",
+                    return_value=orjson if use_orjson else None):
+        for raw_predictions in predictions:
+            if isinstance(raw_predictions, pd.Series):
+                expected = pd.DataFrame(raw_predictions).to_dict(orient="records")
+            elif isinstance(raw_predictions, pd.DataFrame):
+                expected = raw_predictions.to_dict(orient="records")
+            elif isinstance(raw_predictions, np.ndarray):
+                expected = raw_predictions.tolist()
+            else:
+                expected = raw_predictions
+            output = StringIO()
+            pyfunc_scoring_server.predictions_to_json(raw_predictions, output)
+            assert output.getvalue().replace(" ", "") == \
+                json.dumps(expected, cls=NumpyEncoder).replace(" ", "")
+
+
+def test_scoring_server_streams_large_json_responses():
+    class TestModel(object):
+        metadata = mock.Mock(get_input_schema=mock.Mock(return_value=None))
+
+        @staticmethod
+        def predict(model_input):
+            return model_input["x"].values.repeat(5)
+
+    app = pyfunc_scoring_server.init(TestModel())
+    body = pd.DataFrame({"x": [1.5, 2.5]}).to_json(orient="split")
+    with mock.patch("mlflow.pyfunc.scoring_server._MIN_STREAMED_ROWS", 6), \
+            mock.patch("mlflow.pyfunc.scoring_server._RESPONSE_CHUNK_ROWS", 3), \
+            app.test_client() as client:
+        response = client.post("/invocations", data=body, content_type="application/json")
+        # Streamed responses are sent without a Content-Length header
+        assert "Content-Length" not in response.headers
+        assert json.loads(response.data) == [1.5] * 5 + [2.5] * 5
+        response = client.post("/invocations", data=pd.DataFrame({"x": [1.5]}).to_json(
+            orient="split"), content_type="application/json")
+        assert response.headers["Content-Length"] == str(len(response.data))
+        assert json.loads(response.data) == [1.5] * 5
+
+
+def _arrow_stream_bytes(df):
+    import pyarrow as pa
+    sink = pa.BufferOutputStream()
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    writer = pa.ipc.new_stream(sink, table.schema)
+    writer.write_table(table)
+    writer.close()
+    return sink.getvalue().to_pybytes()
+
+
+def _npy_bytes(array):
+    from io import BytesIO
+    output = BytesIO()
+    np.save(output, array)
+    return output.getvalue()
+
+
+def test_parse_binary_inputs():
+    from io import BytesIO
+    df = pd.DataFrame({"a": [1.0, 2.0], "b": np.array([3, 4], np.int32), "c": ["x", "y"]})
+    pd.testing.assert_frame_equal(pyfunc_scoring_server.parse_arrow_input(_arrow_stream_bytes(df)),
+                                  df)
+    parquet_bytes = BytesIO()
+    df.to_parquet(parquet_bytes)
+    pd.testing.assert_frame_equal(
+        pyfunc_scoring_server.parse_parquet_input(parquet_bytes.getvalue()), df)
+
+    array = np.arange(6, dtype=np.float64).reshape(3, 2)
+    parsed = pyfunc_scoring_server.parse_npy_input(_npy_bytes(array))
+    assert list(parsed.columns) == [0, 1]
+    np.testing.assert_array_equal(parsed.values, array)
+    schema = Schema([ColSpec("double", "x"), ColSpec("double", "y")])
+    parsed = pyfunc_scoring_server.parse_npy_input(_npy_bytes(array), schema=schema)
+    assert list(parsed.columns) == ["x", "y"]
+    parsed = pyfunc_scoring_server.parse_npy_input(_npy_bytes(np.arange(3)))
+    assert parsed.shape == (3, 1)
+
+
+def test_parse_binary_inputs_raise_malformed_request_errors():
+    for parse_input in [pyfunc_scoring_server.parse_arrow_input,
+                        pyfunc_scoring_server.parse_parquet_input,
+                        pyfunc_scoring_server.parse_npy_input]:
+        with pytest.raises(MlflowException) as e:
+            parse_input(b"not a valid payload")
+        assert e.value.error_code == ErrorCode.Name(MALFORMED_REQUEST)
+    with pytest.raises(MlflowException) as e:
+        pyfunc_scoring_server.parse_npy_input(_npy_bytes(np.zeros((2, 2, 2))))
+    assert e.value.error_code == ErrorCode.Name(MALFORMED_REQUEST)
+
+
+def test_scoring_server_accepts_and_returns_binary_formats():
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    class TestModel(PythonModel):
+        def predict(self, context, model_input):
+            return model_input["x"].values + model_input["y"].values
+
+    schema = Schema([ColSpec("double", "x"), ColSpec("double", "y")])
+    with TempDir() as tmp:
+        model_path = tmp.path("model")
+        mlflow.pyfunc.save_model(model_path, python_model=TestModel(),
+                                 signature=ModelSignature(schema))
+        app = pyfunc_scoring_server.init(mlflow.pyfunc.load_model(model_path))
+    df = pd.DataFrame({"x": [1.0, 2.0], "y": [10.0, 20.0]})
+    requests = [
+        (pyfunc_scoring_server.CONTENT_TYPE_ARROW_STREAM, _arrow_stream_bytes(df)),
+        (pyfunc_scoring_server.CONTENT_TYPE_NPY, _npy_bytes(df.values)),
+    ]
+    with app.test_client() as client:
+        for content_type, data in requests:
+            response = client.post("/invocations", data=data,
+                                   headers={"Content-Type": content_type})
+            assert response.status_code == 200
+            assert json.loads(response.data) == [11.0, 22.0]
+
+        response = client.post(
+            "/invocations", data=_npy_bytes(df.values),
+            headers={"Content-Type": pyfunc_scoring_server.CONTENT_TYPE_NPY,
+                     "Accept": pyfunc_scoring_server.CONTENT_TYPE_NPY})
+        assert response.mimetype == pyfunc_scoring_server.CONTENT_TYPE_NPY
+        np.testing.assert_array_equal(
+            pyfunc_scoring_server.parse_npy_input(response.data).values[:, 0], [11.0, 22.0])
+
+        response = client.post(
+            "/invocations", data=_arrow_stream_bytes(df),
+            headers={"Content-Type": pyfunc_scoring_server.CONTENT_TYPE_ARROW_STREAM,
+                     "Accept": pyfunc_scoring_server.CONTENT_TYPE_ARROW_STREAM})
+        assert response.mimetype == pyfunc_scoring_server.CONTENT_TYPE_ARROW_STREAM
+        table = pa.ipc.open_stream(response.data).read_all()
+        assert table.column("predictions").to_pylist() == [11.0, 22.0]
+
+        response = client.post(
+            "/invocations", data=_arrow_stream_bytes(df),
+            headers={"Content-Type": pyfunc_scoring_server.CONTENT_TYPE_ARROW_STREAM,
+                     "Accept": pyfunc_scoring_server.CONTENT_TYPE_PARQUET})
+        table = pq.read_table(pa.BufferReader(response.data))
+        assert table.column("predictions").to_pylist() == [11.0, 22.0]
+
+        # Inputs are validated against the model signature
+        response = client.post(
+            "/invocations", data=_arrow_stream_bytes(df[["x"]]),
+            headers={"Content-Type": pyfunc_scoring_server.CONTENT_TYPE_ARROW_STREAM})
+        assert response.status_code == 400
+        assert "missing columns" in json.loads(response.data)["message"]
+
+
+def test_predict_reads_binary_input_formats(tmpdir):
+    class TestModel(PythonModel):
+        def predict(self, context, model_input):
+            return model_input["x"] * 2
+
+    model_path = str(tmpdir.join("model"))
+    mlflow.pyfunc.save_model(model_path, python_model=TestModel(),
+                             signature=ModelSignature(Schema([ColSpec("long", "x")])))
+    input_path = str(tmpdir.join("input.npy"))
+    np.save(input_path, np.array([[1], [2]]))
+    output_path = str(tmpdir.join("output.json"))
+    pyfunc_scoring_server._predict(model_path, input_path, output_path, "npy", None)
+    with open(output_path) as f:
+        assert json.load(f) == [{"x": 2}, {"x": 4}]
@@ -0,0 +1,165 @@
+import asyncio
+import gc
+import json
+import os
+import threading
+
+import mock
+import pandas as pd
+import pytest
+
+import mlflow.pyfunc.scoring_server as pyfunc_scoring_server
+from mlflow.pyfunc.scoring_server import async_server
+
+
+class BlockingModel(object):
+    def __init__(self):
+        self.metadata = mock.Mock(get_input_schema=mock.Mock(return_value=None))
+        self.unblocked = threading.Event()
+        self.unblocked.set()
+
+    def predict(self, data):
+        self.unblocked.wait()
+        return data["x"].values * 2
+
+
+@pytest.fixture
+def event_loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+async def _request(app, method, path, body=b"", content_type="application/json"):
+    request_messages = [{"type": "http.request", "body": body, "more_body": False}]
+    response = {}
+
+    async def receive():
+        if request_messages:
+            return request_messages.pop(0)
+        await asyncio.sleep(3600)
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = dict(message["headers"])
+        else:
+            response["body"] = message["body"]
+
+    scope = {"type": "http", "method": method, "path": path,
+             "headers": [(b"content-type", content_type.encode("latin-1"))]}
+    await app(scope, receive, send)
+    return response
+
+
+def _invoke(app, x):
+    body = pd.DataFrame({"x": x}).to_json(orient="split").encode("utf-8")
+    return _request(app, "POST", "/invocations", body)
+
+
+def test_async_server_serves_ping_and_invocations(event_loop):
+    app = async_server.init(BlockingModel(), workers=2)
+    ping = event_loop.run_until_complete(_request(app, "GET", "/ping"))
+    assert ping["status"] == 200
+    response = event_loop.run_until_complete(_invoke(app, [1, 2]))
+    assert response["status"] == 200
+    assert response["headers"][b"content-type"] == b"application/json"
+    assert json.loads(response["body"].decode("utf-8")) == [2, 4]
+
+
+def test_async_server_rejects_unknown_endpoints_and_content_types(event_loop):
+    app = async_server.init(BlockingModel(), workers=1)
+    response = event_loop.run_until_complete(_request(app, "GET", "/invocations"))
+    assert response["status"] == 404
+    response = event_loop.run_until_complete(
+        _request(app, "POST", "/invocations", b"x", content_type="text/plain"))
+    assert response["status"] == 415
+
+
+def test_async_server_rejects_requests_above_max_pending_requests(event_loop):
+    model = BlockingModel()
+    model.unblocked.clear()
+    app = async_server.init(model, workers=1, max_pending_requests=1)
+
+    async def run():
+        first = asyncio.ensure_future(_invoke(app, [1]))
+        await asyncio.sleep(0.1)
+        second = await _invoke(app, [2])
+        model.unblocked.set()
+        return await first, second
+
+    first, second = event_loop.run_until_complete(run())
+    assert first["status"] == 200
+    assert second["status"] == 503
+    assert second["headers"][b"retry-after"] == b"1"
+    assert json.loads(second["body"].decode("utf-8"))["error_code"] == "TEMPORARILY_UNAVAILABLE"
+
+
+def test_async_server_times_out_requests(event_loop):
+    model = BlockingModel()
+    model.unblocked.clear()
+    app = async_server.init(model, workers=1, request_timeout=0.1)
+    try:
+        response = event_loop.run_until_complete(_invoke(app, [1]))
+    finally:
+        model.unblocked.set()
+    assert response["status"] == 504
+
+
+def test_async_server_shutdown_waits_for_pending_requests(event_loop):
+    model = BlockingModel()
+    model.unblocked.clear()
+    app = async_server.init(model, workers=1)
+
+    async def run():
+        pending = asyncio.ensure_future(_invoke(app, [1]))
+        await asyncio.sleep(0.1)
+        shutdown = asyncio.ensure_future(app.shutdown())
+        await asyncio.sleep(0.1)
+        assert not shutdown.done()
+        rejected = await _invoke(app, [2])
+        model.unblocked.set()
+        await shutdown
+        return await pending, rejected
+
+    pending, rejected = event_loop.run_until_complete(run())
+    assert pending["status"] == 200
+    assert rejected["status"] == 503
+
+
+@pytest.mark.skipif(os.name == "nt", reason="The process executor requires fork")
+def test_async_server_scores_requests_on_forked_processes(event_loop):
+    app = async_server.init(BlockingModel(), executor="process", workers=2)
+    try:
+        response = event_loop.run_until_complete(_invoke(app, [1, 2, 3]))
+        assert response["status"] == 200
+        assert json.loads(response["body"].decode("utf-8")) == [2, 4, 6]
+    finally:
+        event_loop.run_until_complete(app.shutdown())
+        if hasattr(gc, "unfreeze"):
+            gc.unfreeze()
+
+
+def test_async_server_rejects_unknown_executor():
+    with pytest.raises(pyfunc_scoring_server.MlflowException, match="Unknown inference executor"):
+        async_server.init(BlockingModel(), executor="fiber")
+
+
+def test_get_async_config():
+    assert async_server._get_async_config({}) == {}
+    assert async_server._get_async_config({
+        async_server._SERVER_INFERENCE_EXECUTOR: "process",
+        async_server._SERVER_INFERENCE_WORKERS: "4",
+        async_server._SERVER_REQUEST_TIMEOUT: "2.5",
+        async_server._SERVER_MAX_PENDING_REQUESTS: "16",
+    }) == {"executor": "process", "workers": 4, "request_timeout": 2.5,
+           "max_pending_requests": 16}
+
+
+def test_async_server_joins_streamed_responses(event_loop):
+    app = async_server.init(BlockingModel(), workers=1)
+    with mock.patch("mlflow.pyfunc.scoring_server._MIN_STREAMED_ROWS", 1), \
+            mock.patch("mlflow.pyfunc.scoring_server._RESPONSE_CHUNK_ROWS", 2):
+        response = event_loop.run_until_complete(_invoke(app, [1, 2, 3]))
+    assert response["status"] == 200
+    assert json.loads(response["body"].decode("utf-8")) == [2, 4, 6]
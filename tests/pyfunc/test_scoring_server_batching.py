@@ -0,0 +1,135 @@
+import json
+import threading
+
+import mock
+import numpy as np
+import pandas as pd
+import pytest
+
+import mlflow.pyfunc.scoring_server as pyfunc_scoring_server
+from mlflow.pyfunc.scoring_server.batching import BatchingPredictor, _split_predictions
+
+
+class RecordingModel(object):
+    def __init__(self, predict_func=None):
+        self.batches = []
+        self.predict_func = predict_func or (lambda data: data["x"].values * 2)
+
+    def predict(self, data):
+        self.batches.append(len(data))
+        return self.predict_func(data)
+
+
+def _predict_concurrently(predictor, inputs):
+    results = [None] * len(inputs)
+    errors = [None] * len(inputs)
+
+    def predict(i):
+        try:
+            results[i] = predictor.predict(inputs[i])
+        except Exception as e:  # pylint: disable=broad-except
+            errors[i] = e
+
+    threads = [threading.Thread(target=predict, args=(i,)) for i in range(len(inputs))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def test_split_predictions():
+    assert [list(p) for p in _split_predictions(np.arange(5), [2, 3])] == [[0, 1], [2, 3, 4]]
+    assert _split_predictions([1, 2, 3], [1, 2]) == [[1], [2, 3]]
+    df_parts = _split_predictions(pd.DataFrame({"a": range(3)}), [2, 1])
+    assert [list(p["a"]) for p in df_parts] == [[0, 1], [2]]
+    with pytest.raises(ValueError, match="one prediction per input row"):
+        _split_predictions(np.arange(4), [2, 3])
+    with pytest.raises(TypeError, match="cannot be split"):
+        _split_predictions({"a": 1}, [1])
+
+
+def test_batching_predictor_scores_concurrent_requests_in_one_batch():
+    model = RecordingModel()
+    predictor = BatchingPredictor(model, max_batch_size=8, max_batch_wait=1)
+    inputs = [pd.DataFrame({"x": [i, i + 100]}) for i in range(4)]
+    results, errors = _predict_concurrently(predictor, inputs)
+    assert errors == [None] * 4
+    assert [list(r) for r in results] == [[2 * i, 2 * i + 200] for i in range(4)]
+    assert model.batches == [8]
+
+
+def test_batching_predictor_scores_batch_after_max_wait():
+    model = RecordingModel()
+    predictor = BatchingPredictor(model, max_batch_size=100, max_batch_wait=0.01)
+    assert list(predictor.predict(pd.DataFrame({"x": [1]}))) == [2]
+    assert model.batches == [1]
+
+
+def test_batching_predictor_isolates_failing_requests():
+    def predict(data):
+        if (data["x"] < 0).any():
+            raise ValueError("negative input")
+        return data["x"].values
+
+    model = RecordingModel(predict)
+    predictor = BatchingPredictor(model, max_batch_size=3, max_batch_wait=1)
+    inputs = [pd.DataFrame({"x": [1]}), pd.DataFrame({"x": [-1]}), pd.DataFrame({"x": [2]})]
+    results, errors = _predict_concurrently(predictor, inputs)
+    assert [list(r) if r is not None else None for r in results] == [[1], None, [2]]
+    assert errors[0] is None and errors[2] is None
+    assert isinstance(errors[1], ValueError)
+    assert model.batches[0] == 3
+    assert sorted(model.batches[1:]) == [1, 1, 1]
+
+
+def test_batching_predictor_fails_requests_of_batches_that_fail_unexpectedly():
+    predictor = BatchingPredictor(RecordingModel(), max_batch_size=1, max_batch_wait=1)
+    errors = []
+
+    def predict():
+        try:
+            predictor.predict(pd.DataFrame({"x": [1]}))
+        except RuntimeError as e:
+            errors.append(e)
+
+    with mock.patch.object(predictor, "_predict_batch", side_effect=RuntimeError("failed")):
+        thread = threading.Thread(target=predict)
+        thread.daemon = True
+        thread.start()
+        thread.join(timeout=10)
+    assert not thread.is_alive()
+    assert [str(e) for e in errors] == ["failed"]
+    # The batching thread survives the failure
+    assert predictor._thread.is_alive()
+    assert list(predictor.predict(pd.DataFrame({"x": [1]}))) == [2]
+
+
+def test_batching_predictor_does_not_mix_inputs_with_different_columns():
+    model = RecordingModel(lambda data: np.zeros(len(data)))
+    predictor = BatchingPredictor(model, max_batch_size=3, max_batch_wait=1)
+    inputs = [pd.DataFrame({"x": [1]}), pd.DataFrame({"y": [1]}), pd.DataFrame({"x": [2]})]
+    _, errors = _predict_concurrently(predictor, inputs)
+    assert errors == [None] * 3
+    assert sorted(model.batches) == [1, 2]
+
+
+def test_scoring_server_with_batching_returns_predictions_per_request():
+    model = mock.MagicMock()
+    model.metadata.get_input_schema.return_value = None
+    model.predict.side_effect = lambda data: data["x"].values + 1
+    app = pyfunc_scoring_server.init(model, max_batch_size=4, max_batch_wait_ms=1)
+    with app.test_client() as client:
+        response = client.post(
+            "/invocations", data=json.dumps({"columns": ["x"], "data": [[1], [2]]}),
+            headers={"Content-Type": pyfunc_scoring_server.CONTENT_TYPE_JSON_SPLIT_ORIENTED})
+    assert response.status_code == 200
+    assert json.loads(response.data) == [2, 3]
+
+
+def test_get_batching_config():
+    assert pyfunc_scoring_server._get_batching_config({}) == {}
+    env = {pyfunc_scoring_server._SERVER_MAX_BATCH_SIZE: "32",
+           pyfunc_scoring_server._SERVER_MAX_BATCH_WAIT_MS: "2.5"}
+    assert pyfunc_scoring_server._get_batching_config(env) == {
+        "max_batch_size": 32, "max_batch_wait_ms": 2.5}
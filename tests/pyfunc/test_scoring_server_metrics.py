@@ -0,0 +1,159 @@
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import time
+
+import mock
+import pandas as pd
+import pytest
+import sklearn.linear_model as glm
+from prometheus_client.parser import text_string_to_metric_families
+
+import mlflow.pyfunc
+import mlflow.pyfunc.scoring_server as pyfunc_scoring_server
+import mlflow.sklearn
+from mlflow.models import infer_signature
+from mlflow.pyfunc.scoring_server import async_server
+
+from tests.pyfunc.test_scoring_server_async import BlockingModel, _request
+
+
+@pytest.fixture
+def event_loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def pyfunc_model(tmpdir_factory):
+    model_path = str(tmpdir_factory.mktemp("model").join("model"))
+    X = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [2.0, 1.0, 0.0]})
+    y = [1.0, 2.0, 3.0]
+    mlflow.sklearn.save_model(glm.LinearRegression().fit(X, y), model_path,
+                              signature=infer_signature(X))
+    return mlflow.pyfunc.load_model(model_path)
+
+
+def _parse_samples(text):
+    samples = {}
+    for family in text_string_to_metric_families(text):
+        for sample in family.samples:
+            samples[(sample.name, tuple(sorted(sample.labels.items())))] = sample.value
+    return samples
+
+
+def test_scoring_server_exposes_request_and_stage_metrics(pyfunc_model):
+    client = pyfunc_scoring_server.init(pyfunc_model, enable_metrics=True).test_client()
+    body = pd.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0]}).to_json(orient="split")
+    for _ in range(2):
+        response = client.post("/invocations", data=body, content_type="application/json")
+        assert response.status_code == 200
+    response = client.post("/invocations", data="a,b", content_type="text/plain")
+    assert response.status_code == 415
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.content_type.startswith("text/plain")
+    samples = _parse_samples(response.data.decode("utf-8"))
+    assert samples[("mlflow_scoring_requests_total",
+                    (("content_type", "application/json"), ("status", "200")))] == 2
+    assert samples[("mlflow_scoring_requests_total",
+                    (("content_type", "other"), ("status", "415")))] == 1
+    for stage in ["parse", "schema_enforcement", "predict", "serialization"]:
+        assert samples[("mlflow_scoring_stage_duration_seconds_count",
+                        (("stage", stage),))] == 2 + (stage == "parse")
+    assert samples[("mlflow_scoring_batch_size_count", ())] == 2
+    assert samples[("mlflow_scoring_batch_size_sum", ())] == 4
+    assert samples[("mlflow_scoring_requests_in_flight", ())] == 0
+
+
+def test_scoring_server_times_serialization_of_streamed_responses(pyfunc_model):
+    def stream_predictions_json(raw_predictions):
+        def generate():
+            yield b"["
+            # Chunks after the first one are serialized while the response is sent
+            time.sleep(0.2)
+            yield b",".join(str(p).encode("utf-8") for p in raw_predictions)
+            yield b"]"
+        return generate()
+
+    client = pyfunc_scoring_server.init(pyfunc_model, enable_metrics=True).test_client()
+    body = pd.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0]}).to_json(orient="split")
+    with mock.patch.object(pyfunc_scoring_server, "_MIN_STREAMED_ROWS", 1), \
+            mock.patch.object(pyfunc_scoring_server, "_stream_predictions_json",
+                              stream_predictions_json):
+        response = client.post("/invocations", data=body, content_type="application/json")
+    assert response.status_code == 200
+    assert len(json.loads(response.data)) == 2
+
+    samples = _parse_samples(client.get("/metrics").data.decode("utf-8"))
+    assert samples[("mlflow_scoring_stage_duration_seconds_count",
+                    (("stage", "serialization"),))] == 1
+    assert samples[("mlflow_scoring_stage_duration_seconds_sum",
+                    (("stage", "serialization"),))] >= 0.2
+
+
+def test_scoring_server_does_not_expose_metrics_by_default(pyfunc_model):
+    client = pyfunc_scoring_server.init(pyfunc_model).test_client()
+    assert client.get("/metrics").status_code == 404
+
+
+def test_async_server_exposes_metrics_of_rejected_requests(event_loop):
+    model = BlockingModel()
+    model.unblocked.clear()
+    app = async_server.init(model, workers=1, max_pending_requests=1, enable_metrics=True)
+    body = pd.DataFrame({"x": [1]}).to_json(orient="split").encode("utf-8")
+
+    async def run():
+        first = asyncio.ensure_future(_request(app, "POST", "/invocations", body))
+        await asyncio.sleep(0.1)
+        in_flight = await _request(app, "GET", "/metrics")
+        second = await _request(app, "POST", "/invocations", body)
+        model.unblocked.set()
+        return await first, second, in_flight
+
+    first, second, in_flight = event_loop.run_until_complete(run())
+    assert (first["status"], second["status"]) == (200, 503)
+    assert _parse_samples(in_flight["body"].decode("utf-8"))[
+        ("mlflow_scoring_requests_in_flight", ())] == 1
+    samples = _parse_samples(
+        event_loop.run_until_complete(_request(app, "GET", "/metrics"))["body"].decode("utf-8"))
+    assert samples[("mlflow_scoring_requests_total",
+                    (("content_type", "application/json"), ("status", "200")))] == 1
+    assert samples[("mlflow_scoring_requests_total",
+                    (("content_type", "application/json"), ("status", "503")))] == 1
+    assert samples[("mlflow_scoring_stage_duration_seconds_count", (("stage", "predict"),))] == 1
+
+
+@pytest.mark.skipif(os.name == "nt", reason="The test forks a server process")
+def test_metrics_are_aggregated_across_server_processes(tmpdir):
+    # The multiprocess mode of prometheus_client is selected when it is imported, so the metrics
+    # are recorded in a fresh interpreter
+    script = textwrap.dedent("""
+        import os
+        from mlflow.pyfunc.scoring_server.metrics import ScoringMetrics
+        metrics = ScoringMetrics()
+        pid = os.fork()
+        metrics.record_request(200, "application/json")
+        if pid == 0:
+            os._exit(0)
+        os.waitpid(pid, 0)
+        print(metrics.generate_latest()[0].decode("utf-8"))
+    """)
+    env = dict(os.environ, prometheus_multiproc_dir=str(tmpdir))
+    env.pop("PROMETHEUS_MULTIPROC_DIR", None)
+    output = subprocess.check_output([sys.executable, "-c", script], env=env,
+                                     stderr=subprocess.DEVNULL)
+    samples = _parse_samples(output.decode("utf-8"))
+    assert samples[("mlflow_scoring_requests_total",
+                    (("content_type", "application/json"), ("status", "200")))] == 2
+
+
+def test_get_metrics_config():
+    assert pyfunc_scoring_server._get_metrics_config({}) == {}
+    assert pyfunc_scoring_server._get_metrics_config(
+        {pyfunc_scoring_server._SERVER_ENABLE_METRICS: "true"}) == {"enable_metrics": True}
@@ -0,0 +1,171 @@
+import json
+import os
+import threading
+
+import mock
+import pandas as pd
+import pytest
+import requests
+from prometheus_client.parser import text_string_to_metric_families
+
+import mlflow.pyfunc
+from mlflow.pyfunc import PythonModel
+from mlflow.pyfunc.scoring_server import multi_model
+from mlflow.pyfunc.scoring_server.multi_model import ModelCache
+
+
+class MultiplierModel(PythonModel):
+    def __init__(self, factor):
+        self.factor = factor
+
+    def predict(self, context, model_input):
+        return model_input["x"].values * self.factor
+
+
+@pytest.fixture(scope="module")
+def models_root(tmpdir_factory):
+    root = tmpdir_factory.mktemp("models")
+    for factor in [1, 2, 3]:
+        mlflow.pyfunc.save_model(str(root.join("times%d" % factor)),
+                                 python_model=MultiplierModel(factor))
+    mlflow.pyfunc.save_model(str(root.join("nested", "times10")),
+                             python_model=MultiplierModel(10))
+    return str(root)
+
+
+def _invoke(client, name, x):
+    return client.post("/invocations/" + name,
+                       data=pd.DataFrame({"x": x}).to_json(orient="split"),
+                       content_type="application/json")
+
+
+def _loaded_models(client):
+    return json.loads(client.get("/models").data)["models"]
+
+
+def test_multi_model_server_routes_requests_to_models(models_root):
+    client = multi_model.init(models_root).test_client()
+    assert client.get("/ping").status_code == 200
+    assert _loaded_models(client) == []
+    for name, factor in [("times2", 2), ("times3", 3), ("nested/times10", 10)]:
+        response = _invoke(client, name, [1, 2])
+        assert response.status_code == 200
+        assert json.loads(response.data) == [factor, 2 * factor]
+    assert _loaded_models(client) == ["times2", "times3", "nested/times10"]
+
+
+def test_multi_model_server_rejects_unknown_and_invalid_models(models_root):
+    client = multi_model.init(models_root).test_client()
+    response = _invoke(client, "times4", [1])
+    assert response.status_code == 404
+    assert json.loads(response.data)["error_code"] == "RESOURCE_DOES_NOT_EXIST"
+    response = _invoke(client, "nested/../times2", [1])
+    assert response.status_code == 400
+    assert json.loads(response.data)["error_code"] == "INVALID_PARAMETER_VALUE"
+    assert _loaded_models(client) == []
+
+
+def test_model_cache_evicts_least_recently_used_models(models_root):
+    cache = ModelCache(models_root, max_models=2)
+    times1 = cache.get("times1")
+    cache.get("times2")
+    assert cache.get("times1") is times1
+    cache.get("times3")
+    assert cache.list_models() == ["times1", "times3"]
+    assert os.path.exists(times1.local_dir)
+    cache.get("times2")
+    assert cache.list_models() == ["times3", "times2"]
+    # The artifacts of evicted models are deleted
+    assert not os.path.exists(times1.local_dir)
+
+
+def test_model_cache_deletes_evicted_models_once_no_request_uses_them(models_root):
+    cache = ModelCache(models_root, max_models=1)
+    with cache.use("times1") as times1:
+        with cache.use("times1"):
+            cache.get("times2")
+            assert cache.list_models() == ["times2"]
+        # The evicted model is still scoring a request
+        assert os.path.exists(times1.local_dir)
+        assert times1.model.predict(pd.DataFrame({"x": [1]})) == [1]
+    assert not os.path.exists(times1.local_dir)
+
+
+def test_model_cache_does_not_report_download_errors_as_missing_models(models_root):
+    cache = ModelCache(models_root)
+    with mock.patch("mlflow.pyfunc.scoring_server.multi_model._download_artifact_from_uri",
+                    side_effect=requests.exceptions.ConnectionError("Connection refused")):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            cache.get("times1")
+    assert cache.list_models() == []
+
+
+def test_model_cache_evicts_models_above_max_size(models_root):
+    model_size = ModelCache(models_root).get("times1").size
+    cache = ModelCache(models_root, max_size_bytes=int(model_size * 2.5))
+    for name in ["times1", "times2", "times3"]:
+        cache.get(name)
+    assert cache.list_models() == ["times2", "times3"]
+    # The most recently used model is kept even if it exceeds the maximum size on its own
+    cache = ModelCache(models_root, max_size_bytes=1)
+    cache.get("times1")
+    cache.get("times2")
+    assert cache.list_models() == ["times2"]
+
+
+def test_model_cache_loads_models_once_under_concurrent_requests(models_root):
+    cache = ModelCache(models_root)
+    unblocked = threading.Event()
+    load = cache._load
+
+    def blocking_load(name):
+        unblocked.wait()
+        return load(name)
+
+    with mock.patch.object(cache, "_load", side_effect=blocking_load) as load_mock:
+        threads = [threading.Thread(target=cache.get, args=("times1",)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        unblocked.set()
+        for thread in threads:
+            thread.join()
+    assert load_mock.call_count == 1
+    assert cache.list_models() == ["times1"]
+
+
+def test_multi_model_server_preloads_models_and_exposes_per_model_metrics(models_root):
+    client = multi_model.init(models_root, max_models=1, preload=["times1"],
+                              enable_metrics=True).test_client()
+    assert _loaded_models(client) == ["times1"]
+    assert _invoke(client, "times1", [1]).status_code == 200
+    assert _invoke(client, "times2", [1, 2]).status_code == 200
+    samples = {}
+    for family in text_string_to_metric_families(client.get("/metrics").data.decode("utf-8")):
+        for sample in family.samples:
+            samples[(sample.name, tuple(sorted(sample.labels.items())))] = sample.value
+    for model in ["times1", "times2"]:
+        assert samples[("mlflow_scoring_requests_total",
+                        (("content_type", "application/json"), ("model", model),
+                         ("status", "200")))] == 1
+        assert samples[("mlflow_scoring_stage_duration_seconds_count",
+                        (("model", model), ("stage", "predict")))] == 1
+    assert samples[("mlflow_scoring_batch_size_sum", (("model", "times2"),))] == 2
+    assert samples[("mlflow_scoring_model_loads_total", ())] == 2
+    assert samples[("mlflow_scoring_model_evictions_total", ())] == 1
+    assert samples[("mlflow_scoring_models_loaded", ())] == 1
+
+
+def test_get_multi_model_config():
+    assert multi_model._get_multi_model_config({
+        multi_model._SERVER_MODELS_ROOT_URI: "models:/",
+    }) == {"models_root_uri": "models:/"}
+    assert multi_model._get_multi_model_config({
+        multi_model._SERVER_MODELS_ROOT_URI: "models:/",
+        multi_model._SERVER_MAX_MODELS: "10",
+        multi_model._SERVER_MAX_MODELS_SIZE_MB: "1.5",
+        multi_model._SERVER_PRELOAD_MODELS: "a/1,b/Production",
+        "__pyfunc_enable_metrics__": "true",
+    }) == {"models_root_uri": "models:/", "max_models": 10, "max_size_bytes": 1572864,
+           "preload": ["a/1", "b/Production"], "enable_metrics": True}
+    assert ModelCache("models:/").get_model_uri("a/1") == "models:/a/1"
+    assert ModelCache("s3://bucket/models").get_model_uri("a") == "s3://bucket/models/a"
@@ -0,0 +1,140 @@
+import asyncio
+import json
+import threading
+
+import mock
+import pandas as pd
+import pytest
+import sklearn.linear_model as glm
+
+import mlflow.pyfunc
+import mlflow.pyfunc.scoring_server as pyfunc_scoring_server
+import mlflow.sklearn
+from mlflow.pyfunc.scoring_server import async_server
+from mlflow.pyfunc.scoring_server.warmup import WarmUp
+
+from tests.pyfunc.test_scoring_server_async import _request
+
+
+class GatedModel(object):
+    def __init__(self):
+        self.metadata = mock.Mock(get_input_schema=mock.Mock(return_value=None))
+        self.unblocked = threading.Event()
+        self.num_predictions = 0
+
+    def predict(self, data):
+        self.unblocked.wait()
+        self.num_predictions += 1
+        return data["x"].values * 2
+
+
+_WARMUP_INPUT = pd.DataFrame({"x": [1, 2]}).to_json(orient="split").encode("utf-8")
+
+
+@pytest.fixture
+def event_loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def test_warm_up_records_latency_percentiles():
+    warm_up = WarmUp(lambda: ("[]", 200, "application/json"), iterations=10, concurrency=2)
+    assert warm_up.get_status() == {"status": "warming up"}
+    warm_up.run()
+    assert warm_up.ready.is_set()
+    assert len(warm_up.latencies) == 10
+    status = warm_up.get_status()
+    assert status["status"] == "ready"
+    assert status["warmup"]["iterations"] == 10
+    assert set(status["warmup"]["latency_ms"]) == {"p50", "p90", "p99"}
+    assert "error" not in status["warmup"]
+
+
+def test_warm_up_reports_ready_when_requests_fail():
+    warm_up = WarmUp(lambda: ('{"error_code": "BAD_REQUEST"}', 400, "application/json"),
+                     iterations=3)
+    warm_up.run()
+    assert warm_up.ready.is_set()
+    status = warm_up.get_status()
+    assert status["status"] == "ready"
+    assert "status 400" in status["warmup"]["error"]
+
+
+def test_ping_reports_unhealthy_until_model_is_warmed_up():
+    model = GatedModel()
+    app = pyfunc_scoring_server.init(model, warmup_input=_WARMUP_INPUT, warmup_iterations=5,
+                                     warmup_content_type="application/json; format=pandas-split")
+    client = app.test_client()
+    response = client.get("/ping")
+    assert response.status_code == 503
+    assert json.loads(response.data) == {"status": "warming up"}
+    model.unblocked.set()
+    for _ in range(100):
+        response = client.get("/ping")
+        if response.status_code == 200:
+            break
+        threading.Event().wait(0.05)
+    assert response.status_code == 200
+    status = json.loads(response.data)
+    assert status["status"] == "ready"
+    assert status["warmup"]["iterations"] == 5
+    assert model.num_predictions == 5
+
+
+def test_ping_is_not_gated_without_warm_up():
+    response = pyfunc_scoring_server.init(GatedModel()).test_client().get("/ping")
+    assert response.status_code == 200
+
+
+def test_async_server_ping_reports_unhealthy_until_model_is_warmed_up(event_loop):
+    model = GatedModel()
+    app = async_server.init(model, workers=2, warmup_input=_WARMUP_INPUT, warmup_iterations=4)
+    ping = event_loop.run_until_complete(_request(app, "GET", "/ping"))
+    assert ping["status"] == 503
+    model.unblocked.set()
+    assert app._warm_up.ready.wait(10)
+    ping = event_loop.run_until_complete(_request(app, "GET", "/ping"))
+    assert ping["status"] == 200
+    assert json.loads(ping["body"].decode("utf-8"))["warmup"]["iterations"] == 4
+    event_loop.run_until_complete(app.shutdown())
+
+
+def test_get_warmup_config_reads_saved_input_example(tmpdir):
+    model_path = str(tmpdir.join("model"))
+    input_example = pd.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0]})
+    mlflow.sklearn.save_model(glm.LinearRegression().fit(input_example, [1.0, 2.0]), model_path,
+                              input_example=input_example)
+    assert pyfunc_scoring_server._get_warmup_config(
+        {pyfunc_scoring_server._SERVER_MODEL_PATH: model_path}) == {}
+    config = pyfunc_scoring_server._get_warmup_config({
+        pyfunc_scoring_server._SERVER_MODEL_PATH: model_path,
+        pyfunc_scoring_server._SERVER_WARMUP_ITERATIONS: "3",
+    })
+    assert config["warmup_iterations"] == 3
+    assert config["warmup_content_type"] == pyfunc_scoring_server.CONTENT_TYPE_JSON_SPLIT_ORIENTED
+    warm_up = WarmUp(lambda: pyfunc_scoring_server._score(
+        mlflow.pyfunc.load_model(model_path).predict, None, config["warmup_content_type"],
+        config["warmup_input"], pyfunc_scoring_server.MIMEAccept()), config["warmup_iterations"])
+    warm_up.run()
+    assert warm_up.error is None
+    assert len(warm_up.latencies) == 3
+
+    warmup_input_path = str(tmpdir.join("warmup.json"))
+    with open(warmup_input_path, "wb") as f:
+        f.write(_WARMUP_INPUT)
+    config = pyfunc_scoring_server._get_warmup_config({
+        pyfunc_scoring_server._SERVER_MODEL_PATH: model_path,
+        pyfunc_scoring_server._SERVER_WARMUP_ITERATIONS: "1",
+        pyfunc_scoring_server._SERVER_WARMUP_INPUT_PATH: warmup_input_path,
+    })
+    assert config["warmup_input"] == _WARMUP_INPUT
+
+
+def test_get_warmup_config_skips_models_without_input_example(tmpdir):
+    model_path = str(tmpdir.join("model"))
+    mlflow.sklearn.save_model(glm.LinearRegression().fit([[1.0], [2.0]], [1.0, 2.0]), model_path)
+    assert pyfunc_scoring_server._get_warmup_config({
+        pyfunc_scoring_server._SERVER_MODEL_PATH: model_path,
+        pyfunc_scoring_server._SERVER_WARMUP_ITERATIONS: "3",
+    }) == {}
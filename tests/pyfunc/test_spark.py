@@ -13,7 +13,7 @@ import mlflow.pyfunc
 import mlflow.sklearn
 from mlflow.models import ModelSignature
 from mlflow.pyfunc import spark_udf, PythonModel, PyFuncModel
-from mlflow.pyfunc.spark_model_cache import SparkModelCache
+from mlflow.pyfunc.spark_model_cache import SparkModelCache, SPARK_MODEL_CACHE_DIR_ENV_VAR
 
 import tests
 from mlflow.types import Schema, ColSpec
@@ -152,6 +152,27 @@ def test_spark_udf_autofills_column_names_with_schema(spark):
         assert res["res4"][0] == ["a", "b", "c"]
 
 
+@pytest.mark.large
+def test_spark_udf_scores_batches_of_at_most_max_records_per_batch(spark):
+    class BatchSizeModel(PythonModel):
+        def predict(self, context, model_input):
+            return np.full((len(model_input), 2), len(model_input), dtype=np.float64)
+
+    with mlflow.start_run() as run:
+        mlflow.pyfunc.log_model("model", python_model=BatchSizeModel())
+        udf = mlflow.pyfunc.spark_udf(spark, "runs:/{}/model".format(run.info.run_id),
+                                      result_type=ArrayType(DoubleType()))
+    max_records_per_batch = spark.conf.get("spark.sql.execution.arrow.maxRecordsPerBatch")
+    spark.conf.set("spark.sql.execution.arrow.maxRecordsPerBatch", "3")
+    try:
+        data = spark.createDataFrame(pd.DataFrame({"a": range(10)})).coalesce(1)
+        res = data.withColumn("res", udf("a")).select("res").toPandas()
+    finally:
+        spark.conf.set("spark.sql.execution.arrow.maxRecordsPerBatch", max_records_per_batch)
+    assert sorted(row[0] for row in res["res"]) == [1.0] + [3.0] * 9
+    assert all(row[0] == row[1] for row in res["res"])
+
+
 @pytest.mark.large
 def test_model_cache(spark, model_path):
     mlflow.pyfunc.save_model(
@@ -191,3 +212,38 @@ def test_model_cache(spark, model_path):
     # Running again should see no newly-loaded models.
     results2 = spark.sparkContext.parallelize(range(0, 100), 30).map(get_model).collect()
     assert sys.version[0] == '3' or min(results2) > 0
+
+
+@pytest.mark.large
+def test_model_cache_extracts_each_archive_once(spark, model_path, tmpdir, monkeypatch):
+    cache_dir = str(tmpdir.join("cache"))
+    monkeypatch.setenv(SPARK_MODEL_CACHE_DIR_ENV_VAR, cache_dir)
+    mlflow.pyfunc.save_model(
+        path=model_path,
+        loader_module=__name__,
+        code_path=[os.path.dirname(tests.__file__)],
+    )
+
+    def extracted_archives():
+        return [name for name in os.listdir(cache_dir) if "." not in name]
+
+    # Archives with the same contents are extracted to the same directory
+    archive_path = SparkModelCache.add_local_model(spark, model_path)
+    same_archive_path = SparkModelCache.add_local_model(spark, model_path)
+    assert archive_path != same_archive_path
+    SparkModelCache.get_or_load(archive_path)
+    SparkModelCache.get_or_load(same_archive_path)
+    assert len(extracted_archives()) == 1
+
+    # Extracting another archive evicts the archives that no worker has loaded, but keeps the
+    # archives of the cached models, whose files they may still read
+    unused_archive_dir = os.path.join(cache_dir, "0" * 64)
+    os.makedirs(unused_archive_dir)
+    with open(os.path.join(model_path, "extra.txt"), "w") as f:
+        f.write("changed")
+    other_archive_path = SparkModelCache.add_local_model(spark, model_path)
+    model = SparkModelCache.get_or_load(other_archive_path)
+    assert isinstance(model._model_impl, ConstantPyfuncWrapper)
+    assert sorted(extracted_archives()) == sorted(
+        os.path.basename(path)[-68:-4] for path in [archive_path, other_archive_path])
+    assert not os.path.exists(unused_archive_dir)
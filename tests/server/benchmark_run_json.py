@@ -0,0 +1,59 @@
+"""
+Benchmark of the serialization of the response of the search runs endpoint.
+
+Compares converting a page of runs to a protobuf message serialized by ``message_to_json``, as the
+tracking server used to, with converting the runs directly to JSON, and measures the memory used by
+the runs of the page. Run with:
+
+    python -m tests.server.benchmark_run_json
+"""
+import json
+import timeit
+import tracemalloc
+
+from mlflow.entities import Metric, Param, Run, RunData, RunInfo, RunTag
+from mlflow.protos.service_pb2 import SearchRuns
+from mlflow.utils.proto_json_utils import message_to_json, run_to_json_dict
+
+
+def _runs(num_runs, num_keys):
+    return [Run(RunInfo(run_uuid="%032x" % i, experiment_id="1", user_id="user",
+                        status="FINISHED", start_time=1590000000000 + i,
+                        end_time=1590000100000 + i, lifecycle_stage="active",
+                        artifact_uri="s3://bucket/1/%032x/artifacts" % i),
+                RunData(metrics=[Metric("metric_%d" % j, i * 0.1 + j, 1590000000000 + j, j)
+                                 for j in range(num_keys)],
+                        params=[Param("param_%d" % j, str(j)) for j in range(num_keys)],
+                        tags=[RunTag("tag_%d" % j, "value %d" % j) for j in range(num_keys)]))
+            for i in range(num_runs)]
+
+
+def _protobuf_json(runs):
+    response_message = SearchRuns.Response()
+    response_message.runs.extend([r.to_proto() for r in runs])
+    return message_to_json(response_message)
+
+
+def _direct_json(runs):
+    return json.dumps({"runs": [run_to_json_dict(r) for r in runs]})
+
+
+def _time_ms(func, number):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1000
+
+
+def main():
+    print("%-15s %15s %15s %15s" % ("page", "protobuf (ms)", "direct (ms)", "memory (KB)"))
+    for num_runs, num_keys, number in [(1000, 10, 3), (1000, 50, 1), (100, 10, 20)]:
+        tracemalloc.start()
+        runs = _runs(num_runs, num_keys)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert json.loads(_protobuf_json(runs)) == json.loads(_direct_json(runs))
+        print("%-15s %15.1f %15.1f %15.0f" % (
+            "%d x %d" % (num_runs, num_keys), _time_ms(lambda: _protobuf_json(runs), number),
+            _time_ms(lambda: _direct_json(runs), number), memory / 1024))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,7 @@ import pytest
 
 import os
 import mlflow
-from mlflow.entities import ViewType
+from mlflow.entities import ViewType, Run, RunInfo, RunData, Metric
 from mlflow.entities.model_registry import RegisteredModel, ModelVersion, \
     RegisteredModelTag, ModelVersionTag
 from mlflow.exceptions import MlflowException
@@ -22,6 +22,7 @@ from mlflow.server.handlers import get_endpoints, _create_experiment, _get_reque
     _delete_model_version_tag
 from mlflow.server import BACKEND_STORE_URI_ENV_VAR, app
 from mlflow.store.entities.paged_list import PagedList
+from mlflow.store.tracking import SEARCH_MAX_RESULTS_THRESHOLD
 from mlflow.protos.service_pb2 import CreateExperiment, SearchRuns
 from mlflow.protos.model_registry_pb2 import CreateRegisteredModel, UpdateRegisteredModel, \
     DeleteRegisteredModel, ListRegisteredModels, SearchRegisteredModels, GetRegisteredModel, \
@@ -31,6 +32,7 @@ from mlflow.protos.model_registry_pb2 import CreateRegisteredModel, UpdateRegist
     DeleteRegisteredModelTag, SetModelVersionTag, DeleteModelVersionTag
 from mlflow.utils.proto_json_utils import message_to_json
 from mlflow.utils.validation import MAX_BATCH_LOG_REQUEST_SIZE
+from werkzeug.urls import url_quote
 
 
 @pytest.fixture()
@@ -158,6 +160,87 @@ def test_search_runs_default_view_type(mock_get_request_message, mock_tracking_s
     assert args[2] == ViewType.ACTIVE_ONLY
 
 
+def test_search_runs_and_get_run_respond_with_the_json_of_the_runs(mock_tracking_store):
+    run = Run(RunInfo(run_uuid="a", run_id="a", experiment_id="0", user_id="user",
+                      status="FINISHED", start_time=1, end_time=2, lifecycle_stage="active"),
+              RunData(metrics=[Metric("m", float("nan"), 0, 0)]))
+    mock_tracking_store.search_runs.return_value = PagedList([run], b"token")
+    mock_tracking_store.get_run.return_value = run
+    mock_tracking_store.get_metric_history.return_value = run.data._metric_objs
+    with app.test_client() as c:
+        search_response = c.post("/api/2.0/mlflow/runs/search", json={"experiment_ids": ["0"]})
+        get_response = c.get("/api/2.0/mlflow/runs/get?run_id=a")
+        history_response = c.get("/api/2.0/mlflow/metrics/get-history?run_id=a&metric_key=m")
+    run_json = json.loads(message_to_json(run.to_proto()))
+    assert json.loads(search_response.get_data()) == {"runs": [run_json],
+                                                      "next_page_token": "token"}
+    assert json.loads(get_response.get_data()) == {"run": run_json}
+    assert json.loads(history_response.get_data()) == {"metrics": run_json["data"]["metrics"]}
+
+
+def test_export_runs_streams_pages_of_runs(mock_tracking_store):
+    import pyarrow as pa
+    runs = [Run(RunInfo(run_uuid=run_id, run_id=run_id, experiment_id="0", user_id="user",
+                        status="FINISHED", start_time=1, end_time=2, lifecycle_stage="active"),
+                RunData(metrics=[Metric("m", 1.0, 0, 0)]))
+            for run_id in ["a", "b", "c"]]
+    mock_tracking_store.search_runs.side_effect = [PagedList(runs[:2], "token"),
+                                                   PagedList(runs[2:], None)]
+    with app.test_client() as c:
+        response = c.post("/api/2.0/preview/mlflow/runs/export?format=arrow",
+                          json={"experiment_ids": ["0"], "filter": "metrics.m > 0",
+                                "run_view_type": "ALL"})
+    assert response.status_code == 200
+    assert response.mimetype == "application/vnd.apache.arrow.stream"
+    table = pa.ipc.open_stream(response.get_data()).read_all()
+    assert table.column("run_id").to_pylist() == ["a", "b", "c"]
+    first_call, second_call = mock_tracking_store.search_runs.call_args_list
+    assert first_call[0][1:4] == ("metrics.m > 0", ViewType.ALL, SEARCH_MAX_RESULTS_THRESHOLD)
+    assert second_call[0][5] == "token"
+
+
+def test_export_runs_reports_invalid_requests(mock_tracking_store):
+    mock_tracking_store.search_runs.side_effect = MlflowException(
+        "Invalid filter", error_code=INVALID_PARAMETER_VALUE)
+    with app.test_client() as c:
+        response = c.post("/api/2.0/preview/mlflow/runs/export?format=csv",
+                          json={"experiment_ids": ["0"]})
+        assert response.status_code == 400
+        assert "Invalid export format" in json.loads(response.get_data())["message"]
+        response = c.post("/ajax-api/2.0/preview/mlflow/runs/export",
+                          json={"experiment_ids": ["0"]})
+        assert response.status_code == 400
+        assert json.loads(response.get_data())["message"] == "Invalid filter"
+
+
+def test_get_metric_histories(mock_tracking_store):
+    mock_tracking_store.get_metric_histories.return_value = {
+        "a": {"loss": [Metric("loss", 1.5, 10, 0), Metric("loss", float("nan"), 20, 1)]},
+    }
+    with app.test_client() as c:
+        response = c.post("/api/2.0/preview/mlflow/metrics/get-histories",
+                          json={"run_ids": ["a", "b"], "metric_keys": ["loss"],
+                                "max_points_per_series": 100, "min_step": 1})
+    assert response.status_code == 200
+    mock_tracking_store.get_metric_histories.assert_called_once_with(
+        ["a", "b"], ["loss"], 100, (1, None))
+    assert json.loads(response.get_data()) == {"histories": [{
+        "run_id": "a", "metric_key": "loss",
+        "metrics": [{"key": "loss", "value": 1.5, "timestamp": "10", "step": "0"},
+                    {"key": "loss", "value": "NaN", "timestamp": "20", "step": "1"}],
+    }]}
+
+
+def test_get_metric_histories_reports_invalid_requests(mock_tracking_store):
+    with app.test_client() as c:
+        for request_json in [{}, {"run_ids": "a"}, {"run_ids": ["a"], "metric_keys": [1]}]:
+            response = c.post("/ajax-api/2.0/preview/mlflow/metrics/get-histories",
+                              json=request_json)
+            assert response.status_code == 400
+            assert json.loads(response.get_data())["error_code"] == "INVALID_PARAMETER_VALUE"
+    mock_tracking_store.get_metric_histories.assert_not_called()
+
+
 def test_log_batch_api_req(mock_get_request_json):
     mock_get_request_json.return_value = "a" * (MAX_BATCH_LOG_REQUEST_SIZE + 1)
     response = _log_batch()
@@ -199,6 +282,26 @@ def test_mlflow_server_with_installed_plugin(tmpdir):
         assert plugin_file_store.is_plugin
 
 
+def test_tracking_store_is_wrapped_in_entity_cache_if_enabled(tmpdir):
+    from mlflow.server import ENTITY_CACHE_TTL_ENV_VAR, ENTITY_CACHE_SIZE_ENV_VAR
+    from mlflow.store.tracking.caching_store import CachingStore
+
+    env = {
+        BACKEND_STORE_URI_ENV_VAR: tmpdir.strpath,
+        ENTITY_CACHE_TTL_ENV_VAR: "30",
+        ENTITY_CACHE_SIZE_ENV_VAR: "10",
+    }
+    with mock.patch.dict(os.environ, env):
+        mlflow.server.handlers._tracking_store = None
+        try:
+            store = mlflow.server.handlers._get_tracking_store()
+        finally:
+            mlflow.server.handlers._tracking_store = None
+    assert isinstance(store, CachingStore)
+    assert store.ttl == 30
+    assert store._runs.max_size == 10
+
+
 def jsonify(obj):
     def _jsonify(obj):
         return json.loads(message_to_json(obj.to_proto()))
@@ -516,3 +619,94 @@ def test_delete_model_version_tag(mock_get_request_message, mock_model_registry_
     _delete_model_version_tag()
     _, args = mock_model_registry_store.delete_model_version_tag.call_args
     assert args == {"name": name, "version": version, "key": key}
+
+
+@pytest.fixture()
+def artifact_run(mock_tracking_store, tmpdir):
+    artifact_dir = tmpdir.mkdir("artifacts")
+    artifact_dir.mkdir("dir").join("data.bin").write_binary(bytes(bytearray(range(256))) * 4)
+    artifact_dir.join("notes.txt").write("some notes")
+    run = mock.MagicMock()
+    run.info.artifact_uri = str(artifact_dir)
+    mock_tracking_store.get_run.return_value = run
+    return run
+
+
+def _get_artifact(headers=None, path="dir/data.bin"):
+    with app.test_client() as c:
+        return c.get("/get-artifact?run_id=some-run&path=%s" % path, headers=headers)
+
+
+@pytest.mark.usefixtures("artifact_run")
+def test_get_artifact_streams_artifact_as_attachment():
+    resp = _get_artifact()
+    assert resp.status_code == 200
+    assert resp.get_data() == bytes(bytearray(range(256))) * 4
+    assert resp.headers["Content-Length"] == "1024"
+    assert resp.headers["Accept-Ranges"] == "bytes"
+    assert resp.headers["Content-Disposition"] == 'attachment; filename="data.bin"'
+    assert resp.headers["ETag"]
+
+    resp = _get_artifact(path="notes.txt")
+    assert resp.get_data() == b"some notes"
+    assert resp.mimetype == "text/plain"
+
+
+def test_get_artifact_quotes_file_names(artifact_run):
+    artifact_dir = artifact_run.info.artifact_uri
+    for name in [u"r\u00e9sum\u00e9 \u6570\u636e.txt", 'say "hi".txt']:
+        with open(os.path.join(artifact_dir, name), "w") as f:
+            f.write("some notes")
+
+    resp = _get_artifact(path=url_quote(u"r\u00e9sum\u00e9 \u6570\u636e.txt"))
+    assert resp.status_code == 200
+    assert resp.headers["Content-Disposition"] == \
+        "attachment; filename=\"resume .txt\"; " \
+        "filename*=UTF-8''r%C3%A9sum%C3%A9%20%E6%95%B0%E6%8D%AE.txt"
+    resp = _get_artifact(path=url_quote('say "hi".txt'))
+    assert resp.headers["Content-Disposition"] == 'attachment; filename="say \\"hi\\".txt"'
+
+
+@pytest.mark.usefixtures("artifact_run")
+def test_get_artifact_supports_range_requests():
+    # The size of the artifact is looked up without listing its directory
+    with mock.patch("mlflow.store.artifact.local_artifact_repo.LocalArtifactRepository"
+                    ".list_artifacts") as list_artifacts_mock:
+        resp = _get_artifact(headers={"Range": "bytes=256-511"})
+    list_artifacts_mock.assert_not_called()
+    assert resp.status_code == 206
+    assert resp.get_data() == bytes(bytearray(range(256)))
+    assert resp.headers["Content-Range"] == "bytes 256-511/1024"
+
+    resp = _get_artifact(headers={"Range": "bytes=-10"})
+    assert resp.status_code == 206
+    assert resp.get_data() == bytes(bytearray(range(246, 256)))
+
+    resp = _get_artifact(headers={"Range": "bytes=2000-"})
+    assert resp.status_code == 416
+    assert resp.headers["Content-Range"] == "bytes */1024"
+
+    # Ranges of a different version of the artifact are ignored
+    resp = _get_artifact(headers={"Range": "bytes=0-9", "If-Range": '"other-etag"'})
+    assert resp.status_code == 200
+    assert len(resp.get_data()) == 1024
+
+
+@pytest.mark.usefixtures("artifact_run")
+def test_get_artifact_supports_conditional_requests():
+    etag = _get_artifact().headers["ETag"]
+    resp = _get_artifact(headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.get_data() == b""
+
+    resp = _get_artifact(headers={"Range": "bytes=0-9", "If-Range": etag})
+    assert resp.status_code == 206
+    assert len(resp.get_data()) == 10
+
+
+@pytest.mark.usefixtures("artifact_run")
+def test_get_artifact_returns_404_for_missing_artifacts_and_directories():
+    for path in ["missing.txt", "dir"]:
+        resp = _get_artifact(path=path)
+        assert resp.status_code == 404
+        assert json.loads(resp.get_data())["error_code"] == "RESOURCE_DOES_NOT_EXIST"
@@ -0,0 +1,118 @@
+import multiprocessing
+import os
+import time
+
+import mock
+
+from mlflow.store.artifact.artifact_cache import ArtifactCache, get_artifact_cache
+
+
+def _download_model(dst_path, content="model"):
+    model_dir = os.path.join(dst_path, "model")
+    os.makedirs(os.path.join(model_dir, "empty_dir"))
+    with open(os.path.join(model_dir, "model.pkl"), "w") as f:
+        f.write(content)
+    return model_dir
+
+
+def test_download_downloads_artifacts_once(tmpdir):
+    cache = ArtifactCache(tmpdir.join("cache").strpath)
+    download_func = mock.Mock(side_effect=_download_model)
+    for i in range(3):
+        dst_path = tmpdir.mkdir("dst%d" % i).strpath
+        local_path = cache.download("key", download_func, dst_path)
+        assert local_path == os.path.join(dst_path, "model")
+        with open(os.path.join(local_path, "model.pkl")) as f:
+            assert f.read() == "model"
+        assert os.path.isdir(os.path.join(local_path, "empty_dir"))
+    assert download_func.call_count == 1
+
+
+def test_download_copies_artifacts_to_new_directory_by_default(tmpdir):
+    cache = ArtifactCache(tmpdir.strpath)
+    first_path = cache.download("key", _download_model)
+    second_path = cache.download("key", _download_model)
+    assert first_path != second_path
+    assert os.listdir(first_path) == os.listdir(second_path)
+
+
+def test_download_caches_single_files(tmpdir):
+    def download_file(dst_path):
+        path = os.path.join(dst_path, "file.txt")
+        with open(path, "w") as f:
+            f.write("content")
+        return path
+
+    cache = ArtifactCache(tmpdir.join("cache").strpath)
+    cache.download("key", download_file)
+    local_path = cache.download("key", mock.Mock(side_effect=Exception("Not cached")))
+    assert os.path.basename(local_path) == "file.txt"
+
+
+def test_failed_download_is_not_cached(tmpdir):
+    cache = ArtifactCache(tmpdir.strpath)
+    try:
+        cache.download("key", mock.Mock(side_effect=IOError("Failed")))
+    except IOError:
+        pass
+    download_func = mock.Mock(side_effect=_download_model)
+    cache.download("key", download_func)
+    assert download_func.call_count == 1
+    assert not [name for name in os.listdir(tmpdir.strpath) if name.startswith(".tmp")]
+
+
+def test_least_recently_used_entries_are_evicted(tmpdir):
+    # Each entry holds 5 bytes of artifacts
+    cache = ArtifactCache(tmpdir.join("cache").strpath, max_size=10)
+    cache.download("a", _download_model)
+    time.sleep(0.01)
+    cache.download("b", _download_model)
+    time.sleep(0.01)
+    cache.download("a", _download_model)  # "b" is now the least recently used entry
+    time.sleep(0.01)
+    cache.download("c", _download_model)
+
+    download_func = mock.Mock(side_effect=_download_model)
+    cache.download("a", download_func)
+    cache.download("c", download_func)
+    assert download_func.call_count == 0
+    cache.download("b", download_func)
+    assert download_func.call_count == 1
+
+
+def _download_in_process(cache_dir, dst_path, counter_path):
+    def download_func(dst):
+        with open(counter_path, "a") as f:
+            f.write("x")
+        time.sleep(0.5)
+        return _download_model(dst)
+
+    ArtifactCache(cache_dir).download("key", download_func, dst_path)
+
+
+def test_concurrent_processes_download_artifacts_once(tmpdir):
+    cache_dir = tmpdir.join("cache").strpath
+    counter_path = tmpdir.join("counter").strpath
+    processes = [
+        multiprocessing.Process(target=_download_in_process,
+                                args=(cache_dir, tmpdir.mkdir("dst%d" % i).strpath, counter_path))
+        for i in range(3)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+    with open(counter_path) as f:
+        assert f.read() == "x"
+    for i in range(3):
+        assert os.path.exists(tmpdir.join("dst%d" % i, "model", "model.pkl").strpath)
+
+
+def test_get_artifact_cache_is_configured_by_environment_variables(tmpdir, monkeypatch):
+    assert get_artifact_cache() is None
+    monkeypatch.setenv("MLFLOW_ARTIFACT_CACHE_DIR", tmpdir.strpath)
+    monkeypatch.setenv("MLFLOW_ARTIFACT_CACHE_MAX_SIZE", "1000")
+    cache = get_artifact_cache()
+    assert cache.cache_dir == tmpdir.strpath
+    assert cache.max_size == 1000
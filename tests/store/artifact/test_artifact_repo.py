@@ -1,9 +1,14 @@
+import os
 import posixpath
+import threading
+import time
+
 import mock
 import pytest
 
 from mlflow.entities import FileInfo
-from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.store.artifact.artifact_repo import ArtifactRepository, MAX_WORKERS_ENV_VAR, \
+    _transfer_concurrently
 from mlflow.utils.file_utils import TempDir
 
 
@@ -64,3 +69,140 @@ def test_download_artifacts_handles_empty_dir(base_uri, download_arg, list_retur
         repo = ArtifactRepositoryImpl(base_uri)
         with TempDir() as tmp:
             repo.download_artifacts(download_arg, dst_path=tmp.path())
+
+
+def _mock_artifact_dir_listing(num_files):
+    def list_artifacts(path):
+        if path == "model":
+            return [FileInfo("model/sub", True, 0)] + \
+                [FileInfo("model/file%d" % i, False, 1) for i in range(num_files)]
+        elif path == "model/sub":
+            return [FileInfo("model/sub/file", False, 1)]
+        return []
+    return list_artifacts
+
+
+def test_download_artifacts_downloads_files_concurrently_and_reports_progress(tmpdir):
+    num_files = 4
+    # Each download blocks until all the files of the "model" directory are being downloaded
+    barrier = threading.Barrier(num_files)
+
+    def download_file(remote_file_path, local_path):
+        if remote_file_path != "model/sub/file":
+            barrier.wait(timeout=10)
+        with open(local_path, "w") as f:
+            f.write(remote_file_path)
+
+    progress = []
+    with mock.patch.object(ArtifactRepositoryImpl, "list_artifacts",
+                           side_effect=_mock_artifact_dir_listing(num_files)), \
+            mock.patch.object(ArtifactRepositoryImpl, "_download_file",
+                              side_effect=download_file), \
+            mock.patch.dict(os.environ, {MAX_WORKERS_ENV_VAR: str(num_files)}):
+        repo = ArtifactRepositoryImpl("")
+        local_dir = repo.download_artifacts("model", dst_path=str(tmpdir),
+                                            progress_callback=lambda *args: progress.append(args))
+
+    assert local_dir == os.path.join(str(tmpdir), "model")
+    expected_paths = ["model/file%d" % i for i in range(num_files)] + ["model/sub/file"]
+    assert sorted(remote_path for remote_path, _ in progress) == sorted(expected_paths)
+    for remote_path, local_path in progress:
+        assert local_path == os.path.join(str(tmpdir), remote_path)
+        with open(local_path) as f:
+            assert f.read() == remote_path
+
+
+def test_download_artifacts_fails_fast_on_first_error(tmpdir):
+    downloaded = []
+
+    def download_file(remote_file_path, local_path):
+        if remote_file_path == "model/file0":
+            raise IOError("Failed to download %s" % remote_file_path)
+        time.sleep(0.05)
+        downloaded.append(remote_file_path)
+
+    with mock.patch.object(ArtifactRepositoryImpl, "list_artifacts",
+                           side_effect=_mock_artifact_dir_listing(100)), \
+            mock.patch.object(ArtifactRepositoryImpl, "_download_file",
+                              side_effect=download_file), \
+            mock.patch.dict(os.environ, {MAX_WORKERS_ENV_VAR: "1"}):
+        repo = ArtifactRepositoryImpl("")
+        with pytest.raises(IOError, match="Failed to download model/file0"):
+            repo.download_artifacts("model", dst_path=str(tmpdir))
+    assert len(downloaded) < 100
+
+
+def test_max_workers_is_one_for_repos_without_concurrent_transfers():
+    repo = ArtifactRepositoryImpl("")
+    with mock.patch.dict(os.environ, {MAX_WORKERS_ENV_VAR: "3"}):
+        assert repo._get_max_workers() == 3
+        with mock.patch.object(ArtifactRepositoryImpl, "_supports_concurrent_transfers", False):
+            assert repo._get_max_workers() == 1
+
+
+def test_log_artifacts_concurrently_uploads_every_file(tmpdir):
+    tmpdir.join("a.txt").write("A")
+    tmpdir.mkdir("sub").mkdir("subsub").join("b.txt").write("B")
+    uploaded = []
+    repo = ArtifactRepositoryImpl("")
+    repo._log_artifacts_concurrently(
+        str(tmpdir), lambda local_file, rel_path: uploaded.append((local_file, rel_path)))
+    assert sorted(uploaded) == sorted([
+        (os.path.join(str(tmpdir), "a.txt"), "a.txt"),
+        (os.path.join(str(tmpdir), "sub", "subsub", "b.txt"), "sub/subsub/b.txt"),
+    ])
+
+
+def test_log_artifacts_concurrently_raises_upload_errors(tmpdir):
+    for i in range(10):
+        tmpdir.join("file%d" % i).write("content")
+
+    def upload_file(local_file, rel_path):
+        if rel_path == "file3":
+            raise IOError("Failed to upload %s" % rel_path)
+
+    repo = ArtifactRepositoryImpl("")
+    with pytest.raises(IOError, match="Failed to upload file3"):
+        repo._log_artifacts_concurrently(str(tmpdir), upload_file)
+
+
+def test_transfer_concurrently_raises_errors_whose_done_callbacks_have_not_run():
+    def fail():
+        raise IOError("Failed transfer")
+
+    # Done callbacks may run after the waiters of a future are notified of its exception
+    with mock.patch("concurrent.futures.Future.add_done_callback"), \
+            pytest.raises(IOError, match="Failed transfer"):
+        _transfer_concurrently([lambda: None, fail, lambda: None], max_workers=2)
+
+
+def test_open_artifact_stream_reads_downloaded_file_and_deletes_it_on_close():
+    class StreamingRepositoryImpl(ArtifactRepositoryImpl):
+        def list_artifacts(self, path):
+            return []
+
+        def _download_file(self, remote_file_path, local_path):
+            with open(local_path, "w") as f:
+                f.write("0123456789")
+
+    repo = StreamingRepositoryImpl("some/uri")
+    with repo.open_artifact_stream("file.txt") as stream:
+        assert stream.read() == b"0123456789"
+    with repo.open_artifact_stream("file.txt", offset=2, length=5) as stream:
+        local_dir = os.path.dirname(stream._fileobj.name)
+        assert stream.read(3) == b"234"
+        assert stream.read() == b"56"
+        assert stream.read() == b""
+    assert not os.path.exists(local_dir)
+
+
+def test_get_file_info_lists_parent_directory():
+    class ListingRepositoryImpl(ArtifactRepositoryImpl):
+        def list_artifacts(self, path):
+            assert path == "dir"
+            return [FileInfo("dir/file.txt", False, 10), FileInfo("dir/subdir", True, None)]
+
+    repo = ListingRepositoryImpl("some/uri")
+    assert repo.get_file_info("dir/file.txt") == FileInfo("dir/file.txt", False, 10)
+    assert repo.get_file_info("dir/subdir") == FileInfo("dir/subdir", True, None)
+    assert repo.get_file_info("dir/missing.txt") is None
@@ -3,9 +3,11 @@ import posixpath
 import mock
 import pytest
 
+from azure.core.exceptions import ResourceNotFoundError
 from azure.storage.blob import BlobServiceClient
 from azure.storage.blob._models import BlobPrefix, BlobProperties
 
+from mlflow.entities import FileInfo
 from mlflow.exceptions import MlflowException
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.artifact.azure_blob_artifact_repo import AzureBlobArtifactRepository
@@ -168,6 +170,30 @@ def test_log_artifacts(mock_client, tmpdir):
             assert False
 
 
+def test_log_artifacts_uploads_blocks_concurrently(mock_client, tmpdir, monkeypatch):
+    monkeypatch.setenv("MLFLOW_ARTIFACT_MAX_WORKERS", "3")
+    repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
+    tmpdir.join("a.txt").write("A")
+
+    repo.log_artifacts(tmpdir.strpath)
+
+    upload_call = mock_client.get_container_client().upload_blob.call_args
+    assert upload_call[0][0] == posixpath.join(TEST_ROOT_PATH, "a.txt")
+    assert upload_call[1] == {"max_concurrency": 3}
+
+
+def test_client_is_configured_with_multipart_upload_settings(monkeypatch):
+    monkeypatch.setenv("AZURE_STORAGE_ACCESS_KEY", "key")
+    monkeypatch.setenv("MLFLOW_MULTIPART_UPLOAD_THRESHOLD", str(16 * 1024 * 1024))
+    monkeypatch.setenv("MLFLOW_MULTIPART_UPLOAD_CHUNK_SIZE", str(4 * 1024 * 1024))
+    with mock.patch("azure.storage.blob.BlobServiceClient") as client_mock:
+        AzureBlobArtifactRepository(TEST_URI)
+    client_mock.assert_called_once_with(account_url="https://account.blob.core.windows.net",
+                                        credential="key",
+                                        max_single_put_size=16 * 1024 * 1024,
+                                        max_block_size=4 * 1024 * 1024)
+
+
 def test_download_file_artifact(mock_client, tmpdir):
     repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
 
@@ -313,3 +339,27 @@ def test_download_artifact_throws_value_error_when_listed_blobs_do_not_contain_a
         repo.download_artifacts("")
 
     assert "Azure blob does not begin with the specified artifact path" in str(exc)
+
+
+def test_get_file_info_looks_up_single_blob(mock_client):
+    repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
+    container_client = mock_client.get_container_client()
+    blob_props = BlobProperties()
+    blob_props.name = posixpath.join(TEST_ROOT_PATH, "file.txt")
+    blob_props.size = 10
+
+    def get_blob_client(name):
+        blob_client = mock.MagicMock()
+        if name == blob_props.name:
+            blob_client.get_blob_properties.return_value = blob_props
+        else:
+            blob_client.get_blob_properties.side_effect = ResourceNotFoundError()
+        return blob_client
+
+    container_client.get_blob_client.side_effect = get_blob_client
+    container_client.list_blobs.side_effect = lambda name_starts_with, results_per_page: \
+        MockBlobList([blob_props] if name_starts_with == TEST_ROOT_PATH + "/dir/" else [])
+    assert repo.get_file_info("file.txt") == FileInfo("file.txt", False, 10)
+    assert repo.get_file_info("dir") == FileInfo("dir", True, None)
+    assert repo.get_file_info("missing.txt") is None
+    container_client.walk_blobs.assert_not_called()
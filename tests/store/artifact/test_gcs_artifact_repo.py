@@ -5,6 +5,7 @@ import pytest
 
 from google.cloud.storage import client as gcs_client
 
+from mlflow.entities import FileInfo
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.artifact.gcs_artifact_repo import GCSArtifactRepository
 from google.auth.exceptions import DefaultCredentialsError
@@ -154,6 +155,23 @@ def test_log_artifacts(gcs_mock, tmpdir):
         ], any_order=True)
 
 
+def test_log_artifact_uploads_large_files_in_chunks(gcs_mock, tmpdir, monkeypatch):
+    monkeypatch.setenv("MLFLOW_MULTIPART_UPLOAD_THRESHOLD", "10")
+    monkeypatch.setenv("MLFLOW_MULTIPART_UPLOAD_CHUNK_SIZE", str(600 * 1024))
+    repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
+    small_file = tmpdir.join("small.txt")
+    small_file.write("small")
+    large_file = tmpdir.join("large.txt")
+    large_file.write("x" * 100)
+
+    repo.log_artifact(small_file.strpath)
+    gcs_mock.Client().bucket().blob.assert_called_with('some/path/small.txt')
+    repo.log_artifact(large_file.strpath)
+    # The chunk size is rounded down to a multiple of 256 KB
+    gcs_mock.Client().bucket().blob.assert_called_with('some/path/large.txt',
+                                                       chunk_size=512 * 1024)
+
+
 def test_download_artifacts_calls_expected_gcs_client_methods(gcs_mock, tmpdir):
     repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
 
@@ -241,3 +259,15 @@ def test_download_artifacts_downloads_expected_content(gcs_mock, tmpdir):
     dir_contents = os.listdir(tmpdir.strpath)
     assert file_path_1 in dir_contents
     assert file_path_2 in dir_contents
+
+
+def test_get_file_info_looks_up_single_blob(gcs_mock):
+    repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
+    bucket_mock = gcs_mock.Client.return_value.bucket.return_value
+    blob = mock.MagicMock(size=10)
+    bucket_mock.get_blob.side_effect = lambda name: blob if name == "some/path/file.txt" else None
+    bucket_mock.list_blobs.side_effect = \
+        lambda prefix, max_results: [blob] if prefix == "some/path/dir/" else []
+    assert repo.get_file_info("file.txt") == FileInfo("file.txt", False, 10)
+    assert repo.get_file_info("dir") == FileInfo("dir", True, None)
+    assert repo.get_file_info("missing.txt") is None
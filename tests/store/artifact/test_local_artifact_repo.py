@@ -1,7 +1,9 @@
 import os
+import mock
 import pytest
 import posixpath
 
+from mlflow.entities import FileInfo
 from mlflow.exceptions import MlflowException
 from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
 from mlflow.utils.file_utils import TempDir
@@ -186,3 +188,25 @@ def test_delete_artifacts(local_artifact_repo):
         assert os.path.exists(os.path.join(local_artifact_repo._artifact_dir, "b.txt"))
         local_artifact_repo.delete_artifacts()
         assert not os.path.exists(os.path.join(local_artifact_repo._artifact_dir))
+
+
+def test_open_artifact_stream(local_artifact_repo, tmpdir):
+    local_file = tmpdir.join("file.txt")
+    local_file.write("0123456789")
+    local_artifact_repo.log_artifact(str(local_file), "dir")
+    with local_artifact_repo.open_artifact_stream("dir/file.txt") as stream:
+        assert stream.read() == b"0123456789"
+    with local_artifact_repo.open_artifact_stream("dir/file.txt", offset=4, length=3) as stream:
+        assert stream.read() == b"456"
+
+
+def test_get_file_info(local_artifact_repo, tmpdir):
+    local_file = tmpdir.join("file.txt")
+    local_file.write("0123456789")
+    local_artifact_repo.log_artifact(str(local_file), "dir")
+    with mock.patch.object(local_artifact_repo, "list_artifacts") as list_artifacts_mock:
+        assert local_artifact_repo.get_file_info("dir/file.txt") == \
+            FileInfo("dir/file.txt", False, 10)
+        assert local_artifact_repo.get_file_info("dir") == FileInfo("dir", True, None)
+        assert local_artifact_repo.get_file_info("dir/missing.txt") is None
+    list_artifacts_mock.assert_not_called()
@@ -2,8 +2,10 @@ import os
 import posixpath
 import tarfile
 
+import mock
 import pytest
 
+from mlflow.entities import FileInfo
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.artifact.s3_artifact_repo import S3ArtifactRepository
 
@@ -209,3 +211,39 @@ def test_get_s3_file_upload_extra_args_invalid_json():
 
     with pytest.raises(ValueError):
         S3ArtifactRepository.get_s3_file_upload_extra_args()
+
+
+def test_upload_transfer_config_uses_multipart_settings(monkeypatch):
+    monkeypatch.setenv("MLFLOW_MULTIPART_UPLOAD_THRESHOLD", str(16 * 1024 * 1024))
+    monkeypatch.setenv("MLFLOW_MULTIPART_UPLOAD_CHUNK_SIZE", str(32 * 1024 * 1024))
+    monkeypatch.setenv("MLFLOW_ARTIFACT_MAX_WORKERS", "4")
+    config = S3ArtifactRepository("s3://bucket/path")._get_transfer_config()
+    assert config.multipart_threshold == 16 * 1024 * 1024
+    assert config.multipart_chunksize == 32 * 1024 * 1024
+    assert config.max_request_concurrency == 4
+
+
+def test_open_artifact_stream_reads_byte_ranges(s3_artifact_root, tmpdir):
+    local_file = tmpdir.join("file.txt")
+    local_file.write("0123456789")
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    repo.log_artifact(str(local_file))
+    with repo.open_artifact_stream("file.txt") as stream:
+        assert stream.read() == b"0123456789"
+    with repo.open_artifact_stream("file.txt", offset=4, length=3) as stream:
+        assert stream.read() == b"456"
+    with repo.open_artifact_stream("file.txt", offset=7) as stream:
+        assert stream.read() == b"789"
+
+
+def test_get_file_info_does_not_list_artifacts(s3_artifact_root, tmpdir):
+    local_file = tmpdir.join("file.txt")
+    local_file.write("0123456789")
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    repo.log_artifact(str(local_file), "dir")
+    with mock.patch.object(repo, "list_artifacts") as list_artifacts_mock:
+        assert repo.get_file_info("dir/file.txt") == FileInfo("dir/file.txt", False, 10)
+        assert repo.get_file_info("dir") == FileInfo("dir", True, None)
+        assert repo.get_file_info("di") is None
+        assert repo.get_file_info("dir/missing.txt") is None
+    list_artifacts_mock.assert_not_called()
@@ -14,6 +14,7 @@ from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import ErrorCode, RESOURCE_DOES_NOT_EXIST, \
     INVALID_PARAMETER_VALUE, RESOURCE_ALREADY_EXISTS
 from mlflow.store.model_registry.sqlalchemy_store import SqlAlchemyStore
+from mlflow.utils.search_utils import SearchUtils
 from tests.helper_functions import random_str
 
 DB_URI = 'sqlite:///'
@@ -824,6 +825,35 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase):
         self.assertIn("Invalid value for request parameter max_results",
                       exception_context.exception.message)
 
+    def test_search_registered_model_keyset_pagination(self):
+        rms = []
+        for i in range(10):
+            with mock.patch("mlflow.store.model_registry.sqlalchemy_store.now",
+                            return_value=i // 3):
+                rms.append(self._rm_maker(f"RM{i:03}").name)
+        query = "name LIKE 'RM%'"
+        order_by = ["last_updated_timestamp DESC"]
+        expected_rms, _ = self._search_registered_models(query, order_by=order_by,
+                                                         max_results=100)
+        returned_rms = []
+        result, token = self._search_registered_models(query, order_by=order_by, max_results=4)
+        while True:
+            returned_rms.extend(result)
+            if not token:
+                break
+            # Registered models inserted before the current page do not shift the next pages
+            with mock.patch("mlflow.store.model_registry.sqlalchemy_store.now",
+                            return_value=100):
+                self._rm_maker(f"RM-{len(returned_rms)}")
+            result, token = self._search_registered_models(query, order_by=order_by,
+                                                           page_token=token, max_results=4)
+        self.assertEqual(expected_rms, returned_rms)
+
+        # page tokens encoding an offset are still supported
+        offset_token = SearchUtils.create_page_token(3)
+        result, _ = self._search_registered_models(query, page_token=offset_token, max_results=2)
+        self.assertEqual(sorted(rms + [f"RM-{i}" for i in [4, 8]])[3:5], result)
+
     def test_search_registered_model_order_by(self):
         rms = []
         # explicitly mock the creation_timestamps because timestamps seem to be unstable in Windows
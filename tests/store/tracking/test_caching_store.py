@@ -0,0 +1,112 @@
+import time
+
+import mock
+import pytest
+
+from mlflow.entities import Metric, Param, RunStatus, RunTag, ViewType
+from mlflow.store.tracking.caching_store import CachingStore
+from mlflow.store.tracking.file_store import FileStore
+
+
+@pytest.fixture
+def file_store(tmpdir):
+    return FileStore(str(tmpdir.join("mlruns")))
+
+
+@pytest.fixture
+def caching_store(file_store):
+    return CachingStore(file_store, ttl=60)
+
+
+def _create_run(store):
+    return store.create_run(experiment_id="0", user_id="user", start_time=0, tags=[])
+
+
+def test_get_run_is_cached_until_ttl_expires(file_store):
+    store = CachingStore(file_store, ttl=0.2)
+    run_id = _create_run(store).info.run_id
+    with mock.patch.object(file_store, "get_run", wraps=file_store.get_run) as get_run_mock:
+        assert store.get_run(run_id).info.run_id == run_id
+        assert store.get_run(run_id).info.run_id == run_id
+        assert get_run_mock.call_count == 1
+        time.sleep(0.3)
+        store.get_run(run_id)
+        assert get_run_mock.call_count == 2
+
+
+def test_terminated_runs_expire(file_store):
+    store = CachingStore(file_store, ttl=0.1)
+    run_id = _create_run(store).info.run_id
+    store.update_run_info(run_id, RunStatus.FINISHED, end_time=1)
+    assert store.get_run(run_id).info.status == "FINISHED"
+    # Terminated runs still change, for example when they are tagged through another process
+    file_store.set_tag(run_id, RunTag("t", "v"))
+    time.sleep(0.2)
+    assert store.get_run(run_id).data.tags["t"] == "v"
+
+
+def test_run_writes_invalidate_cached_run(caching_store):
+    run_id = _create_run(caching_store).info.run_id
+    caching_store.get_run(run_id)
+    caching_store.log_metric(run_id, Metric("m", 1.0, 0, 0))
+    caching_store.log_param(run_id, Param("p", "v"))
+    caching_store.set_tag(run_id, RunTag("t", "v"))
+    caching_store.log_batch(run_id, [Metric("n", 2.0, 0, 0)], [], [])
+    data = caching_store.get_run(run_id).data
+    assert data.metrics == {"m": 1.0, "n": 2.0}
+    assert data.params == {"p": "v"}
+    assert data.tags["t"] == "v"
+    caching_store.delete_tag(run_id, "t")
+    assert "t" not in caching_store.get_run(run_id).data.tags
+    caching_store.delete_run(run_id)
+    assert caching_store.get_run(run_id).info.lifecycle_stage == "deleted"
+    caching_store.restore_run(run_id)
+    assert caching_store.get_run(run_id).info.lifecycle_stage == "active"
+
+
+def test_experiment_writes_invalidate_cached_experiments(caching_store):
+    experiment_ids = [e.experiment_id for e in caching_store.list_experiments()]
+    experiment_id = caching_store.create_experiment("exp", None)
+    assert [e.experiment_id for e in caching_store.list_experiments()] == \
+        experiment_ids + [experiment_id]
+    assert caching_store.get_experiment(experiment_id).name == "exp"
+    caching_store.rename_experiment(experiment_id, "renamed")
+    assert caching_store.get_experiment(experiment_id).name == "renamed"
+    caching_store.delete_experiment(experiment_id)
+    assert caching_store.get_experiment(experiment_id).lifecycle_stage == "deleted"
+    assert experiment_id not in [e.experiment_id for e in caching_store.list_experiments()]
+    assert experiment_id in [e.experiment_id
+                             for e in caching_store.list_experiments(ViewType.DELETED_ONLY)]
+
+
+def test_cache_evicts_least_recently_used_runs(file_store):
+    store = CachingStore(file_store, ttl=60, max_size=2)
+    run_ids = [_create_run(store).info.run_id for _ in range(3)]
+    with mock.patch.object(file_store, "get_run", wraps=file_store.get_run) as get_run_mock:
+        for run_id in run_ids + run_ids[1:]:
+            store.get_run(run_id)
+        assert get_run_mock.call_count == 3
+        store.get_run(run_ids[0])
+        assert get_run_mock.call_count == 4
+
+
+def test_values_loaded_before_an_invalidation_are_not_cached(caching_store, file_store):
+    run_id = _create_run(caching_store).info.run_id
+    stale_run = file_store.get_run(run_id)
+
+    def get_run_concurrently_with_write(run_id):
+        caching_store.log_param(run_id, Param("p", "v"))
+        return stale_run
+
+    with mock.patch.object(file_store, "get_run", side_effect=get_run_concurrently_with_write):
+        assert caching_store.get_run(run_id) is stale_run
+    assert caching_store.get_run(run_id).data.params == {"p": "v"}
+
+
+def test_other_methods_are_forwarded_to_wrapped_store(caching_store):
+    run_id = _create_run(caching_store).info.run_id
+    caching_store.log_metric(run_id, Metric("m", 1.0, 0, 0))
+    assert [m.value for m in caching_store.get_metric_history(run_id, "m")] == [1.0]
+    assert [r.info.run_id for r in caching_store.search_runs(["0"], None, ViewType.ALL)] == \
+        [run_id]
+    assert caching_store.root_directory == caching_store.store.root_directory
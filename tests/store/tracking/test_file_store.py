@@ -1,11 +1,13 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import math
 import os
 import posixpath
 import random
 import shutil
 import six
 import tempfile
+import threading
 import time
 import unittest
 import uuid
@@ -18,6 +20,7 @@ from mlflow.entities import Metric, Param, RunTag, ViewType, LifecycleStage, Run
 from mlflow.exceptions import MlflowException, MissingConfigException
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
 from mlflow.store.tracking.file_store import FileStore
+from mlflow.store.tracking.file_store_search_index import FileStoreSearchIndex
 from mlflow.utils.file_utils import write_yaml, read_yaml, path_to_local_file_uri, TempDir
 from mlflow.protos.databricks_pb2 import (
     ErrorCode, RESOURCE_DOES_NOT_EXIST, INTERNAL_ERROR, INVALID_PARAMETER_VALUE
@@ -643,6 +646,29 @@ class TestFileStore(unittest.TestCase, AbstractStoreTest):
         assert [r.info.run_id for r in result] == runs[8:]
         assert result.token is None
 
+    def test_search_runs_keyset_pagination_is_stable_under_concurrent_inserts(self):
+        fs = FileStore(self.test_root)
+        exp = fs.create_experiment("test_search_runs_keyset_pagination")
+        for i, value in enumerate([1.0, float("nan"), 1.0, None, 3.0, -1.0, None, 2.0]):
+            run_id = fs.create_run(exp, 'user', i, []).info.run_id
+            if value is not None:
+                fs.log_metric(run_id, Metric("x", value, 0, 0))
+        order_by = ["metrics.x asc"]
+        expected_run_ids = [r.info.run_id for r in fs.search_runs([exp], None, ViewType.ALL,
+                                                                  order_by=order_by)]
+        run_ids = []
+        result = fs.search_runs([exp], None, ViewType.ALL, max_results=3, order_by=order_by)
+        while True:
+            run_ids.extend(r.info.run_id for r in result)
+            if not result.token:
+                break
+            # Runs inserted before the current page do not shift the next pages
+            inserted_run_id = fs.create_run(exp, 'user', 100, []).info.run_id
+            fs.log_metric(inserted_run_id, Metric("x", -100, 0, 0))
+            result = fs.search_runs([exp], None, ViewType.ALL, max_results=3, order_by=order_by,
+                                    page_token=result.token)
+        assert run_ids == expected_run_ids
+
     def test_weird_param_names(self):
         WEIRD_PARAM_NAME = "this is/a weird/but valid param"
         fs = FileStore(self.test_root)
@@ -927,6 +953,36 @@ class TestFileStore(unittest.TestCase, AbstractStoreTest):
             run_id=run_id, metrics=metric_entities, params=param_entities, tags=tag_entities)
         self._verify_logged(fs, run_id, metric_entities, param_entities, tag_entities)
 
+    def test_get_metric_histories(self):
+        fs = FileStore(self.test_root)
+        run_ids = [self._create_run(fs).info.run_id for _ in range(2)]
+        for run_id in run_ids:
+            for step in range(10):
+                fs.log_metric(run_id, Metric("loss", 10.0 - step, step, step))
+                fs.log_metric(run_id, Metric("acc", step / 10.0, step, step))
+        fs.log_metric(run_ids[1], Metric("other", 1.0, 0, 0))
+
+        histories = fs.get_metric_histories(run_ids, ["loss", "missing"])
+        assert set(histories) == set(run_ids)
+        for run_id in run_ids:
+            assert list(histories[run_id]) == ["loss"]
+            assert [m.step for m in histories[run_id]["loss"]] == list(range(10))
+            assert [(m.value, m.timestamp) for m in histories[run_id]["loss"]] == \
+                [(m.value, m.timestamp) for m in fs.get_metric_history(run_id, "loss")]
+
+        histories = fs.get_metric_histories(run_ids)
+        assert set(histories[run_ids[0]]) == {"loss", "acc"}
+        assert set(histories[run_ids[1]]) == {"loss", "acc", "other"}
+
+        # Metrics without points in the step range are omitted
+        histories = fs.get_metric_histories(run_ids, max_points_per_series=4, step_range=(2, 7))
+        for run_id in run_ids:
+            assert set(histories[run_id]) == {"loss", "acc"}
+            assert [m.step for m in histories[run_id]["loss"]] == [2, 4, 5, 7]
+
+        with pytest.raises(MlflowException, match="not found"):
+            fs.get_metric_histories([run_ids[0], uuid.uuid4().hex])
+
     def _create_run(self, fs):
         return fs.create_run(
             experiment_id=FileStore.DEFAULT_EXPERIMENT_ID, user_id='user',
@@ -1017,3 +1073,172 @@ class TestFileStore(unittest.TestCase, AbstractStoreTest):
         run = self._create_run(fs)
         fs.log_batch(run.info.run_id, metrics=[], params=[], tags=[])
         self._verify_logged(fs, run.info.run_id, metrics=[], params=[], tags=[])
+
+
+class TestFileStoreWithSearchIndex(TestFileStore):
+    """
+    Runs the FileStore tests with run searches answered from the per-experiment search index.
+    """
+
+    def setUp(self):
+        super(TestFileStoreWithSearchIndex, self).setUp()
+        self._env_patch = mock.patch.dict(os.environ, {"MLFLOW_FILE_STORE_SEARCH_INDEX": "true"})
+        self._env_patch.start()
+
+    def tearDown(self):
+        self._env_patch.stop()
+        super(TestFileStoreWithSearchIndex, self).tearDown()
+
+    def _get_index(self, experiment_id=FileStore.DEFAULT_EXPERIMENT_ID):
+        return FileStoreSearchIndex(os.path.join(self.test_root, experiment_id))
+
+    def test_malformed_run(self):
+        # These tests modify run metadata files directly, which is only reflected in the index
+        # once it is rebuilt
+        with mock.patch.object(FileStoreSearchIndex, "is_valid", return_value=False):
+            super(TestFileStoreWithSearchIndex, self).test_malformed_run()
+
+    def test_bad_experiment_id_recorded_for_run(self):
+        with mock.patch.object(FileStoreSearchIndex, "is_valid", return_value=False):
+            super(TestFileStoreWithSearchIndex, self).test_bad_experiment_id_recorded_for_run()
+
+    def test_search_index_is_enabled_by_environment_variable(self):
+        assert FileStore(self.test_root).use_search_index
+        assert not FileStore(self.test_root, use_search_index=False).use_search_index
+        with mock.patch.dict(os.environ, {"MLFLOW_FILE_STORE_SEARCH_INDEX": "false"}):
+            assert not FileStore(self.test_root).use_search_index
+
+    def test_search_index_is_built_on_first_search(self):
+        fs = FileStore(self.test_root)
+        assert not self._get_index().exists()
+        runs = self._search(fs, FileStore.DEFAULT_EXPERIMENT_ID)
+        assert self._get_index().is_valid()
+        assert sorted(runs) == sorted(self.exp_data[FileStore.DEFAULT_EXPERIMENT_ID]["runs"])
+        # Logging to runs of an experiment that has not been searched yet does not build an index
+        fs.log_param(self.exp_data[self.experiments[0]]["runs"][0], Param("p", "v"))
+        assert not self._get_index(self.experiments[0]).exists()
+
+    def test_search_does_not_read_run_directories_once_indexed(self):
+        fs = FileStore(self.test_root)
+        expected = fs.search_runs([FileStore.DEFAULT_EXPERIMENT_ID], None, ViewType.ALL)
+        with mock.patch.object(FileStore, "_get_run_from_info") as get_run_mock, \
+                mock.patch.object(FileStore, "_get_run_info_from_dir") as get_run_info_mock:
+            runs = fs.search_runs([FileStore.DEFAULT_EXPERIMENT_ID], None, ViewType.ALL)
+        get_run_mock.assert_not_called()
+        get_run_info_mock.assert_not_called()
+        assert [r.to_proto() for r in runs] == [r.to_proto() for r in expected]
+
+    def test_search_index_is_updated_incrementally(self):
+        fs = FileStore(self.test_root)
+        run_id = self._create_run(fs).info.run_id
+        self._search(fs, FileStore.DEFAULT_EXPERIMENT_ID)
+        fs.log_metric(run_id, Metric("m", 1.0, 1, 1))
+        fs.log_metric(run_id, Metric("m", 5.0, 0, 0))
+        fs.log_param(run_id, Param("p", 1))
+        fs.set_tag(run_id, RunTag("t", "a"))
+        fs.log_batch(run_id, metrics=[Metric("n", float("nan"), 0, 0)],
+                     params=[Param("q", "b")], tags=[RunTag("u", "c"), RunTag("t", "d")])
+        fs.delete_tag(run_id, "u")
+        fs.update_run_info(run_id, RunStatus.FINISHED, 10)
+        with mock.patch.object(FileStore, "_get_run_from_info") as get_run_mock:
+            run, = fs.search_runs([FileStore.DEFAULT_EXPERIMENT_ID], "params.p = '1'",
+                                  ViewType.ALL)
+        get_run_mock.assert_not_called()
+        assert run.info == fs.get_run(run_id).info
+        assert run.data.metrics["m"] == 1.0
+        assert math.isnan(run.data.metrics["n"])
+        assert run.data.params == {"p": "1", "q": "b"}
+        assert run.data.tags == {"t": "d"}
+        assert run.info.status == RunStatus.to_string(RunStatus.FINISHED)
+
+        fs.delete_run(run_id)
+        assert run_id not in self._search(fs, FileStore.DEFAULT_EXPERIMENT_ID,
+                                          run_view_type=ViewType.ACTIVE_ONLY)
+        assert run_id in self._search(fs, FileStore.DEFAULT_EXPERIMENT_ID,
+                                      run_view_type=ViewType.DELETED_ONLY)
+        fs._hard_delete_run(run_id)
+        assert run_id not in self._get_index().run_ids()
+
+    def test_search_index_picks_up_added_and_removed_run_directories(self):
+        fs = FileStore(self.test_root)
+        self._search(fs, FileStore.DEFAULT_EXPERIMENT_ID)
+        removed_run_id = self.exp_data[FileStore.DEFAULT_EXPERIMENT_ID]["runs"][0]
+        shutil.rmtree(os.path.join(self.test_root, FileStore.DEFAULT_EXPERIMENT_ID,
+                                   removed_run_id))
+        # Runs created by a store without the index are picked up by the next search
+        new_run_id = self._create_run(FileStore(self.test_root, use_search_index=False)).info.run_id
+        runs = self._search(fs, FileStore.DEFAULT_EXPERIMENT_ID)
+        assert removed_run_id not in runs
+        assert new_run_id in runs
+        assert new_run_id in self._get_index().run_ids()
+
+    def test_search_of_unchanged_experiment_does_not_lock_search_index(self):
+        fs = FileStore(self.test_root)
+        malformed_run_dir = os.path.join(self.test_root, FileStore.DEFAULT_EXPERIMENT_ID,
+                                         "malformed")
+        os.makedirs(malformed_run_dir)
+        runs = self._search(fs, FileStore.DEFAULT_EXPERIMENT_ID)
+        # Added entries that cannot be read as runs are only read once too
+        with open(os.path.join(self.test_root, FileStore.DEFAULT_EXPERIMENT_ID, "notes.txt"),
+                  "w") as f:
+            f.write("notes")
+        assert self._search(fs, FileStore.DEFAULT_EXPERIMENT_ID) == runs
+        assert self._get_index().ignored_entries() == {"malformed", "notes.txt"}
+        with mock.patch.object(FileStoreSearchIndex, "lock") as lock_mock, \
+                mock.patch.object(FileStore, "_get_run_info_from_dir") as get_run_info_mock:
+            assert self._search(fs, FileStore.DEFAULT_EXPERIMENT_ID) == runs
+        lock_mock.assert_not_called()
+        get_run_info_mock.assert_not_called()
+        # Removed entries are forgotten, and rebuilds record the entries they ignore
+        shutil.rmtree(malformed_run_dir)
+        assert self._search(fs, FileStore.DEFAULT_EXPERIMENT_ID) == runs
+        assert self._get_index().ignored_entries() == {"notes.txt"}
+        fs.rebuild_search_index(FileStore.DEFAULT_EXPERIMENT_ID)
+        assert self._get_index().ignored_entries() == {"notes.txt"}
+
+    def test_rebuild_search_index(self):
+        fs = FileStore(self.test_root)
+        run_id = self._search(fs, FileStore.DEFAULT_EXPERIMENT_ID)[0]
+        FileStore(self.test_root, use_search_index=False).log_param(run_id, Param("p", "v"))
+        assert self._search(fs, FileStore.DEFAULT_EXPERIMENT_ID, "params.p = 'v'") == []
+        fs.rebuild_search_index(FileStore.DEFAULT_EXPERIMENT_ID)
+        assert self._search(fs, FileStore.DEFAULT_EXPERIMENT_ID, "params.p = 'v'") == [run_id]
+        with pytest.raises(MlflowException) as e:
+            fs.rebuild_search_index("12345")
+        assert e.value.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)
+
+    def test_updates_made_while_search_index_is_rebuilt_are_not_lost(self):
+        fs = FileStore(self.test_root)
+        run_id = self._create_run(fs).info.run_id
+        get_run_from_info = FileStore._get_run_from_info
+        writers = []
+
+        def get_run_and_log_param(store, run_info):
+            run = get_run_from_info(store, run_info)
+            if run_info.run_id == run_id and not writers:
+                # Another store logs to the run after the rebuild read it. Its update of the index
+                # waits for the rebuild, and is applied to the rebuilt index.
+                writer = threading.Thread(
+                    target=lambda: FileStore(self.test_root).log_param(run_id, Param("p", "v")))
+                writer.start()
+                writers.append(writer)
+                param_path = os.path.join(self.test_root, FileStore.DEFAULT_EXPERIMENT_ID,
+                                          run_id, "params", "p")
+                while not os.path.exists(param_path):
+                    time.sleep(0.01)
+                time.sleep(0.2)
+                assert writer.is_alive()
+            return run
+
+        with mock.patch.object(FileStore, "_get_run_from_info", get_run_and_log_param):
+            fs.rebuild_search_index(FileStore.DEFAULT_EXPERIMENT_ID)
+        writers[0].join()
+        assert self._search(fs, FileStore.DEFAULT_EXPERIMENT_ID, "params.p = 'v'") == [run_id]
+
+    def test_failed_search_index_update_deletes_index(self):
+        fs = FileStore(self.test_root)
+        run_id = self._search(fs, FileStore.DEFAULT_EXPERIMENT_ID)[0]
+        with mock.patch.object(FileStoreSearchIndex, "log_batch", side_effect=Exception("Error")):
+            fs.log_param(run_id, Param("p", "v"))
+        assert not self._get_index().exists()
+        assert self._search(fs, FileStore.DEFAULT_EXPERIMENT_ID, "params.p = 'v'") == [run_id]
@@ -0,0 +1,64 @@
+import math
+
+import pytest
+
+from mlflow.entities import Metric
+from mlflow.exceptions import MlflowException
+from mlflow.store.tracking.metric_history import validate_metric_histories_request, \
+    downsample_metric_history, add_metric_history
+
+
+def _history(values):
+    return [Metric("m", value, timestamp=step, step=step) for step, value in enumerate(values)]
+
+
+def test_downsample_metric_history_keeps_short_histories_sorted_by_step():
+    history = _history([3.0, 1.0, 2.0])
+    assert downsample_metric_history(list(reversed(history)), None) == history
+    assert downsample_metric_history(list(reversed(history)), 3) == history
+
+
+def test_downsample_metric_history_keeps_minimum_and_maximum_of_each_bucket():
+    history = _history([0.0, 5.0, 1.0, 1.0, -3.0, 2.0, 2.0, 2.0, 100.0, 4.0])
+    downsampled = downsample_metric_history(history, 6)
+    # Buckets of steps [0, 2], [3, 5] and [6, 9]
+    assert [m.step for m in downsampled] == [0, 1, 4, 5, 6, 8]
+    assert downsample_metric_history(history, 1) == history[-1:]
+    assert len(downsample_metric_history(_history(range(1000)), 101)) == 100
+
+
+def test_downsample_metric_history_ignores_nan_values():
+    history = _history([float("nan"), 1.0, 2.0, float("nan"), float("nan"), float("nan")])
+    downsampled = downsample_metric_history(history, 2)
+    assert [m.step for m in downsampled] == [1, 2]
+    downsampled = downsample_metric_history(history, 4)
+    assert [m.step for m in downsampled] == [1, 2, 3]
+    assert math.isnan(downsampled[-1].value)
+
+
+def test_add_metric_history_filters_steps_and_omits_empty_histories():
+    histories = {}
+    add_metric_history(histories, "run", "m", _history(range(10)), step_range=(3, None))
+    add_metric_history(histories, "run", "n", _history(range(10)), step_range=(None, 2))
+    add_metric_history(histories, "run", "o", _history(range(10)), step_range=(20, 30))
+    add_metric_history(histories, "other", "m", _history(range(10)), max_points_per_series=2,
+                       step_range=(4, 6))
+    assert [m.step for m in histories["run"]["m"]] == list(range(3, 10))
+    assert [m.step for m in histories["run"]["n"]] == [0, 1, 2]
+    assert "o" not in histories["run"]
+    assert [m.step for m in histories["other"]["m"]] == [4, 6]
+
+
+@pytest.mark.parametrize("run_ids, metric_keys, max_points_per_series, step_range", [
+    ([], None, None, None),
+    (["run"], [], None, None),
+    (["run"], None, 0, None),
+    (["run"], None, "10", None),
+    (["run"], None, None, (1, 2, 3)),
+])
+def test_validate_metric_histories_request_rejects_invalid_arguments(
+        run_ids, metric_keys, max_points_per_series, step_range):
+    with pytest.raises(MlflowException) as e:
+        validate_metric_histories_request(run_ids, metric_keys, max_points_per_series,
+                                          step_range)
+    assert e.value.error_code == "INVALID_PARAMETER_VALUE"
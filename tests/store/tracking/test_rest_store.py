@@ -1,4 +1,5 @@
 import json
+import math
 import unittest
 
 import mock
@@ -30,7 +31,7 @@ class CustomErrorHandlingRestStore(RestStore):
 
 
 class TestRestStore(object):
-    @mock.patch('requests.request')
+    @mock.patch('requests.Session.request')
     def test_successful_http_request(self, request):
         def mock_request(**kwargs):
             # Filter out None arguments
@@ -53,7 +54,7 @@ class TestRestStore(object):
         experiments = store.list_experiments()
         assert experiments[0].name == "Exp!"
 
-    @mock.patch('requests.request')
+    @mock.patch('requests.Session.request')
     def test_failed_http_request(self, request):
         response = mock.MagicMock
         response.status_code = 404
@@ -65,7 +66,7 @@ class TestRestStore(object):
             store.list_experiments()
         assert "RESOURCE_DOES_NOT_EXIST: No experiment" in str(cm.value)
 
-    @mock.patch('requests.request')
+    @mock.patch('requests.Session.request')
     def test_failed_http_request_custom_handler(self, request):
         response = mock.MagicMock
         response.status_code = 404
@@ -76,7 +77,7 @@ class TestRestStore(object):
         with pytest.raises(MyCoolException):
             store.list_experiments()
 
-    @mock.patch('requests.request')
+    @mock.patch('requests.Session.request')
     def test_response_with_unknown_fields(self, request):
         experiment_json = {
             "experiment_id": "1",
@@ -110,7 +111,7 @@ class TestRestStore(object):
     def _verify_requests(self, http_request, host_creds, endpoint, method, json_body):
         http_request.assert_any_call(**(self._args(host_creds, endpoint, method, json_body)))
 
-    @mock.patch('requests.request')
+    @mock.patch('requests.Session.request')
     def test_requestor(self, request):
         response = mock.MagicMock
         response.status_code = 200
@@ -260,6 +261,57 @@ class TestRestStore(object):
                                   "runs/log-model", "POST",
                                   message_to_json(expected_message))
 
+    def test_export_runs_streams_the_response_to_the_output(self):
+        creds = MlflowHostCreds('https://hello')
+        store = RestStore(lambda: creds)
+        output = six.BytesIO()
+        with mock.patch('mlflow.store.tracking.rest_store.http_request') as mock_http:
+            response = mock.MagicMock()
+            response.status_code = 200
+            response.iter_content.return_value = [b"abc", b"def"]
+            mock_http.return_value = response
+            store.export_runs(["0", 1], "metrics.m > 0", ViewType.ALL, ["metrics.m"], "arrow",
+                              output, max_results=10)
+        assert output.getvalue() == b"abcdef"
+        _, kwargs = mock_http.call_args
+        assert kwargs["endpoint"] == "/api/2.0/preview/mlflow/runs/export"
+        assert kwargs["params"] == {"format": "arrow"}
+        assert kwargs["stream"]
+        assert kwargs["json"] == json.loads(message_to_json(SearchRuns(
+            experiment_ids=["0", "1"], filter="metrics.m > 0",
+            run_view_type=ViewType.to_proto(ViewType.ALL), order_by=["metrics.m"],
+            max_results=10)))
+        response.close.assert_called_once_with()
+
+    def test_get_metric_histories(self):
+        creds = MlflowHostCreds('https://hello')
+        store = RestStore(lambda: creds)
+        with mock.patch('mlflow.store.tracking.rest_store.http_request') as mock_http:
+            response = mock.MagicMock()
+            response.status_code = 200
+            response.text = json.dumps({"histories": [
+                {"run_id": "a", "metric_key": "loss",
+                 "metrics": [{"key": "loss", "value": 1.5, "timestamp": "10", "step": "0"},
+                             {"key": "loss", "value": "NaN", "timestamp": "20", "step": "1"}]},
+                {"run_id": "b", "metric_key": "acc",
+                 "metrics": [{"key": "acc", "value": 0.5, "timestamp": "30", "step": "2"}]},
+            ]})
+            mock_http.return_value = response
+            histories = store.get_metric_histories(["a", "b"], ["loss", "acc"],
+                                                   max_points_per_series=100,
+                                                   step_range=(None, 5))
+        _, kwargs = mock_http.call_args
+        assert kwargs["endpoint"] == "/api/2.0/preview/mlflow/metrics/get-histories"
+        assert kwargs["method"] == "POST"
+        assert kwargs["json"] == {"run_ids": ["a", "b"], "metric_keys": ["loss", "acc"],
+                                  "max_points_per_series": 100, "min_step": None,
+                                  "max_step": 5}
+        assert set(histories) == {"a", "b"}
+        loss = histories["a"]["loss"]
+        assert [(m.key, m.timestamp, m.step) for m in loss] == [("loss", 10, 0), ("loss", 20, 1)]
+        assert loss[0].value == 1.5 and math.isnan(loss[1].value)
+        assert histories["b"]["acc"][0].value == 0.5
+
     @pytest.mark.parametrize("store_class", [RestStore, DatabricksRestStore])
     def test_get_experiment_by_name(self, store_class):
         creds = MlflowHostCreds('https://hello')
@@ -0,0 +1,67 @@
+import io
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from mlflow.entities import Metric, Param, RunTag, ViewType
+from mlflow.exceptions import MlflowException
+from mlflow.store.tracking.file_store import FileStore
+from mlflow.store.tracking.run_export import iter_export_chunks, iter_run_pages
+
+
+@pytest.fixture
+def store(tmpdir):
+    store = FileStore(str(tmpdir.join("mlruns")))
+    for i in range(5):
+        run_id = store.create_run("0", "user", i, []).info.run_id
+        store.log_batch(run_id, metrics=[Metric("m", float(i), 0, 0)],
+                        params=[Param("p%s" % (i % 2), str(i))], tags=[RunTag("t", "v")])
+    return store
+
+
+def _read(data, export_format):
+    if export_format == "parquet":
+        return pq.read_table(io.BytesIO(data))
+    return pa.ipc.open_stream(data).read_all()
+
+
+@pytest.mark.parametrize("export_format", ["parquet", "arrow"])
+def test_export_runs_round_trip(store, export_format):
+    output = io.BytesIO()
+    store.export_runs(["0"], "", ViewType.ALL, ["metrics.m ASC"], export_format, output)
+    table = _read(output.getvalue(), export_format)
+    assert table.num_rows == 5
+    columns = table.to_pydict()
+    rows = [{name: columns[name][i] for name in columns} for i in range(table.num_rows)]
+    runs = store.search_runs(["0"], "", ViewType.ALL, order_by=["metrics.m ASC"])
+    assert [row["run_id"] for row in rows] == [run.info.run_id for run in runs]
+    for row, run in zip(rows, runs):
+        assert row["experiment_id"] == "0"
+        assert row["status"] == run.info.status
+        assert row["start_time"].timestamp() * 1000 == run.info.start_time
+        assert row["end_time"] is None
+        assert dict(row["metrics"]) == run.data.metrics
+        assert dict(row["params"]) == run.data.params
+        assert dict(row["tags"]) == run.data.tags
+
+
+def test_iter_run_pages_follows_page_tokens_up_to_max_results(store):
+    pages = list(iter_run_pages(store, ["0"], "", ViewType.ALL, page_size=2))
+    assert [len(page) for page in pages] == [2, 2, 1]
+    pages = list(iter_run_pages(store, ["0"], "", ViewType.ALL, max_results=3, page_size=2))
+    assert [len(page) for page in pages] == [2, 1]
+
+
+def test_export_chunks_are_yielded_per_page(store):
+    pages = list(iter_run_pages(store, ["0"], "", ViewType.ALL, page_size=2))
+    chunks = list(iter_export_chunks(pages, "arrow"))
+    assert len(chunks) == len(pages) + 1
+    table = _read(b"".join(chunks), "arrow")
+    assert table.num_rows == 5
+    assert len(table.to_batches()) == 3
+
+
+def test_export_runs_rejects_unknown_formats(store):
+    with pytest.raises(MlflowException, match="Invalid export format"):
+        store.export_runs(["0"], "", ViewType.ALL, None, "csv", io.BytesIO())
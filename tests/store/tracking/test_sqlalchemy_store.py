@@ -30,6 +30,7 @@ from mlflow.exceptions import MlflowException
 from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
 from mlflow.utils import mlflow_tags
 from mlflow.utils.file_utils import TempDir
+from mlflow.utils.search_utils import SearchUtils
 from mlflow.utils.uri import extract_db_type_from_uri
 from tests.resources.db.initial_models import Base as InitialBase
 from tests.integration.utils import invoke_cli_runner
@@ -782,6 +783,79 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
                              [(m.key, m.value, m.timestamp) for m in expected],
                              [(m.key, m.value, m.timestamp) for m in actual])
 
+    def test_get_metric_histories(self):
+        exp = self._experiment_factory('test_get_metric_histories')
+        run_ids = [self._run_factory(self._get_run_configs(exp)).info.run_id for _ in range(2)]
+        for run_id in run_ids:
+            for step in range(10):
+                self.store.log_metric(run_id, Metric("loss", 10.0 - step, step, step))
+                self.store.log_metric(run_id, Metric("acc", step / 10.0, step, step))
+        self.store.log_metric(run_ids[1], Metric("other", float("nan"), 0, 0))
+
+        histories = self.store.get_metric_histories(run_ids, ["loss", "missing"])
+        assert set(histories) == set(run_ids)
+        for run_id in run_ids:
+            assert list(histories[run_id]) == ["loss"]
+            assert [(m.value, m.step) for m in histories[run_id]["loss"]] == \
+                [(10.0 - step, step) for step in range(10)]
+
+        histories = self.store.get_metric_histories(run_ids)
+        assert set(histories[run_ids[0]]) == {"loss", "acc"}
+        assert set(histories[run_ids[1]]) == {"loss", "acc", "other"}
+        assert math.isnan(histories[run_ids[1]]["other"][0].value)
+
+        # Metrics without points in the step range are omitted
+        histories = self.store.get_metric_histories(run_ids, max_points_per_series=4,
+                                                    step_range=(2, 7))
+        for run_id in run_ids:
+            assert set(histories[run_id]) == {"loss", "acc"}
+            assert [m.step for m in histories[run_id]["loss"]] == [2, 4, 5, 7]
+
+        with self.assertRaisesRegex(MlflowException, "max_points_per_series"):
+            self.store.get_metric_histories(run_ids, max_points_per_series=0)
+
+    def test_get_metric_histories_reads_deleted_runs_and_rejects_unknown_runs(self):
+        exp = self._experiment_factory('test_get_metric_histories_deleted_runs')
+        run_id = self._run_factory(self._get_run_configs(exp)).info.run_id
+        self.store.log_metric(run_id, Metric("loss", 1.0, 0, 0))
+        self.store.delete_run(run_id)
+        assert list(self.store.get_metric_histories([run_id])[run_id]) == ["loss"]
+        with self.assertRaises(MlflowException) as e:
+            self.store.get_metric_histories([run_id, "unknown"])
+        assert e.exception.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)
+
+    def test_get_metric_histories_limits_the_bind_parameters_of_each_statement(self):
+        exp = self._experiment_factory('test_get_metric_histories_bind_params')
+        run_ids = [self._run_factory(self._get_run_configs(exp)).info.run_id for _ in range(5)]
+        for run_id in run_ids:
+            self.store.log_batch(run_id, metrics=[Metric(key, 1.0, 0, step) for key in "abc"
+                                                  for step in range(3)], params=[], tags=[])
+
+        num_params = []
+
+        def record_params(conn, cursor, statement, parameters, *args):  # pylint: disable=W0613
+            num_params.append(len(parameters))
+
+        sqlalchemy.event.listen(self.store.engine, "before_cursor_execute", record_params)
+        try:
+            with mock.patch(
+                    "mlflow.store.tracking.sqlalchemy_store._MAX_BIND_PARAMS_PER_STATEMENT", 8):
+                histories = self.store.get_metric_histories(run_ids, ["a", "b"], step_range=(1, 2))
+                # Keys that leave little room for the run IDs are filtered after the query
+                all_keys_histories = self.store.get_metric_histories(
+                    run_ids, ["a", "b", "c"], step_range=(1, 2))
+        finally:
+            sqlalchemy.event.remove(self.store.engine, "before_cursor_execute", record_params)
+        assert max(num_params) <= 8
+
+        def steps(histories):
+            return {run_id: {key: [m.step for m in history] for key, history in series.items()}
+                    for run_id, series in histories.items()}
+
+        assert steps(histories) == {run_id: {"a": [1, 2], "b": [1, 2]} for run_id in run_ids}
+        assert steps(all_keys_histories) == \
+            {run_id: {"a": [1, 2], "b": [1, 2], "c": [1, 2]} for run_id in run_ids}
+
     def test_list_run_infos(self):
         experiment_id = self._experiment_factory('test_exp')
         r1 = self._run_factory(config=self._get_run_configs(experiment_id)).info.run_id
@@ -1392,6 +1466,82 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
         assert [r.info.run_id for r in result] == runs[8:]
         assert result.token is None
 
+    def test_search_runs_keyset_pagination_is_stable_under_concurrent_inserts(self):
+        exp = self._experiment_factory('test_search_runs_keyset_pagination')
+        for i, value in enumerate([1.0, float("nan"), 1.0, None, 3.0, -1.0, None, 2.0]):
+            run_id = self._run_factory(self._get_run_configs(exp, start_time=i)).info.run_id
+            if value is not None:
+                self.store.log_metric(run_id, Metric("x", value, 0, 0))
+        for order_by in [["metrics.x asc"], ["metrics.x desc", "attribute.start_time asc"]]:
+            expected_run_ids = [r.info.run_id for r in self.store.search_runs(
+                [exp], None, ViewType.ALL, order_by=order_by)]
+            run_ids = []
+            result = self.store.search_runs([exp], None, ViewType.ALL, max_results=3,
+                                            order_by=order_by)
+            while True:
+                run_ids.extend(r.info.run_id for r in result)
+                if not result.token:
+                    break
+                # Runs inserted before the current page do not shift the next pages
+                inserted_run_id = self._run_factory(
+                    self._get_run_configs(exp, start_time=100)).info.run_id
+                self.store.log_metric(inserted_run_id, Metric("x", -100 if "asc" in order_by[0]
+                                                              else 100, 0, 0))
+                result = self.store.search_runs([exp], None, ViewType.ALL, max_results=3,
+                                                order_by=order_by, page_token=result.token)
+            assert run_ids == expected_run_ids
+
+    def test_search_runs_supports_offset_page_tokens(self):
+        exp = self._experiment_factory('test_search_runs_offset_page_tokens')
+        runs = sorted([self._run_factory(self._get_run_configs(exp, start_time=10)).info.run_id
+                       for r in range(10)])
+        result = self.store.search_runs([exp], None, ViewType.ALL, max_results=4,
+                                        page_token=SearchUtils.create_page_token(4))
+        assert [r.info.run_id for r in result] == runs[4:8]
+        result = self.store.search_runs([exp], None, ViewType.ALL, max_results=4,
+                                        page_token=result.token)
+        assert [r.info.run_id for r in result] == runs[8:]
+
+    def test_search_runs_rejects_page_tokens_of_other_order_by(self):
+        exp = self._experiment_factory('test_search_runs_page_tokens_of_other_order_by')
+        for _ in range(3):
+            self._run_factory(self._get_run_configs(exp, start_time=10))
+        result = self.store.search_runs([exp], None, ViewType.ALL, max_results=1,
+                                        order_by=["metrics.x asc"])
+        with pytest.raises(MlflowException, match="Invalid page token"):
+            self.store.search_runs([exp], None, ViewType.ALL, max_results=1,
+                                   page_token=result.token)
+
+    def test_search_runs_issues_constant_number_of_queries(self):
+        exp = self._experiment_factory('test_search_runs_constant_queries')
+        run_ids = []
+        for i in range(5):
+            run_id = self._run_factory(self._get_run_configs(exp, start_time=i)).info.run_id
+            self.store.log_batch(run_id, metrics=[Metric("m", i, 0, 0), Metric("n", 1, 0, 0)],
+                                 params=[Param("p", "v%s" % i)], tags=[RunTag("t", "a")])
+            run_ids.append(run_id)
+        self.store.log_metric(run_ids[0], Metric("other", 1, 0, 0))
+
+        statements = []
+
+        def record_statement(conn, cursor, statement, *args):  # pylint: disable=unused-argument
+            statements.append(statement)
+
+        sqlalchemy.event.listen(self.store.engine, "before_cursor_execute", record_statement)
+        try:
+            result = self.store.search_runs(
+                [exp], "metrics.m >= 1 and metrics.n = 1 and params.p != 'v4' and tags.t = 'a'",
+                ViewType.ALL, order_by=["metrics.other DESC", "params.p ASC"], max_results=2)
+        finally:
+            sqlalchemy.event.remove(self.store.engine, "before_cursor_execute", record_statement)
+        assert [r.info.run_id for r in result] == [run_ids[1], run_ids[2]]
+        assert result[0].data.metrics == {"m": 1, "n": 1}
+        assert result[0].data.params == {"p": "v1"}
+        assert result[0].data.tags == {"t": "a"}
+        # One query for the IDs of the page, then one per table for the data of the runs
+        assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 5
+        assert "JOIN" not in statements[0].upper()
+
     def test_log_batch(self):
         experiment_id = self._experiment_factory('log_batch')
         run_id = self._run_factory(self._get_run_configs(experiment_id)).info.run_id
@@ -1453,7 +1603,8 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
                                  tags=[tag])
         self.assertIn("Changing param values is not allowed. Param with key=", e.exception.message)
         assert e.exception.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
-        self._verify_logged(self.store, run.info.run_id, metrics=[], params=[param0], tags=[])
+        # The batch is logged in a single transaction, so no partial data is logged
+        self._verify_logged(self.store, run.info.run_id, metrics=[], params=[], tags=[])
 
     def test_log_batch_accepts_empty_payload(self):
         run = self._run_factory()
@@ -1469,9 +1620,9 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
             raise Exception("Some internal error")
 
         package = "mlflow.store.tracking.sqlalchemy_store.SqlAlchemyStore"
-        with mock.patch(package + ".log_metric") as metric_mock, \
-                mock.patch(package + ".log_param") as param_mock, \
-                mock.patch(package + ".set_tag") as tags_mock:
+        with mock.patch(package + "._log_metrics") as metric_mock, \
+                mock.patch(package + "._log_params") as param_mock, \
+                mock.patch(package + "._set_tags") as tags_mock:
             metric_mock.side_effect = _raise_exception_fn
             param_mock.side_effect = _raise_exception_fn
             tags_mock.side_effect = _raise_exception_fn
@@ -1540,6 +1691,45 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
         self._verify_logged(self.store, run.info.run_id, params=[], metrics=[metric0, metric1],
                             tags=[])
 
+    def test_log_batch_is_atomic(self):
+        run = self._run_factory()
+        metric = Metric("m", 1.0, 12345, 0)
+        tag = RunTag("t", "tval")
+        with mock.patch("mlflow.store.tracking.sqlalchemy_store.SqlAlchemyStore._set_tags",
+                        side_effect=Exception("Some internal error")):
+            with self.assertRaises(MlflowException):
+                self.store.log_batch(run.info.run_id, metrics=[metric],
+                                     params=[Param("p", "pval")], tags=[tag])
+        self._verify_logged(self.store, run.info.run_id, metrics=[], params=[], tags=[])
+        assert self.store.get_run(run.info.run_id).data.metrics == {}
+
+    def test_log_batch_updates_latest_metrics(self):
+        run = self._run_factory()
+        self.store.log_metric(run.info.run_id, Metric("a", 5.0, 100, 3))
+        self.store.log_metric(run.info.run_id, Metric("b", 5.0, 100, 3))
+        metrics = [Metric("a", 1.0, 200, 1), Metric("a", 2.0, 200, 2),
+                   Metric("b", 7.0, 50, 4), Metric("b", 6.0, 300, 4),
+                   Metric("c", float("nan"), 1, 0), Metric("d", float("inf"), 1, 0),
+                   Metric("a", 5.0, 100, 3)]
+        self.store.log_batch(run.info.run_id, metrics=metrics, params=[], tags=[])
+        latest = self.store.get_run(run.info.run_id).data.metrics
+        assert latest["a"] == 5.0
+        assert latest["b"] == 6.0
+        assert math.isnan(latest["c"])
+        assert latest["d"] == 1.7976931348623157e308
+        assert len(self.store.get_metric_history(run.info.run_id, "a")) == 3
+
+    def test_log_batch_params_tags_mixed_with_existing(self):
+        run = self._run_factory()
+        self.store.log_param(run.info.run_id, Param("p1", "v1"))
+        self.store.set_tag(run.info.run_id, RunTag("t1", "old"))
+        self.store.log_batch(run.info.run_id, metrics=[],
+                             params=[Param("p1", "v1"), Param("p2", "v2"), Param("p2", "v2")],
+                             tags=[RunTag("t1", "new"), RunTag("t2", "v")])
+        self._verify_logged(self.store, run.info.run_id, metrics=[],
+                            params=[Param("p1", "v1"), Param("p2", "v2")],
+                            tags=[RunTag("t1", "new"), RunTag("t2", "v")])
+
     def test_upgrade_cli_idempotence(self):
         # Repeatedly run `mlflow db upgrade` against our database, verifying that the command
         # succeeds and that the DB has the latest schema
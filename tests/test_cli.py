@@ -202,3 +202,10 @@ def test_mlflow_gc_not_deleted_run(file_store):
                                  run.info.run_uuid])
     runs = store.search_runs(experiment_ids=['0'], filter_string='', run_view_type=ViewType.ALL)
     assert len(runs) == 1
+
+
+def test_server_entity_cache_options_are_forwarded():
+    with mock.patch("mlflow.cli._run_server") as run_server_mock:
+        CliRunner().invoke(server, ["--entity-cache-ttl", "5", "--entity-cache-size", "100"])
+        args, _ = run_server_mock.call_args
+        assert args[-2:] == (5.0, 100)
@@ -1,5 +1,5 @@
 from click.testing import CliRunner
-from mlflow.runs import list_run
+from mlflow.runs import list_run, export_runs
 import mlflow
 
 
@@ -13,3 +13,16 @@ def test_list_run():
 def test_list_run_experiment_id_required():
     result = CliRunner().invoke(list_run, [])
     assert "Missing option '--experiment-id'" in result.output
+
+
+def test_export_runs(tmpdir):
+    import pyarrow.parquet as pq
+    with mlflow.start_run() as run:
+        mlflow.log_metric("m", 1.0)
+    output_path = str(tmpdir.join("runs.parquet"))
+    result = CliRunner().invoke(export_runs, ["--experiment-ids", "0", "-o", output_path,
+                                              "--filter", "metrics.m = 1"])
+    assert result.exit_code == 0, result.output
+    columns = pq.read_table(output_path).to_pydict()
+    assert columns["run_id"] == [run.info.run_id]
+    assert columns["metrics"] == [[("m", 1.0)]]
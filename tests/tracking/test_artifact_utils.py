@@ -1,7 +1,11 @@
 import os
 
+import mock
+
 import mlflow
-from mlflow.tracking.artifact_utils import _download_artifact_from_uri
+from mlflow.tracking import MlflowClient
+from mlflow.tracking.artifact_utils import _download_artifact_from_uri, \
+    _download_artifact_from_uri_without_cache
 
 
 def test_artifact_can_be_downloaded_from_absolute_uri_successfully(tmpdir):
@@ -45,3 +49,75 @@ def test_download_artifact_from_absolute_uri_persists_data_to_specified_output_d
     with open(os.path.join(
             artifact_output_path, logged_artifact_subdir, artifact_file_name), "r") as f:
         assert f.read() == artifact_text
+
+
+def _log_artifact(tmpdir):
+    local_artifact_path = tmpdir.join("artifact.txt").strpath
+    with open(local_artifact_path, "w") as out:
+        out.write("Sample artifact text")
+    mlflow.log_artifact(local_path=local_artifact_path, artifact_path="model")
+
+
+def test_download_artifact_from_terminated_run_uses_artifact_cache(tmpdir, monkeypatch):
+    monkeypatch.setenv("MLFLOW_ARTIFACT_CACHE_DIR", tmpdir.join("cache").strpath)
+    with mlflow.start_run() as run:
+        _log_artifact(tmpdir)
+        artifact_uri = "runs:/%s/model" % run.info.run_id
+        with mock.patch("mlflow.tracking.artifact_utils._download_artifact_from_uri_without_cache",
+                        wraps=_download_artifact_from_uri_without_cache) as download_mock:
+            # Artifacts of active runs may still change, so they are not cached
+            _download_artifact_from_uri(artifact_uri)
+            _download_artifact_from_uri(artifact_uri)
+            assert download_mock.call_count == 2
+            assert not os.path.exists(tmpdir.join("cache").strpath) or \
+                os.listdir(tmpdir.join("cache").strpath) == []
+
+    with mock.patch("mlflow.tracking.artifact_utils._download_artifact_from_uri_without_cache",
+                    wraps=_download_artifact_from_uri_without_cache) as download_mock:
+        first_path = _download_artifact_from_uri(artifact_uri)
+        second_path = _download_artifact_from_uri(artifact_uri)
+    assert download_mock.call_count == 1
+    assert first_path != second_path
+    for path in [first_path, second_path]:
+        with open(os.path.join(path, "artifact.txt")) as f:
+            assert f.read() == "Sample artifact text"
+
+
+def test_download_artifact_from_model_version_uses_artifact_cache(tmpdir, monkeypatch):
+    monkeypatch.setenv("MLFLOW_ARTIFACT_CACHE_DIR", tmpdir.join("cache").strpath)
+    with mlflow.start_run() as run:
+        _log_artifact(tmpdir)
+    mlflow.register_model("runs:/%s/model" % run.info.run_id, "model")
+
+    output_path = tmpdir.mkdir("output").strpath
+    assert _download_artifact_from_uri("models:/model/1", output_path) == output_path
+    with mock.patch.object(MlflowClient, "get_model_version_download_uri") as get_uri_mock:
+        local_path = _download_artifact_from_uri("models:/model/1")
+    # Registered model versions are immutable, so cached versions are loaded without any request
+    # to the model registry
+    get_uri_mock.assert_not_called()
+    with open(os.path.join(local_path, "artifact.txt")) as f:
+        assert f.read() == "Sample artifact text"
+
+
+def test_download_artifact_from_model_stage_downloads_the_cached_version(tmpdir, monkeypatch):
+    monkeypatch.setenv("MLFLOW_ARTIFACT_CACHE_DIR", tmpdir.join("cache").strpath)
+    with mlflow.start_run() as run:
+        _log_artifact(tmpdir)
+    mlflow.register_model("runs:/%s/model" % run.info.run_id, "model")
+    mlflow.register_model("runs:/%s/model" % run.info.run_id, "model")
+    client = MlflowClient()
+    client.transition_model_version_stage("model", "1", "Production")
+
+    def transition_and_download(artifact_uri, dst_path):
+        # The stage moves to another version after it was resolved to build the cache key
+        client.transition_model_version_stage("model", "1", "Archived")
+        client.transition_model_version_stage("model", "2", "Production")
+        return _download_artifact_from_uri_without_cache(artifact_uri, dst_path)
+
+    with mock.patch("mlflow.tracking.artifact_utils._download_artifact_from_uri_without_cache",
+                    side_effect=transition_and_download) as download_mock:
+        local_path = _download_artifact_from_uri("models:/model/Production")
+    download_mock.assert_called_once_with("models:/model/1", mock.ANY)
+    with open(os.path.join(local_path, "artifact.txt")) as f:
+        assert f.read() == "Sample artifact text"
@@ -0,0 +1,135 @@
+import mock
+import pytest
+
+import mlflow
+import mlflow.tracking.fluent
+from mlflow.entities import Metric, Param, RunTag
+from mlflow.exceptions import MlflowException
+from mlflow.tracking.client import MlflowClient
+from mlflow.tracking._async_logging import AsyncBatchLogger, _split_into_batches
+from mlflow.utils.validation import _validate_batch_log_limits
+
+
+@pytest.fixture
+def async_logging():
+    mlflow.enable_async_logging()
+    yield
+    mlflow.enable_async_logging(False)
+    mlflow.tracking.fluent._async_logging_enabled = None
+
+
+def test_split_into_batches_obeys_batch_log_limits():
+    metrics = [Metric("m%s" % i, i, 0, i) for i in range(2500)]
+    params = [Param("p%s" % i, "v") for i in range(150)]
+    tags = [RunTag("t%s" % i, "v") for i in range(250)]
+    batches = list(_split_into_batches(metrics, params, tags))
+    for batch_metrics, batch_params, batch_tags in batches:
+        _validate_batch_log_limits(batch_metrics, batch_params, batch_tags)
+    assert [m for batch in batches for m in batch[0]] == metrics
+    assert [p for batch in batches for p in batch[1]] == params
+    assert [t for batch in batches for t in batch[2]] == tags
+
+
+def test_async_batch_logger_coalesces_operations_per_run():
+    logger = AsyncBatchLogger(flush_interval=60)
+    with mock.patch.object(MlflowClient, "log_batch") as log_batch_mock:
+        futures = [logger.log_batch("run1", metrics=[Metric("a", i, 0, i)]) for i in range(3)]
+        futures.append(logger.log_batch("run2", params=[Param("p", "v")]))
+        futures.append(logger.log_batch("run1", tags=[RunTag("t", "v")]))
+        assert log_batch_mock.call_count == 0
+        logger.flush()
+    assert all(future.done() and future.exception() is None for future in futures)
+    assert log_batch_mock.call_count == 2
+    run1_call, run2_call = log_batch_mock.call_args_list
+    assert run1_call[0] == ("run1",)
+    assert [m.value for m in run1_call[1]["metrics"]] == [0, 1, 2]
+    assert [t.key for t in run1_call[1]["tags"]] == ["t"]
+    assert run2_call[0] == ("run2",)
+    assert [p.key for p in run2_call[1]["params"]] == ["p"]
+    logger.shutdown()
+
+
+def test_async_batch_logger_flushes_when_queue_is_full():
+    logger = AsyncBatchLogger(flush_interval=60, max_queue_size=10)
+    with mock.patch.object(MlflowClient, "log_batch") as log_batch_mock:
+        future = logger.log_batch("run", metrics=[Metric("a", i, 0, i) for i in range(10)])
+        future.result(timeout=10)
+        assert log_batch_mock.call_count == 1
+    logger.shutdown()
+
+
+def test_async_batch_logger_flushes_on_interval():
+    logger = AsyncBatchLogger(flush_interval=0.1)
+    with mock.patch.object(MlflowClient, "log_batch") as log_batch_mock:
+        future = logger.log_batch("run", metrics=[Metric("a", 1, 0, 0)])
+        future.result(timeout=10)
+        assert log_batch_mock.call_count == 1
+    logger.shutdown()
+
+
+def test_async_batch_logger_surfaces_errors_through_futures_and_flush():
+    logger = AsyncBatchLogger(flush_interval=60)
+    with mock.patch.object(MlflowClient, "log_batch",
+                           side_effect=MlflowException("Some error")):
+        failed = logger.log_batch("run", params=[Param("p", "v")])
+        with pytest.raises(MlflowException, match="Some error"):
+            logger.flush()
+    assert isinstance(failed.exception(), MlflowException)
+    logger.shutdown()
+
+
+def test_async_batch_logger_validates_entities_eagerly():
+    logger = AsyncBatchLogger()
+    with pytest.raises(MlflowException, match="Got invalid value"):
+        logger.log_batch("run", metrics=[Metric("a", "not a number", 0, 0)])
+
+
+def test_async_batch_logger_shutdown_logs_queued_entities():
+    logger = AsyncBatchLogger(flush_interval=60)
+    with mock.patch.object(MlflowClient, "log_batch") as log_batch_mock:
+        future = logger.log_batch("run", metrics=[Metric("a", 1, 0, 0)])
+        logger.shutdown()
+        assert future.done()
+        assert log_batch_mock.call_count == 1
+
+
+@pytest.mark.usefixtures("async_logging")
+def test_fluent_async_logging_logs_on_end_run():
+    with mlflow.start_run() as run:
+        mlflow.log_metric("m", 1.0, step=0)
+        future = mlflow.log_metrics({"m": 2.0, "n": 3.0}, step=1)
+        mlflow.log_param("p", 1)
+        mlflow.log_params({"q": 2})
+        mlflow.set_tag("t", "a")
+        mlflow.set_tags({"u": "b"})
+    assert future.done()
+    data = MlflowClient().get_run(run.info.run_id).data
+    assert data.metrics == {"m": 2.0, "n": 3.0}
+    assert data.params == {"p": "1", "q": "2"}
+    assert data.tags["t"] == "a"
+    assert data.tags["u"] == "b"
+    history = MlflowClient().get_metric_history(run.info.run_id, "m")
+    assert sorted((m.step, m.value) for m in history) == [(0, 1.0), (1, 2.0)]
+
+
+@pytest.mark.usefixtures("async_logging")
+def test_fluent_flush_async_logging():
+    with mlflow.start_run() as run:
+        mlflow.log_param("p", "v")
+        mlflow.flush_async_logging()
+        assert MlflowClient().get_run(run.info.run_id).data.params == {"p": "v"}
+
+
+def test_fluent_async_logging_can_be_enabled_from_environment(monkeypatch):
+    monkeypatch.setenv("MLFLOW_ENABLE_ASYNC_LOGGING", "true")
+    with mlflow.start_run():
+        assert mlflow.log_metric("m", 1.0) is not None
+    monkeypatch.delenv("MLFLOW_ENABLE_ASYNC_LOGGING")
+    with mlflow.start_run():
+        assert mlflow.log_metric("m", 1.0) is None
+
+
+def test_fluent_logging_is_synchronous_by_default():
+    with mlflow.start_run() as run:
+        assert mlflow.log_param("p", "v") is None
+        assert MlflowClient().get_run(run.info.run_id).data.params == {"p": "v"}
@@ -468,6 +468,24 @@ def test_search_runs_data():
         pd.testing.assert_frame_equal(pdf, expected_df, check_like=True, check_frame_type=False)
 
 
+def test_search_runs_data_with_sparse_keys_and_unfinished_runs():
+    runs = [create_run(metrics=[Metric("m%s" % i, float(i), 0, 0)],
+                       params=[Param("p%s" % (i % 2), str(i))],
+                       tags=[RunTag("t", str(i))] if i == 2 else [],
+                       start=i, end=None if i == 1 else i + 1)
+            for i in range(3)]
+    with mock.patch('mlflow.tracking.fluent._get_paginated_runs', return_value=runs):
+        pdf = search_runs()
+    assert list(pdf.columns)[6:] == ["metrics.m0", "metrics.m1", "metrics.m2", "params.p0",
+                                     "params.p1", "tags.t"]
+    np.testing.assert_array_equal(pdf["metrics.m1"], [np.nan, 1.0, np.nan])
+    assert pdf["params.p0"].tolist() == ["0", None, "2"]
+    assert pdf["params.p1"].tolist() == [None, "1", None]
+    assert pdf["tags.t"].tolist() == [None, None, "2"]
+    assert pdf["end_time"].isna().tolist() == [False, True, False]
+    assert pdf["start_time"][2] == pd.to_datetime(2, unit="ms", utc=True)
+
+
 def test_search_runs_no_arguments():
     """
     When no experiment ID is specified, it should try to get the implicit one or
@@ -1,10 +1,13 @@
 import json
 
-from mlflow.entities import Experiment, Metric
+import pytest
+
+from mlflow.entities import Experiment, Metric, Param, Run, RunData, RunInfo, RunTag
 from mlflow.protos.service_pb2 import Experiment as ProtoExperiment
 from mlflow.protos.service_pb2 import Metric as ProtoMetric
 
-from mlflow.utils.proto_json_utils import message_to_json, parse_dict, _stringify_all_experiment_ids
+from mlflow.utils.proto_json_utils import message_to_json, parse_dict, run_to_json_dict, \
+    metric_to_json_dict, _stringify_all_experiment_ids
 
 
 def test_message_to_json():
@@ -62,3 +65,29 @@ def test_back_compat():
                            "more_things": {"experiment_id": "7",
                                            "experiment_ids": ["2", "3", "4", "5"]}}}
     assert exp_json == in_json
+
+
+@pytest.mark.parametrize("run", [
+    Run(RunInfo(run_uuid="r", experiment_id="0", user_id="u", status="RUNNING", start_time=1,
+                end_time=None, lifecycle_stage="active"), RunData()),
+    Run(RunInfo(run_uuid="r", experiment_id="1", user_id="", status="FINISHED", start_time=0,
+                end_time=5, lifecycle_stage="deleted", artifact_uri="s3://b/r"), None),
+    Run(RunInfo(run_uuid="r", experiment_id="2", user_id="u\u00e9", status="FAILED",
+                start_time=10 ** 12, end_time=10 ** 12 + 1, lifecycle_stage="active",
+                artifact_uri=""),
+        RunData(metrics=[Metric("m", 1, 2, 0), Metric("m", 0.1, 3, -1),
+                         Metric("n", float("nan"), 4, 10 ** 10), Metric("i", float("inf"), 5, 1),
+                         Metric("j", float("-inf"), 6, 2), Metric("k", 1e20, 7, 3)],
+                params=[Param("p", "v"), Param("q", "")],
+                tags=[RunTag("t", "\"quoted\"\n"), RunTag("mlflow.user", "u")])),
+])
+def test_run_to_json_dict_matches_the_json_of_the_protobuf_message(run):
+    json_dict = run_to_json_dict(run)
+    assert json.loads(json.dumps(json_dict)) == json.loads(message_to_json(run.to_proto()))
+    assert list(json_dict["info"]) == list(json.loads(message_to_json(run.to_proto()))["info"])
+
+
+def test_metric_to_json_dict_matches_the_json_of_the_protobuf_message():
+    for value in [0, 1.5, -2.0, float("nan"), float("inf")]:
+        metric = Metric("m", value, 123, 4)
+        assert metric_to_json_dict(metric) == json.loads(message_to_json(metric.to_proto()))
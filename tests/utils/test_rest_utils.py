@@ -3,17 +3,21 @@
 import mock
 import numpy
 import pytest
+import requests
+import threading
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
 
 from mlflow.exceptions import MlflowException, RestException
 from mlflow.pyfunc.scoring_server import NumpyEncoder
 from mlflow.utils.rest_utils import http_request, http_request_safe, \
-    MlflowHostCreds, _DEFAULT_HEADERS, call_endpoint
+    MlflowHostCreds, _DEFAULT_HEADERS, call_endpoint, _get_request_session, \
+    MLFLOW_HTTP_POOL_MAXSIZE
 from mlflow.protos.service_pb2 import GetRun
 from tests import helper_functions
 
 
 def test_well_formed_json_error_response():
-    with mock.patch('requests.request') as request_mock:
+    with mock.patch('requests.Session.request') as request_mock:
         host_only = MlflowHostCreds("http://my-host")
         response_mock = mock.MagicMock()
         response_mock.status_code = 400
@@ -31,7 +35,7 @@ def test_well_formed_json_error_response():
     helper_functions.create_mock_response(400, None)
 ])
 def test_malformed_json_error_response(response_mock):
-    with mock.patch('requests.request') as request_mock:
+    with mock.patch('requests.Session.request') as request_mock:
         host_only = MlflowHostCreds("http://my-host")
         request_mock.return_value = response_mock
 
@@ -40,7 +44,7 @@ def test_malformed_json_error_response(response_mock):
             call_endpoint(host_only, '/my/endpoint', 'GET', "", response_proto)
 
 
-@mock.patch('requests.request')
+@mock.patch('requests.Session.request')
 def test_http_request_hostonly(request):
     host_only = MlflowHostCreds("http://my-host")
     response = mock.MagicMock()
@@ -54,7 +58,7 @@ def test_http_request_hostonly(request):
     )
 
 
-@mock.patch('requests.request')
+@mock.patch('requests.Session.request')
 def test_http_request_cleans_hostname(request):
     # Add a trailing slash, should be removed.
     host_only = MlflowHostCreds("http://my-host/")
@@ -69,7 +73,7 @@ def test_http_request_cleans_hostname(request):
     )
 
 
-@mock.patch('requests.request')
+@mock.patch('requests.Session.request')
 def test_http_request_with_basic_auth(request):
     host_only = MlflowHostCreds("http://my-host", username='user', password='pass')
     response = mock.MagicMock()
@@ -85,7 +89,7 @@ def test_http_request_with_basic_auth(request):
     )
 
 
-@mock.patch('requests.request')
+@mock.patch('requests.Session.request')
 def test_http_request_with_token(request):
     host_only = MlflowHostCreds("http://my-host", token='my-token')
     response = mock.MagicMock()
@@ -101,7 +105,7 @@ def test_http_request_with_token(request):
     )
 
 
-@mock.patch('requests.request')
+@mock.patch('requests.Session.request')
 def test_http_request_with_insecure(request):
     host_only = MlflowHostCreds("http://my-host", ignore_tls_verification=True)
     response = mock.MagicMock()
@@ -115,7 +119,7 @@ def test_http_request_with_insecure(request):
     )
 
 
-@mock.patch('requests.request')
+@mock.patch('requests.Session.request')
 def test_http_request_client_cert_path(request):
     host_only = MlflowHostCreds("http://my-host", client_cert_path='/some/path')
     response = mock.MagicMock()
@@ -130,7 +134,7 @@ def test_http_request_client_cert_path(request):
     )
 
 
-@mock.patch('requests.request')
+@mock.patch('requests.Session.request')
 def test_http_request_server_cert_path(request):
     host_only = MlflowHostCreds("http://my-host", server_cert_path='/some/path')
     response = mock.MagicMock()
@@ -153,37 +157,93 @@ def test_ignore_tls_verification_not_server_cert_path():
         )
 
 
-@mock.patch('requests.request')
-def test_429_retries(request):
-    host_only = MlflowHostCreds("http://my-host", ignore_tls_verification=True)
+class _MockServerHandler(BaseHTTPRequestHandler):
+    # Status codes returned by successive requests to the mock server
+    status_codes = []
+    post_count = 0
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.send_response(self.status_codes.pop(0))
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        # Closes the connection without responding, as if the request had timed out
+        _MockServerHandler.post_count += 1
+        self.close_connection = True
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture
+def mock_server():
+    server = HTTPServer(("localhost", 0), _MockServerHandler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("status_codes, max_retries, expected_status_code", [
+    ((429, 200), 0, 429),
+    ((429, 200), 1, 200),
+    ((429, 429, 200), 1, 429),
+    ((429, 429, 200), 2, 200),
+    ((429, 404, 429, 200), 3, 404),
+    ((503, 502, 200), 2, 200),
+])
+def test_http_request_retries(mock_server, status_codes, max_retries, expected_status_code):
+    _MockServerHandler.status_codes = list(status_codes)
+    host_creds = MlflowHostCreds("http://localhost:%d" % mock_server.server_port)
+    response = http_request(host_creds, '/my/endpoint', method='GET',
+                            max_retries=max_retries, backoff_factor=0)
+    assert response.status_code == expected_status_code
+
+
+def test_http_request_raises_after_retrying_internal_errors(mock_server):
+    _MockServerHandler.status_codes = [503, 500, 200]
+    host_creds = MlflowHostCreds("http://localhost:%d" % mock_server.server_port)
+    with pytest.raises(MlflowException, match="failed to return code 200 after 2 tries"):
+        http_request(host_creds, '/my/endpoint', method='GET', max_retries=1, backoff_factor=0)
+
+
+def test_http_request_does_not_retry_requests_whose_response_could_not_be_read(mock_server):
+    _MockServerHandler.post_count = 0
+    host_creds = MlflowHostCreds("http://localhost:%d" % mock_server.server_port)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        http_request(host_creds, '/my/endpoint', method='POST', json={},
+                     max_retries=3, backoff_factor=0)
+    assert _MockServerHandler.post_count == 1
+
+
+def test_http_request_reuses_session_per_host():
+    session = _get_request_session("http://my-host", 5, 2)
+    assert _get_request_session("http://my-host", 5, 2) is session
+    assert _get_request_session("http://my-other-host", 5, 2) is not session
+    assert _get_request_session("http://my-host", 1, 2) is not session
+    retry = session.get_adapter("http://my-host").max_retries
+    assert retry.total == 5
+    assert retry.backoff_factor == 2
+    assert 429 in retry.status_forcelist
+
+
+def test_http_request_pool_size_is_configurable(monkeypatch):
+    monkeypatch.setenv(MLFLOW_HTTP_POOL_MAXSIZE, "3")
+    session = _get_request_session("http://pool-size-host", 5, 2)
+    assert session.get_adapter("http://pool-size-host")._pool_maxsize == 3
+
+
+def test_request_sessions_are_reset_in_forked_processes():
+    session = _get_request_session("http://my-host", 5, 2)
+    with mock.patch("os.getpid", return_value=-1):
+        assert _get_request_session("http://my-host", 5, 2) is not session
+
 
-    class MockedResponse(object):
-        def __init__(self, status_code):
-            self.status_code = status_code
-            self.text = "mocked text"
-
-    request.side_effect = [MockedResponse(x) for x in (429, 200)]
-    assert http_request(host_only, '/my/endpoint', max_rate_limit_interval=0).status_code == 429
-    request.side_effect = [MockedResponse(x) for x in (429, 200)]
-    assert http_request(host_only, '/my/endpoint', max_rate_limit_interval=1).status_code == 200
-    request.side_effect = [MockedResponse(x) for x in (429, 429, 200)]
-    assert http_request(host_only, '/my/endpoint', max_rate_limit_interval=1).status_code == 429
-    request.side_effect = [MockedResponse(x) for x in (429, 429, 200)]
-    assert http_request(host_only, '/my/endpoint', max_rate_limit_interval=2).status_code == 200
-    request.side_effect = [MockedResponse(x) for x in (429, 429, 200)]
-    assert http_request(host_only, '/my/endpoint', max_rate_limit_interval=3).status_code == 200
-    # Test that any non 429 code is returned
-    request.side_effect = [MockedResponse(x) for x in (429, 404, 429, 200)]
-    assert http_request(host_only, '/my/endpoint').status_code == 404
-    # Test that retries work as expected
-    request.side_effect = [MockedResponse(x) for x in (429, 503, 429, 200)]
-    with pytest.raises(MlflowException, match="failed to return code 200"):
-        http_request(host_only, '/my/endpoint', retries=1)
-    request.side_effect = [MockedResponse(x) for x in (429, 503, 429, 200)]
-    assert http_request(host_only, '/my/endpoint', retries=2).status_code == 200
-
-
-@mock.patch('requests.request')
+@mock.patch('requests.Session.request')
 def test_http_request_wrapper(request):
     host_only = MlflowHostCreds("http://my-host", ignore_tls_verification=True)
     response = mock.MagicMock()
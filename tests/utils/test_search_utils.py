@@ -345,17 +345,21 @@ def test_invalid_order_by_search_registered_models(order_by, error_message):
 
 
 @pytest.mark.parametrize("page_token, max_results, matching_runs, expected_next_page_token", [
-    (None, 1, [0], {"offset": 1}),
-    (None, 2, [0, 1], {"offset": 2}),
+    (None, 1, [0], {"sort_key": [0, "0"]}),
+    (None, 2, [0, 1], {"sort_key": [0, "1"]}),
     (None, 3, [0, 1, 2], None),
     (None, 5, [0, 1, 2], None),
-    ({"offset": 1}, 1, [1], {"offset": 2}),
+    ({"offset": 1}, 1, [1], {"sort_key": [0, "1"]}),
     ({"offset": 1}, 2, [1, 2], None),
     ({"offset": 1}, 3, [1, 2], None),
     ({"offset": 2}, 1, [2], None),
     ({"offset": 2}, 2, [2], None),
     ({"offset": 2}, 0, [], {"offset": 2}),
     ({"offset": 3}, 1, [], None),
+    ({"sort_key": [0, "0"]}, 1, [1], {"sort_key": [0, "1"]}),
+    ({"sort_key": [0, "0"]}, 2, [1, 2], None),
+    ({"sort_key": [0, "1"]}, 5, [2], None),
+    ({"sort_key": [0, "2"]}, 1, [], None),
 ])
 def test_pagination(page_token, max_results, matching_runs, expected_next_page_token):
     runs = [
@@ -400,8 +404,39 @@ def test_pagination(page_token, max_results, matching_runs, expected_next_page_t
     (base64.b64encode(json.dumps({"offsoot": 7}).encode("utf-8")), "Invalid page token"),
     (base64.b64encode("not json".encode("utf-8")), "Invalid page token"),
     ("not base64", "Invalid page token"),
+    (base64.b64encode(json.dumps({"sort_key": 7}).encode("utf-8")), "Invalid page token"),
+    (base64.b64encode(json.dumps({"sort_key": [0]}).encode("utf-8")), "Invalid page token"),
 ])
 def test_invalid_page_tokens(page_token, error_message):
     with pytest.raises(MlflowException) as e:
         SearchUtils.paginate([], page_token, 1)
     assert error_message in e.value.message
+
+
+@pytest.mark.parametrize("order_by", [["metrics.x asc"], ["metrics.x desc"], ["params.p desc"]])
+def test_keyset_pagination_with_order_by_and_concurrent_inserts(order_by):
+    def create_run(run_id, start_time, metric_value=None):
+        metrics = [Metric("x", metric_value, 1, 0)] if metric_value is not None else []
+        params = [Param("p", str(metric_value))] if metric_value is not None else []
+        return Run(run_info=RunInfo(run_id=run_id, run_uuid=run_id, experiment_id=0,
+                                    user_id="user", status=RunStatus.to_string(RunStatus.FINISHED),
+                                    start_time=start_time, end_time=1,
+                                    lifecycle_stage=LifecycleStage.ACTIVE),
+                   run_data=RunData(metrics=metrics, params=params))
+
+    runs = [create_run("a", 0, 1.0), create_run("b", 1, float("nan")), create_run("c", 2, 1.0),
+            create_run("d", 3), create_run("e", 4, 3.0), create_run("f", 5, -1.0),
+            create_run("g", 6)]
+    expected_run_ids = [run.info.run_id for run in SearchUtils.sort(runs, order_by)]
+    run_ids = []
+    page_token = None
+    while True:
+        page, page_token = SearchUtils.paginate(SearchUtils.sort(runs, order_by), page_token, 2,
+                                                order_by)
+        run_ids.extend(run.info.run_id for run in page)
+        if not page_token:
+            break
+        # Runs inserted before the current page do not shift the next pages
+        runs.append(create_run("0" + page[0].info.run_id, page[0].info.start_time + 100,
+                               page[0].data.metrics.get("x")))
+    assert run_ids == expected_run_ids